@@ -0,0 +1,683 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT002_measured_arrays
+
+Set of unit tests on the module phyqus_lib.measured_arrays.
+"""
+
+__version__= '1.1.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import random
+import operator
+import math
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray, asMeasuredArray
+from phyqus_lib.measured_arrays import STORAGE_MODES, CODED_MIN
+from phyqus_lib.measured_arrays import divide, power, DOMAIN_OK
+from phyqus_lib.measured_arrays import DOMAIN_ZERO_DIVIDER, DOMAIN_NEGATIVE_BASE
+from phyqus_lib.measured_arrays import DOMAIN_ZERO_BASE, DOMAIN_NONPOSITIVE_BASE
+
+#globals
+
+DEF_PRECISION = 8
+
+#classes
+
+#+ helper classes
+
+class HelperClass:
+
+    def __init__(self, Value, SE):
+        self.Value = Value
+        self.SE = SE
+
+#+ test cases
+
+class Test_Init(unittest.TestCase):
+    """
+    Test cases for the class phyqus_lib.measured_arrays.MeasuredArray. Checks
+    the implementation of the __init__() method and the data access.
+
+    Implements tests: TEST-T-200, TEST-T-201.
+    Covers the requirements REQ-FUN-200, REQ-FUN-201, REQ-AWM-200 and
+    REQ-AWM-201.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.BadCases = [int, float, str, '1', ['1'], (1, '1'), {'1' : 1},
+                        HelperClass(1, -1), HelperClass('1', 1), [True],
+                        [HelperClass(1, '1')], 1 + 1j]
+
+    def test_operation_Ok(self):
+        """
+        Checks that the instance is created as expected.
+
+        REQ-FUN-200
+        """
+        for _ in range(100):
+            Values = [random.uniform(-10.0, 10.0) for _ in range(5)]
+            Errors = [random.random() for _ in range(5)]
+            Temp = MeasuredArray(Values)
+            self.assertEqual(Temp.shape, (5, ))
+            self.assertEqual(Temp.Storage, 'float64')
+            self.assertListEqual(Temp.Value.tolist(), Values)
+            self.assertListEqual(Temp.SE.tolist(), [0.0] * 5)
+            Temp = MeasuredArray(Values, Errors)
+            self.assertListEqual(Temp.Value.tolist(), Values)
+            self.assertListEqual(Temp.SE.tolist(), Errors)
+            Temp = MeasuredArray(Values, 0.5)
+            self.assertListEqual(Temp.SE.tolist(), [0.5] * 5)
+            Items = [MeasuredValue(Value, Error)
+                                    for Value, Error in zip(Values, Errors)]
+            Items[0] = HelperClass(Values[0], Errors[0])
+            Temp = MeasuredArray(Items)
+            self.assertListEqual(Temp.Value.tolist(), Values)
+            self.assertListEqual(Temp.SE.tolist(), Errors)
+            Temp2 = MeasuredArray(Temp)
+            self.assertListEqual(Temp2.Value.tolist(), Values)
+            self.assertListEqual(Temp2.SE.tolist(), Errors)
+            self.assertIs(asMeasuredArray(Temp), Temp)
+            Temp2 = asMeasuredArray(Items)
+            self.assertListEqual(Temp2.SE.tolist(), Errors)
+            Temp2 = MeasuredArray(np.array(Values).reshape(5, 1), Errors)
+            self.assertEqual(Temp2.shape, (5, 5))
+            Temp = MeasuredArray(MeasuredValue(Values[0], Errors[0]))
+            self.assertEqual(Temp.shape, tuple())
+            self.assertEqual(Temp.Value, Values[0])
+            self.assertEqual(Temp.SE, Errors[0])
+
+    def test_access(self):
+        """
+        Checks the indexing, slicing, iteration and conversion.
+
+        REQ-FUN-201
+        """
+        Values = [random.uniform(-10.0, 10.0) for _ in range(6)]
+        Errors = [random.random() for _ in range(6)]
+        Temp = MeasuredArray(Values, Errors)
+        self.assertEqual(len(Temp), 6)
+        for Index, Item in enumerate(Temp):
+            self.assertIsInstance(Item, MeasuredValue)
+            self.assertEqual(Item.Value, Values[Index])
+            self.assertEqual(Item.SE, Errors[Index])
+            self.assertEqual(Temp[Index].Value, Values[Index])
+        Part = Temp[1:4]
+        self.assertIsInstance(Part, MeasuredArray)
+        self.assertListEqual(Part.SE.tolist(), Errors[1:4])
+        Part = Temp.reshape(2, 3)
+        self.assertEqual(Part.shape, (2, 3))
+        self.assertEqual(Part[1, 2].SE, Errors[5])
+        self.assertEqual(Part.reshape((6, )).shape, (6, ))
+        Items = Part.toList()
+        self.assertEqual(len(Items), 2)
+        self.assertEqual(Items[1][2].Value, Values[5])
+        self.assertIsInstance(str(Temp), str)
+        self.assertIsInstance(repr(Temp), str)
+        Temp2 = + Temp
+        self.assertIsNot(Temp2, Temp)
+        self.assertListEqual(Temp2.Value.tolist(), Values)
+        Temp2 = - Temp
+        self.assertListEqual(Temp2.Value.tolist(), [- Item for Item in Values])
+        self.assertListEqual(Temp2.SE.tolist(), Errors)
+
+    def test_TypeError(self):
+        """
+        Tests that the TypeError sub-class exception is raised if the
+        arguments of the initialization method are of improper types.
+
+        REQ-AWM-200
+        """
+        for Item in self.BadCases:
+            with self.assertRaises(TypeError, msg = 'from {}'.format(Item)):
+                MeasuredArray(Item)
+        for Item in [int, '1', ['1'], True, [1 + 1j]]:
+            with self.assertRaises(TypeError, msg = 'SE {}'.format(Item)):
+                MeasuredArray([1, 2], Item)
+        with self.assertRaises(TypeError):
+            MeasuredArray([1, 2], Storage = 1)
+
+    def test_ValueError(self):
+        """
+        Tests that the ValueError sub-class exception is raised if the passed
+        SE is negative, the shapes are incompatible or the storage is unknown
+        or overflows.
+
+        REQ-AWM-201
+        """
+        with self.assertRaises(ValueError):
+            MeasuredArray([1, 2], -0.1)
+        with self.assertRaises(ValueError):
+            MeasuredArray([1, 2], [0.1, -0.1])
+        with self.assertRaises(ValueError):
+            MeasuredArray([1, 2], [0.1, 0.1, 0.1])
+        with self.assertRaises(ValueError):
+            MeasuredArray([1, 2], Storage = 'float16')
+        with self.assertRaises(ValueError):
+            MeasuredArray([1.0E300, 2], Storage = 'float32')
+        with self.assertRaises(ValueError):
+            MeasuredArray([1, 2], 1.0E300, Storage = 'float32')
+        with self.assertRaises(ValueError):
+            MeasuredArray([1, 2]).reshape(3)
+
+class Test_Storage(unittest.TestCase):
+    """
+    Test cases for the class phyqus_lib.measured_arrays.MeasuredArray. Checks
+    the reduced precision storage modes.
+
+    Implements tests: TEST-T-202.
+    Covers the requirements REQ-FUN-202.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        Generator = np.random.default_rng()
+        Size = 10000
+        cls.Values = Generator.normal(0.0, 100.0, Size)
+        cls.Values[::100] = 0.0
+        cls.Errors = np.abs(cls.Values) * 10**Generator.uniform(-8, 0.5, Size)
+        cls.Errors[::100] = Generator.uniform(0.0, 1.0, Size // 100)
+        cls.Errors[1::100] = 0.0
+        cls.Bounds = {
+            'float32' : (2**-24, 0.0, 8),
+            'relative16' : (2**-11, 2**-25, 6),
+            'coded8' : (0.033, CODED_MIN, 5)
+        }
+
+    def test_bounds(self):
+        """
+        Checks the memory footprint and the error bounds of the storage modes.
+
+        REQ-FUN-202
+        """
+        for Storage, (Relative, Absolute, Bytes) in self.Bounds.items():
+            Temp = MeasuredArray(self.Values, self.Errors, Storage = Storage)
+            self.assertEqual(Temp.Storage, Storage)
+            self.assertEqual(Temp.nbytes, Bytes * self.Values.size)
+            Values = Temp.Value
+            Errors = Temp.SE
+            self.assertEqual(Values.dtype, np.float64)
+            self.assertEqual(Errors.dtype, np.float64)
+            self.assertTrue(np.all(np.abs(Values - self.Values)
+                                    <= 2**-24 * np.abs(self.Values)))
+            Floor = self.Errors.max() / {'float32' : np.inf,
+                                        'relative16' : 32768.0,
+                                        'coded8' : 10.0}[Storage]
+            Bound = (Relative * self.Errors
+                            + Absolute * np.fmax(np.abs(Values), Floor))
+            self.assertTrue(np.all(np.abs(Errors - self.Errors)
+                                                    <= Bound * (1 + 1.0E-6)))
+            self.assertTrue(np.all(Errors[1::100] == 0))
+            Part = Temp[10:20]
+            self.assertEqual(Part.Storage, Storage)
+            self.assertTrue(np.array_equal(Part.SE, Errors[10:20]))
+            Temp2 = Temp.astype('float64')
+            self.assertTrue(np.array_equal(Temp2.SE, Errors))
+        self.assertEqual(set(STORAGE_MODES), {'float64', 'float32',
+                                                'relative16', 'coded8'})
+
+    def test_arithmetics(self):
+        """
+        Checks that the arithmetics is performed in float64, the result is
+        stored as float64, whereas the augmented assignment preserves the
+        storage mode.
+
+        REQ-FUN-202
+        """
+        Temp = MeasuredArray(self.Values, self.Errors, Storage = 'coded8')
+        Result = Temp * 2
+        self.assertEqual(Result.Storage, 'float64')
+        self.assertTrue(np.array_equal(Result.Value, 2 * Temp.Value))
+        self.assertTrue(np.array_equal(Result.SE, 2 * Temp.SE))
+        Temp *= 2
+        self.assertEqual(Temp.Storage, 'coded8')
+        self.assertTrue(np.allclose(Temp.SE, Result.SE, rtol = 0.07))
+
+class Test_Arithmetics(unittest.TestCase):
+    """
+    Test cases for the class phyqus_lib.measured_arrays.MeasuredArray. Checks
+    the vectorized arithmetics against the scalar class MeasuredValue.
+
+    Implements tests: TEST-T-203.
+    Covers the requirements REQ-FUN-203, REQ-AWM-202 and REQ-AWM-203.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.BadCases = [int, float, str, '1', ['1'], {'1' : 1},
+                        HelperClass(1, -1), HelperClass('1', 1)]
+        cls.Operations = [operator.add, operator.sub, operator.mul,
+                            operator.truediv]
+        cls.AugOperations = [operator.iadd, operator.isub, operator.imul,
+                            operator.itruediv]
+
+    def _compare(self, Result, Expected):
+        """
+        Compares an instance of MeasuredArray with a list of MeasuredValue.
+        """
+        self.assertIsInstance(Result, MeasuredArray)
+        for Item, Check in zip(Result, Expected):
+            self.assertTrue(math.isclose(Item.Value, Check.Value,
+                            rel_tol = 10**-DEF_PRECISION, abs_tol = 1.0E-12))
+            self.assertTrue(math.isclose(Item.SE, Check.SE,
+                            rel_tol = 10**-DEF_PRECISION, abs_tol = 1.0E-12))
+
+    def test_operations(self):
+        """
+        Checks the binary and augmented operations with the other arrays,
+        measured values and real numbers, including the same object case.
+
+        REQ-FUN-203
+        """
+        for _ in range(100):
+            Left = [MeasuredValue(random.uniform(-10.0, 10.0), random.random())
+                                                            for _ in range(5)]
+            Right = [MeasuredValue(random.uniform(1.0, 10.0), random.random())
+                                                            for _ in range(5)]
+            Number = random.choice([random.randint(1, 5),
+                                                    random.uniform(1.0, 5.0)])
+            Single = Right[0]
+            for Operation, AugOperation in zip(self.Operations,
+                                                        self.AugOperations):
+                A = MeasuredArray(Left)
+                B = MeasuredArray(Right)
+                self._compare(Operation(A, B),
+                            [Operation(X, Y) for X, Y in zip(Left, Right)])
+                self._compare(Operation(A, Number),
+                            [Operation(X, Number) for X in Left])
+                self._compare(Operation(Number, B),
+                            [Operation(Number, Y) for Y in Right])
+                self._compare(Operation(A, Single),
+                            [Operation(X, Single) for X in Left])
+                self._compare(Operation(B, B), [Operation(Y, Y)
+                                                            for Y in Right])
+                self._compare(Operation(A, [Y.Value for Y in Right]),
+                            [Operation(X, Y.Value) for X, Y in zip(Left,
+                                                                    Right)])
+                self._compare(Operation(np.array([Y.Value for Y in Right]),
+                                                                        A),
+                            [Operation(Y.Value, X) for X, Y in zip(Left,
+                                                                    Right)])
+                Temp = AugOperation(A, B)
+                self.assertIs(Temp, A)
+                self._compare(A, [Operation(X, Y)
+                                                for X, Y in zip(Left, Right)])
+                AugOperation(B, B)
+                self._compare(B, [Operation(Y, Y) for Y in Right])
+
+    def test_pow(self):
+        """
+        Checks the exponentiation, including the special cases.
+
+        REQ-FUN-203
+        """
+        for _ in range(100):
+            Left = [MeasuredValue(random.uniform(-10.0, 10.0), random.random())
+                                                            for _ in range(5)]
+            Positive = [MeasuredValue(random.uniform(0.1, 10.0),
+                                            random.random()) for _ in range(5)]
+            A = MeasuredArray(Left)
+            P = MeasuredArray(Positive)
+            Power = random.randint(1, 4)
+            self._compare(A ** Power, [X ** Power for X in Left])
+            self._compare(A ** 0, [X ** 0 for X in Left])
+            self._compare(A ** 0.0, [X ** 0.0 for X in Left])
+            Power = random.uniform(-3.0, 3.0)
+            self._compare(P ** Power, [X ** Power for X in Positive])
+            self._compare(P ** A, [X ** Y for X, Y in zip(Positive, Left)])
+            self._compare(P ** P, [X ** X for X in Positive])
+            self._compare(Power ** A if Power > 0 else (- Power) ** A,
+                            [abs(Power) ** X for X in Left])
+            Zero = MeasuredValue(0, random.random())
+            self._compare(MeasuredArray([Zero]) ** 2, [Zero ** 2])
+            self._compare(MeasuredArray([Zero]) ** 0.5, [Zero ** 0.5])
+            P **= A
+            self._compare(P, [X ** Y for X, Y in zip(Positive, Left)])
+
+    def test_TypeError(self):
+        """
+        Tests that the operations raise TypeError if an improper second
+        operand is used.
+
+        REQ-AWM-202
+        """
+        Temp = MeasuredArray([1, 2], 0.1)
+        for Item in self.BadCases:
+            for Operation in self.Operations + [operator.pow]:
+                with self.assertRaises(TypeError):
+                    Operation(Temp, Item)
+            for Operation in self.AugOperations + [operator.ipow]:
+                with self.assertRaises(TypeError):
+                    Operation(Temp, Item)
+
+    def test_ValueError(self):
+        """
+        Tests that the operations raise ValueError in the case of division by
+        zero or improper exponentiation.
+
+        REQ-AWM-203
+        """
+        Temp = MeasuredArray([1, -2, 0], 0.1)
+        Zero = MeasuredArray([1, 0, 3], 0.1)
+        with self.assertRaises(ValueError):
+            Temp / 0
+        with self.assertRaises(ValueError):
+            Temp / Zero
+        with self.assertRaises(ValueError):
+            Temp / [1, 0.0, 2]
+        with self.assertRaises(ValueError):
+            1 / Temp
+        with self.assertRaises(ValueError):
+            Temp /= Zero
+        Part = Zero[1:2]
+        Result = Part / Part
+        self.assertEqual(Result.Value[0], 1)
+        with self.assertRaises(ValueError):
+            Temp ** 0.5
+        with self.assertRaises(ValueError):
+            Temp ** -1
+        with self.assertRaises(ValueError):
+            Temp ** MeasuredValue(2, 0.1)
+        with self.assertRaises(ValueError):
+            Temp ** Temp
+        with self.assertRaises(ValueError):
+            (-2) ** Temp
+        with self.assertRaises(ValueError):
+            Temp **= 0.5
+
+class Test_Domain(unittest.TestCase):
+    """
+    Test cases for the functions phyqus_lib.measured_arrays.divide() and
+    phyqus_lib.measured_arrays.power() - the batch division and exponentiation
+    with the domain check of all elements.
+
+    Implements tests: TEST-T-204.
+    Covers the requirements REQ-FUN-204 and REQ-AWM-204.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Base = MeasuredArray([[1.5, -2.0, 0.0], [0.0, 3.0, -0.5]], 0.1)
+        cls.Divider = MeasuredArray([2.0, 0.0, -1.0], 0.05)
+
+    def _checkValid(self, Result, Mask, Expected) -> None:
+        """
+        Helper method to compare the valid elements with the results of the
+        scalar operations and to check that the invalid ones are NaN.
+        """
+        for Index in np.ndindex(Mask.shape):
+            if Mask[Index]:
+                Item = Result[Index]
+                self.assertTrue(math.isclose(Item.Value, Expected[Index].Value,
+                                            rel_tol = 1E-8, abs_tol = 1E-12))
+                self.assertTrue(math.isclose(Item.SE, Expected[Index].SE,
+                                            rel_tol = 1E-8, abs_tol = 1E-12))
+            else:
+                self.assertTrue(np.isnan(Result.Value[Index]))
+                self.assertTrue(np.isnan(Result.SE[Index]))
+
+    def test_divide(self):
+        """
+        Checks the element-wise division with the domain check.
+
+        REQ-FUN-204
+        """
+        Result, Mask, Codes = divide(self.Base, self.Divider)
+        self.assertIsInstance(Result, MeasuredArray)
+        self.assertEqual(Result.shape, (2, 3))
+        self.assertEqual(Mask.dtype, np.bool_)
+        self.assertEqual(Codes.dtype, np.uint8)
+        self.assertEqual(Mask.tolist(), [[True, False, True]] * 2)
+        self.assertEqual(Codes.tolist(), [[DOMAIN_OK, DOMAIN_ZERO_DIVIDER,
+                                                                DOMAIN_OK]] * 2)
+        Expected = np.empty((2, 3), dtype = object)
+        for Index in np.ndindex(Mask.shape):
+            if Mask[Index]:
+                Expected[Index] = self.Base[Index] / self.Divider[Index[1]]
+        self._checkValid(Result, Mask, Expected)
+        Result, Mask, Codes = divide(2, self.Base)
+        self.assertEqual(Mask.tolist(), [[True, True, False],
+                                                        [False, True, True]])
+        Result, Mask, Codes = divide(self.Base, self.Base)
+        self.assertTrue(Mask.all())
+        self.assertTrue(np.all(Result.Value == 1))
+        self.assertTrue(np.all(Result.SE == 0))
+        Result, Mask, Codes = divide([1.0, 2.0], 4)
+        self.assertTrue(Mask.all())
+        self.assertEqual(Result.Value.tolist(), [0.25, 0.5])
+
+    def test_power(self):
+        """
+        Checks the element-wise exponentiation with the domain check.
+
+        REQ-FUN-204
+        """
+        Result, Mask, Codes = power(self.Base, 2)
+        self.assertTrue(Mask.all())
+        Result, Mask, Codes = power(self.Base, -1)
+        self.assertEqual(Codes.tolist(), [[DOMAIN_OK, DOMAIN_OK,
+                        DOMAIN_ZERO_BASE], [DOMAIN_ZERO_BASE, DOMAIN_OK,
+                                                                DOMAIN_OK]])
+        Expected = np.empty((2, 3), dtype = object)
+        for Index in np.ndindex(Mask.shape):
+            if Mask[Index]:
+                Expected[Index] = self.Base[Index] ** -1
+        self._checkValid(Result, Mask, Expected)
+        Result, Mask, Codes = power(self.Base, [0.5, 2.0, -1.5])
+        self.assertEqual(Codes.tolist(), [[DOMAIN_OK, DOMAIN_NEGATIVE_BASE,
+                        DOMAIN_ZERO_BASE], [DOMAIN_OK, DOMAIN_OK,
+                                                        DOMAIN_NEGATIVE_BASE]])
+        Result, Mask, Codes = power(self.Base, np.array([1, 2, 3]))
+        self.assertEqual(Codes.tolist(), [[DOMAIN_OK] * 3] * 2)
+        Result, Mask, Codes = power(self.Base, MeasuredValue(2, 0.1))
+        self.assertEqual(Mask.tolist(), [[True, False, False],
+                                                        [False, True, False]])
+        self.assertTrue(all(Code == DOMAIN_NONPOSITIVE_BASE
+                                                for Code in Codes[~Mask]))
+        Expected = np.empty((2, 3), dtype = object)
+        for Index in np.ndindex(Mask.shape):
+            if Mask[Index]:
+                Expected[Index] = self.Base[Index] ** MeasuredValue(2, 0.1)
+        self._checkValid(Result, Mask, Expected)
+        Result, Mask, Codes = power(self.Base, self.Base)
+        self.assertEqual(Mask.tolist(), [[True, False, False],
+                                                        [False, True, False]])
+        Expected = np.empty((2, 3), dtype = object)
+        for Index in np.ndindex(Mask.shape):
+            if Mask[Index]:
+                Item = self.Base[Index]
+                Expected[Index] = Item ** Item
+        self._checkValid(Result, Mask, Expected)
+        Result, Mask, Codes = power(2, self.Base)
+        self.assertTrue(Mask.all())
+        Result, Mask, Codes = power(-2, self.Base)
+        self.assertFalse(Mask.any())
+
+    def test_TypeError(self):
+        """
+        Checks that improper operands result in TypeError.
+
+        REQ-AWM-204
+        """
+        for Item in ['1', None, [1, '2'], {1 : 2}]:
+            with self.assertRaises(TypeError):
+                divide(self.Base, Item)
+            with self.assertRaises(TypeError):
+                divide(Item, self.Base)
+            with self.assertRaises(TypeError):
+                power(self.Base, Item)
+            with self.assertRaises(TypeError):
+                power(Item, self.Base)
+
+    def test_ValueError(self):
+        """
+        Checks that a single aggregated ValueError listing all offending
+        elements is raised on request.
+
+        REQ-AWM-204
+        """
+        Result, Mask, Codes = divide(self.Base, [1, 2, 3], Raise = True)
+        self.assertTrue(Mask.all())
+        with self.assertRaises(ValueError) as Context:
+            divide(self.Base, self.Divider, Raise = True)
+        Message = str(Context.exception)
+        self.assertIn('2 of 6', Message)
+        self.assertIn('(0, 1)', Message)
+        self.assertIn('(1, 1)', Message)
+        with self.assertRaises(ValueError) as Context:
+            power(self.Base, 0.5, Raise = True)
+        Message = str(Context.exception)
+        self.assertIn('2 of 6', Message)
+        self.assertIn('(0, 1)', Message)
+        self.assertIn('(1, 2)', Message)
+        self.assertIn('negative base', Message)
+        Long = MeasuredArray(np.zeros(100), 0.1)
+        with self.assertRaises(ValueError) as Context:
+            Long / Long[::-1]
+        self.assertIn('100 of 100', str(Context.exception))
+        self.assertIn('more', str(Context.exception))
+
+class Test_UFunc(unittest.TestCase):
+    """
+    Test cases for the NumPy universal functions dispatch of the class
+    phyqus_lib.measured_arrays.MeasuredArray.
+
+    Implements tests: TEST-T-205.
+    Covers the requirements REQ-FUN-205 and REQ-AWM-205.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Data = MeasuredArray([[0.5, 1.0, 1.5], [2.0, 2.5, 3.0]], 0.1)
+        cls.Real = np.array([1.0, 2.0, 3.0])
+
+    def _compare(self, Result, Expected) -> None:
+        """
+        Helper method to compare the results element-wise.
+        """
+        self.assertIsInstance(Result, MeasuredArray)
+        self.assertEqual(Result.shape, Expected.shape)
+        self.assertListEqual(Result.Value.tolist(), Expected.Value.tolist())
+        self.assertListEqual(Result.SE.tolist(), Expected.SE.tolist())
+
+    def test_operators(self):
+        """
+        Checks that the arithmetic operators and ufuncs with NumPy arrays and
+        scalars as the left operand are performed by the class methods.
+
+        REQ-FUN-205
+        """
+        Data, Real = self.Data, self.Real
+        for Left in [Real, np.float64(2.5), np.int64(3)]:
+            self._compare(Left + Data, Data.__radd__(Left))
+            self._compare(Left - Data, Data.__rsub__(Left))
+            self._compare(Left * Data, Data.__rmul__(Left))
+            self._compare(Left / Data, Data.__rtruediv__(Left))
+            self._compare(Left ** Data, Data.__rpow__(Left))
+        self._compare(np.add(Data, Real), Data + Real)
+        self._compare(np.multiply(Real, Data), Real * Data)
+        self._compare(np.power(Data, Data), Data ** Data)
+        self._compare(np.negative(Data), -Data)
+        self._compare(np.positive(Data), +Data)
+        self._compare(np.eye(2) @ Data, Data.__rmatmul__(np.eye(2)))
+        self._compare(np.matmul(Data, Real), Data @ Real)
+
+    def test_functions(self):
+        """
+        Checks that the ufuncs of the elementary functions are performed by the
+        functions of the module phyqus_lib.functions.
+
+        REQ-FUN-205
+        """
+        from phyqus_lib import functions
+
+        Data = self.Data
+        self._compare(np.sqrt(Data), functions.sqrt(Data))
+        self._compare(np.sin(Data), functions.sin(Data))
+        self._compare(np.arctan(Data), functions.atan(Data))
+        self._compare(np.hypot(Data, self.Real), functions.hypot(Data,
+                                                                self.Real))
+        self._compare(np.arctan2(self.Real, Data), functions.atan2(self.Real,
+                                                                    Data))
+
+    def test_exceptions(self):
+        """
+        Checks that the unsupported ufuncs, methods and keyword arguments
+        result in TypeError, and the domain violations - in ValueError.
+
+        REQ-AWM-205
+        """
+        Data = self.Data
+        for Function in [np.floor, np.sum, np.maximum.reduce]:
+            with self.assertRaises(TypeError):
+                Function(Data)
+        with self.assertRaises(TypeError):
+            np.add(Data, 1.0, out = np.zeros((2, 3)))
+        with self.assertRaises(TypeError):
+            np.add.outer(Data, self.Real)
+        with self.assertRaises(TypeError):
+            np.array(['a', 'b', 'c']) + Data
+        with self.assertRaises(ValueError):
+            np.ones((2, 2)) + Data
+        with self.assertRaises(ValueError):
+            np.log(Data - 1.0)
+        with self.assertRaises(ValueError):
+            self.Real / (Data - 1.0)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_Init)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_Storage)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_Arithmetics)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_Domain)
+TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_UFunc)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3,
+                                                    TestSuite4, TestSuite5])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.measured_arrays module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -0,0 +1,242 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT003_expressions
+
+Set of unit tests on the module phyqus_lib.expressions.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import math
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+from phyqus_lib.expressions import evaluate
+
+#classes
+
+#+ test cases
+
+class Test_evaluate(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.expressions.evaluate().
+
+    Implements tests: TEST-T-300.
+    Covers the requirements REQ-FUN-300, REQ-FUN-301, REQ-AWM-300 and
+    REQ-AWM-301.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        Generator = np.random.default_rng(42)
+        Size = 5000
+        cls.A = MeasuredArray(Generator.normal(5.0, 1.0, Size),
+                                        Generator.uniform(0.0, 0.1, Size))
+        cls.B = MeasuredArray(Generator.normal(3.0, 1.0, Size),
+                        Generator.uniform(0.0, 0.1, Size), Storage = 'coded8')
+        cls.C = MeasuredValue(1.5, 0.2)
+        cls.D = MeasuredArray(Generator.normal(7.0, 1.0, Size),
+                    Generator.uniform(0.0, 0.1, Size), Storage = 'float32')
+        cls.R = Generator.uniform(1.0, 2.0, Size)
+        cls.Variables = {'a' : cls.A, 'b' : cls.B, 'c' : cls.C, 'd' : cls.D,
+                                                                    'r' : cls.R}
+
+    def _compare(self, Result, Expected):
+        """
+        Helper method to compare the results element-wise.
+        """
+        self.assertIsInstance(Result, MeasuredArray)
+        self.assertEqual(Result.Storage, 'float64')
+        self.assertEqual(Result.shape, Expected.shape)
+        for Value1, Value2 in zip(Result.Value.flat, Expected.Value.flat):
+            self.assertTrue(math.isclose(Value1, Value2, rel_tol = 1E-12,
+                                                            abs_tol = 1E-14))
+        for Value1, Value2 in zip(Result.SE.flat, Expected.SE.flat):
+            self.assertTrue(math.isclose(Value1, Value2, rel_tol = 1E-12,
+                                                            abs_tol = 1E-14))
+
+    def test_operation_Ok(self):
+        """
+        Checks that the results of the chunked evaluation are equal to the
+        results of the operations on MeasuredArray instances.
+
+        REQ-FUN-300
+        """
+        a, b, c, d, r = self.A, self.B, self.C, self.D, self.R
+        Cases = [
+            ('(a*b + c) / d**2', (a * b + c) / d ** 2),
+            ('a - b * 2.5 + r', a - b * 2.5 + r),
+            ('-a + +b - (-d)', -a + b + d),
+            ('r / a ** r - 3 ** b', r / a ** r - 3 ** b),
+            ('(a + 1) ** c - d ** -2', (a + 1) ** c - d ** -2),
+            ('1 / (1 + 1 / (1 + 1 / a))', 1 / (1 + 1 / (1 + 1 / a))),
+            ('c * c + r * r', MeasuredArray(c * c) + r * r)
+        ]
+        for Expression, Expected in Cases:
+            for ChunkSize in [None, 1, 777, 10000]:
+                Result = evaluate(Expression, self.Variables,
+                                                        ChunkSize = ChunkSize)
+                self._compare(Result, Expected)
+        Result = evaluate('(a*b + c) / d**2')
+        self._compare(Result, (a * b + c) / d ** 2)
+        Result = evaluate('2 * 3 - 1', {})
+        self.assertEqual(Result.shape, tuple())
+        self.assertEqual(Result.Value, 5)
+        self.assertEqual(Result.SE, 0)
+
+    def test_same_object(self):
+        """
+        Checks that the same object rules are applied to the same variable and
+        to the different variables referring the same object.
+
+        REQ-FUN-300
+        """
+        a = self.A
+        for Expression, Expected in [('a + a', a + a), ('a - a', a - a),
+                                    ('a * a', a * a), ('a / a', a / a),
+                                    ('a ** a', a ** a)]:
+            self._compare(evaluate(Expression), Expected)
+            self._compare(evaluate(Expression.replace('a', 'x', 1),
+                                            {'a' : a, 'x' : a}), Expected)
+        Result = evaluate('(a + 1) * (a + 1)', {'a' : a})
+        self._compare(Result, (a + 1) * (a + 1))
+
+    def test_broadcasting(self):
+        """
+        Checks the broadcasting of the operands.
+
+        REQ-FUN-300
+        """
+        Row = MeasuredArray([1.0, 2.0, 3.0, 4.0], 0.1, Storage = 'relative16')
+        Column = MeasuredArray([[1.0], [2.0], [3.0]], [[0.1], [0.2], [0.3]])
+        Matrix = np.arange(1.0, 13.0).reshape(3, 4)
+        Variables = {'x' : Row, 'y' : Column, 'z' : Matrix, 'k' : [2, 3, 4, 5]}
+        for ChunkSize in [None, 1, 5]:
+            Result = evaluate('x * y + z ** 2 / x - k', Variables,
+                                                        ChunkSize = ChunkSize)
+            self._compare(Result, Row * Column + Matrix ** 2 / Row
+                                                            - [2, 3, 4, 5])
+        Result = evaluate('y ** k', Variables)
+        self._compare(Result, Column ** [2, 3, 4, 5])
+
+    def test_memory(self):
+        """
+        Checks that the chunk size does not depend on the array size, and the
+        peak memory usage besides the result does not depend on the
+        expression depth.
+
+        REQ-FUN-301
+        """
+        import tracemalloc
+        Big = MeasuredArray(np.linspace(1.0, 2.0, 200000), 0.01)
+        Peaks = list()
+        tracemalloc.start()
+        try:
+            for Expression in ['x * x', '((((x + 1) * 2 + 3) / 4) ** 2 - x '
+                                    '* (x + 1) / (x + 2)) * (x - 0.5) / x']:
+                if hasattr(tracemalloc, 'reset_peak'):
+                    tracemalloc.reset_peak()
+                else:
+                    tracemalloc.stop()
+                    tracemalloc.start()
+                Start = tracemalloc.get_traced_memory()[0]
+                evaluate(Expression, {'x' : Big})
+                Peaks.append(tracemalloc.get_traced_memory()[1] - Start)
+        finally:
+            tracemalloc.stop()
+        ResultSize = 16 * Big.size
+        for Peak in Peaks:
+            self.assertLess(Peak, ResultSize + 2 * 1024 * 1024)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-300
+        """
+        for Item in [1, 1.0, None, ['a'], MeasuredValue(1, 0.1)]:
+            with self.assertRaises(TypeError):
+                evaluate(Item, self.Variables)
+        for Item in [1, [('a', 1)], 'a']:
+            with self.assertRaises(TypeError):
+                evaluate('a + 1', Item)
+        for Item in [1.0, '1', True]:
+            with self.assertRaises(TypeError):
+                evaluate('a + 1', self.Variables, ChunkSize = Item)
+        for Item in ['1', None, [1, '2'], {1 : 2}, int]:
+            with self.assertRaises(TypeError):
+                evaluate('a + x', {'a' : self.A, 'x' : Item})
+
+    def test_ValueError(self):
+        """
+        Checks that improper expressions, incompatible shapes and the domain
+        violations result in ValueError.
+
+        REQ-AWM-301
+        """
+        for Item in ['', 'a +', 'sin(a)', 'a.Value', 'a // 2', 'a % 2',
+                    'a < b', 'a, b', '[a]', 'a if b else c', 'True + a',
+                    '"a" + a', 'lambda: a', 'unknown + a']:
+            with self.assertRaises(ValueError):
+                evaluate(Item, self.Variables)
+        with self.assertRaises(ValueError):
+            evaluate('a + x', {'a' : self.A, 'x' : [1, 2]})
+        for Item in [0, -1]:
+            with self.assertRaises(ValueError):
+                evaluate('a + 1', self.Variables, ChunkSize = Item)
+        Data = MeasuredArray([1.0, -2.0, 0.0, 3.0], 0.1)
+        Variables = {'x' : Data, 'y' : MeasuredValue(2.0, 0.1)}
+        for Expression in ['1 / x', 'x / (x - 3)', 'x ** 0.5', 'x ** -1',
+                            'x ** y', 'x ** x', '(-2) ** x', 'x * 2 / x']:
+            for ChunkSize in [None, 1]:
+                with self.assertRaises(ValueError):
+                    evaluate(Expression, Variables, ChunkSize = ChunkSize)
+        with self.assertRaises(ValueError) as Context:
+            evaluate('1 / (x - 3) + x ** 0.5', Variables, ChunkSize = 1)
+        Message = str(Context.exception)
+        self.assertIn('2 of 4', Message)
+        self.assertIn('(1,)', Message)
+        self.assertIn('(3,)', Message)
+        Result = evaluate('x ** 2 + x / x', Variables)
+        self.assertListEqual(Result.Value.tolist(), [2.0, 5.0, 1.0, 10.0])
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_evaluate)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.expressions module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -0,0 +1,390 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT004_linalg
+
+Set of unit tests on the module phyqus_lib.linalg.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import math
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+from phyqus_lib.linalg import dot, matmul, solve, inv
+
+#helper functions
+
+def getJacobianCovariance(Function, Values, Errors, Step = 0.5):
+    """
+    Calculates the covariance matrix of the flattened result of a function
+    using the numerical Jacobian (central differences, exact for the functions
+    linear or quadratic in each element).
+    """
+    Result = Function(*Values).reshape(-1)
+    Covariance = np.zeros((Result.size, Result.size))
+    for Index, (Value, Error) in enumerate(zip(Values, Errors)):
+        Jacobian = np.zeros((Result.size, Value.size))
+        for Position in range(Value.size):
+            Plus = [Item.copy() for Item in Values]
+            Minus = [Item.copy() for Item in Values]
+            Plus[Index].flat[Position] += Step
+            Minus[Index].flat[Position] -= Step
+            Jacobian[:, Position] = (Function(*Plus).reshape(-1)
+                                - Function(*Minus).reshape(-1)) / (2 * Step)
+        Covariance += (Jacobian * np.square(Error).reshape(-1)) @ Jacobian.T
+    return Covariance
+
+#classes
+
+#+ test cases
+
+class Test_Products(unittest.TestCase):
+    """
+    Test cases for the functions phyqus_lib.linalg.dot() and
+    phyqus_lib.linalg.matmul().
+
+    Implements tests: TEST-T-400.
+    Covers the requirements REQ-FUN-400, REQ-FUN-401, REQ-AWM-400 and
+    REQ-AWM-401.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Generator = np.random.default_rng(7)
+        cls.Shapes = [((3, ), (3, )), ((2, 3), (3, )), ((3, ), (3, 4)),
+                        ((2, 3), (3, 4)), ((5, 2, 3), (3, 4)),
+                        ((2, 1, 2, 3), (3, 3, 2)), ((4, 2, 3), (4, 3, 2))]
+
+    def _getRandom(self, Shape):
+        """
+        Helper method to generate random values and uncertainties.
+        """
+        return (self.Generator.normal(0.0, 2.0, Shape),
+                                    self.Generator.uniform(0.1, 0.5, Shape))
+
+    def test_scalar_loop(self):
+        """
+        Checks that the result is the same as of the sum of products of the
+        MeasuredValue instances.
+
+        REQ-FUN-400
+        """
+        for _ in range(10):
+            V1, S1 = self._getRandom((3, 4))
+            V2, S2 = self._getRandom((4, 2))
+            Left = [[MeasuredValue(V1[Row, Column], S1[Row, Column])
+                        for Column in range(4)] for Row in range(3)]
+            Right = [[MeasuredValue(V2[Row, Column], S2[Row, Column])
+                        for Column in range(2)] for Row in range(4)]
+            for Function in (dot, matmul):
+                Result = Function(MeasuredArray(Left), MeasuredArray(Right))
+                self.assertIsInstance(Result, MeasuredArray)
+                self.assertEqual(Result.shape, (3, 2))
+                for Row in range(3):
+                    for Column in range(2):
+                        Expected = Left[Row][0] * Right[0][Column]
+                        for Index in range(1, 4):
+                            Expected += Left[Row][Index] * Right[Index][Column]
+                        Item = Result[Row, Column]
+                        self.assertTrue(math.isclose(Item.Value,
+                                            Expected.Value, rel_tol = 1E-12))
+                        self.assertTrue(math.isclose(Item.SE, Expected.SE,
+                                                            rel_tol = 1E-12))
+            Vector = MeasuredArray(Left[0])
+            Result = dot(Vector, Vector)
+            Expected = Left[0][0] * Left[0][0]
+            for Index in range(1, 4):
+                Expected += Left[0][Index] * Left[0][Index]
+            self.assertEqual(Result.shape, tuple())
+            self.assertTrue(math.isclose(Result.Value, Expected.Value,
+                                                            rel_tol = 1E-12))
+            self.assertTrue(math.isclose(Result.SE, Expected.SE,
+                                                            rel_tol = 1E-12))
+            Result = dot(V1, MeasuredArray(Right))
+            self.assertTrue(np.allclose(Result.SE, np.sqrt(
+                                np.square(V1) @ np.square(S2)), rtol = 1E-12))
+            Result = MeasuredArray(Left) @ V2
+            self.assertTrue(np.allclose(Result.SE, np.sqrt(
+                                np.square(S1) @ np.square(V2)), rtol = 1E-12))
+            Result = V1 @ MeasuredArray(Right)
+            self.assertIsInstance(Result, MeasuredArray)
+            self.assertTrue(np.allclose(Result.Value, V1 @ V2, rtol = 1E-12))
+
+    def test_covariance(self):
+        """
+        Checks the full covariance matrix of the result against the numerical
+        Jacobian calculation, including the stacks of matrices and the same
+        object operands.
+
+        REQ-FUN-401
+        """
+        for LeftShape, RightShape in self.Shapes:
+            V1, S1 = self._getRandom(LeftShape)
+            V2, S2 = self._getRandom(RightShape)
+            Left = MeasuredArray(V1, S1)
+            Right = MeasuredArray(V2, S2)
+            for Data, Errors in [((Left, Right), (S1, S2)),
+                                ((Left, V2), (S1, 0 * S2)),
+                                ((V1, Right), (0 * S1, S2))]:
+                Result, Covariance = matmul(*Data, Covariance = True)
+                Expected = getJacobianCovariance(np.matmul, [V1, V2], Errors)
+                self.assertEqual(Covariance.shape, (Result.size, Result.size))
+                self.assertTrue(np.allclose(Covariance, Expected,
+                                                                atol = 1E-10))
+                Variance = np.square(Result.SE).reshape(-1)
+                self.assertTrue(np.allclose(Variance, np.diag(Expected),
+                                                                atol = 1E-10))
+                self.assertTrue(np.allclose(Result.Value, np.matmul(V1, V2)))
+            if len(LeftShape) < 3 and len(RightShape) < 3:
+                Result, Covariance = dot(Left, Right, Covariance = True)
+                Expected = getJacobianCovariance(np.matmul, [V1, V2],
+                                                                    [S1, S2])
+                self.assertTrue(np.allclose(Covariance, Expected,
+                                                                atol = 1E-10))
+        for Shape in [(3, ), (3, 3), (2, 3, 3)]:
+            Values, Errors = self._getRandom(Shape)
+            Data = MeasuredArray(Values, Errors)
+            Result, Covariance = matmul(Data, Data, Covariance = True)
+            Expected = getJacobianCovariance(lambda X: np.matmul(X, X),
+                                                            [Values], [Errors])
+            self.assertTrue(np.allclose(Covariance, Expected, atol = 1E-10))
+            Variance = np.square(Result.SE).reshape(-1)
+            self.assertTrue(np.allclose(Variance, np.diag(Expected),
+                                                                atol = 1E-10))
+            Result = Data @ Data
+            Variance = np.square(Result.SE).reshape(-1)
+            self.assertTrue(np.allclose(Variance, np.diag(Expected),
+                                                                atol = 1E-10))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-400
+        """
+        Data = MeasuredArray([[1.0, 2.0], [3.0, 4.0]], 0.1)
+        for Item in ['1', None, [1, '2'], {1 : 2}, int, [[1, 2], [3, '4']]]:
+            for Function in (dot, matmul):
+                with self.assertRaises(TypeError):
+                    Function(Data, Item)
+                with self.assertRaises(TypeError):
+                    Function(Item, Data)
+            with self.assertRaises(TypeError):
+                Data @ Item
+        for Item in [1, 1.0, 'True', None, np.bool_(True)]:
+            for Function in (dot, matmul):
+                with self.assertRaises(TypeError):
+                    Function(Data, Data, Covariance = Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper shapes of the arguments result in ValueError.
+
+        REQ-AWM-401
+        """
+        Data = MeasuredArray([[1.0, 2.0], [3.0, 4.0]], 0.1)
+        for Item in [1, MeasuredValue(1, 0.1), [1, 2, 3],
+                                                    np.ones((3, 2)), [[1, 2]]]:
+            for Function in (dot, matmul):
+                with self.assertRaises(ValueError):
+                    Function(Data, Item)
+            with self.assertRaises(ValueError):
+                Data @ Item
+        for Item in [1, MeasuredValue(1, 0.1), [1, 2, 3]]:
+            for Function in (dot, matmul):
+                with self.assertRaises(ValueError):
+                    Function(Item, Data)
+        with self.assertRaises(ValueError):
+            dot(np.ones((2, 2, 2)), Data)
+        with self.assertRaises(ValueError):
+            dot(Data, np.ones((2, 2, 2)))
+        with self.assertRaises(ValueError):
+            matmul(np.ones((3, 2, 2)), np.ones((2, 2, 2)))
+        Temp = MeasuredArray(np.ones((2, 3)), 0.1)
+        with self.assertRaises(ValueError):
+            Temp @ Temp
+
+class Test_Solve(unittest.TestCase):
+    """
+    Test cases for the functions phyqus_lib.linalg.solve() and
+    phyqus_lib.linalg.inv().
+
+    Implements tests: TEST-T-410.
+    Covers the requirements REQ-FUN-410, REQ-FUN-411, REQ-AWM-410 and
+    REQ-AWM-411.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Generator = np.random.default_rng(11)
+        cls.Shapes = [((3, 3), (3, )), ((3, 3), (3, 2)), ((4, 3, 3), (4, 3)),
+                        ((4, 3, 3), (3, )), ((2, 1, 3, 3), (2, 5, 3, 2)),
+                        ((3, 3), (6, 3, 1))]
+
+    def _getMatrix(self, Shape):
+        """
+        Helper method to generate random well conditioned matrices with the
+        uncertainties.
+        """
+        return (self.Generator.normal(0.0, 1.0, Shape) + 3 * np.eye(Shape[-1]),
+                                    self.Generator.uniform(0.01, 0.05, Shape))
+
+    @staticmethod
+    def _solve(Matrix, Vector):
+        """
+        Helper method - reference solution of the linear systems.
+        """
+        if Vector.ndim in (1, Matrix.ndim - 1):
+            return np.linalg.solve(Matrix, Vector[..., None])[..., 0]
+        Shape = np.broadcast(Matrix[..., 0, 0], Vector[..., 0, 0]).shape
+        Matrix = np.broadcast_to(Matrix, Shape + Matrix.shape[-2:])
+        return np.linalg.solve(Matrix,
+                            np.broadcast_to(Vector, Shape + Vector.shape[-2:]))
+
+    def test_solve(self):
+        """
+        Checks the solution of the linear systems and the uncertainties
+        against the numerical Jacobian calculation.
+
+        REQ-FUN-410
+        """
+        for MatrixShape, VectorShape in self.Shapes:
+            V1, S1 = self._getMatrix(MatrixShape)
+            V2 = self.Generator.normal(0.0, 2.0, VectorShape)
+            S2 = self.Generator.uniform(0.01, 0.05, VectorShape)
+            Expected = self._solve(V1, V2)
+            for Data, Errors in [((MeasuredArray(V1, S1),
+                                        MeasuredArray(V2, S2)), (S1, S2)),
+                                ((MeasuredArray(V1, S1), V2), (S1, 0 * S2)),
+                                ((V1, MeasuredArray(V2, S2)), (0 * S1, S2))]:
+                Result = solve(*Data)
+                self.assertIsInstance(Result, MeasuredArray)
+                self.assertEqual(Result.shape, Expected.shape)
+                self.assertTrue(np.allclose(Result.Value, Expected,
+                                                                rtol = 1E-12))
+                Variance = np.diag(getJacobianCovariance(self._solve,
+                                        [V1, V2], Errors, Step = 1E-6))
+                self.assertTrue(np.allclose(np.square(Result.SE).reshape(-1),
+                                                    Variance, rtol = 1E-5))
+        Data = MeasuredArray(*self._getMatrix((2, 3, 3)))
+        Result = solve(Data, Data)
+        self.assertTrue(np.allclose(Result.Value, np.eye(3)))
+        self.assertTrue(np.all(Result.SE == 0))
+        Result = solve([[2, 0], [0, 4]], MeasuredArray([1, 1], 0.1))
+        self.assertListEqual(Result.Value.tolist(), [0.5, 0.25])
+        self.assertListEqual(Result.SE.tolist(), [0.05, 0.025])
+
+    def test_inv(self):
+        """
+        Checks the inverse matrix and the uncertainties against the numerical
+        Jacobian calculation.
+
+        REQ-FUN-411
+        """
+        for Shape in [(1, 1), (3, 3), (4, 2, 2), (2, 3, 4, 4)]:
+            Values, Errors = self._getMatrix(Shape)
+            Result = inv(MeasuredArray(Values, Errors))
+            self.assertIsInstance(Result, MeasuredArray)
+            self.assertEqual(Result.shape, Shape)
+            self.assertTrue(np.allclose(Result.Value, np.linalg.inv(Values),
+                                                                rtol = 1E-12))
+            Variance = np.diag(getJacobianCovariance(np.linalg.inv, [Values],
+                                                    [Errors], Step = 1E-6))
+            self.assertTrue(np.allclose(np.square(Result.SE).reshape(-1),
+                                                    Variance, rtol = 1E-5))
+            Result = inv(Values)
+            self.assertTrue(np.all(Result.SE == 0))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-410
+        """
+        Data = MeasuredArray([[1.0, 2.0], [3.0, 4.0]], 0.1)
+        for Item in ['1', None, [1, '2'], {1 : 2}, int, [[1, 2], [3, '4']]]:
+            with self.assertRaises(TypeError):
+                solve(Data, Item)
+            with self.assertRaises(TypeError):
+                solve(Item, [1, 2])
+            with self.assertRaises(TypeError):
+                inv(Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper shapes of the arguments and singular matrices
+        result in ValueError.
+
+        REQ-AWM-411
+        """
+        Data = MeasuredArray([[1.0, 2.0], [3.0, 4.0]], 0.1)
+        for Item in [1, MeasuredValue(1, 0.1), [1, 2, 3], np.ones((3, 2)),
+                                                np.ones((2, 3, 3)), [[1, 2]]]:
+            with self.assertRaises(ValueError):
+                solve(Data, Item)
+        for Item in [1, MeasuredValue(1, 0.1), [1, 2], np.ones((2, 3)),
+                                                np.ones((2, 3, 2)), [[1, 2]]]:
+            with self.assertRaises(ValueError):
+                solve(Item, [1, 2])
+            with self.assertRaises(ValueError):
+                inv(Item)
+        with self.assertRaises(ValueError):
+            solve(np.ones((3, 2, 2)), np.ones((2, 2, 2)))
+        Singular = MeasuredArray([[1.0, 2.0], [2.0, 4.0]], 0.1)
+        with self.assertRaises(ValueError):
+            solve(Singular, [1, 2])
+        with self.assertRaises(ValueError):
+            inv(Singular)
+        Stack = np.ones((3, 2, 2))
+        Stack[1] = np.eye(2)
+        with self.assertRaises(ValueError) as Context:
+            inv(Stack)
+        self.assertIn('2 of 3', str(Context.exception))
+        with self.assertRaises(ValueError):
+            solve(Stack, [1, 2])
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_Products)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_Solve)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.linalg module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
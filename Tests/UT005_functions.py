@@ -0,0 +1,638 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT005_functions
+
+Set of unit tests on the module phyqus_lib.functions.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import math
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+import phyqus_lib.functions as test_module
+
+#globals
+
+#+ tested functions: name -> valid test points
+
+UNARY = {
+    'sqrt' : [0.3, 1.0, 7.5], 'exp' : [-2.0, 0.0, 1.5],
+    'log' : [0.3, 1.0, 7.5], 'log10' : [0.3, 1.0, 7.5],
+    'sin' : [-2.0, 0.0, 1.5], 'cos' : [-2.0, 0.0, 1.5],
+    'tan' : [-1.0, 0.0, 1.2], 'asin' : [-0.9, 0.0, 0.5],
+    'acos' : [-0.9, 0.0, 0.5], 'atan' : [-2.0, 0.0, 1.5],
+    'sinh' : [-2.0, 0.0, 1.5], 'cosh' : [-2.0, 0.0, 1.5],
+    'tanh' : [-2.0, 0.0, 1.5], 'asinh' : [-2.0, 0.0, 1.5],
+    'acosh' : [1.1, 2.0, 7.5], 'atanh' : [-0.9, 0.0, 0.5]
+}
+
+#+ domain violations: name -> invalid test points
+
+INVALID = {
+    'sqrt' : [-0.1], 'log' : [0.0, -1.0], 'log10' : [0.0, -1.0],
+    'asin' : [1.1, -1.5], 'acos' : [1.1, -1.5], 'acosh' : [0.9, -1.0],
+    'atanh' : [1.0, -1.0, 2.0]
+}
+
+#+ registered test functions
+
+@test_module.measuredFunction(
+                    lambda T, A, E: A * E * np.exp(-E / T) / T ** 2,
+                    lambda T, A, E: np.exp(-E / T),
+                    lambda T, A, E: - A * np.exp(-E / T) / T,
+                    Domain = lambda T, A, E: T > 0)
+def arrhenius(T, A, E):
+    """
+    Arrhenius rate, vectorized function.
+    """
+    return A * np.exp(-E / T)
+
+@test_module.measuredFunction(lambda x: math.exp(x), UFunc = np.expm1,
+                                                        Vectorized = False)
+def expm1(x):
+    """
+    Exponent minus one, scalar function.
+    """
+    return math.expm1(x)
+
+#classes
+
+#+ test cases
+
+class Test_Functions(unittest.TestCase):
+    """
+    Test cases for the elementary functions of the module
+    phyqus_lib.functions.
+
+    Implements tests: TEST-T-500.
+    Covers the requirements REQ-FUN-500, REQ-FUN-501, REQ-FUN-502,
+    REQ-AWM-500 and REQ-AWM-501.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Step = 1.0E-6
+
+    def _derivative(self, Function, Point):
+        """
+        Helper method to estimate the derivative numerically.
+        """
+        return (Function(Point + self.Step) -
+                                Function(Point - self.Step)) / (2 * self.Step)
+
+    def test_unary_Ok(self):
+        """
+        Checks the mean values and the first order uncertainty of the unary
+        functions against the Standard Library functions and the numerical
+        derivatives.
+
+        REQ-FUN-500
+        """
+        for Name, Points in UNARY.items():
+            Function = getattr(test_module, Name)
+            Reference = getattr(math, Name)
+            for Point in Points:
+                Result = Function(MeasuredValue(Point, 0.01))
+                self.assertIsInstance(Result, MeasuredValue)
+                self.assertTrue(math.isclose(Result.Value, Reference(Point),
+                                            rel_tol = 1E-12, abs_tol = 1E-15))
+                SE = 0.01 * abs(self._derivative(Reference, Point))
+                self.assertTrue(math.isclose(Result.SE, SE, rel_tol = 1E-6,
+                                                            abs_tol = 1E-12))
+                Result = Function(MeasuredValue(Point, 0))
+                self.assertEqual(Result.SE, 0)
+
+    def test_binary_Ok(self):
+        """
+        Checks the mean values and the first order uncertainty of the
+        functions of two arguments against the Standard Library functions and
+        the numerical derivatives.
+
+        REQ-FUN-500
+        """
+        for Name in ['hypot', 'atan2']:
+            Function = getattr(test_module, Name)
+            Reference = getattr(math, Name)
+            for First, Second in [(3.0, 4.0), (-1.0, 0.5), (0.5, -2.0),
+                                                                (2.0, 0.0)]:
+                Result = Function(MeasuredValue(First, 0.01),
+                                                    MeasuredValue(Second, 0.02))
+                self.assertTrue(math.isclose(Result.Value,
+                                    Reference(First, Second), rel_tol = 1E-12))
+                D1 = self._derivative(lambda x: Reference(x, Second), First)
+                D2 = self._derivative(lambda x: Reference(First, x), Second)
+                SE = math.sqrt((0.01 * D1)**2 + (0.02 * D2)**2)
+                self.assertTrue(math.isclose(Result.SE, SE, rel_tol = 1E-6))
+                Result = Function(First, MeasuredValue(Second, 0.02))
+                self.assertTrue(math.isclose(Result.SE, abs(0.02 * D2),
+                                            rel_tol = 1E-6, abs_tol = 1E-12))
+        Value = MeasuredValue(2.0, 0.1)
+        Result = test_module.hypot(Value, Value)
+        self.assertTrue(math.isclose(Result.Value, 2.0 * math.sqrt(2)))
+        self.assertTrue(math.isclose(Result.SE, 0.1 * math.sqrt(2)))
+        Result = test_module.atan2(Value, Value)
+        self.assertTrue(math.isclose(Result.Value, math.pi / 4))
+        self.assertEqual(Result.SE, 0)
+
+    def test_input_forms(self):
+        """
+        Checks the type of the result for the different forms of the input,
+        and that the arrays are processed element-wise identically to the
+        scalars.
+
+        REQ-FUN-501
+        """
+        Result = test_module.sin(1)
+        self.assertIsInstance(Result, float)
+        self.assertEqual(Result, math.sin(1))
+        self.assertIsInstance(test_module.atan2(1, 2.0), float)
+        Values = [0.3, 1.0, 7.5]
+        Errors = [0.01, 0.0, 0.2]
+        for Storage in ['float64', 'float32', 'coded8']:
+            Data = MeasuredArray(Values, Errors, Storage = Storage)
+            Result = test_module.log(Data)
+            self.assertIsInstance(Result, MeasuredArray)
+            self.assertEqual(Result.shape, (3, ))
+            for Index, Item in enumerate(Data):
+                Check = test_module.log(Item)
+                self.assertTrue(math.isclose(Result.Value[Index], Check.Value,
+                                                            rel_tol = 1E-12))
+                self.assertTrue(math.isclose(Result.SE[Index], Check.SE,
+                                                            rel_tol = 1E-12))
+        Items = [MeasuredValue(Value, Error)
+                                    for Value, Error in zip(Values, Errors)]
+        for Data in [Items, tuple(Items), np.array(Items, dtype = object),
+                                                                    Values]:
+            Result = test_module.exp(Data)
+            Check = test_module.exp(MeasuredArray(Data))
+            self.assertIsInstance(Check, MeasuredArray)
+            self.assertListEqual(np.ravel(Result.Value).tolist(),
+                                            np.ravel(Check.Value).tolist())
+            self.assertListEqual(np.ravel(Result.SE).tolist(),
+                                                np.ravel(Check.SE).tolist())
+        Row = MeasuredArray([1.0, 2.0, 3.0], 0.1)
+        Column = MeasuredArray([[1.0], [-2.0]], 0.2)
+        Result = test_module.hypot(Row, Column)
+        self.assertEqual(Result.shape, (2, 3))
+        Check = test_module.hypot(Row[2], Column[1, 0])
+        self.assertTrue(math.isclose(Result.Value[1, 2], Check.Value))
+        self.assertTrue(math.isclose(Result.SE[1, 2], Check.SE))
+        Result = test_module.hypot(Row, Row)
+        self.assertTrue(np.allclose(Result.SE, 0.1 * math.sqrt(2)))
+
+    def test_applyArrays(self):
+        """
+        Checks the function applyArrays() on the paired arrays, including the
+        domain violations and the broadcasting.
+
+        REQ-FUN-502
+        """
+        Function = test_module.applyArrays
+        Values = np.array([0.3, 1.0, 7.5])
+        Errors = np.array([0.01, 0.0, 0.2])
+        Mean, SE, Codes = Function('sqrt', (Values, Errors))
+        Check = test_module.sqrt(MeasuredArray(Values, Errors))
+        self.assertListEqual(Mean.tolist(), Check.Value.tolist())
+        self.assertListEqual(SE.tolist(), Check.SE.tolist())
+        self.assertListEqual(Codes.tolist(), [0, 0, 0])
+        self.assertEqual(Codes.dtype, np.uint8)
+        Mean, SE, Codes = Function('log', ([1.0, -1.0, 0.0], 0.1))
+        self.assertTrue(math.isclose(SE[0], 0.1))
+        self.assertTrue(np.isnan(Mean[1:]).all())
+        self.assertTrue(np.isnan(SE[1:]).all())
+        self.assertListEqual(Codes.tolist(), [0, 6, 6])
+        with self.assertRaises(ValueError) as Context:
+            Function('log', ([1.0, -1.0, 0.0], 0.1), Raise = True)
+        self.assertIn('2 of 3', str(Context.exception))
+        Mean, SE, Codes = Function('atan2', (1.0, 0.0), (Values, [[0.1], [0]]))
+        self.assertEqual(Mean.shape, (2, 3))
+        self.assertListEqual(SE[1].tolist(), [0.0, 0.0, 0.0])
+        Mean, SE, Codes = Function('hypot', (0, 0.1), ([0, 1], 0.1))
+        self.assertListEqual(Codes.tolist(), [8, 0])
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-500
+        """
+        for Item in ['1', None, [1, '2'], {1 : 2}, int, True, float]:
+            for Name in UNARY:
+                with self.assertRaises(TypeError):
+                    getattr(test_module, Name)(Item)
+            with self.assertRaises(TypeError):
+                test_module.hypot(Item, 1.0)
+            with self.assertRaises(TypeError):
+                test_module.atan2(1.0, Item)
+        Function = test_module.applyArrays
+        for Item in [1, None, math.sin]:
+            with self.assertRaises(TypeError):
+                Function(Item, (1.0, 0.1))
+        for Item in [1, (1.0, ), (1.0, 0.1, 0.2), ('1', 0.1), (1.0, None),
+                                    (True, 0.1), ([1, 'a'], 0.1), [None, None]]:
+            with self.assertRaises(TypeError):
+                Function('sin', Item)
+        for Item in [1, None, 'True']:
+            with self.assertRaises(TypeError):
+                Function('sin', (1.0, 0.1), Raise = Item)
+
+    def test_ValueError(self):
+        """
+        Checks that the domain violations and incompatible shapes result in
+        ValueError.
+
+        REQ-AWM-501
+        """
+        for Name, Points in INVALID.items():
+            Function = getattr(test_module, Name)
+            for Point in Points:
+                with self.assertRaises(ValueError):
+                    Function(Point)
+                with self.assertRaises(ValueError):
+                    Function(MeasuredValue(Point, 0.1))
+            Data = MeasuredArray(UNARY[Name] + Points, 0.1)
+            with self.assertRaises(ValueError) as Context:
+                Function(Data)
+            Message = str(Context.exception)
+            self.assertIn('{} of {}'.format(len(Points), Data.size), Message)
+            self.assertIn('(3,)', Message)
+        for Name in ['hypot', 'atan2']:
+            Function = getattr(test_module, Name)
+            with self.assertRaises(ValueError):
+                Function(0, MeasuredValue(0, 0.1))
+            with self.assertRaises(ValueError):
+                Function([1.0, 2.0], [1.0, 2.0, 3.0])
+        Function = test_module.applyArrays
+        for Item in ['', 'arcsin', 'Sin', 'pow']:
+            with self.assertRaises(ValueError):
+                Function(Item, (1.0, 0.1))
+        with self.assertRaises(ValueError):
+            Function('sin', (1.0, 0.1), (1.0, 0.1))
+        with self.assertRaises(ValueError):
+            Function('hypot', (1.0, 0.1))
+        with self.assertRaises(ValueError):
+            Function('sin', ([1.0, 2.0], [0.1, -0.1]))
+        with self.assertRaises(ValueError):
+            Function('sin', ([1.0, 2.0], [0.1, 0.1, 0.1]))
+
+class Test_propagate(unittest.TestCase):
+    """
+    Test cases for the functions phyqus_lib.functions.propagate() and
+    phyqus_lib.functions.propagateArrays().
+
+    Implements tests: TEST-T-510.
+    Covers the requirements REQ-FUN-510, REQ-FUN-511, REQ-FUN-512,
+    REQ-AWM-510 and REQ-AWM-511.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.X = MeasuredValue(0.5, 0.01)
+        cls.Y = MeasuredValue(2.0, 0.1)
+        Generator = np.random.default_rng(42)
+        cls.A = MeasuredArray(Generator.uniform(0.1, 1.0, 50),
+                                        Generator.uniform(0.0, 0.02, 50))
+        cls.B = MeasuredArray(Generator.uniform(1.0, 2.0, 50), 0.1)
+
+    def setUp(self):
+        """
+        Preparation for each test case: clears the step cache.
+        """
+        test_module.clearStepCache()
+
+    def _compare(self, Result, Expected, Tolerance):
+        """
+        Helper method to compare the values and the uncertainties.
+        """
+        self.assertTrue(np.allclose(Result.Value, Expected.Value,
+                                                rtol = 1E-12, atol = 1E-15))
+        self.assertTrue(np.allclose(Result.SE, Expected.SE,
+                                            rtol = Tolerance, atol = 1E-15))
+
+    def test_propagate_Ok(self):
+        """
+        Checks the scalar function propagate() against the analytic
+        propagation, using the complex step (NumPy functions) and the central
+        differences (Standard Library functions).
+
+        REQ-FUN-510
+        """
+        X, Y = self.X, self.Y
+        Cases = [
+            (math.sin, (X, ), test_module.sin(X), 1E-7),
+            (np.sin, (X, ), test_module.sin(X), 1E-12),
+            (lambda a, b: a * a * math.exp(-b), (X, Y),
+                                            X * X * test_module.exp(-Y), 1E-7),
+            (lambda a, b: a * a * np.exp(-b), (X, Y),
+                                            X * X * test_module.exp(-Y), 1E-12),
+            (lambda a, b: a * b, (X, X), X * X, 1E-7),
+            (lambda a, b: a / b, (X, 4.0), X / 4.0, 1E-7),
+            (math.log, (MeasuredValue(1.0E-4, 1.0E-6), ),
+                        test_module.log(MeasuredValue(1.0E-4, 1.0E-6)), 1E-7),
+            (math.atan, (MeasuredValue(1.0E3, 1.0), ),
+                            test_module.atan(MeasuredValue(1.0E3, 1.0)), 1E-7)
+        ]
+        for Function, Args, Expected, Tolerance in Cases:
+            for _ in range(2):
+                Result = test_module.propagate(Function, *Args)
+                self.assertIsInstance(Result, MeasuredValue)
+                self._compare(Result, Expected, Tolerance)
+        Result = test_module.propagate(lambda a: 2 * abs(a),
+                                                    MeasuredValue(-1.0, 0.1))
+        self.assertTrue(math.isclose(Result.SE, 0.2, rel_tol = 1E-7))
+        Result = test_module.propagate(math.hypot, 3, 4)
+        self.assertEqual(Result.Value, 5.0)
+        self.assertEqual(Result.SE, 0)
+
+    def test_propagateArrays_Ok(self):
+        """
+        Checks the batch function propagateArrays() against the analytic
+        propagation and the function propagate().
+
+        REQ-FUN-511
+        """
+        A, B = self.A, self.B
+        for Function in [lambda a, b: a * a * np.exp(-b),
+                                    lambda a, b: a * a * np.exp(-b).real]:
+            for _ in range(2):
+                Result = test_module.propagateArrays(Function, A, B)
+                self.assertIsInstance(Result, MeasuredArray)
+                self._compare(Result, A * A * test_module.exp(-B), 1E-7)
+        Result = test_module.propagateArrays(np.hypot, A, A)
+        self._compare(Result, test_module.hypot(A, A), 1E-7)
+        Row = MeasuredArray([1.0, 2.0, 3.0], 0.1)
+        Column = [[1.0], [2.0]]
+        Result = test_module.propagateArrays(np.arctan2, Row, Column)
+        self.assertEqual(Result.shape, (2, 3))
+        self._compare(Result, test_module.atan2(Row, Column), 1E-7)
+        Check = test_module.propagate(math.atan2, Row[2], 2.0)
+        self.assertTrue(math.isclose(Result.SE[1, 2], Check.SE,
+                                                            rel_tol = 1E-7))
+        Result = test_module.propagateArrays(np.exp, [1.0, 2.0])
+        self.assertListEqual(Result.SE.tolist(), [0.0, 0.0])
+
+    def test_cache(self):
+        """
+        Checks that the step search is done only once per function, and the
+        batch form calls the function once per batch.
+
+        REQ-FUN-512
+        """
+        Calls = list()
+        def Function(a, b):
+            Calls.append(1)
+            return a * a * np.exp(-b)
+        test_module.propagate(Function, self.X, self.Y)
+        self.assertGreater(len(Calls), 10)
+        for Args, Count in [((self.X, self.Y), 3), ((self.X, 1.0), 2),
+                        ((MeasuredValue(0.7, 0.2), MeasuredValue(1, 0.3)), 3)]:
+            del Calls[:]
+            test_module.propagate(Function, *Args)
+            self.assertEqual(len(Calls), Count)
+        del Calls[:]
+        test_module.propagateArrays(Function, self.A, self.B)
+        self.assertEqual(len(Calls), 1)
+        def Function(a, b):
+            Calls.append(1)
+            return a * a * math.exp(-b)
+        test_module.propagate(Function, self.X, self.Y)
+        del Calls[:]
+        test_module.propagate(Function, self.X, self.Y)
+        self.assertEqual(len(Calls), 5)
+        test_module.clearStepCache()
+        del Calls[:]
+        test_module.propagate(Function, self.X, self.Y)
+        self.assertGreater(len(Calls), 10)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-510
+        """
+        for Function in [test_module.propagate, test_module.propagateArrays]:
+            for Item in [1, 'sin', None, [math.sin]]:
+                with self.assertRaises(TypeError):
+                    Function(Item, self.X)
+            for Item in ['1', None, {1 : 2}, int, True]:
+                with self.assertRaises(TypeError):
+                    Function(np.exp, Item)
+            with self.assertRaises(TypeError):
+                Function(lambda a: 'a', self.X)
+        with self.assertRaises(TypeError):
+            test_module.propagate(np.exp, self.A)
+        with self.assertRaises(TypeError):
+            test_module.propagate(lambda a: [a], self.X)
+        with self.assertRaises(TypeError) as Context:
+            test_module.propagateArrays(lambda a: math.sin(a), self.A)
+        self.assertIn('vectorized', str(Context.exception))
+
+    def test_ValueError(self):
+        """
+        Checks that the missing arguments and incompatible shapes result in
+        ValueError.
+
+        REQ-AWM-511
+        """
+        for Function in [test_module.propagate, test_module.propagateArrays]:
+            with self.assertRaises(ValueError):
+                Function(np.exp)
+        with self.assertRaises(ValueError):
+            test_module.propagateArrays(np.hypot, [1.0, 2.0], [1.0, 2.0, 3.0])
+        with self.assertRaises(ValueError):
+            test_module.propagateArrays(np.sum, self.A)
+
+class Test_measuredFunction(unittest.TestCase):
+    """
+    Test cases for the decorator phyqus_lib.functions.measuredFunction().
+
+    Implements tests: TEST-T-520.
+    Covers the requirements REQ-FUN-520, REQ-FUN-521, REQ-AWM-520 and
+    REQ-AWM-521.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.T = MeasuredValue(300.0, 2.0)
+        cls.E = MeasuredValue(500.0, 5.0)
+        cls.Temperatures = MeasuredArray([250.0, 300.0, 350.0], [1.0, 2.0, 0.0])
+
+    def _compare(self, Result, Expected, Tolerance = 1E-12):
+        """
+        Helper method to compare the values and the uncertainties.
+        """
+        self.assertTrue(np.allclose(Result.Value, Expected.Value,
+                                                rtol = 1E-12, atol = 1E-15))
+        self.assertTrue(np.allclose(Result.SE, Expected.SE,
+                                            rtol = Tolerance, atol = 1E-15))
+
+    def test_scalar(self):
+        """
+        Checks the generated scalar path against the explicit arithmetics and
+        the numerical propagation.
+
+        REQ-FUN-520
+        """
+        T, E = self.T, self.E
+        Result = arrhenius(T, 1.0E3, E)
+        self.assertIsInstance(Result, MeasuredValue)
+        self._compare(Result, 1.0E3 * test_module.exp(-E / T))
+        self._compare(Result, test_module.propagate(arrhenius.__wrapped__, T,
+                                                        1.0E3, E), 1E-7)
+        Result = arrhenius(T, MeasuredValue(1.0E3, 10.0), 500)
+        self._compare(Result, MeasuredValue(1.0E3, 10.0)
+                                                * test_module.exp(-500 / T))
+        Result = arrhenius(300.0, 1000, 500.0)
+        self.assertIsInstance(Result, float)
+        self.assertEqual(Result, 1000 * math.exp(-500 / 300))
+        Value = MeasuredValue(300.0, 2.0)
+        Result = arrhenius(Value, 1.0E3, Value)
+        self._compare(Result, MeasuredValue(1.0E3 * math.exp(-1), 0))
+        Result = expm1(MeasuredValue(1.0E-3, 1.0E-4))
+        self.assertTrue(math.isclose(Result.Value, math.expm1(1.0E-3)))
+        self.assertTrue(math.isclose(Result.SE, 1.0E-4 * math.exp(1.0E-3)))
+        self.assertEqual(arrhenius.__name__, 'arrhenius')
+        self.assertIn('Arrhenius', arrhenius.__doc__)
+
+    def test_array(self):
+        """
+        Checks the generated array path, the registration in the derivative
+        table and the NumPy dispatch.
+
+        REQ-FUN-521
+        """
+        Data = self.Temperatures
+        Result = arrhenius(Data, 1.0E3, self.E)
+        self.assertIsInstance(Result, MeasuredArray)
+        for Index, Item in enumerate(Data):
+            self._compare(Result[Index], arrhenius(Item, 1.0E3, self.E))
+        Result = arrhenius([250.0, MeasuredValue(300.0, 2.0)], 1.0E3, 500.0)
+        self._compare(Result[1], arrhenius(MeasuredValue(300.0, 2.0), 1.0E3,
+                                                                        500.0))
+        Mean, SE, Codes = test_module.applyArrays('arrhenius',
+                        (Data.Value, Data.SE), (1.0E3, 0.0), (500.0, 5.0))
+        Result = arrhenius(Data, 1.0E3, self.E)
+        self.assertListEqual(Mean.tolist(), Result.Value.tolist())
+        self.assertListEqual(SE.tolist(), Result.SE.tolist())
+        self.assertIn('arrhenius', test_module.DERIVATIVE_TABLE)
+        Data = MeasuredArray([1.0E-3, 1.0], 1.0E-4)
+        for Result in [expm1(Data), np.expm1(Data)]:
+            self.assertIsInstance(Result, MeasuredArray)
+            self._compare(Result[1], expm1(MeasuredValue(1.0, 1.0E-4)))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-520
+        """
+        Decorator = test_module.measuredFunction
+        for Item in [1, 'a', None]:
+            with self.assertRaises(TypeError):
+                Decorator(Item)
+            with self.assertRaises(TypeError):
+                Decorator(math.cos, Domain = Item if Item else 1)
+            with self.assertRaises(TypeError):
+                Decorator(math.cos)(Item)
+            with self.assertRaises(TypeError):
+                Decorator(math.cos, Vectorized = Item)
+        for Item in [1, math.sin, np.sin]:
+            with self.assertRaises(TypeError):
+                Decorator(math.cos, Name = Item)
+        for Item in [1, 'sin', math.sin]:
+            with self.assertRaises(TypeError):
+                Decorator(math.cos, UFunc = Item)
+        for Item in ['1', None, {1 : 2}, int, True, MeasuredValue]:
+            with self.assertRaises(TypeError):
+                arrhenius(Item, 1.0, 1.0)
+            with self.assertRaises(TypeError):
+                arrhenius(self.Temperatures, Item, 1.0)
+
+    def test_ValueError(self):
+        """
+        Checks that improper registration, number of arguments and the domain
+        violations result in ValueError.
+
+        REQ-AWM-521
+        """
+        Decorator = test_module.measuredFunction
+        with self.assertRaises(ValueError):
+            Decorator()
+        with self.assertRaises(ValueError):
+            Decorator(math.cos, math.cos, UFunc = np.sin)
+        with self.assertRaises(ValueError):
+            Decorator(math.cos, math.cos)(lambda x: x)
+        with self.assertRaises(ValueError):
+            Decorator(math.cos)(lambda x, y: x)
+        with self.assertRaises(ValueError):
+            Decorator(math.cos, Name = 'sin')(lambda x: x)
+        with self.assertRaises(ValueError):
+            Decorator(math.cos)(math.sin)
+        with self.assertRaises(ValueError):
+            Decorator(math.cos, Name = 'mysin', UFunc = np.sin)(math.sin)
+        with self.assertRaises(ValueError):
+            Decorator(math.exp, UFunc = np.expm1)(lambda x: math.expm1(x))
+        self.assertEqual(test_module.UFUNC_TABLE[np.sin], 'sin')
+        self.assertNotIn('mysin', test_module.DERIVATIVE_TABLE)
+        for Args in [(self.T, ), (self.T, 1.0, 1.0, 1.0)]:
+            with self.assertRaises(ValueError):
+                arrhenius(*Args)
+        with self.assertRaises(ValueError):
+            arrhenius(MeasuredValue(-1.0, 0.1), 1.0, 1.0)
+        with self.assertRaises(ValueError) as Context:
+            arrhenius(MeasuredArray([1.0, 0.0, -1.0], 0.1), 1.0, 1.0)
+        self.assertIn('2 of 3', str(Context.exception))
+        with self.assertRaises(ValueError):
+            arrhenius([1.0, 2.0], [1.0, 2.0, 3.0], 1.0)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_Functions)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_propagate)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_measuredFunction)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.functions module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -0,0 +1,629 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT006_monte_carlo
+
+Set of unit tests on the module phyqus_lib.monte_carlo.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import math
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+import phyqus_lib.monte_carlo as test_module
+
+#functions
+
+def median(Samples):
+    """
+    Median of the resamples, picklable statistic for the worker processes.
+    """
+    return np.median(Samples, axis = 1)
+
+#classes
+
+#+ test cases
+
+class Test_monteCarlo(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.monte_carlo.monteCarlo().
+
+    Implements tests: TEST-T-600.
+    Covers the requirements REQ-FUN-600, REQ-FUN-601, REQ-FUN-602,
+    REQ-AWM-600 and REQ-AWM-601.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.monteCarlo)
+        cls.X = MeasuredValue(2.0, 0.1)
+        cls.Y = MeasuredValue(3.0, 0.2)
+        cls.Data = MeasuredArray(np.linspace(1.0, 2.0, 20), 0.05)
+
+    def test_Propagation(self):
+        """
+        Checks the mean and the uncertainty of the linear and nonlinear
+        functions, the type of the result and the same object arguments.
+
+        REQ-FUN-600
+        """
+        X, Y = self.X, self.Y
+        Result = self.TestFunction(np.add, X, Y, Seed = 1)
+        self.assertIsInstance(Result, MeasuredValue)
+        Expected = X + Y
+        self.assertAlmostEqual(Result.Value, Expected.Value, delta = 0.005)
+        self.assertAlmostEqual(Result.SE, Expected.SE, delta = 0.002)
+        Result = self.TestFunction(lambda x, y: x * y - 1.0, X, 2.5, Seed = 2)
+        self.assertAlmostEqual(Result.Value, 4.0, delta = 0.005)
+        self.assertAlmostEqual(Result.SE, 0.25, delta = 0.002)
+        Result = self.TestFunction(np.subtract, X, X, Seed = 3)
+        self.assertEqual(Result.Value, 0)
+        self.assertEqual(Result.SE, 0)
+        Result = self.TestFunction(np.hypot, 3.0, 4.0, Samples = 10)
+        self.assertEqual(Result.Value, 5.0)
+        self.assertEqual(Result.SE, 0)
+        #nonlinear: E(x^2) = x^2 + s^2, Var(x^2) = 4 x^2 s^2 + 2 s^4
+        Value = MeasuredValue(1.0, 0.5)
+        Result = self.TestFunction(np.square, Value, Seed = 4)
+        self.assertAlmostEqual(Result.Value, 1.25, delta = 0.01)
+        self.assertAlmostEqual(Result.SE, math.sqrt(1.125), delta = 0.01)
+        Result = self.TestFunction(np.sqrt, self.Data, Seed = 5)
+        self.assertIsInstance(Result, MeasuredArray)
+        self.assertTupleEqual(Result.shape, (20, ))
+        Expected = np.sqrt(self.Data)
+        self.assertTrue(np.allclose(Result.Value, Expected.Value,
+                                                                atol = 1E-3))
+        self.assertTrue(np.allclose(Result.SE, Expected.SE, atol = 5E-4))
+        Result = self.TestFunction(np.multiply, self.Data,
+                            MeasuredArray([[1.0], [2.0]], 0.01), Seed = 6)
+        self.assertTupleEqual(Result.shape, (2, 20))
+
+    def test_Distributions(self):
+        """
+        Checks the non-normal and custom distributions, and the correlated
+        arguments.
+
+        REQ-FUN-601
+        """
+        X, Y = self.X, self.Y
+        for Name in ['uniform', 'triangular']:
+            Result, Quantiles = self.TestFunction(lambda x: x, X, Seed = 7,
+                    Distributions = [Name], Quantiles = [0.0001, 0.9999])
+            self.assertAlmostEqual(Result.Value, 2.0, delta = 0.002)
+            self.assertAlmostEqual(Result.SE, 0.1, delta = 0.002)
+            HalfWidth = 0.1 * math.sqrt(3.0 if Name == 'uniform' else 6.0)
+            self.assertTrue(np.allclose(Quantiles, [2.0 - HalfWidth,
+                                        2.0 + HalfWidth], atol = 0.01))
+        Sampler = lambda Generator, Size: Generator.choice([-1.0, 1.0], Size)
+        Result = self.TestFunction(np.add, X, Y, Seed = 8,
+                                        Distributions = [Sampler, 'normal'])
+        self.assertAlmostEqual(Result.SE, Y.SE * math.sqrt(1.25),
+                                                                delta = 0.002)
+        for Rho in [-0.9, 0.0, 0.5]:
+            Result = self.TestFunction(np.add, X, Y, Seed = 9,
+                                    Correlation = [[1.0, Rho], [Rho, 1.0]])
+            Expected = math.sqrt(0.01 + 0.04 + 2 * Rho * 0.02)
+            self.assertAlmostEqual(Result.SE, Expected, delta = 0.003)
+        Result = self.TestFunction(np.add, self.Data, self.Data, Seed = 10,
+                                                Correlation = np.eye(2))
+        self.assertTrue(np.allclose(Result.SE, 0.1, atol = 0.002))
+
+    def test_Chunks(self):
+        """
+        Checks the reproducibility with the same seed, the independence of
+        the chunk size and of the number of the workers, and the quantiles.
+
+        REQ-FUN-602
+        """
+        Function = self.TestFunction
+        Data = self.Data
+        First = Function(np.sqrt, Data, Seed = 11, Samples = 20000)
+        Second = Function(np.sqrt, Data, Seed = 11, Samples = 20000)
+        self.assertListEqual(First.Value.tolist(), Second.Value.tolist())
+        self.assertListEqual(First.SE.tolist(), Second.SE.tolist())
+        Third = Function(np.sqrt, Data, Seed = 12, Samples = 20000)
+        self.assertFalse(np.array_equal(First.Value, Third.Value))
+        Seed = np.random.SeedSequence(11)
+        for _ in range(2):
+            Result = Function(np.sqrt, Data, Seed = Seed, Samples = 20000)
+            self.assertListEqual(First.Value.tolist(), Result.Value.tolist())
+            self.assertListEqual(First.SE.tolist(), Result.SE.tolist())
+        self.assertEqual(Seed.n_children_spawned, 0)
+        #the children spawned by the caller are not reused
+        Child = Seed.spawn(1)[0]
+        Result = Function(np.sqrt, Data, Seed = Seed, Samples = 20000)
+        self.assertFalse(np.array_equal(First.Value, Result.Value))
+        self.assertEqual(Seed.n_children_spawned, 1)
+        Reference = Function(np.sqrt, Data, Seed = Seed, Samples = 20000)
+        self.assertListEqual(Reference.Value.tolist(), Result.Value.tolist())
+        Result = Function(np.sqrt, Data, Seed = Child, Samples = 20000)
+        self.assertFalse(np.array_equal(Reference.Value, Result.Value))
+        self.assertFalse(np.array_equal(First.Value, Result.Value))
+        for ChunkSize in [1000, 7777, 50000]:
+            Result = Function(np.sqrt, Data, Seed = 11, Samples = 20000,
+                                                    ChunkSize = ChunkSize)
+            self.assertTrue(np.allclose(Result.Value, First.Value,
+                                                                atol = 2E-3))
+            self.assertTrue(np.allclose(Result.SE, First.SE, atol = 2E-3))
+        Reference, Quantiles = Function(np.sqrt, Data, Seed = 13,
+                    Samples = 40000, ChunkSize = 3000, Quantiles = [0.5])
+        Result, Parallel = Function(np.sqrt, Data, Seed = 13, Samples = 40000,
+                        ChunkSize = 3000, Quantiles = [0.5], Workers = 2)
+        self.assertTrue(np.allclose(Result.Value, Reference.Value,
+                                                    rtol = 0, atol = 1E-12))
+        self.assertTrue(np.allclose(Result.SE, Reference.SE,
+                                                    rtol = 0, atol = 1E-12))
+        self.assertListEqual(Parallel.tolist(), Quantiles.tolist())
+        Probabilities = [0.025, 0.16, 0.5, 0.84, 0.975]
+        Result, Quantiles = Function(np.add, self.X, self.Y, Seed = 14,
+                                                Quantiles = Probabilities)
+        self.assertTupleEqual(Quantiles.shape, (5, ))
+        Expected = 5.0 + Result.SE * np.array([-1.96, -0.9945, 0.0, 0.9945,
+                                                                        1.96])
+        self.assertTrue(np.allclose(Quantiles, Expected, atol = 0.01))
+        Result, Quantiles = Function(np.exp, Data, Seed = 15,
+                                        Quantiles = Probabilities)
+        self.assertTupleEqual(Quantiles.shape, (5, 20))
+        Expected = np.exp(np.add.outer(0.05 * np.array([-1.96, -0.9945, 0.0,
+                                        0.9945, 1.96]), Data.Value))
+        self.assertTrue(np.allclose(Quantiles, Expected, rtol = 0.005))
+        #large shape, small chunks: the histogram range of the pilot samples
+        Large = MeasuredArray(np.zeros(5000), 1.0E-3)
+        Result, Quantiles = Function(lambda X: X, Large, Samples = 2000,
+                    ChunkSize = 2, Seed = 16, Quantiles = [0.025, 0.975])
+        self.assertTupleEqual(Quantiles.shape, (2, 5000))
+        self.assertTrue(np.allclose(Quantiles.mean(axis = 1),
+                                    [-1.96E-3, 1.96E-3], rtol = 0.02))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-600
+        """
+        Function = self.TestFunction
+        X = self.X
+        for Item in [1, 'a', None, X]:
+            with self.assertRaises(TypeError):
+                Function(Item, X)
+        for Item in ['1', None, {1 : 2}, int, True, MeasuredValue]:
+            with self.assertRaises(TypeError):
+                Function(np.sqrt, Item)
+        for Item in [1.0, '1', True, [1]]:
+            with self.assertRaises(TypeError):
+                Function(np.sqrt, X, Samples = Item)
+            with self.assertRaises(TypeError):
+                Function(np.sqrt, X, ChunkSize = Item)
+            with self.assertRaises(TypeError):
+                Function(np.sqrt, X, Workers = Item)
+            with self.assertRaises(TypeError):
+                Function(np.sqrt, X, Seed = Item)
+        for Item in ['normal', [1], (None, ), {'normal'}]:
+            with self.assertRaises(TypeError):
+                Function(np.sqrt, X, Distributions = Item)
+        for Item in ['a', [['a']], MeasuredArray([1.0], 0.1)]:
+            with self.assertRaises(TypeError):
+                Function(np.sqrt, X, Correlation = Item)
+        for Item in [0.5, 'a', [1, 2], [[0.5]]]:
+            with self.assertRaises(TypeError):
+                Function(np.sqrt, X, Quantiles = Item)
+        with self.assertRaises(TypeError):
+            Function(lambda x: x.astype(str), X, Samples = 10)
+        with self.assertRaises(TypeError):
+            Function(lambda x: np.sqrt(x), X, Samples = 10, Workers = 2)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments, the shape change and
+        the non-finite function values result in ValueError.
+
+        REQ-AWM-601
+        """
+        Function = self.TestFunction
+        X, Y = self.X, self.Y
+        with self.assertRaises(ValueError):
+            Function(np.sqrt)
+        with self.assertRaises(ValueError):
+            Function(np.add, [1.0, 2.0], [1.0, 2.0, 3.0])
+        for Name, Value in [('Samples', 1), ('ChunkSize', 0), ('Workers', 0),
+                                                            ('Seed', -1)]:
+            with self.assertRaises(ValueError):
+                Function(np.sqrt, X, **{Name : Value})
+        for Item in [['normal'], ['normal'] * 3, ['gauss', 'normal']]:
+            with self.assertRaises(ValueError):
+                Function(np.add, X, Y, Distributions = Item)
+        for Item in [[[1.0]], [[1.0, 0.5], [0.4, 1.0]],
+                        [[1.0, 1.5], [1.5, 1.0]], [[0.9, 0.5], [0.5, 0.9]],
+                        [[1.0, 1.0], [1.0, 1.0]]]:
+            with self.assertRaises(ValueError):
+                Function(np.add, X, Y, Correlation = Item)
+        with self.assertRaises(ValueError):
+            Function(np.add, X, Y, Correlation = np.eye(2),
+                                    Distributions = ['uniform', 'normal'])
+        for Item in [[0.0, 0.5], [0.5, 1.0], [-0.1]]:
+            with self.assertRaises(ValueError):
+                Function(np.sqrt, X, Quantiles = Item)
+        Size = test_module.QUANTILE_MAX_COUNTS // test_module.QUANTILE_BINS
+        with self.assertRaises(ValueError):
+            Function(np.sqrt, MeasuredArray(np.ones(Size + 1), 0.1),
+                                            Samples = 10, Quantiles = [0.5])
+        with self.assertRaises(ValueError):
+            Function(np.sum, self.Data, Samples = 10)
+        with self.assertRaises(ValueError) as Context:
+            Function(np.log, MeasuredValue(0.1, 0.1), Samples = 1000,
+                                                    ChunkSize = 100, Seed = 1)
+        self.assertIn('of 1000', str(Context.exception))
+
+class Test_propagateAdaptive(unittest.TestCase):
+    """
+    Test cases for the functions phyqus_lib.monte_carlo.nonlinearity() and
+    phyqus_lib.monte_carlo.propagateAdaptive().
+
+    Implements tests: TEST-T-610.
+    Covers the requirements REQ-FUN-610, REQ-FUN-611, REQ-AWM-610 and
+    REQ-AWM-611.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.propagateAdaptive)
+        cls.X = MeasuredValue(2.0, 0.1)
+        cls.Y = MeasuredArray([3.0, 0.3, 30.0, 0.5], 0.1)
+
+    def test_nonlinearity(self):
+        """
+        Checks the nonlinearity indicator against the analytic values.
+
+        REQ-FUN-610
+        """
+        Function = test_module.nonlinearity
+        X = self.X
+        Result = Function(np.add, X, MeasuredValue(1.0, 0.2))
+        self.assertIsInstance(Result, float)
+        self.assertLess(Result, 1E-12)
+        #x^2: second difference 2 s^2, linear SE 2 |x| s
+        Result = Function(np.square, MeasuredArray([1.0, -2.0, 0.0], 0.1))
+        self.assertIsInstance(Result, np.ndarray)
+        self.assertTrue(np.allclose(Result[:2], [0.05, 0.025]))
+        self.assertEqual(Result[2], np.inf)
+        Result = Function(np.divide, X, self.Y)
+        self.assertTupleEqual(Result.shape, (4, ))
+        Expected = [abs(2 / (Y + 0.1) + 2 / (Y - 0.1) - 4 / Y)
+                            / (2 * math.hypot(0.1 / Y, 0.2 / Y**2))
+                                                    for Y in self.Y.Value]
+        self.assertTrue(np.allclose(Result, Expected))
+        self.assertGreater(Result[1], 0.1)
+        self.assertLess(Result[0], 0.1)
+        self.assertEqual(Function(np.subtract, X, X), 0)
+        self.assertEqual(Function(np.divide, 1.0, MeasuredValue(0.1, 0.1)),
+                                                                        np.inf)
+
+    def test_propagateAdaptive(self):
+        """
+        Checks that only the flagged elements are propagated by the Monte
+        Carlo method, and the rest - by the linear approximation.
+
+        REQ-FUN-611
+        """
+        X, Y = self.X, self.Y
+        Linear = MeasuredArray(X.Value, X.SE) / Y
+        Result, Flags = self.TestFunction(np.divide, X, Y, Seed = 1,
+                                                Samples = 20000, Mask = True)
+        self.assertIsInstance(Result, MeasuredArray)
+        self.assertListEqual(Flags.tolist(), [False, True, False, True])
+        Reference = test_module.monteCarlo(np.divide, X,
+                        MeasuredArray([0.3, 0.5], 0.1), Seed = 1,
+                                                            Samples = 20000)
+        for Index in [0, 2]:
+            self.assertAlmostEqual(Result.Value[Index], Linear.Value[Index],
+                                                                places = 12)
+            self.assertAlmostEqual(Result.SE[Index], Linear.SE[Index],
+                                                                places = 9)
+        self.assertListEqual(Result.Value[Flags].tolist(),
+                                                    Reference.Value.tolist())
+        self.assertListEqual(Result.SE[Flags].tolist(),
+                                                    Reference.SE.tolist())
+        Shapes = list()
+        def Recorder(Left, Right):
+            Shapes.append(np.shape(Right))
+            return Left / Right
+        self.TestFunction(Recorder, X, Y, Seed = 2, Samples = 1000)
+        self.assertIn((1000, 2), Shapes)
+        self.assertFalse(any(Shape[-1:] == (4, ) and Shape[0] == 1000
+                                                    for Shape in Shapes))
+        Result, Flags = self.TestFunction(np.divide, X, Y, Threshold = 1E6,
+                                                                Mask = True)
+        self.assertFalse(np.any(Flags))
+        Result, Flags = self.TestFunction(np.divide, X, Y, Threshold = 1E-9,
+                                        Mask = True, Samples = 1000, Seed = 3)
+        self.assertTrue(np.all(Flags))
+        Result = self.TestFunction(np.divide, X, MeasuredValue(3.0, 0.1))
+        self.assertIsInstance(Result, MeasuredValue)
+        Expected = X / MeasuredValue(3.0, 0.1)
+        self.assertAlmostEqual(Result.Value, Expected.Value, places = 12)
+        self.assertAlmostEqual(Result.SE, Expected.SE, places = 9)
+        Result, Flag = self.TestFunction(np.square, MeasuredValue(0.0, 0.1),
+                                        Seed = 4, Samples = 40000, Mask = True)
+        self.assertTrue(Flag)
+        self.assertAlmostEqual(Result.Value, 0.01, delta = 0.0005)
+        self.assertAlmostEqual(Result.SE, 0.01 * math.sqrt(2), delta = 0.0005)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-610
+        """
+        X, Y = self.X, self.Y
+        for Function in [test_module.nonlinearity, self.TestFunction]:
+            for Item in [1, 'a', None, X]:
+                with self.assertRaises(TypeError):
+                    Function(Item, X)
+            for Item in ['1', None, {1 : 2}, int, True, MeasuredValue]:
+                with self.assertRaises(TypeError):
+                    Function(np.sqrt, Item)
+            with self.assertRaises(TypeError):
+                Function(lambda x: np.full(np.shape(x), 'a'), X)
+        for Item in ['1', None, True, [0.1]]:
+            with self.assertRaises(TypeError):
+                self.TestFunction(np.divide, X, Y, Threshold = Item)
+        for Item in [1, '1', None, [True]]:
+            with self.assertRaises(TypeError):
+                self.TestFunction(np.divide, X, Y, Mask = Item)
+        for Name in ['Samples', 'ChunkSize', 'Workers', 'Seed']:
+            with self.assertRaises(TypeError):
+                self.TestFunction(np.divide, X, Y, **{Name : 1.5})
+            with self.assertRaises(TypeError): #no flagged elements
+                self.TestFunction(np.add, X, Y, **{Name : 1.5})
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-611
+        """
+        X, Y = self.X, self.Y
+        for Function in [test_module.nonlinearity, self.TestFunction]:
+            with self.assertRaises(ValueError):
+                Function(np.sqrt)
+            with self.assertRaises(ValueError):
+                Function(np.add, [1.0, 2.0], [1.0, 2.0, 3.0])
+            with self.assertRaises(ValueError):
+                Function(np.sum, MeasuredArray([1.0, 2.0], 0.1))
+        for Item in [0, -0.1]:
+            with self.assertRaises(ValueError):
+                self.TestFunction(np.divide, X, Y, Threshold = Item)
+        for Name, Value in [('Samples', 1), ('ChunkSize', 0), ('Workers', 0),
+                                                            ('Seed', -1)]:
+            with self.assertRaises(ValueError):
+                self.TestFunction(np.divide, X, Y, **{Name : Value})
+            with self.assertRaises(ValueError): #no flagged elements
+                self.TestFunction(np.add, X, Y, **{Name : Value})
+        with self.assertRaises(ValueError):
+            self.TestFunction(np.log, MeasuredValue(0.1, 0.1), Samples = 1000,
+                                                                    Seed = 1)
+
+class Test_bootstrap(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.monte_carlo.bootstrap().
+
+    Implements tests: TEST-T-620.
+    Covers the requirements REQ-FUN-620, REQ-FUN-621, REQ-AWM-620 and
+    REQ-AWM-621.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.bootstrap)
+        Generator = np.random.default_rng(2026)
+        cls.X = Generator.normal(10.0, 2.0, 1000)
+        cls.Y = Generator.normal(5.0, 1.0, 500)
+        cls.Z = Generator.normal(0.0, 1.0, (400, 3))
+        cls.Mean = staticmethod(lambda Samples: Samples.mean(axis = 1))
+
+    def test_Statistics(self):
+        """
+        Checks the values and the uncertainties of the mean, the median, the
+        ratio of the means and of the multi-channel and paired statistics.
+
+        REQ-FUN-620
+        """
+        X, Y = self.X, self.Y
+        Result = self.TestFunction(self.Mean, X, Seed = 1)
+        self.assertIsInstance(Result, MeasuredValue)
+        self.assertEqual(Result.Value, X.mean())
+        Expected = X.std() / math.sqrt(len(X))
+        self.assertAlmostEqual(Result.SE, Expected, delta = 0.05 * Expected)
+        Result = self.TestFunction(median, X, Seed = 2)
+        self.assertEqual(Result.Value, np.median(X))
+        Expected = 1.2533 * 2.0 / math.sqrt(len(X))
+        self.assertAlmostEqual(Result.SE, Expected, delta = 0.15 * Expected)
+        Result = self.TestFunction(lambda A, B: A.mean(1) / B.mean(1), X, Y,
+                                                                    Seed = 3)
+        self.assertEqual(Result.Value, X.mean() / Y.mean())
+        Ratio = X.mean() / Y.mean()
+        Expected = Ratio * math.hypot(X.std() / X.mean() / math.sqrt(len(X)),
+                                    Y.std() / Y.mean() / math.sqrt(len(Y)))
+        self.assertAlmostEqual(Result.SE, Expected, delta = 0.05 * Expected)
+        Result = self.TestFunction(self.Mean, self.Z, Seed = 4)
+        self.assertIsInstance(Result, MeasuredArray)
+        self.assertTupleEqual(Result.shape, (3, ))
+        self.assertTrue(np.allclose(Result.Value, self.Z.mean(axis = 0)))
+        Expected = self.Z.std(axis = 0) / math.sqrt(400)
+        self.assertTrue(np.allclose(Result.SE, Expected, rtol = 0.1))
+        #paired difference of the identical samples has no spread
+        Difference = lambda A, B: (A - B).mean(axis = 1)
+        Result = self.TestFunction(Difference, X, X.copy(), Seed = 5,
+                                                                Paired = True)
+        self.assertEqual(Result.SE, 0)
+        Result = self.TestFunction(Difference, X, X.copy(), Seed = 5)
+        Expected = X.std() * math.sqrt(2 / len(X))
+        self.assertAlmostEqual(Result.SE, Expected, delta = 0.1 * Expected)
+        Result, Quantiles = self.TestFunction(self.Mean, X, Seed = 6,
+                                                Quantiles = [0.025, 0.975])
+        Expected = X.mean() + np.array([-1.96, 1.96]) * Result.SE
+        self.assertTrue(np.allclose(Quantiles, Expected,
+                                                    atol = 0.2 * Result.SE))
+
+    def test_Blocks(self):
+        """
+        Checks the block evaluation, the reproducibility and the parallel
+        evaluation.
+
+        REQ-FUN-621
+        """
+        X = self.X
+        Sizes = list()
+        def Recorder(Samples):
+            Sizes.append(Samples.shape)
+            return Samples.mean(axis = 1)
+        First = self.TestFunction(Recorder, X, Resamples = 1000,
+                                                BlockSize = 300, Seed = 7)
+        self.assertListEqual(Sizes, [(1, 1000), (300, 1000), (300, 1000),
+                                                (300, 1000), (100, 1000)])
+        Second = self.TestFunction(self.Mean, X, Resamples = 1000,
+                                                BlockSize = 300, Seed = 7)
+        self.assertEqual(First.SE, Second.SE)
+        Third = self.TestFunction(self.Mean, X, Resamples = 1000,
+                                                BlockSize = 300, Seed = 8)
+        self.assertNotEqual(First.SE, Third.SE)
+        Seed = np.random.SeedSequence(7)
+        for _ in range(2):
+            Result = self.TestFunction(self.Mean, X, Resamples = 1000,
+                                                BlockSize = 300, Seed = Seed)
+            self.assertEqual(First.SE, Result.SE)
+        Sizes.clear()
+        self.TestFunction(Recorder, self.Z, Resamples = 100, Seed = 9)
+        self.assertEqual(Sizes[1][0], 100)
+        Reference, Quantiles = self.TestFunction(median, X, Resamples = 2000,
+                        BlockSize = 100, Seed = 10, Quantiles = [0.5])
+        Result, Parallel = self.TestFunction(median, X, Resamples = 2000,
+            BlockSize = 100, Seed = 10, Quantiles = [0.5], Workers = 2)
+        self.assertEqual(Result.Value, Reference.Value)
+        self.assertAlmostEqual(Result.SE, Reference.SE, places = 12)
+        self.assertListEqual(Parallel.tolist(), Quantiles.tolist())
+        #large raw samples: 2 resamples per default block, the histogram
+        #+ range is defined by the pilot resamples
+        Large = np.random.default_rng(11).normal(1000.0, 50.0, 2 ** 19)
+        Result, Quantiles = self.TestFunction(self.Mean, Large,
+                        Resamples = 200, Seed = 12, Quantiles = [0.025, 0.975])
+        Expected = 50.0 / math.sqrt(len(Large))
+        self.assertAlmostEqual(Result.SE, Expected, delta = 0.2 * Expected)
+        self.assertTrue(np.allclose(Quantiles, Large.mean() + np.array(
+                        [-1.96, 1.96]) * Expected, rtol = 0,
+                                                    atol = 0.5 * Expected))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-620
+        """
+        Function = self.TestFunction
+        X = self.X
+        for Item in [1, 'a', None, X]:
+            with self.assertRaises(TypeError):
+                Function(Item, X)
+        for Item in ['1', None, {1 : 2}, int, [True, False],
+                        MeasuredValue(1.0, 0.1), MeasuredArray([1.0, 2.0]),
+                                                            ['a', 'b']]:
+            with self.assertRaises(TypeError):
+                Function(self.Mean, Item)
+        for Item in [1.0, '1', True, [1]]:
+            for Name in ['Resamples', 'BlockSize', 'Workers', 'Seed']:
+                with self.assertRaises(TypeError):
+                    Function(self.Mean, X, **{Name : Item})
+        for Item in [1, 'a', None]:
+            with self.assertRaises(TypeError):
+                Function(self.Mean, X, Paired = Item)
+        for Item in [0.5, 'a', [1, 2]]:
+            with self.assertRaises(TypeError):
+                Function(self.Mean, X, Quantiles = Item)
+        with self.assertRaises(TypeError):
+            Function(lambda A: A.astype(str), X)
+        with self.assertRaises(TypeError):
+            Function(self.Mean, X, Resamples = 10, Workers = 2)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments, the shape of the
+        statistic and the non-finite statistic result in ValueError.
+
+        REQ-AWM-621
+        """
+        Function = self.TestFunction
+        X = self.X
+        with self.assertRaises(ValueError):
+            Function(self.Mean)
+        for Item in [1.0, [1.0], np.ones((1, 3))]:
+            with self.assertRaises(ValueError):
+                Function(self.Mean, Item)
+        with self.assertRaises(ValueError):
+            Function(lambda A, B: A.mean(1) - B.mean(1), X, self.Y,
+                                                                Paired = True)
+        for Name, Value in [('Resamples', 1), ('BlockSize', 0),
+                                            ('Workers', 0), ('Seed', -1)]:
+            with self.assertRaises(ValueError):
+                Function(self.Mean, X, **{Name : Value})
+        with self.assertRaises(ValueError):
+            Function(self.Mean, X, Quantiles = [0.5, 1.0])
+        for Item in [np.mean, lambda A: A.mean(axis = 1)[0]]:
+            with self.assertRaises(ValueError):
+                Function(Item, X, Resamples = 10)
+        with self.assertRaises(ValueError):
+            Function(lambda A: 1 / A.mean(axis = 1), [1.0, -1.0])
+        with self.assertRaises(ValueError) as Context:
+            Function(lambda A: 1 / np.ptp(A, axis = 1), [1.0, 2.0, 3.0],
+                                                    Resamples = 100, Seed = 1)
+        self.assertIn('of 100', str(Context.exception))
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_monteCarlo)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_propagateAdaptive)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_bootstrap)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.monte_carlo module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
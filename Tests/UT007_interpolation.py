@@ -0,0 +1,283 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT007_interpolation
+
+Set of unit tests on the module phyqus_lib.interpolation.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import math
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+import phyqus_lib.interpolation as test_module
+
+#classes
+
+#+ test cases
+
+class Test_CalibrationTable(unittest.TestCase):
+    """
+    Test cases for the class phyqus_lib.interpolation.CalibrationTable.
+
+    Implements tests: TEST-T-700.
+    Covers the requirements REQ-FUN-700, REQ-FUN-701, REQ-FUN-702,
+    REQ-FUN-703, REQ-AWM-700 and REQ-AWM-701.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = test_module.CalibrationTable
+        Generator = np.random.default_rng(2026)
+        cls.X = np.sort(Generator.uniform(0.0, 10.0, 12))
+        cls.Y = np.cumsum(Generator.normal(0.0, 1.0, 12))
+        cls.SX = Generator.uniform(0.0, 0.01, 12)
+        cls.SY = Generator.uniform(0.0, 0.05, 12)
+        cls.Input = Generator.uniform(cls.X[0], cls.X[-1], 200)
+
+    def numericalSE(self, Size, Method, Error):
+        """
+        Reference uncertainty of the interpolation of the first Size points
+        of the table by the central differences over all table entries and
+        the input.
+        """
+        def evaluate(X, Y, Data):
+            Table = self.TestClass(X, Y, Method = Method, Extrapolate = True)
+            return Table(Data).Value
+        X, Y, Data = self.X[:Size], self.Y[:Size], self.Input
+        Data = Data[Data <= X[-1]]
+        Step = 1.0E-6
+        Variance = ((evaluate(X, Y, Data + Step) - evaluate(X, Y, Data - Step))
+                                                    / (2 * Step) * Error)**2
+        for Index in range(Size):
+            for Table, SE in ((X, self.SX), (Y, self.SY)):
+                Plus = Table.copy()
+                Plus[Index] += Step
+                Minus = Table.copy()
+                Minus[Index] -= Step
+                if Table is X:
+                    Delta = evaluate(Plus, Y, Data) - evaluate(Minus, Y, Data)
+                else:
+                    Delta = evaluate(X, Plus, Data) - evaluate(X, Minus, Data)
+                Variance += (Delta / (2 * Step) * SE[Index])**2
+        return Data, np.sqrt(Variance)
+
+    def test_init(self):
+        """
+        Checks the instantiation, the sorting of the table and the read-only
+        properties.
+
+        REQ-FUN-700
+        """
+        Order = np.arange(12)[::-1]
+        Table = self.TestClass(MeasuredArray(self.X[Order], self.SX[Order]),
+                                                list(self.Y[Order]))
+        self.assertEqual(len(Table), 12)
+        self.assertEqual(Table.Method, 'linear')
+        self.assertFalse(Table.Extrapolate)
+        self.assertIsInstance(Table.X, MeasuredArray)
+        self.assertIsInstance(Table.Y, MeasuredArray)
+        self.assertListEqual(Table.X.Value.tolist(), self.X.tolist())
+        self.assertListEqual(Table.X.SE.tolist(), self.SX.tolist())
+        self.assertListEqual(Table.Y.Value.tolist(), self.Y.tolist())
+        self.assertListEqual(Table.Y.SE.tolist(), [0.0] * 12)
+        Table = self.TestClass([MeasuredValue(1.0, 0.1), 2],
+                        [3.0, MeasuredValue(4.0, 0.2)], Method = 'monotone',
+                                                        Extrapolate = True)
+        self.assertEqual(len(Table), 2)
+        self.assertEqual(Table.Method, 'monotone')
+        self.assertTrue(Table.Extrapolate)
+        self.assertListEqual(Table.X.SE.tolist(), [0.1, 0.0])
+        self.assertListEqual(Table.Y.SE.tolist(), [0.0, 0.2])
+        for Name in ['X', 'Y', 'Method', 'Extrapolate']:
+            with self.assertRaises(AttributeError):
+                setattr(Table, Name, 1)
+
+    def test_linear(self):
+        """
+        Checks the values and the uncertainties of the linear interpolation.
+
+        REQ-FUN-701
+        """
+        Table = self.TestClass(MeasuredArray([1.0, 2.0, 4.0], [0.1, 0.0, 0.2]),
+                                    MeasuredArray([0.0, 1.0, 2.0], 0.1))
+        Result = Table(MeasuredValue(1.5, 0.2))
+        self.assertIsInstance(Result, MeasuredValue)
+        self.assertAlmostEqual(Result.Value, 0.5)
+        Expected = math.sqrt(0.2**2 + 2 * 0.05**2 + 0.05**2)
+        self.assertAlmostEqual(Result.SE, Expected)
+        Result = Table(3)
+        self.assertAlmostEqual(Result.Value, 1.5)
+        self.assertAlmostEqual(Result.SE, math.sqrt(0.005 + 0.0025))
+        Result = Table([[1.0, 2.0], [4.0, 3.0]])
+        self.assertIsInstance(Result, MeasuredArray)
+        self.assertTupleEqual(Result.shape, (2, 2))
+        self.assertListEqual(Result.Value.tolist(), [[0.0, 1.0], [2.0, 1.5]])
+        for Size in [2, 3, 12]:
+            Table = self.TestClass(MeasuredArray(self.X[:Size],
+                    self.SX[:Size]), MeasuredArray(self.Y[:Size],
+                                                            self.SY[:Size]))
+            Data, Expected = self.numericalSE(Size, 'linear', 0.02)
+            Result = Table(MeasuredArray(Data, 0.02))
+            self.assertTrue(np.allclose(Result.Value, np.interp(Data,
+                                self.X[:Size], self.Y[:Size]), rtol = 1.0E-12,
+                                                            atol = 1.0E-12))
+            self.assertTrue(np.allclose(Result.SE, Expected, rtol = 1.0E-6))
+
+    def test_monotone(self):
+        """
+        Checks the values and the uncertainties of the monotone cubic
+        interpolation.
+
+        REQ-FUN-702
+        """
+        X = np.linspace(0.0, 1.0, 8)
+        Y = np.array([0.0, 0.0, 0.1, 0.5, 2.0, 2.0, 2.1, 5.0])
+        Table = self.TestClass(X, Y, Method = 'monotone')
+        Data = np.linspace(0.0, 1.0, 10001)
+        Result = Table(Data)
+        self.assertTrue(np.all(np.diff(Result.Value) >= -1.0E-15))
+        self.assertTrue(np.all(Result.Value >= 0.0))
+        self.assertTrue(np.all(Result.Value <= 5.0))
+        self.assertListEqual(Table(X).Value.tolist(), Y.tolist())
+        self.assertListEqual(Result.SE.tolist(), [0.0] * 10001)
+        #flat segments stay flat, linear data is reproduced exactly
+        Flat = Result.Value[(Data >= X[4]) & (Data <= X[5])]
+        self.assertTrue(np.allclose(Flat, 2.0, rtol = 1.0E-15))
+        Table = self.TestClass(X, 3.0 * X - 1.0, Method = 'monotone')
+        self.assertTrue(np.allclose(Table(Data).Value, 3.0 * Data - 1.0,
+                                        rtol = 1.0E-12, atol = 1.0E-12))
+        for Size in [2, 3, 4, 5, 12]:
+            Table = self.TestClass(MeasuredArray(self.X[:Size],
+                    self.SX[:Size]), MeasuredArray(self.Y[:Size],
+                                        self.SY[:Size]), Method = 'monotone')
+            Data, Expected = self.numericalSE(Size, 'monotone', 0.02)
+            Result = Table(MeasuredArray(Data, 0.02))
+            self.assertTrue(np.allclose(Result.SE, Expected, rtol = 1.0E-6))
+            Linear = Table(Data, Method = 'linear')
+            Check = self.TestClass(self.X[:Size], self.Y[:Size])(Data)
+            self.assertListEqual(Linear.Value.tolist(), Check.Value.tolist())
+
+    def test_lookup(self):
+        """
+        Checks the table points, the extrapolation and the chunked evaluation
+        of the large input.
+
+        REQ-FUN-703
+        """
+        Table = self.TestClass(self.X, self.Y, Extrapolate = True)
+        self.assertListEqual(Table(self.X).Value.tolist(), self.Y.tolist())
+        Slope = (self.Y[1] - self.Y[0]) / (self.X[1] - self.X[0])
+        Result = Table(self.X[0] - 1.0)
+        self.assertAlmostEqual(Result.Value, self.Y[0] - Slope)
+        Slope = (self.Y[-1] - self.Y[-2]) / (self.X[-1] - self.X[-2])
+        Result = Table(self.X[-1] + 2.0)
+        self.assertAlmostEqual(Result.Value, self.Y[-1] + 2 * Slope)
+        Data = np.random.default_rng(1).uniform(self.X[0], self.X[-1],
+                                    3 * test_module.CHUNK_ELEMENTS + 17)
+        for Method in test_module.INTERPOLATION_METHODS:
+            Table = self.TestClass(MeasuredArray(self.X, self.SX),
+                        MeasuredArray(self.Y, self.SY), Method = Method)
+            Result = Table(MeasuredArray(Data, 0.01))
+            self.assertTupleEqual(Result.shape, Data.shape)
+            Part = Table(MeasuredArray(Data[-100:], 0.01))
+            self.assertListEqual(Result.Value[-100:].tolist(),
+                                                    Part.Value.tolist())
+            self.assertListEqual(Result.SE[-100:].tolist(), Part.SE.tolist())
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-700
+        """
+        for Item in ['1', b'1', {1 : 2}, [1, '2'], None, True]:
+            with self.assertRaises(TypeError):
+                self.TestClass(Item, [1.0, 2.0])
+            with self.assertRaises(TypeError):
+                self.TestClass([1.0, 2.0], Item)
+        for Item in [1, 1.0, None, ['linear'], True]:
+            with self.assertRaises(TypeError):
+                self.TestClass([1.0, 2.0], [1.0, 2.0], Method = Item)
+        for Item in [1, 1.0, None, 'True']:
+            with self.assertRaises(TypeError):
+                self.TestClass([1.0, 2.0], [1.0, 2.0], Extrapolate = Item)
+        Table = self.TestClass([1.0, 2.0], [1.0, 2.0])
+        for Item in ['1', b'1', {1 : 2}, [1, '2'], None, True]:
+            with self.assertRaises(TypeError):
+                Table(Item)
+        for Item in [1, 1.0, ['linear'], True]:
+            with self.assertRaises(TypeError):
+                Table.interpolate(1.5, Method = Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-701
+        """
+        for X, Y in [([1.0], [1.0]), ([1.0, 2.0], [1.0, 2.0, 3.0]),
+                        ([[1.0, 2.0]], [[1.0, 2.0]]), (1.0, 1.0),
+                        ([1.0, 2.0, 1.0], [1.0, 2.0, 3.0]),
+                        ([1.0, math.nan], [1.0, 2.0]),
+                        ([1.0, 2.0], [1.0, math.inf]),
+                        ([1.0, 2.0], MeasuredArray([1.0, 2.0], math.inf))]:
+            with self.assertRaises(ValueError):
+                self.TestClass(X, Y)
+        with self.assertRaises(ValueError):
+            self.TestClass([1.0, 2.0], [1.0, 2.0], Method = 'cubic')
+        Table = self.TestClass([1.0, 2.0], [1.0, 2.0])
+        with self.assertRaises(ValueError):
+            Table(1.5, Method = 'nearest')
+        for Item in [0.5, [1.0, 2.5], math.nan, [1.5, math.inf]]:
+            with self.assertRaises(ValueError):
+                Table(Item)
+        with self.assertRaises(ValueError) as Context:
+            Table([0.0, 1.0, 1.5, 3.0, 4.0])
+        self.assertIn('in 3 of 5', str(Context.exception))
+        Table = self.TestClass([1.0, 2.0], [1.0, 2.0], Extrapolate = True)
+        self.assertAlmostEqual(Table(3.0).Value, 3.0)
+        with self.assertRaises(ValueError):
+            Table(MeasuredArray([1.5], math.inf))
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_CalibrationTable)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.interpolation module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -0,0 +1,369 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT008_series
+
+Set of unit tests on the module phyqus_lib.series.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import math
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+import phyqus_lib.series as test_module
+
+#classes
+
+#+ test cases
+
+class Test_convolve(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.series.convolve().
+
+    Implements tests: TEST-T-800.
+    Covers the requirements REQ-FUN-800, REQ-FUN-801, REQ-AWM-800 and
+    REQ-AWM-801.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.convolve)
+        Generator = np.random.default_rng(2026)
+        cls.X = Generator.normal(0.0, 1.0, 1000)
+        cls.SX = Generator.uniform(0.1, 1.0, 1000)
+        cls.H = Generator.normal(0.0, 1.0, 700)
+        cls.SH = Generator.uniform(0.0, 0.01, 700)
+
+    def checkConvolution(self, Size):
+        """
+        Compares the convolution of the signal with the first Size measured
+        kernel coefficients in all modes with the direct calculation.
+        """
+        X, SX, H, SH = self.X, self.SX, self.H[:Size], self.SH[:Size]
+        for Mode in test_module.CONVOLUTION_MODES:
+            for Left, Right in [((X, SX), (H, SH)), ((H, SH), (X, SX))]:
+                Result = self.TestFunction(MeasuredArray(*Left),
+                                            MeasuredArray(*Right), Mode = Mode)
+                self.assertIsInstance(Result, MeasuredArray)
+                Expected = np.convolve(Left[0], Right[0], Mode)
+                self.assertTupleEqual(Result.shape, Expected.shape)
+                self.assertTrue(np.allclose(Result.Value, Expected,
+                                            rtol = 1.0E-12, atol = 1.0E-12))
+                Expected = np.sqrt(np.convolve(Left[1]**2, Right[0]**2, Mode)
+                            + np.convolve(Left[0]**2, Right[1]**2, Mode))
+                self.assertTrue(np.allclose(Result.SE, Expected,
+                                            rtol = 1.0E-10, atol = 1.0E-12))
+
+    def test_Convolution(self):
+        """
+        Checks the values and the uncertainties of the convolution in all
+        modes with the plain and measured kernels.
+
+        REQ-FUN-800
+        """
+        Result = self.TestFunction([MeasuredValue(1.0, 0.1), 2.0, 3.0],
+                                                                [0.5, 0.5])
+        self.assertListEqual(Result.Value.tolist(), [0.5, 1.5, 2.5, 1.5])
+        self.assertTrue(np.allclose(Result.SE, [0.05, 0.05, 0.0, 0.0]))
+        Result = self.TestFunction([1.0, 2.0],
+                                    [MeasuredValue(2.0, 0.1), 1.0], 'valid')
+        self.assertListEqual(Result.Value.tolist(), [5.0])
+        self.assertAlmostEqual(Result.SE[0], 0.2)
+        Result = self.TestFunction(MeasuredArray(self.X, 0.1), [1.0], 'same')
+        self.assertListEqual(Result.Value.tolist(), self.X.tolist())
+        self.assertTrue(np.allclose(Result.SE, 0.1))
+        self.checkConvolution(5)
+        #moving average of the independent samples
+        Result = self.TestFunction(MeasuredArray(np.ones(100), 0.3),
+                                            np.full(9, 1 / 9), Mode = 'valid')
+        self.assertTrue(np.allclose(Result.Value, 1.0))
+        self.assertTrue(np.allclose(Result.SE, 0.1))
+
+    def test_FFT(self):
+        """
+        Checks the FFT-based convolution of the long kernels.
+
+        REQ-FUN-801
+        """
+        self.assertLess(test_module.DIRECT_KERNEL_SIZE, 700)
+        self.checkConvolution(700)
+        Result = self.TestFunction(np.zeros(1000), np.ones(1000))
+        self.assertTrue(np.all(Result.SE == 0))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-800
+        """
+        for Item in ['1', b'1', {1 : 2}, [1, '2'], None, True]:
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item, [1.0, 2.0])
+            with self.assertRaises(TypeError):
+                self.TestFunction([1.0, 2.0], Item)
+        for Item in [1, 1.0, None, ['full'], True]:
+            with self.assertRaises(TypeError):
+                self.TestFunction([1.0, 2.0], [1.0, 2.0], Mode = Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-801
+        """
+        for Item in [1.0, [], [[1.0, 2.0]], MeasuredValue(1.0, 0.1)]:
+            with self.assertRaises(ValueError):
+                self.TestFunction(Item, [1.0, 2.0])
+            with self.assertRaises(ValueError):
+                self.TestFunction([1.0, 2.0], Item)
+        with self.assertRaises(ValueError):
+            self.TestFunction([1.0, 2.0], [1.0, 2.0], Mode = 'circular')
+
+class Test_firFilter(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.series.firFilter().
+
+    Implements tests: TEST-T-810.
+    Covers the requirements REQ-FUN-810, REQ-FUN-811, REQ-AWM-810 and
+    REQ-AWM-811.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.firFilter)
+        Generator = np.random.default_rng(2027)
+        cls.X = Generator.normal(0.0, 1.0, 3000)
+        cls.SX = Generator.uniform(0.1, 1.0, 3000)
+        cls.H = Generator.normal(0.0, 1.0, 600)
+        cls.SH = Generator.uniform(0.0, 0.01, 600)
+
+    def test_Filter(self):
+        """
+        Checks the values and the uncertainties of the filtered signal and
+        the returned state.
+
+        REQ-FUN-810
+        """
+        for Size in [1, 7, 600]:
+            Signal = MeasuredArray(self.X, self.SX)
+            Kernel = MeasuredArray(self.H[:Size], self.SH[:Size])
+            Result, State = self.TestFunction(Signal, Kernel)
+            self.assertIsInstance(Result, MeasuredArray)
+            self.assertIsInstance(State, MeasuredArray)
+            self.assertTupleEqual(Result.shape, (3000, ))
+            self.assertListEqual(State.Value.tolist(),
+                                            self.X[3000 - Size + 1:].tolist())
+            self.assertListEqual(State.SE.tolist(),
+                                            self.SX[3000 - Size + 1:].tolist())
+            Expected = np.convolve(self.X, self.H[:Size])[:3000]
+            self.assertTrue(np.allclose(Result.Value, Expected,
+                                            rtol = 1.0E-12, atol = 1.0E-12))
+            Expected = np.sqrt(np.convolve(self.SX**2, self.H[:Size]**2)
+                            + np.convolve(self.X**2, self.SH[:Size]**2))[:3000]
+            self.assertTrue(np.allclose(Result.SE, Expected,
+                                            rtol = 1.0E-10, atol = 1.0E-12))
+        Result, State = self.TestFunction([MeasuredValue(1.0, 0.1)],
+                                                            [1.0, 1.0, 1.0])
+        self.assertListEqual(Result.Value.tolist(), [1.0])
+        self.assertListEqual(State.Value.tolist(), [0.0, 1.0])
+        self.assertListEqual(State.SE.tolist(), [0.0, 0.1])
+
+    def test_Streaming(self):
+        """
+        Checks that the chunks processed with the carried over state give the
+        same result as the entire signal.
+
+        REQ-FUN-811
+        """
+        for Size in [1, 7, 600]:
+            Kernel = MeasuredArray(self.H[:Size], self.SH[:Size])
+            Reference, _ = self.TestFunction(MeasuredArray(self.X, self.SX),
+                                                                        Kernel)
+            State = None
+            Values, Errors = [], []
+            for Chunk in np.array_split(np.arange(3000), 13):
+                Result, State = self.TestFunction(MeasuredArray(self.X[Chunk],
+                                            self.SX[Chunk]), Kernel, State)
+                Values.append(Result.Value)
+                Errors.append(Result.SE)
+            self.assertTrue(np.allclose(np.concatenate(Values),
+                        Reference.Value, rtol = 1.0E-12, atol = 1.0E-12))
+            self.assertTrue(np.allclose(np.concatenate(Errors),
+                        Reference.SE, rtol = 1.0E-10, atol = 1.0E-12))
+        #chunks shorter than the filter
+        State = None
+        Values = []
+        for Item in self.X[:50]:
+            Result, State = self.TestFunction([Item], self.H[:7], State)
+            Values.append(Result.Value[0])
+        Expected = np.convolve(self.X[:50], self.H[:7])[:50]
+        self.assertTrue(np.allclose(Values, Expected, rtol = 1.0E-12,
+                                                            atol = 1.0E-12))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-810
+        """
+        for Item in ['1', b'1', {1 : 2}, [1, '2'], None, True]:
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item, [1.0, 2.0])
+            with self.assertRaises(TypeError):
+                self.TestFunction([1.0, 2.0], Item)
+        for Item in ['1', b'1', {1 : 2}, ['2'], True]:
+            with self.assertRaises(TypeError):
+                self.TestFunction([1.0, 2.0], [1.0, 2.0], State = Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-811
+        """
+        for Item in [1.0, [], [[1.0, 2.0]], MeasuredValue(1.0, 0.1)]:
+            with self.assertRaises(ValueError):
+                self.TestFunction(Item, [1.0, 2.0])
+            with self.assertRaises(ValueError):
+                self.TestFunction([1.0, 2.0], Item)
+        for Item in [[], [1.0, 2.0], [[1.0]], 1.0]:
+            with self.assertRaises(ValueError):
+                self.TestFunction([1.0, 2.0], [1.0, 2.0], State = Item)
+
+class Test_movingAverage(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.series.movingAverage().
+
+    Implements tests: TEST-T-820.
+    Covers the requirements REQ-FUN-820, REQ-AWM-820 and REQ-AWM-821.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.movingAverage)
+        Generator = np.random.default_rng(2028)
+        cls.X = Generator.normal(0.0, 1.0, 2000)
+        cls.SX = Generator.uniform(0.1, 1.0, 2000)
+
+    def test_Average(self):
+        """
+        Checks the values and the uncertainties of the moving average, the
+        returned state and the streaming mode.
+
+        REQ-FUN-820
+        """
+        Result, State = self.TestFunction(MeasuredArray([1.0, 2.0, 3.0, 4.0],
+                                                    [0.3, 0.0, 0.3, 0.3]), 3)
+        self.assertListEqual(Result.Value.tolist(), [2.0, 3.0])
+        self.assertTrue(np.allclose(Result.SE, [math.sqrt(0.02),
+                                                        math.sqrt(0.02)]))
+        self.assertListEqual(State.Value.tolist(), [3.0, 4.0])
+        Result, State = self.TestFunction(MeasuredArray(self.X, 0.3), 1)
+        self.assertListEqual(Result.Value.tolist(), self.X.tolist())
+        self.assertEqual(len(State), 0)
+        for Window in [3, 600]:
+            Signal = MeasuredArray(self.X, self.SX)
+            Reference, _ = self.TestFunction(Signal, Window)
+            self.assertTupleEqual(Reference.shape, (2001 - Window, ))
+            Expected = np.convolve(self.X, np.full(Window, 1 / Window),
+                                                                    'valid')
+            self.assertTrue(np.allclose(Reference.Value, Expected,
+                                            rtol = 1.0E-12, atol = 1.0E-12))
+            Expected = np.sqrt(np.convolve(self.SX**2, np.ones(Window),
+                                                        'valid')) / Window
+            self.assertTrue(np.allclose(Reference.SE, Expected,
+                                            rtol = 1.0E-10, atol = 1.0E-12))
+            State = None
+            Values, Errors = [], []
+            for Chunk in np.array_split(np.arange(2000), 17):
+                Result, State = self.TestFunction(MeasuredArray(self.X[Chunk],
+                                            self.SX[Chunk]), Window, State)
+                self.assertLessEqual(len(State), Window - 1)
+                Values.append(Result.Value)
+                Errors.append(Result.SE)
+            self.assertTrue(np.allclose(np.concatenate(Values),
+                        Reference.Value, rtol = 1.0E-12, atol = 1.0E-12))
+            self.assertTrue(np.allclose(np.concatenate(Errors),
+                        Reference.SE, rtol = 1.0E-10, atol = 1.0E-12))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-820
+        """
+        for Item in ['1', b'1', {1 : 2}, [1, '2'], None, True]:
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item, 2)
+        for Item in ['1', 2.0, None, [2], True]:
+            with self.assertRaises(TypeError):
+                self.TestFunction([1.0, 2.0], Item)
+        for Item in ['1', b'1', {1 : 2}, ['2'], True]:
+            with self.assertRaises(TypeError):
+                self.TestFunction([1.0, 2.0], 2, State = Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-821
+        """
+        for Item in [1.0, [], [[1.0, 2.0]], MeasuredValue(1.0, 0.1)]:
+            with self.assertRaises(ValueError):
+                self.TestFunction(Item, 2)
+        for Item in [0, -1]:
+            with self.assertRaises(ValueError):
+                self.TestFunction([1.0, 2.0], Item)
+        for Item in [[1.0, 2.0], [[1.0]], 1.0]:
+            with self.assertRaises(ValueError):
+                self.TestFunction([1.0, 2.0], 2, State = Item)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_convolve)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_firFilter)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_movingAverage)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.series module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -0,0 +1,412 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT009_calculus
+
+Set of unit tests on the module phyqus_lib.calculus.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import math
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+import phyqus_lib.calculus as test_module
+
+#globals
+
+Generator = np.random.default_rng(2026)
+
+X = np.cumsum(Generator.uniform(0.5, 1.5, 11))
+
+SX = Generator.uniform(0.0, 0.05, 11)
+
+Y = Generator.normal(0.0, 1.0, 11)
+
+SY = Generator.uniform(0.0, 0.1, 11)
+
+#functions
+
+def numericalSE(Function, Size):
+    """
+    Reference value and uncertainty of a plain function of the coordinates
+    and the values of the first Size samples by the central differences over
+    all samples, as well as the same with the measured spacing 0.5 +/- 0.01.
+    """
+    Step = 1.0E-6
+    Coordinates, Values = X[:Size], Y[:Size]
+    Variance = 0.0
+    for Index in range(Size):
+        for Data, Errors in ((Coordinates, SX), (Values, SY)):
+            Plus = Data.copy()
+            Plus[Index] += Step
+            Minus = Data.copy()
+            Minus[Index] -= Step
+            if Data is Coordinates:
+                Delta = Function(Plus, Values) - Function(Minus, Values)
+            else:
+                Delta = Function(Coordinates, Plus) - Function(Coordinates,
+                                                                        Minus)
+            Variance = Variance + (Delta / (2 * Step) * Errors[Index])**2
+    Reference = (Function(Coordinates, Values), np.sqrt(Variance))
+    Grid = np.arange(Size, dtype = np.float64)
+    Variance = ((Function((0.5 + Step) * Grid, Values)
+                - Function((0.5 - Step) * Grid, Values)) / (2 * Step) * 0.01)**2
+    for Index in range(Size):
+        Plus = Values.copy()
+        Plus[Index] += Step
+        Minus = Values.copy()
+        Minus[Index] -= Step
+        Delta = Function(0.5 * Grid, Plus) - Function(0.5 * Grid, Minus)
+        Variance = Variance + (Delta / (2 * Step) * SY[Index])**2
+    Spaced = (Function(0.5 * Grid, Values), np.sqrt(Variance))
+    return Reference, Spaced
+
+def trapezoid(Coordinates, Values):
+    """
+    Plain trapezoidal integral.
+    """
+    return float(np.sum(np.diff(Coordinates)
+                                    * (Values[:-1] + Values[1:]) / 2))
+
+def cumulative(Coordinates, Values):
+    """
+    Plain cumulative trapezoidal integral.
+    """
+    return np.cumsum(np.diff(Coordinates) * (Values[:-1] + Values[1:]) / 2)
+
+def parabolas(Coordinates, Values):
+    """
+    Plain composite Simpson's rule, pair of intervals by pair.
+    """
+    Result = 0.0
+    for Index in range(0, len(Values) - 1, 2):
+        H0 = Coordinates[Index + 1] - Coordinates[Index]
+        H1 = Coordinates[Index + 2] - Coordinates[Index + 1]
+        S = H0 + H1
+        Result += S / 6 * ((2 - H1 / H0) * Values[Index]
+                    + S * S / (H0 * H1) * Values[Index + 1]
+                    + (2 - H0 / H1) * Values[Index + 2])
+    return Result
+
+#classes
+
+#+ test cases
+
+class Test_trapz(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.calculus.trapz().
+
+    Implements tests: TEST-T-900.
+    Covers the requirements REQ-FUN-900, REQ-AWM-900 and REQ-AWM-901.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.trapz)
+        cls.Reference = staticmethod(trapezoid)
+        cls.Sizes = [2, 3, 10, 11]
+        cls.Minimum = 2
+
+    def checkIntegral(self):
+        """
+        Compares the integrals of the measured samples with the measured
+        coordinates and spacing with the numerically differentiated plain
+        integrals.
+        """
+        for Size in self.Sizes:
+            (Value, SE), (SpacedValue, SpacedSE) = numericalSE(self.Reference,
+                                                                        Size)
+            Result = self.TestFunction(MeasuredArray(Y[:Size], SY[:Size]),
+                                        MeasuredArray(X[:Size], SX[:Size]))
+            self.assertIsInstance(Result, MeasuredValue)
+            self.assertAlmostEqual(Result.Value, Value, places = 12)
+            self.assertAlmostEqual(Result.SE / SE, 1.0, places = 6)
+            Result = self.TestFunction(MeasuredArray(Y[:Size], SY[:Size]),
+                                                    MeasuredValue(0.5, 0.01))
+            self.assertAlmostEqual(Result.Value, SpacedValue, places = 12)
+            self.assertAlmostEqual(Result.SE / SpacedSE, 1.0, places = 6)
+
+    def test_Result(self):
+        """
+        Checks the values and the uncertainties with the measured samples,
+        coordinates and spacing.
+
+        REQ-FUN-900
+        """
+        self.checkIntegral()
+        #the inner samples are shared by 2 trapezoids
+        Result = self.TestFunction(MeasuredArray([1.0, 2.0, 3.0], 0.1))
+        self.assertAlmostEqual(Result.Value, 4.0)
+        self.assertAlmostEqual(Result.SE, 0.1 * math.sqrt(1.5))
+        Result = self.TestFunction([1.0, 2.0, 3.0], X = [0.0, 1.0, 3.0])
+        self.assertEqual(Result.SE, 0)
+        self.assertAlmostEqual(Result.Value, 6.5)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-900
+        """
+        Values = list(range(self.Sizes[-1]))
+        for Item in ['1', b'1', {1 : 2}, [1, '2', 3], None, True]:
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item)
+            with self.assertRaises(TypeError):
+                self.TestFunction(Values, X = Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-901
+        """
+        Values = list(range(self.Sizes[-1]))
+        for Item in [1.0, [], [[1.0, 2.0, 3.0]], list(range(self.Minimum - 1)),
+                                                    MeasuredValue(1.0, 0.1)]:
+            with self.assertRaises(ValueError):
+                self.TestFunction(Item)
+        for Item in [0, math.inf, math.nan, MeasuredValue(1.0, math.inf),
+                        [1.0, 2.0], [Values], Values[:-1] + [math.nan]]:
+            with self.assertRaises(ValueError):
+                self.TestFunction(Values, X = Item)
+
+class Test_cumtrapz(Test_trapz):
+    """
+    Test cases for the function phyqus_lib.calculus.cumtrapz().
+
+    Implements tests: TEST-T-910.
+    Covers the requirements REQ-FUN-910, REQ-AWM-910 and REQ-AWM-911.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.cumtrapz)
+        cls.Reference = staticmethod(cumulative)
+        cls.Sizes = [2, 3, 10, 11]
+        cls.Minimum = 2
+
+    def test_Result(self):
+        """
+        Checks the values and the uncertainties with the measured samples,
+        coordinates and spacing, and the initial zero.
+
+        REQ-FUN-910
+        """
+        for Size in self.Sizes:
+            (Value, SE), (SpacedValue, SpacedSE) = numericalSE(self.Reference,
+                                                                        Size)
+            Result = self.TestFunction(MeasuredArray(Y[:Size], SY[:Size]),
+                                        MeasuredArray(X[:Size], SX[:Size]))
+            self.assertIsInstance(Result, MeasuredArray)
+            self.assertTupleEqual(Result.shape, (Size - 1, ))
+            self.assertTrue(np.allclose(Result.Value, Value, rtol = 1.0E-12,
+                                                            atol = 1.0E-12))
+            self.assertTrue(np.allclose(Result.SE, SE, rtol = 1.0E-6))
+            Result = self.TestFunction(MeasuredArray(Y[:Size], SY[:Size]),
+                                        MeasuredValue(0.5, 0.01), True)
+            self.assertTupleEqual(Result.shape, (Size, ))
+            self.assertEqual(Result.Value[0], 0)
+            self.assertEqual(Result.SE[0], 0)
+            self.assertTrue(np.allclose(Result.Value[1:], SpacedValue,
+                                            rtol = 1.0E-12, atol = 1.0E-12))
+            self.assertTrue(np.allclose(Result.SE[1:], SpacedSE,
+                                                            rtol = 1.0E-6))
+            Total = test_module.trapz(MeasuredArray(Y[:Size], SY[:Size]),
+                                        MeasuredArray(X[:Size], SX[:Size]))
+            Result = self.TestFunction(MeasuredArray(Y[:Size], SY[:Size]),
+                                        MeasuredArray(X[:Size], SX[:Size]))
+            self.assertAlmostEqual(Result.Value[-1], Total.Value, places = 12)
+            self.assertAlmostEqual(Result.SE[-1], Total.SE, places = 12)
+        Result = self.TestFunction(MeasuredArray([1.0, 2.0, 3.0, 4.0], 0.1))
+        self.assertListEqual(Result.Value.tolist(), [1.5, 4.0, 7.5])
+        Expected = [0.1 * math.sqrt(Item) for Item in [0.5, 1.5, 2.5]]
+        self.assertTrue(np.allclose(Result.SE, Expected))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-910
+        """
+        super().test_TypeError()
+        for Item in [1, 0, None, 'True']:
+            with self.assertRaises(TypeError):
+                self.TestFunction([1.0, 2.0], Initial = Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-911
+        """
+        super().test_ValueError()
+
+class Test_simpson(Test_trapz):
+    """
+    Test cases for the function phyqus_lib.calculus.simpson().
+
+    Implements tests: TEST-T-920.
+    Covers the requirements REQ-FUN-920, REQ-AWM-920 and REQ-AWM-921.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.simpson)
+        cls.Reference = staticmethod(parabolas)
+        cls.Sizes = [3, 5, 11]
+        cls.Minimum = 3
+
+    def test_Result(self):
+        """
+        Checks the values and the uncertainties with the measured samples,
+        coordinates and spacing, and the exact integration of a parabola.
+
+        REQ-FUN-920
+        """
+        self.checkIntegral()
+        Result = self.TestFunction(X**2 - X, X)
+        Expected = (X[-1]**3 - X[0]**3) / 3 - (X[-1]**2 - X[0]**2) / 2
+        self.assertAlmostEqual(Result.Value, Expected, places = 10)
+        Result = self.TestFunction(MeasuredArray([1.0, 1.0, 1.0], 0.3), 0.5)
+        self.assertAlmostEqual(Result.Value, 1.0)
+        self.assertAlmostEqual(Result.SE, 0.3 * math.sqrt(18) / 6)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-920
+        """
+        super().test_TypeError()
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-921
+        """
+        super().test_ValueError()
+        for Item in [[1.0, 2.0], [1.0, 2.0, 3.0, 4.0]]:
+            with self.assertRaises(ValueError):
+                self.TestFunction(Item)
+        with self.assertRaises(ValueError):
+            self.TestFunction([1.0, 2.0, 3.0], [1.0, 1.0, 2.0])
+
+class Test_gradient(Test_trapz):
+    """
+    Test cases for the function phyqus_lib.calculus.gradient().
+
+    Implements tests: TEST-T-930.
+    Covers the requirements REQ-FUN-930, REQ-AWM-930 and REQ-AWM-931.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.gradient)
+        cls.Reference = staticmethod(lambda Coordinates, Values: np.gradient(
+                                                        Values, Coordinates))
+        cls.Sizes = [2, 3, 10, 11]
+        cls.Minimum = 2
+
+    def test_Result(self):
+        """
+        Checks the values and the uncertainties with the measured samples,
+        coordinates and spacing, and the exact derivative of a parabola.
+
+        REQ-FUN-930
+        """
+        for Size in self.Sizes:
+            (Value, SE), (SpacedValue, SpacedSE) = numericalSE(self.Reference,
+                                                                        Size)
+            Result = self.TestFunction(MeasuredArray(Y[:Size], SY[:Size]),
+                                        MeasuredArray(X[:Size], SX[:Size]))
+            self.assertIsInstance(Result, MeasuredArray)
+            self.assertTupleEqual(Result.shape, (Size, ))
+            self.assertTrue(np.allclose(Result.Value, Value, rtol = 1.0E-12,
+                                                            atol = 1.0E-12))
+            self.assertTrue(np.allclose(Result.SE, SE, rtol = 1.0E-6))
+            Result = self.TestFunction(MeasuredArray(Y[:Size], SY[:Size]),
+                                                    MeasuredValue(0.5, 0.01))
+            self.assertTrue(np.allclose(Result.Value, SpacedValue,
+                                            rtol = 1.0E-12, atol = 1.0E-12))
+            self.assertTrue(np.allclose(Result.SE, SpacedSE, rtol = 1.0E-6))
+        Result = self.TestFunction(X**2, X)
+        self.assertTrue(np.allclose(Result.Value[1:-1], 2 * X[1:-1]))
+        Result = self.TestFunction(MeasuredArray([1.0, 2.0, 4.0], 0.2), 2.0)
+        self.assertListEqual(Result.Value.tolist(), [0.5, 0.75, 1.0])
+        Expected = [0.1 * math.sqrt(2), 0.05 * math.sqrt(2),
+                                                        0.1 * math.sqrt(2)]
+        self.assertTrue(np.allclose(Result.SE, Expected))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-930
+        """
+        super().test_TypeError()
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-931
+        """
+        super().test_ValueError()
+        with self.assertRaises(ValueError):
+            self.TestFunction([1.0, 2.0, 3.0], [1.0, 2.0, 2.0])
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_trapz)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_cumtrapz)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_simpson)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_gradient)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.calculus module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
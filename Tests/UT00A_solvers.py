@@ -0,0 +1,258 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT00A_solvers
+
+Set of unit tests on the module phyqus_lib.solvers.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import math
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+import phyqus_lib.solvers as test_module
+
+#functions
+
+def cubic(X, A, B):
+    """
+    The equation x**3 + a * x - b = 0, which has a single real root for a > 0.
+    """
+    return X**3 + A * X - B
+
+def cubicDerivative(X, A, B):
+    """
+    The derivative of the cubic equation with respect to x.
+    """
+    return 3 * X * X + A
+
+def kepler(E, M, Eccentricity):
+    """
+    Kepler's equation E - e * sin(E) - M = 0 without the complex arguments
+    support, i.e. the central differences are used.
+    """
+    return np.asarray(E, dtype = float) - Eccentricity * np.sin(E) - M
+
+#classes
+
+#+ test cases
+
+class Test_findRoot(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.solvers.findRoot().
+
+    Implements tests: TEST-T-A00.
+    Covers the requirements REQ-FUN-A00, REQ-FUN-A01, REQ-FUN-A02,
+    REQ-AWM-A00 and REQ-AWM-A01.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.findRoot)
+        Generator = np.random.default_rng(2026)
+        cls.A = Generator.uniform(0.5, 2.0, 1000)
+        cls.SA = Generator.uniform(0.0, 0.05, 1000)
+        cls.B = Generator.uniform(-5.0, 5.0, 1000)
+        cls.SB = Generator.uniform(0.0, 0.05, 1000)
+
+    def test_Roots(self):
+        """
+        Checks the roots of the batch of the equations with the numerical and
+        analytic derivatives, scalar and broadcast arguments.
+
+        REQ-FUN-A00
+        """
+        A, B, SA, SB = self.A, self.B, self.SA, self.SB
+        for Derivative in (None, cubicDerivative):
+            Result = self.TestFunction(cubic, -10, 10.0, MeasuredArray(A, SA),
+                        MeasuredArray(B, SB), Derivative = Derivative)
+            self.assertIsInstance(Result, MeasuredArray)
+            self.assertTupleEqual(Result.shape, (1000, ))
+            X = Result.Value
+            self.assertTrue(np.all(np.abs(cubic(X, A, B))
+                                    <= 1E-10 * cubicDerivative(X, A, B)))
+        Result = self.TestFunction(cubic, -10, 10, 1.0, 2.0)
+        self.assertIsInstance(Result, MeasuredValue)
+        self.assertAlmostEqual(Result.Value, 1.0, places = 12)
+        self.assertEqual(Result.SE, 0.0)
+        Result = self.TestFunction(cubic, [[-10], [0]], 10, 1.0, [2.0, -2.0])
+        self.assertTupleEqual(Result.shape, (2, 2))
+        self.assertTrue(np.allclose(Result.Value, [[1.0, -1.0], [1.0, np.nan]],
+                                                        equal_nan = True))
+        Result = self.TestFunction(kepler, 0, math.pi, [0.5, 1.0, 2.0], 0.3)
+        self.assertTrue(np.allclose(Result.Value - 0.3 * np.sin(Result.Value),
+                                            [0.5, 1.0, 2.0], atol = 1E-12))
+        #root at the bracket end, reversed bracket
+        Result = self.TestFunction(cubic, [-1.0, 10.0], [1.0, -10.0], 1.0,
+                                                                    [-2.0, 0.0])
+        self.assertListEqual(Result.Value.tolist(), [-1.0, 0.0])
+        Result = self.TestFunction(cubic, [], 1.0, 1.0, 0.0)
+        self.assertTupleEqual(Result.shape, (0, ))
+
+    def test_Uncertainty(self):
+        """
+        Checks the uncertainty of the roots against the analytic implicit
+        function theorem and the numerical perturbation of the parameters.
+
+        REQ-FUN-A01
+        """
+        A, B, SA, SB = self.A, self.B, self.SA, self.SB
+        for Derivative in (None, cubicDerivative):
+            Result = self.TestFunction(cubic, -10, 10, MeasuredArray(A, SA),
+                        MeasuredArray(B, SB), Derivative = Derivative)
+            X = Result.Value
+            FX = cubicDerivative(X, A, B)
+            Expected = np.sqrt((X * SA / FX)**2 + (SB / FX)**2)
+            self.assertTrue(np.allclose(Result.SE, Expected, rtol = 1E-6,
+                                                                atol = 1E-14))
+        #the same object parameter, x**2 - 2 * c * x + c = 0
+        C = MeasuredValue(2.0, 0.1)
+        Result = self.TestFunction(lambda X, P, Q: X * X - 2 * P * X + Q,
+                                                            2.0, 5.0, C, C)
+        Root = lambda Value: Value + math.sqrt(Value * Value - Value)
+        self.assertAlmostEqual(Result.Value, Root(2.0), places = 12)
+        Expected = 0.1 * (Root(2.0 + 1E-6) - Root(2.0 - 1E-6)) / 2E-6
+        self.assertAlmostEqual(Result.SE, Expected, places = 7)
+        #central differences (no complex support)
+        Result = self.TestFunction(kepler, 0, math.pi,
+                        MeasuredValue(1.0, 0.01), MeasuredValue(0.3, 0.02))
+        E = Result.Value
+        Expected = (math.hypot(0.01, 0.02 * math.sin(E))
+                                                / (1 - 0.3 * math.cos(E)))
+        self.assertTrue(math.isclose(Result.SE, Expected, rel_tol = 1E-5))
+        #the probe of the steps is called with the 1-element arrays
+        Indexed = lambda X, C: X[ : X.shape[0]] * X - C
+        Result = self.TestFunction(Indexed, 0.0, 2.0, MeasuredValue(2.0, 0.1))
+        self.assertAlmostEqual(Result.Value, math.sqrt(2.0), places = 12)
+        self.assertAlmostEqual(Result.SE, 0.05 / math.sqrt(2.0), places = 8)
+        #singularity at the probe point (the midpoint of the first bracket)
+        #+ - the default central differences
+        Pole = lambda X, C: X - C - 1.0 / (X - C)
+        Result = self.TestFunction(Pole, [-1.0, 1.0], [2.0, 3.0],
+                                                    MeasuredValue(0.5, 0.1))
+        self.assertAlmostEqual(Result.Value[1], 1.5, places = 12)
+        self.assertAlmostEqual(Result.SE[1], 0.1, places = 6)
+
+    def test_Failures(self):
+        """
+        Checks that the failed roots are filled with NaN or listed in a single
+        exception.
+
+        REQ-FUN-A02
+        """
+        Bad = lambda X, C: np.where(X > 1.5, np.inf, X * X - C)
+        Result = self.TestFunction(Bad, 0.0, [1.0, 1.0, 2.0],
+                        MeasuredArray([0.25, 4.0, 1.0], 0.01))
+        self.assertTrue(np.allclose(Result.Value, [0.5, np.nan, np.nan],
+                                                            equal_nan = True))
+        self.assertTrue(np.allclose(Result.SE, [0.01, np.nan, np.nan],
+                                                            equal_nan = True))
+        Result = self.TestFunction(cubic, -10, 10, 1.0, 2.0, MaxIterations = 1)
+        self.assertTrue(math.isnan(Result.Value))
+        with self.assertRaises(ValueError):
+            self.TestFunction(Bad, 0.0, [1.0, 1.0, 2.0], [0.25, 4.0, 1.0],
+                                                                Raise = True)
+        with self.assertRaises(ValueError):
+            self.TestFunction(cubic, -10, 10, 1.0, 2.0, MaxIterations = 1,
+                                                                Raise = True)
+        Result = self.TestFunction(Bad, 0.0, 1.0, 0.25, Raise = True)
+        self.assertAlmostEqual(Result.Value, 0.5, places = 12)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-A00
+        """
+        for Function in (1, 'cubic', None):
+            with self.assertRaises(TypeError):
+                self.TestFunction(Function, 0, 1, 1.0, 2.0)
+        for Bound in ('0', MeasuredValue(0.0, 0.1), [0, 'a'], {0: 1}):
+            with self.assertRaises(TypeError):
+                self.TestFunction(cubic, Bound, 1, 1.0, 2.0)
+            with self.assertRaises(TypeError):
+                self.TestFunction(cubic, 0, Bound, 1.0, 2.0)
+        for Parameter in ('1', [1.0, 'a'], {1: 2}, None):
+            with self.assertRaises(TypeError):
+                self.TestFunction(cubic, 0, 1, Parameter, 2.0)
+        for Value in (1, '1', True, None):
+            with self.assertRaises(TypeError):
+                self.TestFunction(cubic, 0, 1, 1.0, 2.0, Tolerance = Value)
+        for Value in (1.0, '1', True, None):
+            with self.assertRaises(TypeError):
+                self.TestFunction(cubic, 0, 1, 1.0, 2.0,
+                                                    MaxIterations = Value)
+        for Value in (1, 'True', None):
+            with self.assertRaises(TypeError):
+                self.TestFunction(cubic, 0, 1, 1.0, 2.0, Raise = Value)
+        with self.assertRaises(TypeError):
+            self.TestFunction(cubic, 0, 1, 1.0, 2.0, Derivative = 1)
+        with self.assertRaises(TypeError):
+            self.TestFunction(lambda X, A, B: 'a', 0, 1, 1.0, 2.0)
+        with self.assertRaises(TypeError):
+            self.TestFunction(cubic, 0, 2, 1.0, 2.0,
+                                            Derivative = lambda X, A, B: 'a')
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-A01
+        """
+        with self.assertRaises(ValueError):
+            self.TestFunction(cubic, [0, 1], 2, [1.0, 2.0, 3.0], 2.0)
+        for Value in (0.0, -1E-12, 1.0, 2.0):
+            with self.assertRaises(ValueError):
+                self.TestFunction(cubic, 0, 1, 1.0, 2.0, Tolerance = Value)
+        for Value in (0, -1):
+            with self.assertRaises(ValueError):
+                self.TestFunction(cubic, 0, 1, 1.0, 2.0,
+                                                    MaxIterations = Value)
+        with self.assertRaises(ValueError):
+            self.TestFunction(lambda X, A, B: np.sum(cubic(X, A, B)), [0, 0],
+                                                                2, 1.0, 2.0)
+        with self.assertRaises(ValueError):
+            self.TestFunction(cubic, [0, 0], 2, 1.0, 2.0,
+                        Derivative = lambda X, A, B: np.ones(3))
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_findRoot)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.solvers module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -0,0 +1,1223 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT00B_accumulators
+
+Set of unit tests on the module phyqus_lib.accumulators.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import math
+import statistics
+import pickle
+import struct
+import time
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+import phyqus_lib.accumulators as test_module
+
+#classes
+
+#+ test cases
+
+class Test_SampleAccumulator(unittest.TestCase):
+    """
+    Test cases for the class phyqus_lib.accumulators.SampleAccumulator.
+
+    Implements tests: TEST-T-B00.
+    Covers the requirements REQ-FUN-B00, REQ-FUN-B01, REQ-FUN-B02,
+    REQ-FUN-B03, REQ-FUN-B04, REQ-AWM-B00 and REQ-AWM-B01.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = test_module.SampleAccumulator
+        Generator = np.random.default_rng(2026)
+        #large offset to check the numerical stability
+        cls.Samples = Generator.normal(1.0E6, 0.5, 5000)
+        cls.Weights = Generator.uniform(0.1, 2.0, 5000)
+
+    def checkState(self, Accumulator, Samples):
+        """
+        Compares the state of the accumulator with the statistics of the
+        samples.
+        """
+        self.assertEqual(Accumulator.Count, len(Samples))
+        self.assertEqual(len(Accumulator), len(Samples))
+        self.assertAlmostEqual(Accumulator.Mean, statistics.fmean(Samples),
+                                                                places = 8)
+        self.assertTrue(math.isclose(Accumulator.Variance,
+                        statistics.variance(Samples), rel_tol = 1E-9))
+        Result = Accumulator.toMeasuredValue()
+        self.assertIsInstance(Result, MeasuredValue)
+        self.assertEqual(Result.Value, Accumulator.Mean)
+        self.assertTrue(math.isclose(Result.SE, statistics.stdev(Samples)
+                                    / math.sqrt(len(Samples)), rel_tol = 1E-9))
+
+    def checkWeighted(self, Accumulator, Samples, Weights):
+        """
+        Compares the state of the accumulator with the weighted statistics of
+        the samples (reliability weights).
+        """
+        Weight = Weights.sum()
+        Square = np.dot(Weights, Weights)
+        Mean = np.dot(Weights, Samples) / Weight
+        Variance = (np.dot(Weights, (Samples - Mean)**2)
+                                                / (Weight - Square / Weight))
+        self.assertEqual(Accumulator.Count, Samples.size)
+        self.assertTrue(math.isclose(Accumulator.Weight, Weight,
+                                                            rel_tol = 1E-12))
+        self.assertTrue(math.isclose(Accumulator.EffectiveCount,
+                                    Weight**2 / Square, rel_tol = 1E-12))
+        self.assertAlmostEqual(Accumulator.Mean, Mean, places = 8)
+        self.assertTrue(math.isclose(Accumulator.Variance, Variance,
+                                                            rel_tol = 1E-9))
+        self.assertTrue(math.isclose(Accumulator.toMeasuredValue().SE,
+                    math.sqrt(Variance * Square) / Weight, rel_tol = 1E-9))
+
+    def test_init(self):
+        """
+        Checks the empty accumulator.
+
+        REQ-FUN-B00
+        """
+        Accumulator = self.TestClass()
+        self.assertEqual(Accumulator.Count, 0)
+        self.assertTrue(math.isnan(Accumulator.Mean))
+        self.assertTrue(math.isnan(Accumulator.Variance))
+        Accumulator.push(2)
+        self.assertEqual(Accumulator.Mean, 2.0)
+        self.assertTrue(math.isnan(Accumulator.Variance))
+        Accumulator.push(np.float32(4.0))
+        self.assertEqual(Accumulator.Mean, 3.0)
+        self.assertEqual(Accumulator.Variance, 2.0)
+        self.assertEqual(Accumulator.toMeasuredValue().SE, 1.0)
+
+    def test_push(self):
+        """
+        Checks the single samples streaming.
+
+        REQ-FUN-B00
+        """
+        Accumulator = self.TestClass()
+        for Sample in self.Samples:
+            Accumulator.push(Sample)
+        self.checkState(Accumulator, self.Samples.tolist())
+
+    def test_pushMany(self):
+        """
+        Checks the bulk updates by the arrays of samples, including the
+        chunked reduction, mixed with the single samples.
+
+        REQ-FUN-B01
+        """
+        Samples = self.Samples
+        Accumulator = self.TestClass()
+        Accumulator.pushMany(Samples[:1000].reshape(10, 100))
+        Accumulator.pushMany([])
+        Accumulator.push(Samples[1000])
+        Accumulator.pushMany(Samples[1001:2000].tolist())
+        Saved = test_module.CHUNK_ELEMENTS
+        try:
+            test_module.CHUNK_ELEMENTS = 333
+            Accumulator.pushMany(Samples[2000:])
+        finally:
+            test_module.CHUNK_ELEMENTS = Saved
+        self.checkState(Accumulator, Samples.tolist())
+        Accumulator = self.TestClass()
+        Accumulator.pushMany(np.arange(10, dtype = np.int16))
+        self.assertEqual(Accumulator.Mean, 4.5)
+        self.assertAlmostEqual(Accumulator.Variance, 55 / 6, places = 12)
+        #failed bulk update does not change the state
+        with self.assertRaises(ValueError):
+            Accumulator.pushMany([1.0, math.nan])
+        self.assertEqual(Accumulator.Count, 10)
+
+    def test_weights(self):
+        """
+        Checks the weighted samples, single and bulk.
+
+        REQ-FUN-B02
+        """
+        Samples, Weights = self.Samples, self.Weights
+        Accumulator = self.TestClass()
+        for Sample, Weight in zip(Samples[:100], Weights[:100]):
+            Accumulator.push(Sample, Weight)
+        Accumulator.pushMany(Samples[100:1000], Weights[100:1000].tolist())
+        Accumulator.pushMany(Samples[1000:], Weights[1000:])
+        self.checkWeighted(Accumulator, Samples, Weights)
+        #equal weights
+        Accumulator = self.TestClass()
+        Accumulator.pushMany(Samples[:1000], 2.5)
+        Accumulator.push(Samples[1000], 2.5)
+        Accumulator.pushMany(Samples[1001:].reshape(-1, 1),
+                                                    np.full((1, 1), 2.5))
+        self.checkState(Accumulator, Samples.tolist())
+        self.assertTrue(math.isclose(Accumulator.Weight, 2.5 * Samples.size,
+                                                            rel_tol = 1E-12))
+
+    def test_merge(self):
+        """
+        Checks the merging of the independent accumulators in any order.
+
+        REQ-FUN-B03
+        """
+        Samples, Weights = self.Samples, self.Weights
+        Parts = list()
+        for Start, Stop in ((0, 1), (1, 1700), (1700, 1700), (1700, 5000)):
+            Part = self.TestClass()
+            Part.pushMany(Samples[Start : Stop], Weights[Start : Stop])
+            Parts.append(Part)
+        for Order in ((0, 1, 2, 3), (3, 2, 1, 0), (2, 0, 3, 1)):
+            Accumulator = self.TestClass()
+            for Index in Order:
+                Accumulator.merge(Parts[Index])
+            self.checkWeighted(Accumulator, Samples, Weights)
+            Accumulator = sum((Parts[Index] for Index in Order),
+                                                            self.TestClass())
+            self.checkWeighted(Accumulator, Samples, Weights)
+        Accumulator = Parts[1] + Parts[3]
+        self.assertIsInstance(Accumulator, self.TestClass)
+        Accumulator += Parts[0]
+        self.checkWeighted(Accumulator, Samples, Weights)
+        self.assertEqual(Parts[1].Count, 1699)
+        self.assertEqual(Parts[2].Count, 0)
+        Mean, Weight = Accumulator.Mean, Accumulator.Weight
+        Accumulator.merge(Accumulator)
+        self.assertEqual(Accumulator.Count, 2 * Samples.size)
+        self.assertEqual(Accumulator.Mean, Mean)
+        self.assertEqual(Accumulator.Weight, 2 * Weight)
+
+    def test_bytes(self):
+        """
+        Checks the binary serialization of the state.
+
+        REQ-FUN-B04
+        """
+        for Size in (0, 1, 100):
+            Accumulator = self.TestClass()
+            Accumulator.pushMany(self.Samples[:Size], self.Weights[:Size])
+            Data = Accumulator.toBytes()
+            self.assertIsInstance(Data, bytes)
+            self.assertEqual(len(Data), test_module.STATE_SIZE)
+            for Item in (Data, bytearray(Data), memoryview(Data)):
+                Restored = self.TestClass.fromBytes(Item)
+                self.assertIsInstance(Restored, self.TestClass)
+                self.assertEqual(Restored.toBytes(), Data)
+            Restored = pickle.loads(pickle.dumps(Accumulator))
+            self.assertEqual(Restored.toBytes(), Data)
+        Restored.push(1.0E6)
+        self.assertEqual(Restored.Count, Accumulator.Count + 1)
+        self.assertEqual(Accumulator.Count, 100)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-B00
+        """
+        Accumulator = self.TestClass()
+        for Item in ('1', True, None, [1.0], MeasuredValue(1.0, 0.1), 1j):
+            with self.assertRaises(TypeError):
+                Accumulator.push(Item)
+            with self.assertRaises(TypeError):
+                Accumulator.push(1.0, Item)
+        for Item in ('1', 1.0, None, [1.0, '1'], [True, False],
+                            [MeasuredValue(1.0, 0.1)], {1 : 2}, [1, [2, 3]]):
+            with self.assertRaises(TypeError):
+                Accumulator.pushMany(Item)
+        for Item in ('1', True, [1.0, '1'], [True, False],
+                            [MeasuredValue(1.0, 0.1)], {1 : 2}):
+            with self.assertRaises(TypeError):
+                Accumulator.pushMany([1.0, 2.0], Item)
+        for Item in (1, 1.0, None, [1, 2], MeasuredValue(1.0, 0.1)):
+            with self.assertRaises(TypeError):
+                Accumulator.merge(Item)
+            with self.assertRaises(TypeError):
+                Accumulator + Item
+            with self.assertRaises(TypeError):
+                Accumulator += Item
+        for Item in (1, 'a' * test_module.STATE_SIZE, None,
+                                        list(bytes(test_module.STATE_SIZE))):
+            with self.assertRaises(TypeError):
+                self.TestClass.fromBytes(Item)
+        self.assertEqual(Accumulator.Count, 0)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-B01
+        """
+        Accumulator = self.TestClass()
+        for Item in (math.nan, math.inf, -math.inf):
+            with self.assertRaises(ValueError):
+                Accumulator.push(Item)
+            with self.assertRaises(ValueError):
+                Accumulator.pushMany([1.0, Item])
+        with self.assertRaises(ValueError):
+            Accumulator.toMeasuredValue()
+        Accumulator.push(1.0)
+        with self.assertRaises(ValueError):
+            Accumulator.toMeasuredValue()
+        for Item in (0, -1.0, math.nan, math.inf):
+            with self.assertRaises(ValueError):
+                Accumulator.push(1.0, Item)
+            with self.assertRaises(ValueError):
+                Accumulator.pushMany([1.0, 2.0], [1.0, Item])
+            with self.assertRaises(ValueError):
+                Accumulator.pushMany([1.0, 2.0], Item)
+        with self.assertRaises(ValueError):
+            Accumulator.pushMany([1.0, 2.0], [1.0, 2.0, 3.0])
+        self.assertEqual(Accumulator.Count, 1)
+        Data = Accumulator.toBytes()
+        for Item in (Data[:-1], Data + b'0', b''):
+            with self.assertRaises(ValueError):
+                self.TestClass.fromBytes(Item)
+        for State in ((0, 1.0, 0.0, 0.0, 0.0), (2, 0.0, 1.0, 1.0, 1.0),
+                        (2, 2.0, 2.0, 1.0, -1.0), (2, 2.0, 2.0, math.nan, 1.0),
+                        (2, math.inf, 2.0, 1.0, 1.0)):
+            with self.assertRaises(ValueError):
+                self.TestClass.fromBytes(struct.pack(
+                                            test_module.STATE_FORMAT, *State))
+
+class Test_WeightedMean(unittest.TestCase):
+    """
+    Test cases for the class phyqus_lib.accumulators.WeightedMean.
+
+    Implements tests: TEST-T-B10.
+    Covers the requirements REQ-FUN-B10, REQ-FUN-B11, REQ-FUN-B12,
+    REQ-AWM-B10 and REQ-AWM-B11.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = test_module.WeightedMean
+        Generator = np.random.default_rng(2026)
+        cls.Errors = Generator.uniform(0.5, 2.0, 5000)
+        cls.Values = Generator.normal(1.0E6, cls.Errors)
+        Weights = 1.0 / cls.Errors**2
+        cls.Weight = math.fsum(Weights)
+        cls.Mean = math.fsum(Weights * cls.Values) / cls.Weight
+        cls.ChiSquared = math.fsum(Weights * (cls.Values - cls.Mean)**2)
+
+    def checkState(self, Accumulator):
+        """
+        Compares the state of the accumulator with the exact sums.
+        """
+        self.assertEqual(Accumulator.Count, self.Values.size)
+        self.assertEqual(len(Accumulator), self.Values.size)
+        self.assertEqual(Accumulator.ExactCount, 0)
+        self.assertTrue(math.isclose(Accumulator.Weight, self.Weight,
+                                                            rel_tol = 1E-14))
+        self.assertAlmostEqual(Accumulator.Mean, self.Mean, places = 9)
+        self.assertTrue(math.isclose(Accumulator.ChiSquared, self.ChiSquared,
+                                                            rel_tol = 1E-9))
+        self.assertTrue(math.isclose(Accumulator.ReducedChiSquared,
+                    self.ChiSquared / (self.Values.size - 1), rel_tol = 1E-9))
+        Result = Accumulator.toMeasuredValue()
+        self.assertIsInstance(Result, MeasuredValue)
+        self.assertEqual(Result.Value, Accumulator.Mean)
+        self.assertTrue(math.isclose(Result.SE, 1.0 / math.sqrt(self.Weight),
+                                                            rel_tol = 1E-14))
+
+    def test_combine(self):
+        """
+        Checks the single, bulk and merged updates.
+
+        REQ-FUN-B10
+        """
+        Values, Errors = self.Values, self.Errors
+        Accumulator = self.TestClass()
+        self.assertEqual(Accumulator.Count, 0)
+        self.assertTrue(math.isnan(Accumulator.Mean))
+        self.assertTrue(math.isnan(Accumulator.ChiSquared))
+        for Value, Error in zip(Values[:100], Errors[:100]):
+            Accumulator.push(MeasuredValue(float(Value), float(Error)))
+        for Value, Error in zip(Values[100:200], Errors[100:200]):
+            Accumulator.push(Value, Error)
+        Accumulator.pushMany([MeasuredValue(float(Value), float(Error))
+                    for Value, Error in zip(Values[200:300], Errors[200:300])])
+        Accumulator.pushMany(MeasuredArray(Values[300:1000],
+                                                            Errors[300:1000]))
+        Accumulator.pushMany([])
+        Accumulator.pushMany(Values[1000:2000].tolist(),
+                                                Errors[1000:2000].tolist())
+        Saved = test_module.CHUNK_ELEMENTS
+        try:
+            test_module.CHUNK_ELEMENTS = 333
+            Accumulator.pushMany(Values[2000:].reshape(-1, 10),
+                                                Errors[2000:].reshape(-1, 10))
+        finally:
+            test_module.CHUNK_ELEMENTS = Saved
+        self.checkState(Accumulator)
+        Parts = list()
+        for Start, Stop in ((0, 1), (1, 2500), (2500, 2500), (2500, 5000)):
+            Part = self.TestClass()
+            Part.pushMany(Values[Start : Stop], Errors[Start : Stop])
+            Parts.append(Part)
+        for Order in ((0, 1, 2, 3), (3, 2, 1, 0), (2, 0, 3, 1)):
+            Accumulator = self.TestClass()
+            for Index in Order:
+                Accumulator.merge(Parts[Index])
+            self.checkState(Accumulator)
+            self.checkState(sum((Parts[Index] for Index in Order),
+                                                            self.TestClass()))
+        #equal uncertainties - arithmetic mean
+        Accumulator = self.TestClass()
+        Accumulator.pushMany(np.arange(1, 5), 2)
+        Result = Accumulator.toMeasuredValue()
+        self.assertEqual(Result.Value, 2.5)
+        self.assertEqual(Result.SE, 1.0)
+        #failed bulk update does not change the state
+        with self.assertRaises(ValueError):
+            Accumulator.pushMany([1.0, 2.0], [1.0, -1.0])
+        self.assertEqual(Accumulator.Count, 4)
+
+    def test_compensated(self):
+        """
+        Checks the compensated summation of the weights and the weighted
+        values.
+
+        REQ-FUN-B10
+        """
+        Accumulator = self.TestClass()
+        #the naive sum 2**54 + 1 + 1 + ... remains 2**54
+        Accumulator.push(1.0, 2.0**-27)
+        for _ in range(10000):
+            Accumulator.push(1.0, 1.0)
+        self.assertEqual(Accumulator.Weight, 2.0**54 + 10000)
+        self.assertEqual(Accumulator.Mean, 1.0)
+        self.assertEqual(Accumulator.ChiSquared, 0.0)
+
+    def test_exact(self):
+        """
+        Checks the exact entries (zero uncertainty).
+
+        REQ-FUN-B11
+        """
+        Accumulator = self.TestClass()
+        Accumulator.push(MeasuredValue(1.0, 0.5))
+        Accumulator.pushMany([2.0, 3.0], [0.0, 1.0])
+        Accumulator.push(2)
+        self.assertEqual(Accumulator.Count, 4)
+        self.assertEqual(Accumulator.ExactCount, 2)
+        self.assertEqual(Accumulator.Weight, 5.0)
+        self.assertEqual(Accumulator.Mean, 2.0)
+        self.assertAlmostEqual(Accumulator.ChiSquared, 5.0, places = 12)
+        Result = Accumulator.toMeasuredValue()
+        self.assertEqual(Result.Value, 2.0)
+        self.assertEqual(Result.SE, 0.0)
+        self.assertEqual(Accumulator.toMeasuredValue(Scale = True).SE, 0.0)
+        Accumulator.pushMany(MeasuredArray([2.5], [0.0]))
+        self.assertTrue(math.isnan(Accumulator.Mean))
+        self.assertEqual(Accumulator.ChiSquared, math.inf)
+        Accumulator = self.TestClass()
+        Accumulator.pushMany([4, 4, 4])
+        self.assertEqual(Accumulator.Mean, 4.0)
+        self.assertEqual(Accumulator.ChiSquared, 0.0)
+        self.assertEqual(Accumulator.toMeasuredValue().SE, 0.0)
+
+    def test_consistency(self):
+        """
+        Checks the chi-squared statistic and the scaled uncertainty.
+
+        REQ-FUN-B12
+        """
+        Accumulator = self.TestClass()
+        Accumulator.push(1.0, 0.5)
+        self.assertEqual(Accumulator.ChiSquared, 0.0)
+        self.assertTrue(math.isnan(Accumulator.ReducedChiSquared))
+        self.assertEqual(Accumulator.toMeasuredValue(Scale = True).SE, 0.5)
+        Accumulator.pushMany([3.0, 5.0], 0.5)
+        self.assertEqual(Accumulator.Mean, 3.0)
+        self.assertAlmostEqual(Accumulator.ChiSquared, 32.0, places = 12)
+        self.assertAlmostEqual(Accumulator.ReducedChiSquared, 16.0,
+                                                                places = 12)
+        Error = 0.5 / math.sqrt(3)
+        self.assertAlmostEqual(Accumulator.toMeasuredValue().SE, Error,
+                                                                places = 14)
+        self.assertAlmostEqual(Accumulator.toMeasuredValue(Scale = True).SE,
+                                                        4 * Error, places = 14)
+        #consistent entries - no scaling
+        Accumulator = self.TestClass()
+        Accumulator.pushMany([1.0, 1.1, 0.9], 1.0)
+        self.assertLess(Accumulator.ReducedChiSquared, 1.0)
+        self.assertEqual(Accumulator.toMeasuredValue(Scale = True).SE,
+                                        Accumulator.toMeasuredValue().SE)
+        #random consistent entries
+        Accumulator = self.TestClass()
+        Accumulator.pushMany(self.Values, self.Errors)
+        self.assertLess(abs(Accumulator.ReducedChiSquared - 1.0), 0.1)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-B10
+        """
+        Accumulator = self.TestClass()
+        for Item in ('1', True, None, [1.0], 1j, {1 : 2}):
+            with self.assertRaises(TypeError):
+                Accumulator.push(Item)
+            with self.assertRaises(TypeError):
+                Accumulator.push(1.0, Item if Item is not None else '1')
+        with self.assertRaises(TypeError):
+            Accumulator.push(MeasuredValue(1.0, 0.1), 0.1)
+        for Item in ('1', None, [1.0, '1'], [True, False], {1 : 2},
+                                                                [1, [2, 3]]):
+            with self.assertRaises(TypeError):
+                Accumulator.pushMany(Item)
+        for Item in ('1', True, [1.0, '1'], {1 : 2}):
+            with self.assertRaises(TypeError):
+                Accumulator.pushMany([1.0, 2.0], Item)
+        with self.assertRaises(TypeError):
+            Accumulator.pushMany([MeasuredValue(1.0, 0.1)], 0.1)
+        for Item in (1, None, [1, 2], test_module.SampleAccumulator()):
+            with self.assertRaises(TypeError):
+                Accumulator.merge(Item)
+            with self.assertRaises(TypeError):
+                Accumulator + Item
+            with self.assertRaises(TypeError):
+                Accumulator += Item
+        Accumulator.push(1.0, 1.0)
+        for Item in (1, None, 'True'):
+            with self.assertRaises(TypeError):
+                Accumulator.toMeasuredValue(Scale = Item)
+        self.assertEqual(Accumulator.Count, 1)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-B11
+        """
+        Accumulator = self.TestClass()
+        with self.assertRaises(ValueError):
+            Accumulator.toMeasuredValue()
+        for Value, Error in ((math.nan, 1.0), (math.inf, 1.0), (1.0, -1.0),
+                        (1.0, math.nan), (1.0, math.inf), (1.0, 1.0E-200),
+                        (1.0, 1.0E200)):
+            with self.assertRaises(ValueError):
+                Accumulator.push(Value, Error)
+            with self.assertRaises(ValueError):
+                Accumulator.pushMany([1.0, Value], [1.0, Error])
+        with self.assertRaises(ValueError):
+            Accumulator.pushMany(MeasuredArray([1.0, math.nan], 1.0))
+        with self.assertRaises(ValueError):
+            Accumulator.pushMany([1.0, 2.0], [1.0, 2.0, 3.0])
+        self.assertEqual(Accumulator.Count, 0)
+        Accumulator.pushMany([1.0, 2.0])
+        with self.assertRaises(ValueError):
+            Accumulator.toMeasuredValue()
+
+class Test_RollingWindow(unittest.TestCase):
+    """
+    Test cases for the class phyqus_lib.accumulators.RollingWindow.
+
+    Implements tests: TEST-T-B20.
+    Covers the requirements REQ-FUN-B20, REQ-FUN-B21, REQ-FUN-B22,
+    REQ-AWM-B20 and REQ-AWM-B21.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = test_module.RollingWindow
+        Generator = np.random.default_rng(2026)
+        cls.Errors = Generator.uniform(0.5, 2.0, 3000)
+        cls.Errors[::37] = 0.0
+        cls.Values = Generator.normal(1.0E6, cls.Errors)
+        cls.Times = np.cumsum(Generator.exponential(1.0, 3000))
+        cls.Times[100 : 105] = cls.Times[100]
+
+    def checkWindow(self, Window, Values, Errors):
+        """
+        Compares the state of the window with the brute force statistics of
+        the readings in the window.
+        """
+        Count = Values.size
+        self.assertEqual(Window.Count, Count)
+        self.assertEqual(len(Window), Count)
+        Sum = math.fsum(Values)
+        Deviation = math.sqrt(math.fsum(Errors**2))
+        for Result, Value, Error in ((Window.Sum, Sum, Deviation),
+                            (Window.Mean, Sum / Count, Deviation / Count)):
+            self.assertIsInstance(Result, MeasuredValue)
+            self.assertTrue(math.isclose(Result.Value, Value,
+                                                            rel_tol = 1E-13))
+            self.assertTrue(math.isclose(Result.SE, Error, rel_tol = 1E-9,
+                                                            abs_tol = 1E-12))
+        IsExact = Errors == 0
+        Result = Window.WeightedMean
+        if np.any(IsExact):
+            self.assertTrue(math.isclose(Result.Value,
+                    math.fsum(Values[IsExact]) / np.count_nonzero(IsExact),
+                                                            rel_tol = 1E-13))
+            self.assertEqual(Result.SE, 0.0)
+        else:
+            Weights = 1.0 / Errors**2
+            Weight = math.fsum(Weights)
+            self.assertTrue(math.isclose(Result.Value,
+                    math.fsum(Weights * Values) / Weight, rel_tol = 1E-13))
+            self.assertTrue(math.isclose(Result.SE, 1.0 / math.sqrt(Weight),
+                                                            rel_tol = 1E-9))
+
+    def test_init(self):
+        """
+        Checks the empty windows.
+
+        REQ-FUN-B20
+        REQ-FUN-B21
+        """
+        for Window, Size, Span in ((self.TestClass(Size = 3), 3, None),
+                        (self.TestClass(Span = 2), None, 2.0),
+                        (self.TestClass(Size = np.int8(1)), 1, None),
+                        (self.TestClass(Span = 0.5), None, 0.5)):
+            self.assertEqual(Window.Size, Size)
+            self.assertEqual(Window.Span, Span)
+            self.assertEqual(Window.Count, 0)
+            self.assertEqual(Window.Sum.Value, 0.0)
+            self.assertEqual(Window.Sum.SE, 0.0)
+            self.assertTrue(math.isnan(Window.Mean.Value))
+            self.assertTrue(math.isnan(Window.WeightedMean.Value))
+
+    def test_count(self):
+        """
+        Checks the count-based windows.
+
+        REQ-FUN-B20
+        """
+        Values, Errors = self.Values, self.Errors
+        for Size in (1, 2, 50, 5000):
+            Window = self.TestClass(Size = Size)
+            for Index in range(Values.size):
+                if Index % 3:
+                    Window.push(Values[Index], Errors[Index])
+                else:
+                    Window.push(MeasuredValue(float(Values[Index]),
+                                                    float(Errors[Index])))
+                if not (Index % 97):
+                    Lower = max(0, Index - Size + 1)
+                    self.checkWindow(Window, Values[Lower : Index + 1],
+                                                Errors[Lower : Index + 1])
+            self.checkWindow(Window, Values[-Size : ], Errors[-Size : ])
+        Window = self.TestClass(Size = 2)
+        Window.push(1)
+        Window.push(3, 0.5, Time = 'ignored')
+        Window.push(MeasuredValue(5.0, 1.5))
+        self.assertEqual(Window.Sum.Value, 8.0)
+        self.assertAlmostEqual(Window.Sum.SE, math.sqrt(2.5), places = 15)
+        self.assertEqual(Window.Mean.Value, 4.0)
+        self.assertAlmostEqual(Window.WeightedMean.Value, 3.2, places = 12)
+        self.assertAlmostEqual(Window.WeightedMean.SE, math.sqrt(0.225),
+                                                                places = 12)
+
+    def test_time(self):
+        """
+        Checks the time-based windows.
+
+        REQ-FUN-B21
+        """
+        Values, Errors, Times = self.Values, self.Errors, self.Times
+        for Span in (0.1, 1, 30.0):
+            Window = self.TestClass(Span = Span)
+            for Index in range(Values.size):
+                Window.push(Values[Index], Errors[Index], Times[Index])
+                if not (Index % 97) or (100 <= Index <= 105):
+                    Lower = np.searchsorted(Times, Times[Index] - Span,
+                                                            side = 'right')
+                    self.checkWindow(Window, Values[Lower : Index + 1],
+                                                Errors[Lower : Index + 1])
+        Window = self.TestClass(Span = 2)
+        for Time in (0, 1, 2, 2, 3.5):
+            Window.push(Time, 1.0, Time)
+        self.assertEqual(Window.Count, 3)
+        self.assertEqual(Window.Sum.Value, 7.5)
+
+    def test_drift(self):
+        """
+        Checks the bounded drift of the running sums.
+
+        REQ-FUN-B22
+        """
+        Window = self.TestClass(Size = 10)
+        #1.0E17 + 1.0 == 1.0E17, the subtraction leaves the rounding errors
+        Window.push(1.0E17, 1.0E8)
+        for Count in (10, 3 * test_module.RESUM_PERIOD):
+            for _ in range(Count):
+                Window.push(1.0, 1.0)
+            self.assertEqual(Window.Sum.Value, 10.0)
+            self.assertEqual(Window.Sum.SE, math.sqrt(10))
+            self.assertEqual(Window.Mean.Value, 1.0)
+            self.assertEqual(Window.WeightedMean.Value, 1.0)
+        Window = self.TestClass(Size = 3)
+        Window.push(1.0E17, 1.0)
+        for Index in range(6):
+            Window.push(1.0, 1.0)
+            if Index < 2:
+                continue
+            self.assertEqual(Window.Sum.Value, 3.0)
+            self.assertEqual(Window.Mean.Value, 1.0)
+        #the huge weight expires, the running weight must not cancel to 0
+        Window = self.TestClass(Size = 2)
+        Window.push(0.0, 1.0E-100)
+        for _ in range(3):
+            Window.push(1.0, 1.0)
+        self.assertEqual(Window.WeightedMean.Value, 1.0)
+        self.assertAlmostEqual(Window.WeightedMean.SE, math.sqrt(0.5),
+                                                                places = 15)
+        #exact readings only - no residuals
+        Window.push(1.0E17, 1.0E8)
+        for _ in range(10):
+            Window.push(2.0)
+        self.assertEqual(Window.Sum.SE, 0.0)
+        self.assertEqual(Window.WeightedMean.Value, 2.0)
+        self.assertEqual(Window.WeightedMean.SE, 0.0)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-B20
+        """
+        for Item in ('1', 1.0, True, [1]):
+            with self.assertRaises(TypeError):
+                self.TestClass(Size = Item)
+        for Item in ('1', True, [1.0], 1j):
+            with self.assertRaises(TypeError):
+                self.TestClass(Span = Item)
+        with self.assertRaises(TypeError):
+            self.TestClass(3)
+        Window = self.TestClass(Span = 1.0)
+        for Item in ('1', True, None, [1.0], 1j):
+            with self.assertRaises(TypeError):
+                Window.push(Item, 1.0, 1.0)
+            with self.assertRaises(TypeError):
+                Window.push(1.0, Item if Item is not None else '1', 1.0)
+            with self.assertRaises(TypeError):
+                Window.push(1.0, 1.0, Item)
+        with self.assertRaises(TypeError):
+            Window.push(MeasuredValue(1.0, 0.1), 0.1, 1.0)
+        self.assertEqual(Window.Count, 0)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-B21
+        """
+        for Arguments in ({}, {'Size' : 1, 'Span' : 1.0}, {'Size' : 0},
+                        {'Span' : 0}, {'Span' : -1.0}, {'Span' : math.inf},
+                        {'Span' : math.nan}):
+            with self.assertRaises(ValueError):
+                self.TestClass(**Arguments)
+        Window = self.TestClass(Span = 1.0)
+        for Value, Error, Time in ((math.nan, 1.0, 0.0), (1.0, -1.0, 0.0),
+                        (1.0, math.inf, 0.0), (1.0, 1.0E-200, 0.0),
+                        (1.0, 1.0E200, 0.0), (1.0, 1.0, math.nan),
+                        (1.0, 1.0, -math.inf)):
+            with self.assertRaises(ValueError):
+                Window.push(Value, Error, Time)
+        Window.push(1.0, 1.0, 2.0)
+        with self.assertRaises(ValueError):
+            Window.push(1.0, 1.0, 1.5)
+        self.assertEqual(Window.Count, 1)
+
+class Test_rollingWindows(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.accumulators.rollingWindows().
+
+    Implements tests: TEST-T-B30.
+    Covers the requirements REQ-FUN-B30, REQ-AWM-B30 and REQ-AWM-B31.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.rollingWindows)
+        Generator = np.random.default_rng(2026)
+        cls.Errors = Generator.uniform(0.5, 2.0, 3000)
+        cls.Errors[::37] = 0.0
+        cls.Values = Generator.normal(1.0E6, cls.Errors)
+        cls.Times = np.cumsum(Generator.exponential(1.0, 3000))
+        cls.Times[100 : 105] = cls.Times[100]
+
+    def checkStream(self, Window, Values, Errors, Times):
+        """
+        Compares the batch mode with the streaming window.
+        """
+        Arguments = dict(Size = Window.Size, Span = Window.Span,
+                        Times = None if Window.Span is None else Times)
+        Results = self.TestFunction(Values, Errors, **Arguments)
+        self.assertIsInstance(Results, tuple)
+        self.assertEqual(len(Results), 3)
+        for Result in Results:
+            self.assertIsInstance(Result, MeasuredArray)
+            self.assertEqual(Result.shape, Values.shape)
+        for Index in range(Values.size):
+            Window.push(Values[Index], Errors[Index], Times[Index])
+            for Result, Expected in zip(Results, (Window.Sum, Window.Mean,
+                                                        Window.WeightedMean)):
+                self.assertTrue(math.isclose(Result.Value[Index],
+                                        Expected.Value, rel_tol = 1E-12))
+                self.assertTrue(math.isclose(Result.SE[Index], Expected.SE,
+                                            rel_tol = 1E-9, abs_tol = 1E-12))
+
+    def test_batch(self):
+        """
+        Checks the batch mode against the streaming windows.
+
+        REQ-FUN-B30
+        """
+        Values, Errors, Times = self.Values, self.Errors, self.Times
+        Saved = test_module.RESUM_PERIOD
+        try:
+            test_module.RESUM_PERIOD = 100
+            for Window in (test_module.RollingWindow(Size = 1),
+                            test_module.RollingWindow(Size = 50),
+                            test_module.RollingWindow(Size = 500),
+                            test_module.RollingWindow(Size = 5000),
+                            test_module.RollingWindow(Span = 1.0),
+                            test_module.RollingWindow(Span = 300.0)):
+                self.checkStream(Window, Values, Errors, Times)
+        finally:
+            test_module.RESUM_PERIOD = Saved
+        #input forms
+        Expected = self.TestFunction(Values[:100], Errors[:100], Size = 5)
+        for Data, SE in ((MeasuredArray(Values[:100], Errors[:100]), None),
+                    ([MeasuredValue(float(Value), float(Error))
+                        for Value, Error in zip(Values[:100], Errors[:100])],
+                                                                        None),
+                    (Values[:100].tolist(), Errors[:100].tolist())):
+            Results = self.TestFunction(Data, SE, Size = 5)
+            for Result, Reference in zip(Results, Expected):
+                self.assertTrue(np.array_equal(Result.Value, Reference.Value))
+                self.assertTrue(np.array_equal(Result.SE, Reference.SE))
+        Sums, Means, WeightedMeans = self.TestFunction([1, 2, 3, 4], 0.5,
+                                                                    Size = 2)
+        self.assertListEqual(Sums.Value.tolist(), [1.0, 3.0, 5.0, 7.0])
+        self.assertListEqual(Means.Value.tolist(), [1.0, 1.5, 2.5, 3.5])
+        self.assertListEqual(WeightedMeans.Value.tolist(),
+                                                        [1.0, 1.5, 2.5, 3.5])
+        self.assertAlmostEqual(WeightedMeans.SE[-1], math.sqrt(0.125),
+                                                                places = 15)
+        Sums = self.TestFunction([], Size = 2)[0]
+        self.assertEqual(Sums.shape, (0, ))
+
+    def test_drift(self):
+        """
+        Checks that the large expired readings do not cancel the sums of the
+        following windows.
+
+        REQ-FUN-B30
+        """
+        Sums, Means, WeightedMeans = self.TestFunction(
+                                    np.r_[1.0E17, np.ones(20)], 1.0, Size = 3)
+        self.assertListEqual(Sums.Value[3:].tolist(), [3.0] * 18)
+        self.assertListEqual(Means.Value[3:].tolist(), [1.0] * 18)
+        self.assertListEqual(WeightedMeans.Value[3:].tolist(), [1.0] * 18)
+        Sums, Means, WeightedMeans = self.TestFunction([0.0, 1.0, 1.0, 1.0],
+                                        [1.0E-100, 1.0, 1.0, 1.0], Size = 2)
+        self.assertListEqual(WeightedMeans.Value[2:].tolist(), [1.0, 1.0])
+        for Item in WeightedMeans.SE[2:]:
+            self.assertAlmostEqual(Item, math.sqrt(0.5), places = 15)
+        Sums = self.TestFunction([1.0E17, 1.0, 0.0, 0.0, 0.0], 0.0,
+                                                                Size = 3)[0]
+        self.assertListEqual(Sums.Value[3:].tolist(), [1.0, 0.0])
+
+    def test_sparse(self):
+        """
+        Checks that the windows of zeros (sparse signals, exact readings) do
+        not restart the cumulative sums, i.e. the cost stays about the same
+        as for the dense signal.
+
+        REQ-FUN-B30
+        """
+        Dense = np.random.default_rng(3).normal(size = 200000)
+        Sparse = np.where(np.arange(Dense.size) % 3, 0.0, Dense)
+        Durations = list()
+        for Values, Errors in ((Dense, 1.0), (Sparse, 1.0),
+                                        (Dense, np.where(Sparse, 1.0, 0.0))):
+            Begin = time.perf_counter()
+            Sums = self.TestFunction(Values, Errors, Size = 2)[0]
+            Durations.append(time.perf_counter() - Begin)
+            Expected = np.convolve(Values, np.ones(2))[ : Values.size]
+            self.assertTrue(np.allclose(Sums.Value, Expected, rtol = 0,
+                                                                atol = 1E-12))
+        self.assertLess(max(Durations[1:]), 10 * Durations[0] + 0.1)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-B30
+        """
+        for Item in ('1', None, [1.0, '1'], [True, False], {1 : 2}):
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item, Size = 2)
+        for Item in ('1', True, [1.0, '1'], {1 : 2}):
+            with self.assertRaises(TypeError):
+                self.TestFunction([1.0, 2.0], Item, Size = 2)
+        for Item in ('1', 1.0, True, [1]):
+            with self.assertRaises(TypeError):
+                self.TestFunction([1.0, 2.0], Size = Item)
+        for Item in ('1', True, [1.0], 1j):
+            with self.assertRaises(TypeError):
+                self.TestFunction([1.0, 2.0], Span = Item, Times = [1, 2])
+        for Item in ('1', 1.0, [1.0, '1'], [True, False]):
+            with self.assertRaises(TypeError):
+                self.TestFunction([1.0, 2.0], Span = 1.0, Times = Item)
+        with self.assertRaises(TypeError):
+            self.TestFunction([1.0, 2.0], 1.0, 2)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-B31
+        """
+        for Arguments in ({}, {'Size' : 1, 'Span' : 1.0, 'Times' : [1, 2]},
+                        {'Size' : 0}, {'Span' : 0, 'Times' : [1, 2]},
+                        {'Span' : math.inf, 'Times' : [1, 2]},
+                        {'Span' : 1.0}, {'Size' : 1, 'Times' : [1, 2]},
+                        {'Span' : 1.0, 'Times' : [1, 2, 3]},
+                        {'Span' : 1.0, 'Times' : [1, math.nan]},
+                        {'Span' : 1.0, 'Times' : [2, 1]}):
+            with self.assertRaises(ValueError):
+                self.TestFunction([1.0, 2.0], **Arguments)
+        for Values, SE in (([[1.0, 2.0]], None), ([1.0, 2.0], [1.0, 2.0, 3.0]),
+                        ([1.0, math.nan], 1.0), ([1.0, 2.0], [1.0, -1.0]),
+                        ([1.0, 2.0], [1.0, 1.0E-200]),
+                        ([1.0, 2.0], [1.0, 1.0E200])):
+            with self.assertRaises(ValueError):
+                self.TestFunction(Values, SE, Size = 2)
+
+class Test_CovarianceAccumulator(unittest.TestCase):
+    """
+    Test cases for the class phyqus_lib.accumulators.CovarianceAccumulator.
+
+    Implements tests: TEST-T-B40.
+    Covers the requirements REQ-FUN-B40, REQ-FUN-B41, REQ-FUN-B42,
+    REQ-FUN-B43, REQ-FUN-B44, REQ-AWM-B40 and REQ-AWM-B41.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = test_module.CovarianceAccumulator
+        Generator = np.random.default_rng(2026)
+        #large offset to check the numerical stability
+        cls.Samples = Generator.multivariate_normal([1.0E6, 5.0, -3.0],
+                    [[1.0, 0.8, 0.1], [0.8, 2.0, -0.3], [0.1, -0.3, 0.5]],
+                                                                        3000)
+
+    def checkState(self, Accumulator, Samples):
+        """
+        Compares the state of the accumulator with the statistics of the
+        samples.
+        """
+        self.assertEqual(Accumulator.Count, len(Samples))
+        self.assertEqual(len(Accumulator), len(Samples))
+        self.assertEqual(Accumulator.Channels, Samples.shape[1])
+        self.assertTrue(np.allclose(Accumulator.Mean, Samples.mean(axis = 0),
+                                                    rtol = 0, atol = 1E-8))
+        Expected = np.cov(Samples.T)
+        self.assertTrue(np.allclose(Accumulator.Covariance, Expected,
+                                                rtol = 1E-9, atol = 1E-12))
+        self.assertTrue(np.array_equal(Accumulator.Covariance,
+                                                Accumulator.Covariance.T))
+        self.assertTrue(np.allclose(Accumulator.Correlation,
+                        np.corrcoef(Samples.T), rtol = 0, atol = 1E-10))
+
+    def test_init(self):
+        """
+        Checks the empty accumulator and the single samples streaming.
+
+        REQ-FUN-B40
+        """
+        Accumulator = self.TestClass(2)
+        self.assertEqual(Accumulator.Channels, 2)
+        self.assertEqual(Accumulator.Count, 0)
+        self.assertTrue(np.all(np.isnan(Accumulator.Mean)))
+        self.assertEqual(Accumulator.Covariance.shape, (2, 2))
+        self.assertTrue(np.all(np.isnan(Accumulator.Covariance)))
+        self.assertTrue(np.all(np.isnan(Accumulator.Correlation)))
+        Accumulator.push([1, 2])
+        self.assertListEqual(Accumulator.Mean.tolist(), [1.0, 2.0])
+        self.assertTrue(np.all(np.isnan(Accumulator.Covariance)))
+        Accumulator.push(np.array([3.0, 2.0], dtype = np.float32))
+        self.assertListEqual(Accumulator.Mean.tolist(), [2.0, 2.0])
+        self.assertListEqual(Accumulator.Covariance.tolist(),
+                                                    [[2.0, 0.0], [0.0, 0.0]])
+        Correlation = Accumulator.Correlation
+        self.assertEqual(Correlation[0, 0], 1.0)
+        self.assertTrue(np.all(np.isnan(Correlation[1])))
+        self.assertTrue(np.all(np.isnan(Correlation[:, 1])))
+        #the mean is a copy
+        Accumulator.Mean[0] = 100.0
+        self.assertEqual(Accumulator.Mean[0], 2.0)
+        Accumulator = self.TestClass(3)
+        for Sample in self.Samples:
+            Accumulator.push(Sample)
+        self.checkState(Accumulator, self.Samples)
+
+    def test_pushMany(self):
+        """
+        Checks the bulk updates by the arrays of samples, including the
+        chunked reduction, mixed with the single samples.
+
+        REQ-FUN-B41
+        """
+        Samples = self.Samples
+        Accumulator = self.TestClass(3)
+        Accumulator.pushMany(Samples[:1000])
+        Accumulator.pushMany([])
+        Accumulator.pushMany(np.empty((0, 3)))
+        Accumulator.push(Samples[1000].tolist())
+        Accumulator.pushMany(Samples[1001:2000].tolist())
+        Saved = test_module.CHUNK_ELEMENTS
+        try:
+            test_module.CHUNK_ELEMENTS = 100
+            Accumulator.pushMany(Samples[2000:])
+        finally:
+            test_module.CHUNK_ELEMENTS = Saved
+        self.checkState(Accumulator, Samples)
+        Accumulator = self.TestClass(1)
+        Accumulator.pushMany(np.arange(10, dtype = np.int16).reshape(10, 1))
+        self.assertEqual(Accumulator.Mean[0], 4.5)
+        self.assertAlmostEqual(Accumulator.Covariance[0, 0], 55 / 6,
+                                                                places = 12)
+        self.assertEqual(Accumulator.Correlation[0, 0], 1.0)
+        #failed bulk update does not change the state
+        with self.assertRaises(ValueError):
+            Accumulator.pushMany([[1.0], [math.nan]])
+        self.assertEqual(Accumulator.Count, 10)
+
+    def test_merge(self):
+        """
+        Checks the merging of the independent accumulators in any order.
+
+        REQ-FUN-B42
+        """
+        Samples = self.Samples
+        Parts = list()
+        for Start, Stop in ((0, 1), (1, 1300), (1300, 1300), (1300, 3000)):
+            Part = self.TestClass(3)
+            Part.pushMany(Samples[Start : Stop])
+            Parts.append(Part)
+        for Order in ((0, 1, 2, 3), (3, 2, 1, 0), (2, 0, 3, 1)):
+            Accumulator = self.TestClass(3)
+            for Index in Order:
+                Accumulator.merge(Parts[Index])
+            self.checkState(Accumulator, Samples)
+            Accumulator = sum((Parts[Index] for Index in Order),
+                                                            self.TestClass(3))
+            self.checkState(Accumulator, Samples)
+        Accumulator = Parts[1] + Parts[3]
+        self.assertIsInstance(Accumulator, self.TestClass)
+        Accumulator += Parts[0]
+        self.checkState(Accumulator, Samples)
+        self.assertEqual(Parts[1].Count, 1299)
+        self.assertEqual(Parts[2].Count, 0)
+        Covariance = Accumulator.Covariance
+        Accumulator.merge(Accumulator)
+        self.assertEqual(Accumulator.Count, 2 * len(Samples))
+        self.assertTrue(np.allclose(Accumulator.Covariance,
+                        Covariance * (2999 / 5999) * 2, rtol = 1E-12, atol = 0))
+
+    def test_toMeasuredArray(self):
+        """
+        Checks the means with the covariance matrix of the means.
+
+        REQ-FUN-B43
+        """
+        Accumulator = self.TestClass(3)
+        Accumulator.pushMany(self.Samples)
+        Result = Accumulator.toMeasuredArray()
+        self.assertIsInstance(Result, tuple)
+        self.assertEqual(len(Result), 2)
+        Means, Covariance = Result
+        self.assertIsInstance(Means, MeasuredArray)
+        self.assertEqual(Means.shape, (3, ))
+        self.assertIsInstance(Covariance, np.ndarray)
+        self.assertEqual(Covariance.shape, (3, 3))
+        self.assertTrue(np.array_equal(Means.Value, Accumulator.Mean))
+        self.assertTrue(np.allclose(Covariance,
+                        np.cov(self.Samples.T) / 3000, rtol = 1E-9, atol = 0))
+        self.assertTrue(np.allclose(Means.SE**2, np.diag(Covariance),
+                                                    rtol = 1E-15, atol = 0))
+        for Channel in range(3):
+            Single = test_module.SampleAccumulator()
+            Single.pushMany(self.Samples[:, Channel])
+            Expected = Single.toMeasuredValue()
+            self.assertAlmostEqual(Means.Value[Channel], Expected.Value,
+                                                                places = 8)
+            self.assertTrue(math.isclose(Means.SE[Channel], Expected.SE,
+                                                            rel_tol = 1E-9))
+        #the correlation of the means is the correlation of the samples
+        Scale = np.sqrt(np.diag(Covariance))
+        self.assertTrue(np.allclose(Covariance / np.outer(Scale, Scale),
+                            Accumulator.Correlation, rtol = 0, atol = 1E-12))
+
+    def test_bytes(self):
+        """
+        Checks the binary serialization of the state.
+
+        REQ-FUN-B44
+        """
+        for Channels in (1, 3):
+            for Size in (0, 1, 100):
+                Accumulator = self.TestClass(Channels)
+                Accumulator.pushMany(self.Samples[:Size, :Channels])
+                Data = Accumulator.toBytes()
+                self.assertIsInstance(Data, bytes)
+                self.assertEqual(len(Data), test_module.COVARIANCE_HEADER_SIZE
+                                            + 8 * Channels * (Channels + 1))
+                for Item in (Data, bytearray(Data), memoryview(Data)):
+                    Restored = self.TestClass.fromBytes(Item)
+                    self.assertIsInstance(Restored, self.TestClass)
+                    self.assertEqual(Restored.Channels, Channels)
+                    self.assertEqual(Restored.toBytes(), Data)
+                Restored = pickle.loads(pickle.dumps(Accumulator))
+                self.assertEqual(Restored.toBytes(), Data)
+        Restored.push([1.0E6, 5.0, -3.0])
+        self.assertEqual(Restored.Count, Accumulator.Count + 1)
+        self.assertEqual(Accumulator.Count, 100)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-B40
+        """
+        for Item in (1.0, '2', True, None, [2]):
+            with self.assertRaises(TypeError):
+                self.TestClass(Item)
+        Accumulator = self.TestClass(2)
+        for Item in ('12', None, [1.0, '1'], [True, False],
+                        [MeasuredValue(1.0, 0.1), 1.0], {1 : 2}, [1, [2, 3]]):
+            with self.assertRaises(TypeError):
+                Accumulator.push(Item)
+            with self.assertRaises(TypeError):
+                Accumulator.pushMany([Item])
+        for Item in (1, 1.0, None, test_module.SampleAccumulator()):
+            with self.assertRaises(TypeError):
+                Accumulator.merge(Item)
+            with self.assertRaises(TypeError):
+                Accumulator + Item
+            with self.assertRaises(TypeError):
+                Accumulator += Item
+        for Item in (1, 'a' * 64, None, list(bytes(64))):
+            with self.assertRaises(TypeError):
+                self.TestClass.fromBytes(Item)
+        self.assertEqual(Accumulator.Count, 0)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-B41
+        """
+        for Item in (0, -1):
+            with self.assertRaises(ValueError):
+                self.TestClass(Item)
+        Accumulator = self.TestClass(2)
+        for Item in (math.nan, math.inf, -math.inf):
+            with self.assertRaises(ValueError):
+                Accumulator.push([1.0, Item])
+            with self.assertRaises(ValueError):
+                Accumulator.pushMany([[1.0, 2.0], [1.0, Item]])
+        for Item in ([1.0], [1.0, 2.0, 3.0], [[1.0, 2.0]]):
+            with self.assertRaises(ValueError):
+                Accumulator.push(Item)
+        for Item in ([1.0, 2.0], [[1.0, 2.0, 3.0]], np.ones((2, 2, 2)),
+                                                            np.empty((0, 3))):
+            with self.assertRaises(ValueError):
+                Accumulator.pushMany(Item)
+        with self.assertRaises(ValueError):
+            Accumulator.toMeasuredArray()
+        Accumulator.push([1.0, 2.0])
+        with self.assertRaises(ValueError):
+            Accumulator.toMeasuredArray()
+        Other = self.TestClass(3)
+        with self.assertRaises(ValueError):
+            Accumulator.merge(Other)
+        with self.assertRaises(ValueError):
+            Accumulator + Other
+        with self.assertRaises(ValueError):
+            Accumulator += Other
+        self.assertEqual(Accumulator.Count, 1)
+        Data = Accumulator.toBytes()
+        for Item in (Data[:-1], Data + b'0', b'', Data[:10],
+                            struct.pack(test_module.COVARIANCE_HEADER, 0, 0)):
+            with self.assertRaises(ValueError):
+                self.TestClass.fromBytes(Item)
+        for Count, Values in ((0, [1.0, 0.0, 0.0, 0.0, 0.0, 0.0]),
+                            (2, [1.0, 1.0, 1.0, 0.5, 0.4, 1.0]),
+                            (2, [1.0, 1.0, -1.0, 0.0, 0.0, 1.0]),
+                            (2, [math.nan, 1.0, 1.0, 0.0, 0.0, 1.0]),
+                            (2, [1.0, 1.0, math.inf, 0.0, 0.0, 1.0])):
+            with self.assertRaises(ValueError):
+                self.TestClass.fromBytes(struct.pack(
+                        test_module.COVARIANCE_HEADER, 2, Count)
+                                        + struct.pack('<6d', *Values))
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_SampleAccumulator)
+
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_WeightedMean)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_RollingWindow)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_rollingWindows)
+TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(
+                                                Test_CovarianceAccumulator)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4,
+                                                                TestSuite5])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.accumulators module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
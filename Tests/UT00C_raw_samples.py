@@ -0,0 +1,427 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT00C_raw_samples
+
+Set of unit tests on the module phyqus_lib.raw_samples.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import math
+import tempfile
+import shutil
+import pathlib
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+import phyqus_lib.raw_samples as test_module
+
+#globals
+
+HEADER = 512 #bytes of the file header
+
+CHANNELS = 4 #number of the interleaved channels
+
+#classes
+
+#+ test cases
+
+class Test_mapSamples(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.raw_samples.mapSamples().
+
+    Implements tests: TEST-T-C00.
+    Covers the requirements REQ-FUN-C00, REQ-AWM-C00 and REQ-AWM-C01.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.mapSamples)
+        cls.Folder = tempfile.mkdtemp()
+        Generator = np.random.default_rng(2026)
+        cls.Samples = Generator.integers(-30000, 30000, (1001, CHANNELS),
+                                                        dtype = np.int16)
+        cls.Path = os.path.join(cls.Folder, 'samples.bin')
+        with open(cls.Path, 'wb') as File:
+            File.write(b'\x00' * HEADER)
+            File.write(cls.Samples.astype('>i2').tobytes())
+            File.write(b'\x01') #incomplete trailing sample
+        cls.Empty = os.path.join(cls.Folder, 'empty.bin')
+        open(cls.Empty, 'wb').close()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean-up after all test cases, done only once.
+        """
+        shutil.rmtree(cls.Folder, ignore_errors = True)
+
+    def test_map(self):
+        """
+        Checks the mapping of the interleaved channels and the byte order.
+
+        REQ-FUN-C00
+        """
+        for Channel in range(CHANNELS):
+            for Path in (self.Path, pathlib.Path(self.Path)):
+                Result = self.TestFunction(Path, '>i2', Offset = HEADER
+                                    + 2 * Channel, Stride = 2 * CHANNELS)
+                self.assertIsInstance(Result, np.ndarray)
+                self.assertEqual(Result.ndim, 1)
+                self.assertFalse(Result.flags.writeable)
+                self.assertTrue(np.array_equal(Result,
+                                                self.Samples[:, Channel]))
+        Result = self.TestFunction(self.Path, np.dtype('>i2'),
+                                                            Offset = HEADER)
+        self.assertTrue(np.array_equal(Result, self.Samples.ravel()))
+        Result = self.TestFunction(self.Path, np.uint8)
+        self.assertEqual(Result.size, HEADER + 2 * self.Samples.size + 1)
+        Result = self.TestFunction(self.Path, Offset = HEADER)
+        self.assertEqual(Result.dtype, np.float64)
+        self.assertEqual(Result.size, (2 * self.Samples.size + 1) // 8)
+        for Offset in (HEADER + 2 * self.Samples.size, 10 ** 6):
+            Result = self.TestFunction(self.Path, '>i2', Offset = Offset)
+            self.assertEqual(Result.size, 0)
+        Result = self.TestFunction(self.Empty, 'f4')
+        self.assertEqual(Result.size, 0)
+        self.assertEqual(Result.dtype, np.float32)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-C00
+        """
+        for Item in (1, None, b'samples.bin', [self.Path]):
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item)
+        for Item in (None, 1, 1.0, ['f4'], 'not a type'):
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Path, Item)
+        for Item in (1.0, '0', None, True):
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Path, Offset = Item)
+        for Item in (8.0, '8', True):
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Path, Stride = Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError or
+        OSError.
+
+        REQ-AWM-C01
+        """
+        for Item in ('c16', 'U4', 'datetime64[s]', bool, object):
+            with self.assertRaises(ValueError):
+                self.TestFunction(self.Path, Item)
+        with self.assertRaises(ValueError):
+            self.TestFunction(self.Path, Offset = -1)
+        for Item in (0, 7):
+            with self.assertRaises(ValueError):
+                self.TestFunction(self.Path, 'f8', Stride = Item)
+        with self.assertRaises(OSError):
+            self.TestFunction(os.path.join(self.Folder, 'missing.bin'))
+
+class Test_reduceBlocks(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.raw_samples.reduceBlocks().
+
+    Implements tests: TEST-T-C10.
+    Covers the requirements REQ-FUN-C10, REQ-FUN-C11, REQ-AWM-C10 and
+    REQ-AWM-C11.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.reduceBlocks)
+        Generator = np.random.default_rng(2026)
+        #large offset to check the numerical stability
+        cls.Samples = Generator.normal(1.0E6, 0.5, 10007)
+        Starts = np.sort(Generator.choice(np.arange(1, 10007), 300,
+                                                            replace = False))
+        cls.Starts = np.concatenate(([0], Starts))
+
+    def checkBlocks(self, Result, Bounds):
+        """
+        Compares the reduced blocks with the mean and the standard error of
+        the mean of each block calculated by NumPy.
+        """
+        self.assertIsInstance(Result, MeasuredArray)
+        self.assertEqual(Result.shape, (len(Bounds) - 1, ))
+        for Index, (Start, Stop) in enumerate(zip(Bounds[:-1], Bounds[1:])):
+            Block = self.Samples[Start : Stop]
+            self.assertAlmostEqual(Result.Value[Index], Block.mean(),
+                                                                places = 8)
+            if Block.size > 1:
+                self.assertTrue(math.isclose(Result.SE[Index],
+                        Block.std(ddof = 1) / math.sqrt(Block.size),
+                                                            rel_tol = 1E-8))
+            else:
+                self.assertTrue(math.isnan(Result.SE[Index]))
+
+    def test_fixed(self):
+        """
+        Checks the fixed size blocks.
+
+        REQ-FUN-C10
+        """
+        for BlockSize in (1, 2, 100, 10007, 20000):
+            Result = self.TestFunction(self.Samples, BlockSize)
+            Count = self.Samples.size // BlockSize
+            self.checkBlocks(Result, [Index * BlockSize
+                                            for Index in range(Count + 1)])
+        Saved = test_module.CHUNK_ELEMENTS
+        try:
+            test_module.CHUNK_ELEMENTS = 333
+            for BlockSize in (7, 100, 1000):
+                Result = self.TestFunction(self.Samples, BlockSize)
+                Count = self.Samples.size // BlockSize
+                self.checkBlocks(Result, [Index * BlockSize
+                                            for Index in range(Count + 1)])
+        finally:
+            test_module.CHUNK_ELEMENTS = Saved
+        Result = self.TestFunction(np.arange(6, dtype = np.uint8), 3)
+        self.assertListEqual(Result.Value.tolist(), [1.0, 4.0])
+        for Item in Result.SE:
+            self.assertAlmostEqual(Item, 1 / math.sqrt(3), places = 15)
+        Result = self.TestFunction([1, 2, 3, 4, 5], BlockSize = 2)
+        self.assertListEqual(Result.Value.tolist(), [1.5, 3.5])
+        self.assertListEqual(Result.SE.tolist(), [0.5, 0.5])
+        self.assertEqual(self.TestFunction([], 3).shape, (0, ))
+        #non-finite samples affect only their blocks
+        Result = self.TestFunction([1.0, 2.0, math.nan, 4.0], 2)
+        self.assertEqual(Result.Value[0], 1.5)
+        self.assertTrue(math.isnan(Result.Value[1]))
+
+    def test_variable(self):
+        """
+        Checks the variable blocks.
+
+        REQ-FUN-C11
+        """
+        Bounds = self.Starts.tolist() + [self.Samples.size]
+        for Starts in (self.Starts, self.Starts.tolist(),
+                                            self.Starts.astype(np.uint32)):
+            self.checkBlocks(self.TestFunction(self.Samples, Starts = Starts),
+                                                                        Bounds)
+        Saved = test_module.CHUNK_ELEMENTS
+        try:
+            test_module.CHUNK_ELEMENTS = 50
+            self.checkBlocks(self.TestFunction(self.Samples,
+                                            Starts = self.Starts), Bounds)
+        finally:
+            test_module.CHUNK_ELEMENTS = Saved
+        Starts = self.Starts[5 : 20]
+        self.checkBlocks(self.TestFunction(self.Samples, Starts = Starts),
+                                    Starts.tolist() + [self.Samples.size])
+        Result = self.TestFunction([1, 2, 3, 4, 5], Starts = [0, 4])
+        self.assertListEqual(Result.Value.tolist(), [2.5, 5.0])
+        self.assertAlmostEqual(Result.SE[0], math.sqrt(5 / 12), places = 15)
+        self.assertTrue(math.isnan(Result.SE[1]))
+        self.assertEqual(self.TestFunction([], Starts = []).shape, (0, ))
+        self.assertEqual(self.TestFunction([1, 2], Starts = []).shape, (0, ))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-C10
+        """
+        for Item in (1, 1.0, None, '12', [1, '2'], [True, False],
+                                                        {1 : 2}, [1, [2, 3]]):
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item, 2)
+        for Item in (2.0, '2', True, [2]):
+            with self.assertRaises(TypeError):
+                self.TestFunction([1, 2, 3], Item)
+        for Item in (0, 1.0, '0', [0.0, 1.0], [True, False], [0, '1']):
+            with self.assertRaises(TypeError):
+                self.TestFunction([1, 2, 3], Starts = Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-C11
+        """
+        with self.assertRaises(ValueError):
+            self.TestFunction([[1, 2], [3, 4]], 2)
+        with self.assertRaises(ValueError):
+            self.TestFunction([1, 2, 3])
+        with self.assertRaises(ValueError):
+            self.TestFunction([1, 2, 3], 2, Starts = [0])
+        for Item in (0, -1):
+            with self.assertRaises(ValueError):
+                self.TestFunction([1, 2, 3], Item)
+        for Item in ([[0, 1]], [0, 0, 1], [1, 0], [-1, 1], [0, 3]):
+            with self.assertRaises(ValueError):
+                self.TestFunction([1, 2, 3], Starts = Item)
+
+class Test_reduceFile(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.raw_samples.reduceFile().
+
+    Implements tests: TEST-T-C20.
+    Covers the requirements REQ-FUN-C20, REQ-FUN-C21, REQ-AWM-C20 and
+    REQ-AWM-C21.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.reduceFile)
+        cls.Folder = tempfile.mkdtemp()
+        Generator = np.random.default_rng(2026)
+        cls.Samples = Generator.normal(1.0E4, 3.0, (20011, CHANNELS)).astype(
+                                                                    '<f4')
+        cls.Path = os.path.join(cls.Folder, 'samples.bin')
+        with open(cls.Path, 'wb') as File:
+            File.write(b'\x00' * HEADER)
+            File.write(cls.Samples.tobytes())
+        Starts = np.sort(Generator.choice(np.arange(1, 20011), 500,
+                                                            replace = False))
+        cls.Starts = np.concatenate(([0], Starts))
+        cls.Layout = dict(DType = '<f4', Offset = HEADER + 4 * 2,
+                                                        Stride = 4 * CHANNELS)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean-up after all test cases, done only once.
+        """
+        shutil.rmtree(cls.Folder, ignore_errors = True)
+
+    def checkSame(self, Result, Expected):
+        """
+        Checks that two arrays of measurements are identical.
+        """
+        self.assertIsInstance(Result, MeasuredArray)
+        self.assertTrue(np.array_equal(Result.Value, Expected.Value))
+        self.assertTrue(np.array_equal(Result.SE, Expected.SE,
+                                                            equal_nan = True))
+
+    def test_reduce(self):
+        """
+        Checks the reduction of a file.
+
+        REQ-FUN-C20
+        """
+        Samples = self.Samples[:, 2]
+        for BlockSize in (1, 10, 1000, 30000):
+            Expected = test_module.reduceBlocks(Samples, BlockSize)
+            self.checkSame(self.TestFunction(self.Path, BlockSize,
+                                                    **self.Layout), Expected)
+        self.checkSame(self.TestFunction(pathlib.Path(self.Path),
+                                    Starts = self.Starts, **self.Layout),
+                    test_module.reduceBlocks(Samples, Starts = self.Starts))
+        Result = self.TestFunction(self.Path, 1000, **self.Layout)
+        Expected = Samples[:20000].astype(np.float64).reshape(20, 1000)
+        self.assertTrue(np.allclose(Result.Value, Expected.mean(axis = 1),
+                                                rtol = 1E-14, atol = 0.0))
+        self.assertTrue(np.allclose(Result.SE, Expected.std(axis = 1,
+                        ddof = 1) / math.sqrt(1000), rtol = 1E-10, atol = 0.0))
+        self.assertEqual(self.TestFunction(self.Path, 10, DType = 'f8',
+                                    Offset = 10 ** 7).shape, (0, ))
+
+    def test_parallel(self):
+        """
+        Checks the reduction of the file regions by the worker processes.
+
+        REQ-FUN-C21
+        """
+        for Arguments in ({'BlockSize' : 7}, {'BlockSize' : 20011},
+                                                    {'Starts' : self.Starts}):
+            Expected = self.TestFunction(self.Path, **Arguments,
+                                                                **self.Layout)
+            for Workers in (2, 3):
+                self.checkSame(self.TestFunction(self.Path, **Arguments,
+                                    Workers = Workers, **self.Layout), Expected)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-C20
+        """
+        for Item in (1, None, [self.Path]):
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item, 2)
+        for Item in (2.0, '2', True):
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Path, Item)
+        for Item in (0, [0.0, 1.0], [0, '1']):
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Path, Starts = Item)
+        for Item in (None, 1, ['f4']):
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Path, 2, DType = Item)
+        for Name in ('Offset', 'Stride', 'Workers'):
+            for Item in (8.0, '8', True):
+                with self.assertRaises(TypeError):
+                    self.TestFunction(self.Path, 2, **{Name : Item})
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError or
+        OSError.
+
+        REQ-AWM-C21
+        """
+        for Arguments in ({}, {'BlockSize' : 2, 'Starts' : [0]},
+                        {'BlockSize' : 0}, {'Starts' : [1, 1]},
+                        {'Starts' : [-1]}, {'Starts' : [0, 10 ** 6]},
+                        {'BlockSize' : 2, 'DType' : 'c8'},
+                        {'BlockSize' : 2, 'Offset' : -1},
+                        {'BlockSize' : 2, 'Stride' : 2},
+                        {'BlockSize' : 2, 'Workers' : 0}):
+            with self.assertRaises(ValueError):
+                self.TestFunction(self.Path, **Arguments)
+        with self.assertRaises(OSError):
+            self.TestFunction(os.path.join(self.Folder, 'missing.bin'), 2)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_mapSamples)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_reduceBlocks)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_reduceFile)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.raw_samples module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -0,0 +1,567 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT00D_aggregation
+
+Set of unit tests on the module phyqus_lib.aggregation.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import math
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+import phyqus_lib.aggregation as test_module
+
+#classes
+
+#+ test cases
+
+class Test_GroupBy(unittest.TestCase):
+    """
+    Test cases for the class phyqus_lib.aggregation.GroupBy.
+
+    Implements tests: TEST-T-D00.
+    Covers the requirements REQ-FUN-D00, REQ-FUN-D01, REQ-FUN-D02,
+    REQ-FUN-D03, REQ-AWM-D00 and REQ-AWM-D01.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = test_module.GroupBy
+        Generator = np.random.default_rng(2026)
+        cls.Labels = Generator.integers(-5, 20, 1000)
+        cls.Values = Generator.normal(10.0, 3.0, 1000)
+        cls.Errors = Generator.uniform(0.1, 2.0, 1000)
+
+    def reference(self, Labels, Values, Errors):
+        """
+        Calculates the keys, the counts, the sums, the means and the
+        weighted means of the groups of 1-D readings in a Python loop.
+        """
+        Groups = dict()
+        for Label, Value, Error in zip(Labels, Values, Errors):
+            Groups.setdefault(Label, []).append((Value, Error))
+        Result = []
+        for Key in sorted(Groups):
+            Readings = Groups[Key]
+            Sum = math.fsum(Value for Value, _ in Readings)
+            Variance = math.fsum(Error * Error for _, Error in Readings)
+            Weight = math.fsum(1 / (Error * Error) for _, Error in Readings)
+            WeightedSum = math.fsum(Value / (Error * Error)
+                                                for Value, Error in Readings)
+            Count = len(Readings)
+            Result.append((Key, Count, Sum, math.sqrt(Variance), Sum / Count,
+                            math.sqrt(Variance) / Count, WeightedSum / Weight,
+                                                        1 / math.sqrt(Weight)))
+        return Result
+
+    def checkResults(self, Groups, Values, Errors):
+        """
+        Compares the reductions of the groups with the reference ones.
+        """
+        Sums = Groups.sum(Values, Errors)
+        Means = Groups.mean(Values, Errors)
+        WeightedMeans = Groups.weightedMean(Values, Errors)
+        for Item in (Sums, Means, WeightedMeans):
+            self.assertIsInstance(Item, MeasuredArray)
+            self.assertEqual(Item.shape, (len(Groups), ))
+        Reference = self.reference(self.Labels, Values, Errors)
+        self.assertEqual(len(Groups), len(Reference))
+        for Index, Expected in enumerate(Reference):
+            self.assertEqual(Groups.Keys[Index], Expected[0])
+            self.assertEqual(Groups.Counts[Index], Expected[1])
+            for Item, Value, Error in ((Sums, *Expected[2:4]),
+                                            (Means, *Expected[4:6]),
+                                            (WeightedMeans, *Expected[6:])):
+                self.assertAlmostEqual(Item.Value[Index], Value, places = 10)
+                self.assertAlmostEqual(Item.SE[Index], Error, places = 12)
+
+    def test_init(self):
+        """
+        Checks the factorization of the labels.
+
+        REQ-FUN-D00
+        """
+        Groups = self.TestClass([3, 1, 3, 2, 1, 3])
+        self.assertEqual(len(Groups), 3)
+        self.assertListEqual(Groups.Keys.tolist(), [1, 2, 3])
+        self.assertListEqual(Groups.Counts.tolist(), [2, 1, 3])
+        self.assertListEqual(Groups.Indexes.tolist(), [2, 0, 2, 1, 0, 2])
+        for Item in (Groups.Keys, Groups.Counts, Groups.Indexes):
+            self.assertIsInstance(Item, np.ndarray)
+            self.assertFalse(Item.flags.writeable)
+        Groups = self.TestClass(('run_2', 'run_1', 'run_2'))
+        self.assertListEqual(Groups.Keys.tolist(), ['run_1', 'run_2'])
+        self.assertListEqual(Groups.Counts.tolist(), [1, 2])
+        Groups = self.TestClass(np.array([0.5, -1.0, 0.5, 0.5]))
+        self.assertListEqual(Groups.Keys.tolist(), [-1.0, 0.5])
+        Groups = self.TestClass([True, False, True])
+        self.assertListEqual(Groups.Keys.tolist(), [False, True])
+        Groups = self.TestClass(np.array([7, 7, 8, 9, 9], dtype = np.uint8))
+        self.assertListEqual(Groups.Counts.tolist(), [2, 1, 2])
+        Groups = self.TestClass([])
+        self.assertEqual(len(Groups), 0)
+        self.assertEqual(Groups.Counts.size, 0)
+
+    def test_sum_mean(self):
+        """
+        Checks the sums and the means of the groups.
+
+        REQ-FUN-D01
+        """
+        Groups = self.TestClass(self.Labels)
+        self.checkResults(Groups, self.Values, self.Errors)
+        #pre-sorted labels
+        Order = np.argsort(self.Labels, kind = 'stable')
+        Sorted = self.TestClass(self.Labels[Order])
+        Result = Sorted.sum(self.Values[Order], self.Errors[Order])
+        Expected = Groups.sum(self.Values, self.Errors)
+        self.assertTrue(np.allclose(Result.Value, Expected.Value,
+                                                rtol = 1E-13, atol = 0.0))
+        self.assertTrue(np.allclose(Result.SE, Expected.SE,
+                                                rtol = 1E-13, atol = 0.0))
+        Groups = self.TestClass([3, 1, 3, 2, 1, 3])
+        Result = Groups.sum([1, 2, 3, 4, 5, 6], [1, 1, 2, 0.5, 1, 2])
+        self.assertListEqual(Result.Value.tolist(), [7.0, 4.0, 10.0])
+        self.assertListEqual(Result.SE.tolist(), [math.sqrt(2), 0.5, 3.0])
+        Result = Groups.mean([1, 2, 3, 4, 5, 6], 0.0)
+        self.assertListEqual(Result.Value.tolist(), [3.5, 4.0, 10 / 3])
+        self.assertListEqual(Result.SE.tolist(), [0.0, 0.0, 0.0])
+        Result = Groups.mean(MeasuredArray([1, 2, 3, 4, 5, 6], 1.0))
+        self.assertListEqual(Result.Value.tolist(), [3.5, 4.0, 10 / 3])
+        for Item, Expected in zip(Result.SE, [math.sqrt(2) / 2, 1.0,
+                                                        math.sqrt(3) / 3]):
+            self.assertAlmostEqual(Item, Expected, places = 15)
+        Readings = [MeasuredValue(Value, 0.5) for Value in range(6)]
+        Result = Groups.sum(Readings)
+        self.assertListEqual(Result.Value.tolist(), [5.0, 3.0, 7.0])
+        self.assertEqual(self.TestClass([]).sum([]).shape, (0, ))
+        self.assertEqual(self.TestClass([]).mean([]).shape, (0, ))
+
+    def test_weightedMean(self):
+        """
+        Checks the weighted means of the groups.
+
+        REQ-FUN-D02
+        """
+        Groups = self.TestClass([3, 1, 3, 2, 1, 3])
+        Result = Groups.weightedMean([1, 2, 3, 4, 5, 6], [1, 1, 2, 0.5, 1, 2])
+        self.assertIsInstance(Result, MeasuredArray)
+        self.assertListEqual(Result.Value.tolist()[:2], [3.5, 4.0])
+        self.assertAlmostEqual(Result.Value[2], 3.25 / 1.5, places = 15)
+        for Item, Expected in zip(Result.SE, [math.sqrt(0.5), 0.5,
+                                                        math.sqrt(1 / 1.5)]):
+            self.assertAlmostEqual(Item, Expected, places = 15)
+        #exact readings take precedence
+        Result = Groups.weightedMean([1, 2, 3, 4, 5, 6], [1, 0, 0, 0.5, 0, 2])
+        self.assertListEqual(Result.Value.tolist(), [3.5, 4.0, 3.0])
+        self.assertListEqual(Result.SE.tolist(), [0.0, 0.5, 0.0])
+        self.assertEqual(self.TestClass([]).weightedMean([]).shape, (0, ))
+
+    def test_multidimensional(self):
+        """
+        Checks the reduction of the N-D readings along the first axis.
+
+        REQ-FUN-D03
+        """
+        Groups = self.TestClass(self.Labels)
+        Values = np.stack([self.Values, 2 * self.Values, self.Values[::-1]],
+                                                                    axis = 1)
+        Errors = np.stack([self.Errors, self.Errors, self.Errors[::-1]],
+                                                                    axis = 1)
+        Results = [Groups.sum(Values, Errors), Groups.mean(Values, Errors),
+                                        Groups.weightedMean(Values, Errors)]
+        for Column in range(3):
+            Expected = [Groups.sum(Values[:, Column], Errors[:, Column]),
+                            Groups.mean(Values[:, Column], Errors[:, Column]),
+                    Groups.weightedMean(Values[:, Column], Errors[:, Column])]
+            for Result, Reference in zip(Results, Expected):
+                self.assertEqual(Result.shape, (len(Groups), 3))
+                self.assertTrue(np.allclose(Result.Value[:, Column],
+                            Reference.Value, rtol = 1E-13, atol = 1E-13))
+                self.assertTrue(np.allclose(Result.SE[:, Column],
+                            Reference.SE, rtol = 1E-13, atol = 1E-13))
+        Result = Groups.sum(np.ones((1000, 2, 2)), 1.0)
+        self.assertEqual(Result.shape, (len(Groups), 2, 2))
+        self.assertTrue(np.array_equal(Result.Value[:, 1, 1], Groups.Counts))
+        self.assertEqual(self.TestClass([]).sum(np.zeros((0, 3))).shape,
+                                                                    (0, 3))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-D00
+        """
+        for Item in (1, None, 'labels', {1 : 2}, [None, 1], [1, [2, 3]],
+                                                [1 + 2j], [MeasuredValue(1)]):
+            with self.assertRaises(TypeError):
+                self.TestClass(Item)
+        Groups = self.TestClass([1, 2, 1])
+        for Method in (Groups.sum, Groups.mean, Groups.weightedMean):
+            for Item in (None, '123', [1, '2', 3], [1, None, 3]):
+                with self.assertRaises(TypeError):
+                    Method(Item)
+            for Item in ('1', [1, '2', 3], [True] * 3):
+                with self.assertRaises(TypeError):
+                    Method([1, 2, 3], Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-D01
+        """
+        for Item in ([[1, 2], [3, 4]], np.array(1), [1.0, math.nan]):
+            with self.assertRaises(ValueError):
+                self.TestClass(Item)
+        Groups = self.TestClass([1, 2, 1])
+        for Method in (Groups.sum, Groups.mean, Groups.weightedMean):
+            for Values, SE in (([1, 2], None), ([1, 2, 3, 4], None),
+                    (1.0, None), ([1, 2, 3], [1, 2]), ([1, math.nan, 3], 1),
+                    ([1, 2, 3], -1), ([1, 2, 3], [1, math.inf, 1]),
+                    ([1, 2, 3], 1.0E-200), (np.ones((2, 3)), 1)):
+                with self.assertRaises(ValueError):
+                    Method(Values, SE)
+
+class Test_groupBy(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.aggregation.groupBy().
+
+    Implements tests: TEST-T-D10.
+    Covers the requirements REQ-FUN-D10, REQ-AWM-D10 and REQ-AWM-D11.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.groupBy)
+        Generator = np.random.default_rng(2026)
+        cls.Labels = Generator.choice(['A1', 'B2', 'C3', 'D4'], 500)
+        cls.Values = Generator.normal(0.0, 1.0, (500, 2))
+        cls.Errors = Generator.uniform(0.1, 1.0, (500, 2))
+
+    def test_groupBy(self):
+        """
+        Checks the simultaneous reductions of the groups.
+
+        REQ-FUN-D10
+        """
+        Groups = test_module.GroupBy(self.Labels)
+        for Arguments in ((self.Values, self.Errors),
+                                (MeasuredArray(self.Values, self.Errors), )):
+            Result = self.TestFunction(self.Labels, *Arguments)
+            self.assertIsInstance(Result, tuple)
+            self.assertEqual(len(Result), 5)
+            Keys, Counts, Sums, Means, WeightedMeans = Result
+            self.assertListEqual(Keys.tolist(), ['A1', 'B2', 'C3', 'D4'])
+            self.assertTrue(np.array_equal(Counts, Groups.Counts))
+            self.assertEqual(int(Counts.sum()), 500)
+            for Item, Method in ((Sums, Groups.sum), (Means, Groups.mean),
+                                        (WeightedMeans, Groups.weightedMean)):
+                self.assertIsInstance(Item, MeasuredArray)
+                Expected = Method(*Arguments)
+                self.assertTrue(np.array_equal(Item.Value, Expected.Value))
+                self.assertTrue(np.array_equal(Item.SE, Expected.SE))
+        Keys, Counts, Sums, Means, WeightedMeans = self.TestFunction(
+                                                [2, 1, 2], [1.0, 2.0, 3.0], 1.0)
+        self.assertListEqual(Keys.tolist(), [1, 2])
+        self.assertListEqual(Counts.tolist(), [1, 2])
+        self.assertListEqual(Sums.Value.tolist(), [2.0, 4.0])
+        self.assertListEqual(Means.Value.tolist(), [2.0, 2.0])
+        self.assertEqual(WeightedMeans.SE[0], 1.0)
+        self.assertAlmostEqual(WeightedMeans.SE[1], math.sqrt(0.5), places = 15)
+        Result = self.TestFunction([], [])
+        for Item in Result:
+            self.assertEqual(Item.shape, (0, ))
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-D10
+        """
+        for Item in (1, None, [None, 1]):
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item, [1, 2])
+        for Item in (None, '12', [1, '2']):
+            with self.assertRaises(TypeError):
+                self.TestFunction([1, 2], Item)
+        with self.assertRaises(TypeError):
+            self.TestFunction([1, 2], [1, 2], '1')
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-D11
+        """
+        for Labels, Values, SE in (([[1, 2]], [1, 2], None),
+                ([1, math.nan], [1, 2], None), ([1, 2], [1, 2, 3], None),
+                ([1, 2], [1, 2], [1, 2, 3]), ([1, 2], [1, math.inf], None),
+                ([1, 2], [1, 2], -1.0), ([1, 2], [1, 2], 1.0E-200)):
+            with self.assertRaises(ValueError):
+                self.TestFunction(Labels, Values, SE)
+
+class Test_sigmaClip(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.aggregation.sigmaClip().
+
+    Implements tests: TEST-T-D20.
+    Covers the requirements REQ-FUN-D20, REQ-FUN-D21, REQ-FUN-D22,
+    REQ-AWM-D20 and REQ-AWM-D21.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.sigmaClip)
+        Generator = np.random.default_rng(2026)
+        cls.Values = Generator.normal(10.0, 1.0, (40, 50))
+        cls.Errors = Generator.uniform(0.5, 1.5, (40, 50))
+        cls.Values[::3, 7] += 20.0
+        cls.Values[::5, 11] -= 15.0
+
+    def clip(self, Values, Errors, Threshold = 3.0, MaxIterations = 10):
+        """
+        Reference implementation: clipping of a 1-D array of the readings
+        reading by reading.
+        """
+        Kept = list(range(len(Values)))
+        Iterations = 0
+        while Iterations < MaxIterations:
+            Weight = sum(1 / Errors[Index]**2 for Index in Kept)
+            Mean = sum(Values[Index] / Errors[Index]**2
+                                                for Index in Kept) / Weight
+            Outliers = [Index for Index in Kept
+                        if abs(Values[Index] - Mean) > Threshold * math.sqrt(
+                                            Errors[Index]**2 + 1 / Weight)]
+            if not Outliers:
+                break
+            Kept = [Index for Index in Kept if not (Index in Outliers)]
+            Iterations += 1
+        Weight = sum(1 / Errors[Index]**2 for Index in Kept)
+        Mean = sum(Values[Index] / Errors[Index]**2
+                                                for Index in Kept) / Weight
+        Mask = [not (Index in Kept) for Index in range(len(Values))]
+        return Mean, 1 / math.sqrt(Weight), Mask, Iterations
+
+    def test_clipping(self):
+        """
+        Checks the clipping of all readings.
+
+        REQ-FUN-D20
+        """
+        Values, Errors = self.Values[0], self.Errors[0]
+        for Arguments in ((Values, Errors), (MeasuredArray(Values, Errors), ),
+                    ([MeasuredValue(Value, Error)
+                                for Value, Error in zip(Values, Errors)], )):
+            Result = self.TestFunction(*Arguments)
+            self.assertIsInstance(Result, tuple)
+            self.assertEqual(len(Result), 3)
+            Mean, Mask, Iterations = Result
+            self.assertIsInstance(Mean, MeasuredValue)
+            self.assertIsInstance(Mask, np.ndarray)
+            self.assertEqual(Mask.dtype, bool)
+            self.assertEqual(Mask.shape, (50, ))
+            self.assertIsInstance(Iterations, int)
+            Expected = self.clip(Values, Errors)
+            self.assertAlmostEqual(Mean.Value, Expected[0], places = 12)
+            self.assertAlmostEqual(Mean.SE, Expected[1], places = 12)
+            self.assertListEqual(Mask.tolist(), Expected[2])
+            self.assertEqual(Iterations, Expected[3])
+            self.assertTrue(Mask[7] and Mask[11])
+        #the same as the weighted mean of the kept readings
+        Expected = test_module.GroupBy(np.zeros(50 - int(Mask.sum()))
+                    ).weightedMean(Values[~Mask], Errors[~Mask])
+        self.assertAlmostEqual(Mean.Value, Expected.Value[0], places = 12)
+        self.assertAlmostEqual(Mean.SE, Expected.SE[0], places = 12)
+        #no outliers
+        Mean, Mask, Iterations = self.TestFunction([1.0, 2.0, 3.0], 1.0)
+        self.assertEqual(Mean.Value, 2.0)
+        self.assertAlmostEqual(Mean.SE, 1 / math.sqrt(3), places = 15)
+        self.assertFalse(np.any(Mask))
+        self.assertEqual(Iterations, 0)
+        #N-D readings, a single scalar uncertainty
+        Mean, Mask, _ = self.TestFunction(self.Values, 1.0)
+        self.assertEqual(Mask.shape, (40, 50))
+        self.assertTrue(np.all(Mask[::3, 7]))
+        self.assertTrue(np.all(Mask[::5, 11]))
+        self.assertAlmostEqual(Mean.Value, self.Values[~Mask].mean(),
+                                                                places = 12)
+        #threshold
+        _, Loose, _ = self.TestFunction(self.Values, self.Errors,
+                                                            Threshold = 5)
+        _, Tight, _ = self.TestFunction(self.Values, self.Errors,
+                                                            Threshold = 2.0)
+        self.assertTrue(np.all(Tight[Loose]))
+        self.assertGreater(Tight.sum(), Loose.sum())
+
+    def test_Axis(self):
+        """
+        Checks the clipping along an axis.
+
+        REQ-FUN-D21
+        """
+        Means, Mask, Iterations = self.TestFunction(self.Values, self.Errors,
+                                                                    Axis = 1)
+        self.assertIsInstance(Means, MeasuredArray)
+        self.assertEqual(Means.shape, (40, ))
+        self.assertEqual(Mask.shape, (40, 50))
+        Total = 0
+        for Row in range(40):
+            Expected = self.clip(self.Values[Row], self.Errors[Row])
+            self.assertAlmostEqual(Means.Value[Row], Expected[0], places = 12)
+            self.assertAlmostEqual(Means.SE[Row], Expected[1], places = 12)
+            self.assertListEqual(Mask[Row].tolist(), Expected[2])
+            Total = max(Total, Expected[3])
+        self.assertEqual(Iterations, Total)
+        Other, Transposed, Count = self.TestFunction(
+                        MeasuredArray(self.Values.T, self.Errors.T), Axis = 0)
+        self.assertTrue(np.array_equal(Other.Value, Means.Value))
+        self.assertTrue(np.array_equal(Other.SE, Means.SE))
+        self.assertTrue(np.array_equal(Transposed, Mask.T))
+        self.assertEqual(Count, Iterations)
+        Data = self.Values.reshape(4, 10, 50)
+        Errors = self.Errors.reshape(4, 10, 50)
+        Cubes, Mask, _ = self.TestFunction(Data, Errors, Axis = -1)
+        self.assertEqual(Cubes.shape, (4, 10))
+        self.assertEqual(Mask.shape, (4, 10, 50))
+        self.assertTrue(np.array_equal(Cubes.Value.ravel(), Means.Value))
+        Columns, Mask, _ = self.TestFunction(Data, Errors, Axis = 1)
+        self.assertEqual(Columns.shape, (4, 50))
+        Expected = self.clip(Data[2, :, 7], Errors[2, :, 7])
+        self.assertAlmostEqual(Columns.Value[2, 7], Expected[0], places = 12)
+        self.assertListEqual(Mask[2, :, 7].tolist(), Expected[2])
+        Single, Mask, _ = self.TestFunction(self.Values[0], self.Errors[0],
+                                                                    Axis = 0)
+        self.assertIsInstance(Single, MeasuredArray)
+        self.assertEqual(Single.shape, ())
+        self.assertEqual(float(Single.Value), Means.Value[0])
+        self.assertTrue(np.array_equal(Mask, Transposed[:, 0]))
+        #empty along the clipped axis - NaN, along another axis - empty
+        for Shape, Axis, Reduced in (((3, 0), 1, (3, )), ((0, 3), 0, (3, )),
+                                ((3, 0), 0, (0, )), ((2, 0, 4), -1, (2, 0))):
+            Result, Mask, Count = self.TestFunction(np.zeros(Shape), 1.0,
+                                                                Axis = Axis)
+            self.assertEqual(Result.shape, Reduced)
+            self.assertTrue(np.all(np.isnan(Result.Value)))
+            self.assertTrue(np.all(np.isnan(Result.SE)))
+            self.assertEqual(Mask.shape, Shape)
+            self.assertEqual(Count, 0)
+
+    def test_iterations(self):
+        """
+        Checks the max number of iterations and the fully rejected rows.
+
+        REQ-FUN-D22
+        """
+        #the second outlier is revealed only after the first is rejected
+        Values = [0.0] * 100 + [200.0, 4.0]
+        Mean, Mask, Iterations = self.TestFunction(Values, 1.0)
+        self.assertEqual(Iterations, 2)
+        self.assertListEqual(Mask.tolist(), [False] * 100 + [True, True])
+        self.assertEqual(Mean.Value, 0.0)
+        self.assertAlmostEqual(Mean.SE, 0.1, places = 15)
+        Mean, Mask, Iterations = self.TestFunction(Values, 1.0,
+                                                            MaxIterations = 1)
+        self.assertEqual(Iterations, 1)
+        self.assertListEqual(Mask.tolist(), [False] * 100 + [True, False])
+        self.assertAlmostEqual(Mean.Value, 4 / 101, places = 15)
+        Means, Mask, _ = self.TestFunction([[1.0, 1.0], [1.0, 2.0]], 0.01,
+                                                Threshold = 0.1, Axis = 1)
+        self.assertEqual(Means.Value[0], 1.0)
+        self.assertTrue(math.isnan(Means.Value[1]))
+        self.assertTrue(math.isnan(Means.SE[1]))
+        self.assertListEqual(Mask.tolist(), [[False, False], [True, True]])
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-D20
+        """
+        for Item in (None, '12', [1, '2']):
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item, 1.0)
+            if Item is not None:
+                with self.assertRaises(TypeError):
+                    self.TestFunction([1, 2], Item)
+        for Item in (None, '3', True, [3]):
+            with self.assertRaises(TypeError):
+                self.TestFunction([1, 2], 1.0, Threshold = Item)
+        for Item in ('0', 1.0, True, [0]):
+            with self.assertRaises(TypeError):
+                self.TestFunction([1, 2], 1.0, Axis = Item)
+        for Item in (None, 1.0, True, '10'):
+            with self.assertRaises(TypeError):
+                self.TestFunction([1, 2], 1.0, MaxIterations = Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-D21
+        """
+        for Values, SE in (([1, 2], [1, 2, 3]), ([1, math.nan], 1.0),
+                ([1, 2], -1.0), ([1, 2], 1.0E-200), ([1, 2], [1.0, 0.0]),
+                (MeasuredArray([1, 2], 0.0), None)):
+            with self.assertRaises(ValueError):
+                self.TestFunction(Values, SE)
+        for Item in (0, -1.0, math.inf, math.nan):
+            with self.assertRaises(ValueError):
+                self.TestFunction([1, 2], 1.0, Threshold = Item)
+        for Item in (1, -2):
+            with self.assertRaises(ValueError):
+                self.TestFunction([1, 2], 1.0, Axis = Item)
+        for Item in (0, -1):
+            with self.assertRaises(ValueError):
+                self.TestFunction([1, 2], 1.0, MaxIterations = Item)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_GroupBy)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_groupBy)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_sigmaClip)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.aggregation module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
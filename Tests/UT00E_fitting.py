@@ -0,0 +1,609 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.Tests.UT00E_fitting
+
+Set of unit tests on the module phyqus_lib.fitting.
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Testing'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import unittest
+import math
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(os.path.dirname(MODULE_PATH))
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+import phyqus_lib.fitting as test_module
+
+#classes
+
+#+ test cases
+
+class Test_fitLine(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.fitting.fitLine().
+
+    Implements tests: TEST-T-E00.
+    Covers the requirements REQ-FUN-E00, REQ-FUN-E01, REQ-FUN-E02,
+    REQ-FUN-E03, REQ-FUN-E04, REQ-FUN-E05, REQ-AWM-E00 and REQ-AWM-E01.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.fitLine)
+        #Pearson's data with York's weights
+        cls.X = np.array([0.0, 0.9, 1.8, 2.6, 3.3, 4.4, 5.2, 6.1, 6.5, 7.4])
+        cls.Y = np.array([5.9, 5.4, 4.4, 4.6, 3.5, 3.7, 2.8, 2.8, 2.4, 1.5])
+        cls.SX = 1 / np.sqrt([1000, 1000, 500, 800, 200, 80, 60, 20, 1.8, 1])
+        cls.SY = 1 / np.sqrt([1, 1.8, 4, 8, 20, 20, 70, 70, 100, 500])
+        Generator = np.random.default_rng(2026)
+        cls.Grid = np.linspace(0.0, 10.0, 15)
+        cls.Data = 3.0 + 2.0 * cls.Grid + Generator.normal(0.0, 0.5, (200, 15))
+        cls.Errors = Generator.uniform(0.2, 1.0, (200, 15))
+
+    def checkPolyfit(self, X, Y, Errors, Slope, Intercept, Covariance,
+                                                            Unscaled = True):
+        """
+        Compares the line parameters and their covariance with those of
+        numpy.polyfit().
+        """
+        if Unscaled:
+            Parameters, Expected = np.polyfit(X, Y, 1, w = 1 / Errors,
+                                                        cov = 'unscaled')
+        else:
+            Parameters, Expected = np.polyfit(X, Y, 1, cov = True)
+        self.assertAlmostEqual(Slope.Value, Parameters[0], places = 12)
+        self.assertAlmostEqual(Intercept.Value, Parameters[1], places = 12)
+        self.assertTrue(np.allclose(Covariance, Expected, rtol = 1E-10,
+                                                            atol = 1E-15))
+        self.assertAlmostEqual(Slope.SE, math.sqrt(Expected[0, 0]),
+                                                                places = 12)
+        self.assertAlmostEqual(Intercept.SE, math.sqrt(Expected[1, 1]),
+                                                                places = 12)
+
+    def test_weighted(self):
+        """
+        Checks the weighted least squares fits.
+
+        REQ-FUN-E00
+        """
+        for Index in range(5):
+            Y, Errors = self.Data[Index], self.Errors[Index]
+            for Arguments in ((self.Grid, MeasuredArray(Y, Errors)),
+                    (self.Grid.tolist(), [MeasuredValue(Value, Error)
+                                    for Value, Error in zip(Y, Errors)])):
+                Result = self.TestFunction(*Arguments)
+                self.assertIsInstance(Result, tuple)
+                self.assertEqual(len(Result), 3)
+                Slope, Intercept, Covariance = Result
+                self.assertIsInstance(Slope, MeasuredValue)
+                self.assertIsInstance(Intercept, MeasuredValue)
+                self.assertIsInstance(Covariance, np.ndarray)
+                self.assertEqual(Covariance.shape, (2, 2))
+                self.checkPolyfit(self.Grid, Y, Errors, *Result)
+        Slope, Intercept, Covariance = self.TestFunction([0, 1, 2],
+                                                MeasuredArray([1, 3, 5], 1.0))
+        self.assertAlmostEqual(Slope.Value, 2.0, places = 14)
+        self.assertAlmostEqual(Intercept.Value, 1.0, places = 14)
+        self.assertAlmostEqual(Slope.SE, math.sqrt(0.5), places = 14)
+        self.assertAlmostEqual(Intercept.SE, math.sqrt(5 / 6), places = 14)
+        self.assertAlmostEqual(Covariance[0, 1], -0.5, places = 14)
+        self.assertEqual(Covariance[0, 1], Covariance[1, 0])
+
+    def test_York(self):
+        """
+        Checks the errors-in-variables regression of York.
+
+        REQ-FUN-E01
+        """
+        X = MeasuredArray(self.X, self.SX)
+        Y = MeasuredArray(self.Y, self.SY)
+        Slope, Intercept, Covariance = self.TestFunction(X, Y)
+        #reference values: Cantrell, Atmos. Chem. Phys. 8 (2008) 5477
+        self.assertAlmostEqual(Slope.Value, -0.480533, places = 6)
+        self.assertAlmostEqual(Slope.SE, 0.057985, places = 6)
+        self.assertAlmostEqual(Intercept.Value, 5.47991, places = 5)
+        self.assertAlmostEqual(Intercept.SE, 0.29497, places = 5)
+        self.assertTrue(np.allclose(Covariance, Covariance.T))
+        #the minimum of the York's sum of the weighted squared residuals
+        def getSum(Slope):
+            W = 1 / (self.SY**2 + Slope**2 * self.SX**2)
+            Intercept = np.sum(W * (self.Y - Slope * self.X)) / np.sum(W)
+            return np.sum(W * (self.Y - Intercept - Slope * self.X)**2)
+        for Delta in (-1.0E-4, 1.0E-4):
+            self.assertGreater(getSum(Slope.Value + Delta),
+                                                        getSum(Slope.Value))
+        #symmetry: swapped axes
+        Inverse, _, _ = self.TestFunction(Y, X)
+        self.assertAlmostEqual(Inverse.Value, 1 / Slope.Value, places = 10)
+        self.assertAlmostEqual(Inverse.SE / abs(Inverse.Value),
+                                    Slope.SE / abs(Slope.Value), places = 10)
+        #exact y values with uncertain x
+        Slope, Intercept, _ = self.TestFunction(MeasuredArray(self.Grid, 0.5),
+                                    MeasuredArray(3.0 + 2.0 * self.Grid, 0.1))
+        self.assertAlmostEqual(Slope.Value, 2.0, places = 12)
+        self.assertAlmostEqual(Intercept.Value, 3.0, places = 12)
+
+    def test_unweighted(self):
+        """
+        Checks the ordinary least squares fits of the exact data points.
+
+        REQ-FUN-E02
+        """
+        for Index in range(5):
+            Result = self.TestFunction(self.Grid, self.Data[Index])
+            self.checkPolyfit(self.Grid, self.Data[Index], None, *Result,
+                                                            Unscaled = False)
+            Result = self.TestFunction(self.Grid, self.Data[Index],
+                                                                Scale = True)
+            self.checkPolyfit(self.Grid, self.Data[Index], None, *Result,
+                                                            Unscaled = False)
+        Slope, Intercept, Covariance = self.TestFunction([1, 2], [3, 5])
+        self.assertEqual(Slope.Value, 2.0)
+        self.assertEqual(Intercept.Value, 1.0)
+        self.assertTrue(math.isnan(Slope.SE))
+        self.assertTrue(np.all(np.isnan(Covariance)))
+
+    def test_batch(self):
+        """
+        Checks the batched fits and the broadcasting of the data points.
+
+        REQ-FUN-E03
+        """
+        X = MeasuredArray(self.Grid, 0.05)
+        Y = MeasuredArray(self.Data, self.Errors)
+        Slopes, Intercepts, Covariances = self.TestFunction(X, Y)
+        self.assertIsInstance(Slopes, MeasuredArray)
+        self.assertIsInstance(Intercepts, MeasuredArray)
+        self.assertEqual(Slopes.shape, (200, ))
+        self.assertEqual(Intercepts.shape, (200, ))
+        self.assertEqual(Covariances.shape, (200, 2, 2))
+        for Index in range(0, 200, 20):
+            Slope, Intercept, Covariance = self.TestFunction(X,
+                            MeasuredArray(self.Data[Index], self.Errors[Index]))
+            self.assertAlmostEqual(Slopes.Value[Index], Slope.Value,
+                                                                places = 12)
+            self.assertAlmostEqual(Slopes.SE[Index], Slope.SE, places = 12)
+            self.assertAlmostEqual(Intercepts.Value[Index], Intercept.Value,
+                                                                places = 12)
+            self.assertAlmostEqual(Intercepts.SE[Index], Intercept.SE,
+                                                                places = 12)
+            self.assertTrue(np.allclose(Covariances[Index], Covariance,
+                                                    rtol = 1E-10, atol = 0.0))
+        Y = MeasuredArray(self.Data.reshape(10, 20, 15),
+                                            self.Errors.reshape(10, 20, 15))
+        Result = self.TestFunction(X, Y)
+        self.assertEqual(Result[0].shape, (10, 20))
+        self.assertEqual(Result[2].shape, (10, 20, 2, 2))
+        self.assertTrue(np.allclose(Result[0].Value.ravel(), Slopes.Value,
+                                                    rtol = 1E-12, atol = 0.0))
+        #mixed weighted and unweighted fits
+        Errors = self.Errors[:3].copy()
+        Errors[2] = 0.0
+        Result = self.TestFunction(np.stack([self.Grid, self.Grid,
+                    self.Grid]), MeasuredArray(self.Data[:3], Errors))
+        for Index in (0, 2):
+            Expected = self.TestFunction(self.Grid, MeasuredArray(
+                                    self.Data[Index], Errors[Index]))
+            self.assertAlmostEqual(Result[0].Value[Index], Expected[0].Value,
+                                                                places = 12)
+            self.assertAlmostEqual(Result[0].SE[Index], Expected[0].SE,
+                                                                places = 12)
+        Result = self.TestFunction(np.zeros((0, 5)), np.zeros((0, 5)))
+        self.assertEqual(Result[0].shape, (0, ))
+        self.assertEqual(Result[2].shape, (0, 2, 2))
+
+    def test_Scale(self):
+        """
+        Checks the scaling of the covariance by the reduced chi-squared.
+
+        REQ-FUN-E04
+        """
+        Y = MeasuredArray(self.Data[0], 0.05) #underestimated uncertainties
+        _, _, Covariance = self.TestFunction(self.Grid, Y)
+        Slope, Intercept, Scaled = self.TestFunction(self.Grid, Y,
+                                                                Scale = True)
+        Residuals = self.Data[0] - Intercept.Value - Slope.Value * self.Grid
+        Reduced = np.sum(Residuals**2 / 0.05**2) / 13
+        self.assertGreater(Reduced, 1.0)
+        self.assertTrue(np.allclose(Scaled, Covariance * Reduced,
+                                                    rtol = 1E-12, atol = 0.0))
+        Y = MeasuredArray(self.Data[0], 50.0) #overestimated uncertainties
+        _, _, Covariance = self.TestFunction(self.Grid, Y)
+        _, _, Scaled = self.TestFunction(self.Grid, Y, Scale = True)
+        self.assertTrue(np.array_equal(Scaled, Covariance))
+        _, _, Covariance = self.TestFunction([1, 2], MeasuredArray([1, 2], 1),
+                                                                Scale = True)
+        self.assertTrue(np.all(np.isfinite(Covariance)))
+
+    def test_failed(self):
+        """
+        Checks the failed fits.
+
+        REQ-FUN-E05
+        """
+        X = np.stack([self.Grid, np.full(15, 2.0), self.Grid])
+        Y = MeasuredArray(self.Data[:3], self.Errors[:3])
+        Slopes, Intercepts, Covariances = self.TestFunction(X, Y)
+        for Item in (Slopes, Intercepts):
+            self.assertTrue(np.all(np.isfinite(Item.Value[[0, 2]])))
+            self.assertTrue(math.isnan(Item.Value[1]))
+            self.assertTrue(math.isnan(Item.SE[1]))
+        self.assertTrue(np.all(np.isnan(Covariances[1])))
+        with self.assertRaises(ValueError):
+            self.TestFunction(X, Y, Raise = True)
+        Result = self.TestFunction([1, 1], [1, 2])
+        self.assertTrue(math.isnan(Result[0].Value))
+        with self.assertRaises(ValueError):
+            self.TestFunction([1, 1], [1, 2], Raise = True)
+        X = MeasuredArray(self.X, self.SX)
+        Y = MeasuredArray(self.Y, self.SY)
+        Slope, _, _ = self.TestFunction(X, Y, MaxIterations = 1)
+        self.assertTrue(math.isnan(Slope.Value))
+        with self.assertRaises(ValueError):
+            self.TestFunction(X, Y, MaxIterations = 1, Raise = True)
+        Slope, _, _ = self.TestFunction(X, Y, Tolerance = 0.1,
+                                                            MaxIterations = 5)
+        self.assertAlmostEqual(Slope.Value, -0.48, places = 2)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-E00
+        """
+        for Item in (None, '123', [1, '2', 3], {1 : 2}, True):
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item, [1, 2, 3])
+            with self.assertRaises(TypeError):
+                self.TestFunction([1, 2, 3], Item)
+        for Name in ('Scale', 'Raise'):
+            for Item in (1, None, 'True'):
+                with self.assertRaises(TypeError):
+                    self.TestFunction([1, 2, 3], [1, 2, 3], **{Name : Item})
+        for Item in (1, '1E-3', None):
+            with self.assertRaises(TypeError):
+                self.TestFunction([1, 2, 3], [1, 2, 3], Tolerance = Item)
+        for Item in (1.0, '10', True):
+            with self.assertRaises(TypeError):
+                self.TestFunction([1, 2, 3], [1, 2, 3], MaxIterations = Item)
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-E01
+        """
+        for X, Y in ((1.0, 2.0), ([1.0], [2.0]), ([1, 2, 3], [1, 2]),
+                (np.ones((2, 3)), np.ones((3, 3))), ([1, 2, math.nan], 1.0),
+                ([1, 2, 3], [1, math.inf, 3]),
+                ([1, 2, 3], MeasuredArray([1, 2, 3], 1.0E-200)),
+                ([1, 2, 3], MeasuredArray([1, 2, 3], [1, 0, 1])),
+                (MeasuredArray([1, 2, 3], 1), [1, 2, 3])):
+            with self.assertRaises(ValueError):
+                self.TestFunction(X, Y)
+        for Item in (0.0, 1.0, -1.0E-6):
+            with self.assertRaises(ValueError):
+                self.TestFunction([1, 2, 3], [1, 2, 3], Tolerance = Item)
+        for Item in (0, -1):
+            with self.assertRaises(ValueError):
+                self.TestFunction([1, 2, 3], [1, 2, 3], MaxIterations = Item)
+
+class Test_fitModel(unittest.TestCase):
+    """
+    Test cases for the function phyqus_lib.fitting.fitModel().
+
+    Implements tests: TEST-T-E10.
+    Covers the requirements REQ-FUN-E10, REQ-FUN-E11, REQ-FUN-E12,
+    REQ-FUN-E13, REQ-FUN-E14, REQ-AWM-E10 and REQ-AWM-E11.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.fitModel)
+        cls.Line = staticmethod(lambda X, A, B: A + B * X)
+        cls.Decay = staticmethod(lambda X, A, B, C: A * np.exp(-B * X) + C)
+        cls.Partials = staticmethod(lambda X, A, B, C: [np.exp(-B * X),
+                                -A * X * np.exp(-B * X), np.ones_like(X)])
+        Generator = np.random.default_rng(2026)
+        cls.Grid = np.linspace(0.0, 5.0, 30)
+        cls.Data = (cls.Decay(cls.Grid, 3.0, 0.8, 0.5)
+                                + Generator.normal(0.0, 0.05, (50, 30)))
+        cls.Errors = Generator.uniform(0.03, 0.08, (50, 30))
+        cls.Initial = [1.0, 1.0, 0.0]
+
+    def test_nonlinear(self):
+        """
+        Checks the weighted least squares fits of a non-linear model.
+
+        REQ-FUN-E10
+        """
+        Y = MeasuredArray(self.Data[0], self.Errors[0])
+        Result = self.TestFunction(self.Decay, self.Grid, Y, self.Initial)
+        self.assertIsInstance(Result, tuple)
+        self.assertEqual(len(Result), 2)
+        Parameters, Covariance = Result
+        self.assertIsInstance(Parameters, tuple)
+        self.assertEqual(len(Parameters), 3)
+        for Item in Parameters:
+            self.assertIsInstance(Item, MeasuredValue)
+        self.assertIsInstance(Covariance, np.ndarray)
+        self.assertEqual(Covariance.shape, (3, 3))
+        self.assertTrue(np.allclose(Covariance, Covariance.T, rtol = 0,
+                                                            atol = 1E-15))
+        for Item, Expected in zip(Parameters, (3.0, 0.8, 0.5)):
+            self.assertLess(abs(Item.Value - Expected), 5 * Item.SE)
+        #the gradient of chi-squared is zero at the minimum
+        Values = np.array([Item.Value for Item in Parameters])
+        Weights = 1 / self.Errors[0]
+        Residuals = (self.Data[0] - self.Decay(self.Grid, *Values)) * Weights
+        Partials = np.stack(self.Partials(self.Grid, *Values),
+                                            axis = 1) * Weights[:, np.newaxis]
+        self.assertTrue(np.allclose(Partials.T @ Residuals, 0, atol = 1E-8))
+        self.assertTrue(np.allclose(Covariance,
+                np.linalg.inv(Partials.T @ Partials), rtol = 1E-6, atol = 0))
+        for Item, Error in zip(Parameters, np.sqrt(np.diag(Covariance))):
+            self.assertEqual(Item.SE, Error)
+        #the same data points in the other forms
+        Other, _ = self.TestFunction(self.Decay, self.Grid.tolist(),
+                        [MeasuredValue(Value, Error) for Value, Error in
+                            zip(self.Data[0], self.Errors[0])], (1, 1, 0))
+        for Item, Expected in zip(Other, Parameters):
+            self.assertAlmostEqual(Item.Value, Expected.Value, places = 10)
+            self.assertAlmostEqual(Item.SE, Expected.SE, places = 10)
+
+    def test_Jacobian(self):
+        """
+        Checks the analytic and the numerical Jacobian.
+
+        REQ-FUN-E11
+        """
+        for Index in range(5):
+            Y = MeasuredArray(self.Data[Index], self.Errors[Index])
+            Numerical, First = self.TestFunction(self.Decay, self.Grid, Y,
+                                                                self.Initial)
+            Analytic, Second = self.TestFunction(self.Decay, self.Grid, Y,
+                                self.Initial, Jacobian = self.Partials)
+            for Item, Expected in zip(Numerical, Analytic):
+                self.assertAlmostEqual(Item.Value, Expected.Value, places = 9)
+                self.assertAlmostEqual(Item.SE, Expected.SE, places = 7)
+            self.assertTrue(np.allclose(First, Second, rtol = 1E-6,
+                                                                atol = 0))
+
+    def test_linear(self):
+        """
+        Checks the unweighted fits and the scaling of the covariance on the
+        linear model against the function fitLine().
+
+        REQ-FUN-E12
+        """
+        X = np.linspace(0.0, 10.0, 15)
+        Generator = np.random.default_rng(12)
+        Values = 3.0 + 2.0 * X + Generator.normal(0.0, 0.5, 15)
+        Errors = Generator.uniform(0.2, 1.0, 15)
+        for Y in (MeasuredArray(Values, Errors), Values,
+                                        MeasuredArray(Values, 0.1 * Errors)):
+            for Scale in (False, True):
+                Slope, Intercept, Expected = test_module.fitLine(X, Y,
+                                                                Scale = Scale)
+                (A, B), Covariance = self.TestFunction(self.Line, X, Y,
+                                                [0.0, 0.0], Scale = Scale)
+                self.assertAlmostEqual(A.Value, Intercept.Value, places = 10)
+                self.assertAlmostEqual(B.Value, Slope.Value, places = 10)
+                self.assertAlmostEqual(A.SE, Intercept.SE, places = 10)
+                self.assertAlmostEqual(B.SE, Slope.SE, places = 10)
+                self.assertTrue(np.allclose(Covariance, Expected[::-1, ::-1],
+                                                    rtol = 1E-8, atol = 0))
+        #the reduced chi-squared of the scattered data points is > 1
+        Y = MeasuredArray(Values, 0.1 * Errors)
+        _, Unscaled = self.TestFunction(self.Line, X, Y, [0.0, 0.0])
+        _, Scaled = self.TestFunction(self.Line, X, Y, [0.0, 0.0],
+                                                                Scale = True)
+        self.assertTrue(np.all(np.abs(Scaled) > np.abs(Unscaled)))
+        #the exact data points on the line - no scatter at all
+        (A, B), Covariance = self.TestFunction(self.Line, [0, 1, 2],
+                                                        [1, 3, 5], [0, 0])
+        self.assertAlmostEqual(A.Value, 1.0, places = 12)
+        self.assertAlmostEqual(B.Value, 2.0, places = 12)
+        self.assertAlmostEqual(A.SE, 0.0, places = 12)
+        self.assertTrue(np.allclose(Covariance, 0.0, atol = 1E-20))
+
+    def test_batch(self):
+        """
+        Checks the batch of the independent fits.
+
+        REQ-FUN-E13
+        """
+        Y = MeasuredArray(self.Data, self.Errors)
+        Parameters, Covariances = self.TestFunction(self.Decay, self.Grid, Y,
+                                                                self.Initial)
+        self.assertIsInstance(Parameters, MeasuredArray)
+        self.assertEqual(Parameters.shape, (50, 3))
+        self.assertIsInstance(Covariances, np.ndarray)
+        self.assertEqual(Covariances.shape, (50, 3, 3))
+        for Index in (0, 17, 49):
+            Single, Covariance = self.TestFunction(self.Decay, self.Grid,
+                            Y[Index], self.Initial, Jacobian = self.Partials)
+            for Column, Item in enumerate(Single):
+                self.assertAlmostEqual(Parameters.Value[Index, Column],
+                                                    Item.Value, places = 9)
+                self.assertAlmostEqual(Parameters.SE[Index, Column],
+                                                    Item.SE, places = 7)
+            self.assertTrue(np.allclose(Covariances[Index], Covariance,
+                                                    rtol = 1E-6, atol = 0))
+        #the spread of the fitted parameters agrees with their uncertainties
+        Spread = np.std(Parameters.Value, axis = 0, ddof = 1)
+        Mean = np.mean(Parameters.SE, axis = 0)
+        self.assertTrue(np.all(Spread / Mean > 0.6))
+        self.assertTrue(np.all(Spread / Mean < 1.5))
+        #broadcasting: a batch of the initial guesses and of x values
+        Initial = np.array([[1.0, 1.0, 0.0], [2.0, 0.5, 1.0]])
+        Second, _ = self.TestFunction(self.Decay, self.Grid,
+                                    Y[:2], Initial, Jacobian = self.Partials)
+        self.assertEqual(Second.shape, (2, 3))
+        self.assertTrue(np.allclose(Second.Value, Parameters.Value[:2],
+                                                    rtol = 1E-9, atol = 0))
+        Third, Covariances = self.TestFunction(self.Line,
+                        np.stack([self.Grid, 2 * self.Grid]), Y[0],
+                                                Initial[:, np.newaxis, :2])
+        self.assertEqual(Third.shape, (2, 2, 2))
+        self.assertEqual(Covariances.shape, (2, 2, 2, 2))
+        self.assertTrue(np.allclose(Third.Value[0], Third.Value[1],
+                                                    rtol = 1E-9, atol = 0))
+        self.assertAlmostEqual(Third.Value[0, 0, 1],
+                                        2 * Third.Value[0, 1, 1], places = 9)
+
+    def test_failed(self):
+        """
+        Checks the failed fits.
+
+        REQ-FUN-E14
+        """
+        Y = MeasuredArray(self.Data[:3], self.Errors[:3])
+        X = np.stack([self.Grid, np.zeros(30), self.Grid])
+        Parameters, Covariances = self.TestFunction(self.Decay, X, Y,
+                                                                self.Initial)
+        self.assertTrue(np.all(np.isfinite(Parameters.Value[[0, 2]])))
+        self.assertTrue(np.all(np.isnan(Parameters.Value[1])))
+        self.assertTrue(np.all(np.isnan(Parameters.SE[1])))
+        self.assertTrue(np.all(np.isnan(Covariances[1])))
+        with self.assertRaises(ValueError):
+            self.TestFunction(self.Decay, X, Y, self.Initial, Raise = True)
+        Parameters, Covariance = self.TestFunction(self.Decay, self.Grid,
+                                    Y[0], self.Initial, MaxIterations = 2)
+        self.assertTrue(all(math.isnan(Item.Value) for Item in Parameters))
+        self.assertTrue(np.all(np.isnan(Covariance)))
+        with self.assertRaises(ValueError):
+            self.TestFunction(self.Decay, self.Grid, Y[0], self.Initial,
+                                            MaxIterations = 2, Raise = True)
+        Parameters, _ = self.TestFunction(lambda X, A: np.exp(A * X),
+                                                [1, 2, 3], [1, 2, 3], [1000])
+        self.assertTrue(math.isnan(Parameters[0].Value))
+        with self.assertRaises(ValueError):
+            self.TestFunction(lambda X, A: np.exp(A * X), [1, 2, 3],
+                                            [1, 2, 3], [1000], Raise = True)
+
+    def test_TypeError(self):
+        """
+        Checks that improper types of the arguments result in TypeError.
+
+        REQ-AWM-E10
+        """
+        for Item in (None, 1, 'exp', [self.Line]):
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item, [1, 2, 3], [1, 2, 3], [0, 0])
+            if Item is not None:
+                with self.assertRaises(TypeError):
+                    self.TestFunction(self.Line, [1, 2, 3], [1, 2, 3],
+                                                    [0, 0], Jacobian = Item)
+        for Item in (None, '123', [1, '2', 3], {1 : 2}, True):
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Line, Item, [1, 2, 3], [0, 0])
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Line, [1, 2, 3], Item, [0, 0])
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Line, [1, 2, 3], [1, 2, 3], Item)
+        for Item in (MeasuredArray([1, 2, 3], 0.1), MeasuredValue(1, 0.1)):
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Line, Item, [1, 2, 3], [0, 0])
+        with self.assertRaises(TypeError):
+            self.TestFunction(self.Line, [1, 2, 3], [1, 2, 3],
+                                            MeasuredArray([0, 0], 0.1))
+        for Name in ('Scale', 'Raise'):
+            for Item in (1, None, 'True'):
+                with self.assertRaises(TypeError):
+                    self.TestFunction(self.Line, [1, 2, 3], [1, 2, 3],
+                                                    [0, 0], **{Name : Item})
+        for Item in (1, '1E-3', None):
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Line, [1, 2, 3], [1, 2, 3], [0, 0],
+                                                            Tolerance = Item)
+        for Item in (1.0, '10', True):
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Line, [1, 2, 3], [1, 2, 3], [0, 0],
+                                                        MaxIterations = Item)
+        for Item in (lambda X, A, B: 'line', lambda X, A, B: None,
+                            lambda X, A, B: (A + B * X).astype(complex)):
+            with self.assertRaises(TypeError):
+                self.TestFunction(Item, [1, 2, 3], [1, 2, 3], [0, 0])
+            with self.assertRaises(TypeError):
+                self.TestFunction(self.Line, [1, 2, 3], [1, 2, 3], [0, 0],
+                                    Jacobian = lambda X, A, B: [Item(X, A, B),
+                                                            np.ones_like(X)])
+
+    def test_ValueError(self):
+        """
+        Checks that improper values of the arguments result in ValueError.
+
+        REQ-AWM-E11
+        """
+        for X, Y, Initial in ((1.0, 2.0, [0, 0]), ([1, 2, 3], 1.0, 0.0),
+                ([1, 2, 3], [1, 2], [0, 0]), ([1, 2, 3], [1, 2, 3], []),
+                ([1, 2, 3], [1, 2, 3], [0, 0, 0, 0]),
+                (np.ones((2, 3)), np.ones((3, 3)), [0, 0]),
+                (np.ones((2, 3)), np.ones((2, 3)), np.ones((3, 2))),
+                ([1, 2, math.nan], 1.0, [0, 0]),
+                ([1, 2, 3], [1, math.inf, 3], [0, 0]),
+                ([1, 2, 3], [1, 2, 3], [0, math.nan]),
+                ([1, 2, 3], MeasuredArray([1, 2, 3], 1.0E-200), [0, 0]),
+                ([1, 2, 3], MeasuredArray([1, 2, 3], [1, 0, 1]), [0, 0])):
+            with self.assertRaises(ValueError):
+                self.TestFunction(lambda X, *Args: sum(Args) * X, X, Y,
+                                                                    Initial)
+        for Item in (lambda X, A, B: X[:, :2], lambda X, A, B: np.ones(5)):
+            with self.assertRaises(ValueError):
+                self.TestFunction(Item, [1, 2, 3], [1, 2, 3], [0, 0])
+        with self.assertRaises(ValueError):
+            self.TestFunction(self.Line, [1, 2, 3], [1, 2, 3], [0, 0],
+                                Jacobian = lambda X, A, B: [np.ones_like(X)])
+        for Item in (0.0, 1.0, -1.0E-6):
+            with self.assertRaises(ValueError):
+                self.TestFunction(self.Line, [1, 2, 3], [1, 2, 3], [0, 0],
+                                                            Tolerance = Item)
+        for Item in (0, -1):
+            with self.assertRaises(ValueError):
+                self.TestFunction(self.Line, [1, 2, 3], [1, 2, 3], [0, 0],
+                                                        MaxIterations = Item)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_fitLine)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_fitModel)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1, TestSuite2])
+
+if __name__ == "__main__":
+    sys.stdout.write("Conducting phyqus_lib.fitting module tests...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -13,6 +13,33 @@ subtract, whereas addition and subtraction are allowed for the same quantities
 Modules:
     base_classes: arithmetics and data type to store a measurement with an
         uncertainty values
+    measured_arrays: array container of the measurements with uncertainty with
+        the vectorized arithmetics and the reduced precision storage modes
+    expressions: cache-blocked evaluation of the arithmetic expressions over
+        the arrays of measurements with uncertainty
+    linalg: matrix and dot products, linear systems solution and matrix
+        inverse of the arrays of measurements with uncertainty
+    functions: elementary mathematical functions of the measurements with
+        uncertainty and of the arrays of measurements
+    monte_carlo: Monte Carlo propagation of the uncertainty through the
+        vectorized functions with the chunked and parallel evaluation
+    interpolation: calibration tables with the indexed lookup and the linear and
+        monotone cubic interpolation of the measurements with uncertainty
+    series: convolution, FIR filtering and moving average of the measured time
+        series with the streaming mode
+    calculus: numerical integration and differentiation of the measured series
+        with the exact propagation of the correlated contributions
+    solvers: batched root finding with the implicit function uncertainty
+        propagation
+    accumulators: streaming accumulators of the raw samples, the
+        inverse-variance weighted mean and the rolling windows of the
+        measurements with uncertainty
+    raw_samples: memory-mapped raw detector sample files reduced block-wise
+        into the measurements with uncertainty
+    aggregation: vectorized group-by reductions of the labelled measurements
+        with uncertainty
+    fitting: batched weighted least squares and errors-in-variables fitting of
+        the models to the measured data points
 
 """
 
@@ -27,4 +54,6 @@ __maintainer__ = 'a.azarov@diagnoptics.com'
 __license__ = 'Public Domain'
 __copyright__ = 'Diagnoptics Technologies B.V.'
 
-__all__ = ['base_classes']
\ No newline at end of file
+__all__ = ['base_classes', 'measured_arrays', 'expressions', 'linalg',
+            'functions', 'monte_carlo', 'interpolation', 'series', 'calculus',
+            'solvers', 'accumulators', 'raw_samples', 'aggregation', 'fitting']
\ No newline at end of file
@@ -0,0 +1,2224 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.accumulators
+
+Implements the streaming accumulators of the raw samples of the digital
+(sampled) measurements, which derive the measurements with uncertainty -
+the mean of the samples with the standard error of the mean (see DE001) -
+in the constant memory, i.e. without holding the samples. The samples can be
+added one by one (Welford's algorithm) or in bulk, as arrays of any size,
+which are reduced by the vectorized two-pass statistics per chunk and merged
+into the running state by the parallel update formulas of Chan et al. The
+samples can be weighted. The same formulas merge the accumulators filled
+independently (e.g. by the worker processes) exactly and in any order, and
+the state is serialized into a compact fixed size binary form.
+
+The measurements with uncertainty of the same quantity (repeated runs,
+independent methods) are combined by the streaming inverse-variance weighted
+mean, which keeps the compensated sums of the weights and of the weighted
+values, and provides the chi-squared consistency statistic.
+
+The rolling windows (the last N readings, or the readings within the time
+span) of a measured stream are aggregated in O(1) per update by adding the
+new and subtracting the expired readings from the running sums, which are
+periodically re-calculated from scratch to bound the rounding errors drift.
+The batch mode calculates all windows of an array from the cumulative sums.
+
+The multi-channel samples are accumulated into the mean vector and the
+co-moment matrix (the sum of the outer products of the deviations from the
+mean) by the rank-k updates per chunk of samples, merged by the multivariate
+form of the same parallel formulas, which yields the channel means with the
+covariance matrix of the means.
+
+Classes:
+    SampleAccumulator
+    WeightedMean
+    RollingWindow
+    CovarianceAccumulator
+
+Functions:
+    rollingWindows(Values, SE = None, *, Size = None, Span = None,
+                                                            Times = None)
+        type A /, type B/, *, /int > 0 OR None, float > 0 OR None,
+            seq(int OR float) OR numpy.ndarray OR None/
+                -> MeasuredArray, MeasuredArray, MeasuredArray
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import math
+import struct
+import collections
+
+from typing import Optional, Any, Tuple
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray, _toArrays
+
+#types
+
+#+ statistics of a set of samples: the number of samples, the sum of the
+#+ weights, the sum of the squared weights, the weighted mean and the
+#+ weighted sum of the squared deviations from the mean (M2)
+
+TStatistics = Tuple[int, float, float, float, float]
+
+#+ state of the inverse-variance weighted mean: the number of entries, the
+#+ sum of the weights and the sum of the weighted values with their rounding
+#+ error compensations, the weighted sum of the squared deviations from the
+#+ mean (M2), and the number, the min and the max of the exact values
+
+TWeighted = Tuple[int, float, float, float, float, float, int, float, float]
+
+#+ statistics of a set of multi-channel samples: the number of samples, the
+#+ mean vector and the co-moment matrix (the sum of the outer products of the
+#+ deviations from the mean)
+
+TCovariance = Tuple[int, np.ndarray, np.ndarray]
+
+#globals
+
+CHUNK_ELEMENTS = 2 ** 20 #max number of the samples reduced at once
+
+#+ binary state: little-endian unsigned 64-bit count and 4 float64 - the
+#+ sum of the weights, the sum of the squared weights, the mean and M2
+
+STATE_FORMAT = '<Q4d'
+
+STATE_SIZE = struct.calcsize(STATE_FORMAT) #40 bytes
+
+#+ binary state of the multi-channel accumulator: little-endian unsigned
+#+ 64-bit number of channels K and count, followed by K + K * K float64 -
+#+ the mean vector and the co-moment matrix (row-major)
+
+COVARIANCE_HEADER = '<2Q'
+
+COVARIANCE_HEADER_SIZE = struct.calcsize(COVARIANCE_HEADER) #16 bytes
+
+RESUM_PERIOD = 1024 #min number of the expired readings between re-summations
+                    #of a rolling window / block length of the batch mode
+
+CANCELLATION_LIMIT = 4 * RESUM_PERIOD #max ratio of the absolute sum of the
+                    #expired terms to that of a window in the batch mode
+
+#functions
+
+#+ 'private' helper functions
+
+def _toSamples(Data: Any, SkipFrames: int = 2) -> np.ndarray:
+    """
+    Helper function to check the samples or the weights and to convert them
+    into a numpy array of real numbers (a view, if possible).
+
+    Signature:
+        type A /, int/ -> numpy.ndarray
+
+    Raises:
+        UT_TypeError: the data is not a sequence or array of real numbers
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Data, (list, tuple, np.ndarray)):
+        raise UT_TypeError(Data, (list, tuple, np.ndarray),
+                                                    SkipFrames = SkipFrames)
+    try:
+        Result = np.asarray(Data)
+    except (ValueError, TypeError):
+        raise UT_TypeError(Data, (list, tuple, np.ndarray),
+                                        SkipFrames = SkipFrames) from None
+    if Result.dtype.kind not in 'iuf':
+        raise UT_TypeError(Data, (list, tuple, np.ndarray),
+                                                    SkipFrames = SkipFrames)
+    return Result
+
+def _toMeasurement(Value: Any, SE: Any,
+                            SkipFrames: int = 2) -> Tuple[float, float]:
+    """
+    Helper function to check a single measurement with uncertainty, passed as
+    a MeasuredValue (SE is None), or as a real number with an optional real
+    number SE, and to convert it into a pair of floats.
+
+    Signature:
+        type A, int OR float OR None /, int/ -> float, float
+
+    Raises:
+        UT_TypeError: the value is neither a real number nor a measurement
+            with uncertainty, OR the uncertainty is not a real number
+        UT_ValueError: the value or the uncertainty is not finite, OR the
+            uncertainty is negative, OR its inverse variance overflows or
+            underflows to zero
+
+    Version 1.0.0.0
+    """
+    if SE is None and hasattr(Value, 'Value') and hasattr(Value, 'SE'):
+        Mean, Error = Value.Value, Value.SE
+    else:
+        Mean, Error = Value, 0.0 if SE is None else SE
+    for Item, Original in ((Mean, Value), (Error, SE)):
+        if ((not isinstance(Item, (int, float, np.integer, np.floating)))
+                                    or isinstance(Item, (bool, np.bool_))):
+            raise UT_TypeError(Original, (int, float, MeasuredValue),
+                                                    SkipFrames = SkipFrames)
+    Mean, Error = float(Mean), float(Error)
+    if not math.isfinite(Mean):
+        raise UT_ValueError(Mean, 'finite value', SkipFrames = SkipFrames)
+    if not (0 <= Error < math.inf):
+        raise UT_ValueError(Error, 'finite non-negative SE',
+                                                    SkipFrames = SkipFrames)
+    if Error and not (0.0 < (1.0 / Error) * (1.0 / Error) < math.inf):
+        raise UT_ValueError(Error, 'SE with finite non-zero inverse variance',
+                                                    SkipFrames = SkipFrames)
+    return Mean, Error
+
+def _toMeasurements(Values: Any, SE: Any,
+                SkipFrames: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Helper function to convert the measurements with uncertainty, passed in
+    any form accepted by MeasuredArray (SE is None), or as an array of real
+    numbers with the uncertainties broadcastable to its shape, into a pair of
+    numpy arrays of the same shape (not checked for the values).
+
+    Signature:
+        type A, type B OR None /, int/ -> numpy.ndarray, numpy.ndarray
+
+    Raises:
+        UT_TypeError: the values are not real number(s) and / or
+            measurement(s) with uncertainty, OR the uncertainties are passed,
+            and the values or the uncertainties are not real numbers
+        UT_ValueError: the uncertainties are not broadcastable to the shape
+            of the values
+
+    Version 1.0.0.0
+    """
+    if SE is None:
+        Data, Errors = _toArrays(Values, SkipFrames = SkipFrames)
+        return Data, np.broadcast_to(Errors, Data.shape)
+    Data = _toSamples(Values, SkipFrames = SkipFrames)
+    if (isinstance(SE, (int, float, np.integer, np.floating))
+                                    and not isinstance(SE, (bool, np.bool_))):
+        Errors = np.asarray(SE)
+    else:
+        Errors = _toSamples(SE, SkipFrames = SkipFrames)
+    try:
+        Errors = np.broadcast_to(Errors, Data.shape)
+    except ValueError:
+        raise UT_ValueError(Errors.shape, 'broadcastable to {}'.format(
+                                Data.shape), SkipFrames = SkipFrames) from None
+    return Data, Errors
+
+def _countInvalid(Values: np.ndarray, Errors: np.ndarray) -> Tuple[int, int]:
+    """
+    Helper function to count the non-finite values and the invalid
+    uncertainties, i.e. negative, non-finite or with the inverse variance
+    overflow or underflow to zero.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray -> int, int
+
+    Version 1.0.0.0
+    """
+    with np.errstate(over = 'ignore', under = 'ignore', divide = 'ignore'):
+        Inverse = 1.0 / Errors
+        Inverse *= Inverse
+    IsValid = (Errors == 0) | ((Errors > 0) & (Errors < np.inf)
+                                        & (Inverse > 0) & (Inverse < np.inf))
+    return (int(np.count_nonzero(~np.isfinite(Values))),
+                                        int(np.count_nonzero(~IsValid)))
+
+def _raiseInvalid(Invalid: int, Negative: int, Total: int,
+                                                SkipFrames: int = 2) -> None:
+    """
+    Helper function to raise the aggregated exception listing the number of
+    the non-finite values or the invalid uncertainties, if any.
+
+    Signature:
+        int, int, int /, int/ -> None
+
+    Raises:
+        UT_ValueError: any value or uncertainty is invalid
+
+    Version 1.0.0.0
+    """
+    for Count, Requirement in ((Invalid, 'non-finite values'), (Negative,
+                            'negative, non-finite, too small or too large SE')):
+        if Count:
+            Error = UT_ValueError(Count, '== 0 {}'.format(Requirement),
+                                                    SkipFrames = SkipFrames)
+            Error.setMessage('{}: {} of {}'.format(Requirement.capitalize(),
+                                                                Count, Total))
+            raise Error
+
+def _chunkStatistics(Samples: np.ndarray,
+                            Weights: Optional[np.ndarray]) -> TStatistics:
+    """
+    Helper function to calculate the statistics of a chunk of samples by the
+    two-pass algorithm.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray OR None
+            -> tuple(int, float, float, float, float)
+
+    Version 1.0.0.0
+    """
+    Count = int(Samples.size)
+    if Weights is None:
+        Mean = float(Samples.mean())
+        Deviations = Samples - Mean
+        return (Count, float(Count), float(Count), Mean,
+                                        float(np.dot(Deviations, Deviations)))
+    Weight = float(Weights.sum())
+    Mean = float(np.dot(Weights, Samples)) / Weight
+    Deviations = Samples - Mean
+    return (Count, Weight, float(np.dot(Weights, Weights)), Mean,
+                                float(np.dot(Weights * Deviations, Deviations)))
+
+def _merge(First: TStatistics, Second: TStatistics) -> TStatistics:
+    """
+    Helper function to merge the statistics of two sets of samples using the
+    parallel update formulas of Chan et al.
+
+    Signature:
+        tuple(int, float, float, float, float),
+            tuple(int, float, float, float, float)
+                -> tuple(int, float, float, float, float)
+
+    Version 1.0.0.0
+    """
+    if not Second[0]:
+        return First
+    if not First[0]:
+        return Second
+    Count1, Weight1, Square1, Mean1, M21 = First
+    Count2, Weight2, Square2, Mean2, M22 = Second
+    Weight = Weight1 + Weight2
+    Delta = Mean2 - Mean1
+    Mean = Mean1 + Delta * (Weight2 / Weight)
+    M2 = M21 + M22 + Delta * Delta * (Weight1 * Weight2 / Weight)
+    return Count1 + Count2, Weight, Square1 + Square2, Mean, M2
+
+def _chunkCovariance(Samples: np.ndarray) -> TCovariance:
+    """
+    Helper function to calculate the statistics of a chunk of multi-channel
+    samples (one row per sample) by the two-pass algorithm: the co-moment
+    matrix is a single rank-k update by the deviations from the chunk mean.
+
+    Signature:
+        numpy.ndarray -> tuple(int, numpy.ndarray, numpy.ndarray)
+
+    Version 1.0.0.0
+    """
+    Mean = Samples.mean(axis = 0)
+    Deviations = Samples - Mean
+    Moments = Deviations.T @ Deviations
+    #exactly symmetric
+    return Samples.shape[0], Mean, 0.5 * (Moments + Moments.T)
+
+def _mergeCovariance(First: TCovariance,
+                                    Second: TCovariance) -> TCovariance:
+    """
+    Helper function to merge the statistics of two sets of multi-channel
+    samples using the multivariate form of the parallel update formulas of
+    Chan et al.
+
+    Signature:
+        tuple(int, numpy.ndarray, numpy.ndarray),
+            tuple(int, numpy.ndarray, numpy.ndarray)
+                -> tuple(int, numpy.ndarray, numpy.ndarray)
+
+    Version 1.0.0.0
+    """
+    if not Second[0]:
+        return First
+    if not First[0]:
+        return Second
+    Count1, Mean1, Moments1 = First
+    Count2, Mean2, Moments2 = Second
+    Count = Count1 + Count2
+    Delta = Mean2 - Mean1
+    Mean = Mean1 + Delta * (Count2 / Count)
+    Moments = Moments1 + Moments2 + np.outer(Delta, Delta) * (
+                                                    Count1 * Count2 / Count)
+    return Count, Mean, Moments
+
+def _addCompensated(Total: float, Compensation: float,
+                                    Value: float) -> Tuple[float, float]:
+    """
+    Helper function to add a value to a sum with the running compensation of
+    the rounding errors (Kahan-Babuska-Neumaier summation).
+
+    Signature:
+        float, float, float -> float, float
+
+    Version 1.0.0.0
+    """
+    Result = Total + Value
+    if abs(Total) >= abs(Value):
+        Compensation += (Total - Result) + Value
+    else:
+        Compensation += (Value - Result) + Total
+    return Result, Compensation
+
+def _mergeWeighted(First: TWeighted, Second: TWeighted) -> TWeighted:
+    """
+    Helper function to merge the states of two inverse-variance weighted
+    means, the sums are compensated, M2 is merged by the formulas of Chan et
+    al.
+
+    Signature:
+        tuple(int, float, float, float, float, float, int, float, float),
+            tuple(int, float, float, float, float, float, int, float, float)
+                -> tuple(int, float, float, float, float, float, int, float,
+                                                                        float)
+
+    Version 1.0.0.0
+    """
+    (Count1, Weight1, WeightError1, Sum1, SumError1, M21, Exact1,
+                                                Min1, Max1) = First
+    (Count2, Weight2, WeightError2, Sum2, SumError2, M22, Exact2,
+                                                Min2, Max2) = Second
+    if not Weight2:
+        Weight, WeightError, Sum, SumError, M2 = (Weight1, WeightError1, Sum1,
+                                                            SumError1, M21)
+    elif not Weight1:
+        Weight, WeightError, Sum, SumError, M2 = (Weight2, WeightError2, Sum2,
+                                                            SumError2, M22)
+    else:
+        Total1 = Weight1 + WeightError1
+        Total2 = Weight2 + WeightError2
+        Delta = (Sum2 + SumError2) / Total2 - (Sum1 + SumError1) / Total1
+        M2 = M21 + M22 + Delta * Delta * (Total1 * Total2 / (Total1 + Total2))
+        Weight, WeightError = _addCompensated(Weight1, WeightError1, Weight2)
+        Sum, SumError = _addCompensated(Sum1, SumError1, Sum2)
+        WeightError += WeightError2
+        SumError += SumError2
+    return (Count1 + Count2, Weight, WeightError, Sum, SumError, M2,
+                            Exact1 + Exact2, min(Min1, Min2), max(Max1, Max2))
+
+def _weightedStatistics(Values: np.ndarray,
+                                    Errors: np.ndarray) -> TWeighted:
+    """
+    Helper function to calculate the state of the inverse-variance weighted
+    mean of a chunk of the checked measurements by the two-pass algorithm.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray
+            -> tuple(int, float, float, float, float, float, int, float,
+                                                                        float)
+
+    Version 1.0.0.0
+    """
+    IsExact = Errors == 0
+    Exact = int(np.count_nonzero(IsExact))
+    if Exact:
+        ExactValues = Values[IsExact]
+        Min, Max = float(ExactValues.min()), float(ExactValues.max())
+        Values, Errors = Values[~IsExact], Errors[~IsExact]
+    else:
+        Min, Max = math.inf, -math.inf
+    Weight = Sum = M2 = 0.0
+    if Values.size:
+        Weights = 1.0 / (Errors * Errors)
+        Weight = float(Weights.sum())
+        Sum = float((Weights * Values).sum())
+        Deviations = Values - Sum / Weight
+        M2 = float(np.dot(Weights * Deviations, Deviations))
+    return (Exact + int(Values.size), Weight, 0.0, Sum, 0.0, M2, Exact, Min,
+                                                                        Max)
+
+def _checkWindow(Size: Any, Span: Any, SkipFrames: int = 2) -> None:
+    """
+    Helper function to check the definition of a rolling window - either by
+    the number of readings, or by the time span.
+
+    Signature:
+        type A, type B /, int/ -> None
+
+    Raises:
+        UT_TypeError: the size is not an integer or None, OR the span is not
+            a real number or None
+        UT_ValueError: not exactly one of the size and the span is passed,
+            OR the passed one is not positive and finite
+
+    Version 1.0.0.0
+    """
+    if (Size is None) == (Span is None):
+        raise UT_ValueError((Size, Span), 'exactly one of Size and Span',
+                                                    SkipFrames = SkipFrames)
+    if Span is None:
+        if ((not isinstance(Size, (int, np.integer)))
+                                    or isinstance(Size, (bool, np.bool_))):
+            raise UT_TypeError(Size, (int, None), SkipFrames = SkipFrames)
+        if Size < 1:
+            raise UT_ValueError(Size, '>= 1', SkipFrames = SkipFrames)
+    else:
+        if ((not isinstance(Span, (int, float, np.integer, np.floating)))
+                                    or isinstance(Span, (bool, np.bool_))):
+            raise UT_TypeError(Span, (int, float, None),
+                                                    SkipFrames = SkipFrames)
+        if not (0 < Span < math.inf):
+            raise UT_ValueError(Span, 'finite > 0', SkipFrames = SkipFrames)
+
+def _windowSums(Data: np.ndarray, Lower: np.ndarray) -> np.ndarray:
+    """
+    Helper function to calculate the sums of the 1-D array elements within
+    the windows [Lower[i], i] for each index i by the differences of the
+    cumulative sums. The cumulative sums restart every block of (at least)
+    RESUM_PERIOD windows, so the rounding errors do not grow with the length
+    of the array, and also at the first window of a floating point array, for
+    which the absolute sum of the expired elements of the block exceeds the
+    CANCELLATION_LIMIT times the absolute sum of the window - the large
+    expired elements would cancel the small window sums otherwise. The
+    windows of zeros only are exempt, their sums are exactly zero anyway.
+    After a restart the next block is only twice as long as the truncated
+    one (growing back to RESUM_PERIOD), so the frequent restarts cost O(1)
+    per window beyond the window length, and the cumulative sums of the
+    truncated block are not recalculated.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray(int) -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Result = np.empty_like(Data)
+    IsFloat = np.issubdtype(Data.dtype, np.floating)
+    Start = 0
+    Length = RESUM_PERIOD
+    while Start < Data.size:
+        Offset = int(Lower[Start])
+        Stop = min(Data.size, Start + max(Length, Start - Offset + 1))
+        Heads = Lower[Start : Stop] - Offset
+        Block = Data[Offset : Stop]
+        Cumulative = np.concatenate((np.zeros(1, dtype = Data.dtype),
+                                                            np.cumsum(Block)))
+        Length = min(RESUM_PERIOD, 2 * Length)
+        if IsFloat:
+            Tails = slice(Start - Offset + 1, None)
+            Absolute = np.concatenate((np.zeros(1), np.cumsum(np.abs(Block))))
+            NonZero = np.concatenate((np.zeros(1, dtype = np.int64),
+                                                    np.cumsum(Block != 0)))
+            Expired = Absolute[Heads]
+            Dominated = np.flatnonzero(
+                    (Expired > CANCELLATION_LIMIT * (Absolute[Tails] - Expired))
+                                        & (NonZero[Tails] > NonZero[Heads]))
+            if Dominated.size: #never the first window, Expired is 0 there
+                Stop = Start + int(Dominated[0])
+                Heads = Heads[ : Stop - Start]
+                Length = 2 * (Stop - Start)
+        Result[Start : Stop] = (Cumulative[Start - Offset + 1 :
+                                    Stop - Offset + 1] - Cumulative[Heads])
+        Start = Stop
+    return Result
+
+#+ public API
+
+def rollingWindows(Values: Any, SE: Optional[Any] = None, *,
+                    Size: Optional[int] = None, Span: Optional[float] = None,
+                    Times: Optional[Any] = None) -> Tuple[MeasuredArray,
+                                                MeasuredArray, MeasuredArray]:
+    """
+    Calculates the sums, the means and the inverse-variance weighted means of
+    the measured readings over the rolling windows ending at each reading -
+    the last Size readings, or the readings with the times within the Span
+    before the time of the current reading (inclusive), in one vectorized
+    pass over the cumulative sums. The first windows are incomplete, thus the
+    I-th result is the same as the state of RollingWindow after the I-th
+    reading is pushed.
+
+    Signature:
+        type A /, type B/, *, /int > 0 OR None, float > 0 OR None,
+            seq(int OR float) OR numpy.ndarray OR None/
+                -> MeasuredArray, MeasuredArray, MeasuredArray
+
+    Args:
+        Values: type A; the 1-D readings in any form accepted by the class
+            MeasuredArray, or the real number mean values, if the
+            uncertainties are passed separately
+        SE: (optional) type B; a non-negative real number or a sequence or
+            array of them broadcastable to the shape of the mean values,
+            defaults to None - the uncertainties are taken from the values
+        Size: (keyword) int > 0 OR None; the number of the readings per
+            window, defaults to None
+        Span: (keyword) int > 0 OR float > 0 OR None; the time span of the
+            windows, defaults to None
+        Times: (keyword) seq(int OR float) OR numpy.ndarray OR None; the
+            non-decreasing times of the readings, required (only) with the
+            time span, defaults to None
+
+    Returns:
+        tuple(MeasuredArray, MeasuredArray, MeasuredArray): the sums, the
+            means and the weighted means of the windows
+
+    Raises:
+        UT_TypeError: the values or the uncertainties are not real numbers
+            and / or measurements with uncertainty, OR the size is not an
+            integer, OR the span is not a real number, OR the times are not
+            a sequence or array of real numbers
+        UT_ValueError: not exactly one of the size and the span is passed,
+            OR the size or the span is not positive, OR the times are passed
+            without the span or missing, OR the readings are not 1-D, OR the
+            uncertainties are not broadcastable to them, OR any value,
+            uncertainty or time is not finite, OR any uncertainty is
+            negative or its inverse variance overflows or underflows to
+            zero, OR the times are not 1-D of the same length as the
+            readings, OR not non-decreasing
+
+    Version 1.0.0.0
+    """
+    _checkWindow(Size, Span)
+    Data, Errors = _toMeasurements(Values, SE)
+    if Data.ndim != 1:
+        raise UT_ValueError(Data.shape, '1-D readings', SkipFrames = 1)
+    Data = Data.astype(np.float64)
+    Errors = Errors.astype(np.float64)
+    _raiseInvalid(*_countInvalid(Data, Errors), Data.size)
+    Index = np.arange(Data.size)
+    if Span is None:
+        if Times is not None:
+            raise UT_ValueError(Times, 'None for the count-based windows',
+                                                                SkipFrames = 1)
+        Lower = np.maximum(Index - (Size - 1), 0)
+    else:
+        if Times is None:
+            raise UT_ValueError(Times, 'times of the time-based windows',
+                                                                SkipFrames = 1)
+        Moments = _toSamples(Times).astype(np.float64)
+        if Moments.shape != Data.shape:
+            raise UT_ValueError(Moments.shape, '== {}'.format(Data.shape),
+                                                                SkipFrames = 1)
+        if not np.all(np.isfinite(Moments)):
+            raise UT_ValueError(Times, 'finite times', SkipFrames = 1)
+        if np.any(np.diff(Moments) < 0):
+            raise UT_ValueError(Times, 'non-decreasing times', SkipFrames = 1)
+        Lower = np.searchsorted(Moments, Moments - Span, side = 'right')
+    Counts = Index + 1 - Lower
+    IsExact = Errors == 0
+    Variances = Errors * Errors
+    Weights = 1.0 / np.where(IsExact, np.inf, Variances)
+    Exact = _windowSums(IsExact.astype(np.int64), Lower)
+    HasExact = Exact > 0
+    #no rounding residuals of the expired readings
+    IsAllExact = Exact == Counts
+    Sums = _windowSums(Data, Lower)
+    Variance = np.where(IsAllExact, 0.0,
+                            np.maximum(_windowSums(Variances, Lower), 0.0))
+    Weight = np.where(IsAllExact, 0.0, _windowSums(Weights, Lower))
+    WeightedSums = _windowSums(Weights * Data, Lower)
+    ExactSums = np.where(HasExact,
+                        _windowSums(np.where(IsExact, Data, 0.0), Lower), 0.0)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        Means = np.where(HasExact, ExactSums / np.maximum(Exact, 1),
+                        np.where(Weight > 0, WeightedSums / Weight, np.nan))
+        Deviations = np.where(HasExact, 0.0, 1.0 / np.sqrt(Weight))
+    Deviation = np.sqrt(Variance)
+    return (MeasuredArray(Sums, Deviation),
+                MeasuredArray(Sums / Counts, Deviation / Counts),
+                                            MeasuredArray(Means, Deviations))
+
+#classes
+
+class SampleAccumulator:
+    """
+    Implements the streaming accumulator of the raw samples of a digital
+    measurement, which keeps only the number of samples, the sums of the
+    weights and of the squared weights, the running (weighted) mean and the
+    running (weighted) sum of the squared deviations from the mean (M2), and
+    produces the measurement with uncertainty - the mean with the standard
+    error of the mean - on demand. The single samples are added by Welford's
+    algorithm (West's weighted form), the arrays of samples - by the
+    vectorized two-pass statistics of the chunks of CHUNK_ELEMENTS samples,
+    which are merged into the state by the parallel update formulas of Chan
+    et al. The memory and the state size are constant, independently of the
+    number of samples.
+
+    The weights are the reliability weights (e.g. the relative quality or
+    the duration of the samples), all samples are weighted equally by
+    default. The accumulators filled independently are merged exactly and in
+    any order (up to the rounding errors) by the method merge() or by the
+    addition, e.g. sum(Parts, SampleAccumulator()). The state is serialized
+    into STATE_SIZE bytes by the method toBytes() and restored by the class
+    method fromBytes(); the instances are also picklable.
+
+    Properties:
+        Count: (read-only) int; the number of the accumulated samples
+        Weight: (read-only) float; the sum of the weights of the samples
+        EffectiveCount: (read-only) float; the effective number of samples,
+            i.e. the squared sum of the weights divided by the sum of the
+            squared weights, NaN if no samples
+        Mean: (read-only) float; the (weighted) mean of the samples, NaN if
+            no samples
+        Variance: (read-only) float; the unbiased (weighted) sample variance,
+            NaN if less than 2 samples
+
+    Methods:
+        push(Sample, Weight = 1.0):
+            int OR float /, int OR float/ -> None
+        pushMany(Samples, Weights = None):
+            seq(int OR float) OR numpy.ndarray
+                /, int OR float OR seq(int OR float) OR numpy.ndarray OR None/
+                    -> None
+        merge(Other):
+            SampleAccumulator -> None
+        toMeasuredValue():
+            None -> MeasuredValue
+        toBytes():
+            None -> bytes
+        fromBytes(Data):
+            bytes OR bytearray OR memoryview -> SampleAccumulator
+
+    Version 1.0.0.0
+    """
+
+    #'private' helper methods
+
+    def _getState(self) -> TStatistics:
+        """
+        Helper 'private' method to get the state as a tuple.
+
+        Signature:
+            None -> tuple(int, float, float, float, float)
+
+        Version 1.0.0.0
+        """
+        return self._Count, self._Weight, self._Square, self._Mean, self._M2
+
+    def _setState(self, State: TStatistics) -> None:
+        """
+        Helper 'private' method to set the state from a tuple.
+
+        Signature:
+            tuple(int, float, float, float, float) -> None
+
+        Version 1.0.0.0
+        """
+        (self._Count, self._Weight, self._Square, self._Mean,
+                                                            self._M2) = State
+
+    #special methods
+
+    def __init__(self) -> None:
+        """
+        Initializer. Creates an empty accumulator.
+
+        Signature:
+            None -> None
+
+        Version 1.0.0.0
+        """
+        self._setState((0, 0.0, 0.0, 0.0, 0.0))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of the accumulated samples.
+
+        Signature:
+            None -> int
+
+        Version 1.0.0.0
+        """
+        return self._Count
+
+    def __add__(self, Other: 'SampleAccumulator') -> 'SampleAccumulator':
+        """
+        Creates a new accumulator with the merged states of the both operands,
+        which are not changed.
+
+        Signature:
+            SampleAccumulator -> SampleAccumulator
+
+        Raises:
+            UT_TypeError: the other operand is not an instance of
+                SampleAccumulator
+
+        Version 1.0.0.0
+        """
+        if not isinstance(Other, SampleAccumulator):
+            raise UT_TypeError(Other, SampleAccumulator, SkipFrames = 1)
+        Result = self.__class__()
+        Result._setState(_merge(self._getState(), Other._getState()))
+        return Result
+
+    def __iadd__(self, Other: 'SampleAccumulator') -> 'SampleAccumulator':
+        """
+        Merges the state of the other accumulator into the current one.
+
+        Signature:
+            SampleAccumulator -> SampleAccumulator
+
+        Raises:
+            UT_TypeError: the other operand is not an instance of
+                SampleAccumulator
+
+        Version 1.0.0.0
+        """
+        if not isinstance(Other, SampleAccumulator):
+            raise UT_TypeError(Other, SampleAccumulator, SkipFrames = 1)
+        self._setState(_merge(self._getState(), Other._getState()))
+        return self
+
+    #public API
+
+    #+ read-only properties
+
+    @property
+    def Count(self) -> int:
+        """
+        Read-only access property to the number of the accumulated samples.
+
+        Signature:
+            None -> int
+
+        Version 1.0.0.0
+        """
+        return self._Count
+
+    @property
+    def Weight(self) -> float:
+        """
+        Read-only access property to the sum of the weights of the
+        accumulated samples.
+
+        Signature:
+            None -> float
+
+        Version 1.0.0.0
+        """
+        return self._Weight
+
+    @property
+    def EffectiveCount(self) -> float:
+        """
+        Read-only access property to the effective number of the accumulated
+        samples, which is equal to their number for the equal weights, NaN if
+        there are no samples.
+
+        Signature:
+            None -> float
+
+        Version 1.0.0.0
+        """
+        if not self._Count:
+            return math.nan
+        return self._Weight * self._Weight / self._Square
+
+    @property
+    def Mean(self) -> float:
+        """
+        Read-only access property to the (weighted) mean of the accumulated
+        samples, NaN if there are no samples.
+
+        Signature:
+            None -> float
+
+        Version 1.0.0.0
+        """
+        if not self._Count:
+            return math.nan
+        return self._Mean
+
+    @property
+    def Variance(self) -> float:
+        """
+        Read-only access property to the unbiased (weighted) variance of the
+        accumulated samples, NaN if there are less than 2 samples.
+
+        Signature:
+            None -> float
+
+        Version 1.0.0.0
+        """
+        if self._Count < 2:
+            return math.nan
+        return self._M2 / (self._Weight - self._Square / self._Weight)
+
+    #+ methods
+
+    def push(self, Sample: Any, Weight: Any = 1.0) -> None:
+        """
+        Adds a single sample using Welford's algorithm.
+
+        Signature:
+            int OR float /, int OR float/ -> None
+
+        Args:
+            Sample: int OR float; the sample
+            Weight: (optional) int > 0 OR float > 0; the weight of the
+                sample, defaults to 1.0
+
+        Raises:
+            UT_TypeError: the sample or the weight is not a real number
+            UT_ValueError: the sample is not finite, OR the weight is not
+                positive and finite
+
+        Version 1.0.0.0
+        """
+        for Item in (Sample, Weight):
+            if ((not isinstance(Item, (int, float, np.integer, np.floating)))
+                                    or isinstance(Item, (bool, np.bool_))):
+                raise UT_TypeError(Item, (int, float), SkipFrames = 1)
+        Sample = float(Sample)
+        Weight = float(Weight)
+        if not math.isfinite(Sample):
+            raise UT_ValueError(Sample, 'finite value', SkipFrames = 1)
+        if not (0 < Weight < math.inf):
+            raise UT_ValueError(Weight, 'finite positive weight',
+                                                                SkipFrames = 1)
+        self._Count += 1
+        self._Weight += Weight
+        self._Square += Weight * Weight
+        Delta = Sample - self._Mean
+        self._Mean += Delta * (Weight / self._Weight)
+        self._M2 += Weight * Delta * (Sample - self._Mean)
+
+    def pushMany(self, Samples: Any, Weights: Optional[Any] = None) -> None:
+        """
+        Adds an array of samples (of any shape, which is flattened) in bulk
+        using the vectorized statistics of the chunks of CHUNK_ELEMENTS
+        samples. The samples are checked before the state is changed, i.e.
+        either all or none of them are added.
+
+        Signature:
+            seq(int OR float) OR numpy.ndarray
+                /, int OR float OR seq(int OR float) OR numpy.ndarray OR None/
+                    -> None
+
+        Args:
+            Samples: seq(int OR float) OR numpy.ndarray; the (nested)
+                sequence or numpy array of real numbers, which can be a
+                memory-mapped array
+            Weights: (optional) int > 0 OR float > 0 OR seq(int OR float) OR
+                numpy.ndarray; the weight(s) of the samples, a real number or
+                an array broadcastable to the shape of the samples, defaults
+                to None - the equal weights
+
+        Raises:
+            UT_TypeError: the samples are not a sequence or array of real
+                numbers, OR the weights are not a real number, a sequence or
+                array of real numbers or None
+            UT_ValueError: any sample is not finite, OR the weights are not
+                broadcastable to the shape of the samples, OR any weight is not
+                positive and finite
+
+        Version 1.0.0.0
+        """
+        Data = _toSamples(Samples)
+        if Weights is not None:
+            if (isinstance(Weights, (int, float, np.integer, np.floating))
+                            and not isinstance(Weights, (bool, np.bool_))):
+                Factors = np.asarray(Weights)
+            else:
+                Factors = _toSamples(Weights)
+            try:
+                Factors = np.broadcast_to(Factors, Data.shape).reshape(-1)
+            except ValueError:
+                raise UT_ValueError(Factors.shape, 'broadcastable to {}'.format(
+                                        Data.shape), SkipFrames = 1) from None
+        Data = Data.reshape(-1)
+        Statistics = list()
+        Invalid = 0
+        Negative = 0
+        for Start in range(0, Data.size, CHUNK_ELEMENTS):
+            Stop = Start + CHUNK_ELEMENTS
+            Chunk = Data[Start : Stop].astype(np.float64)
+            Invalid += int(np.count_nonzero(~np.isfinite(Chunk)))
+            Factor = None
+            if Weights is not None:
+                Factor = Factors[Start : Stop].astype(np.float64)
+                Negative += int(np.count_nonzero(~((Factor > 0)
+                                                    & (Factor < np.inf))))
+            if not (Invalid or Negative):
+                Statistics.append(_chunkStatistics(Chunk, Factor))
+        for Count, Requirement in ((Invalid, 'non-finite samples'),
+                            (Negative, 'non-positive or infinite weights')):
+            if Count:
+                Error = UT_ValueError(Count, '== 0 {}'.format(Requirement),
+                                                                SkipFrames = 1)
+                Error.setMessage('{}: {} of {}'.format(Requirement.capitalize(),
+                                                            Count, Data.size))
+                raise Error
+        State = self._getState()
+        for Item in Statistics:
+            State = _merge(State, Item)
+        self._setState(State)
+
+    def merge(self, Other: 'SampleAccumulator') -> None:
+        """
+        Merges the state of another accumulator into the current one, the
+        other accumulator is not changed.
+
+        Signature:
+            SampleAccumulator -> None
+
+        Args:
+            Other: SampleAccumulator; the accumulator to be merged
+
+        Raises:
+            UT_TypeError: the argument is not an instance of SampleAccumulator
+
+        Version 1.0.0.0
+        """
+        if not isinstance(Other, SampleAccumulator):
+            raise UT_TypeError(Other, SampleAccumulator, SkipFrames = 1)
+        self._setState(_merge(self._getState(), Other._getState()))
+
+    def toMeasuredValue(self) -> MeasuredValue:
+        """
+        Produces the measurement with uncertainty from the accumulated
+        samples: the (weighted) mean of the samples with the standard error of
+        the mean, i.e. the square root of the unbiased sample variance divided
+        by the (effective) number of samples.
+
+        Signature:
+            None -> MeasuredValue
+
+        Returns:
+            MeasuredValue: the mean with the standard error of the mean
+
+        Raises:
+            UT_ValueError: less than 2 samples are accumulated
+
+        Version 1.0.0.0
+        """
+        if self._Count < 2:
+            raise UT_ValueError(self._Count, '>= 2 samples', SkipFrames = 1)
+        return MeasuredValue(self._Mean,
+                            math.sqrt(self.Variance / self.EffectiveCount))
+
+    def toBytes(self) -> bytes:
+        """
+        Serializes the state into STATE_SIZE bytes (see STATE_FORMAT).
+
+        Signature:
+            None -> bytes
+
+        Returns:
+            bytes: the binary state
+
+        Version 1.0.0.0
+        """
+        return struct.pack(STATE_FORMAT, *self._getState())
+
+    @classmethod
+    def fromBytes(cls, Data: Any) -> 'SampleAccumulator':
+        """
+        Creates an accumulator from the binary state produced by the method
+        toBytes().
+
+        Signature:
+            bytes OR bytearray OR memoryview -> SampleAccumulator
+
+        Args:
+            Data: bytes OR bytearray OR memoryview; the binary state
+
+        Returns:
+            SampleAccumulator: the restored accumulator
+
+        Raises:
+            UT_TypeError: the data is not a bytes-like object
+            UT_ValueError: the data is not of STATE_SIZE bytes, OR the state
+                is not consistent
+
+        Version 1.0.0.0
+        """
+        if not isinstance(Data, (bytes, bytearray, memoryview)):
+            raise UT_TypeError(Data, (bytes, bytearray, memoryview),
+                                                                SkipFrames = 1)
+        if len(Data) != STATE_SIZE:
+            raise UT_ValueError(len(Data), '== {} bytes'.format(STATE_SIZE),
+                                                                SkipFrames = 1)
+        Count, Weight, Square, Mean, M2 = struct.unpack(STATE_FORMAT, Data)
+        if not all(math.isfinite(Item) for Item in (Weight, Square, Mean, M2)):
+            IsValid = False
+        elif not Count:
+            IsValid = not (Weight or Square or Mean or M2)
+        else:
+            IsValid = Weight > 0 and Square > 0 and M2 >= 0
+        if not IsValid:
+            raise UT_ValueError(Data, 'consistent state', SkipFrames = 1)
+        Result = cls()
+        Result._setState((Count, Weight, Square, Mean, M2))
+        return Result
+
+class WeightedMean:
+    """
+    Implements the streaming inverse-variance weighted mean of the
+    measurements with uncertainty of the same quantity, which keeps only the
+    number of entries, the sum of the weights (the inverse variances) and the
+    sum of the weighted values, both with the compensation of the rounding
+    errors, the weighted sum of the squared deviations from the running mean
+    (M2) and the summary of the exact values (zero uncertainty). The combined
+    measurement is the weighted mean with the uncertainty 1 / sqrt(sum of
+    weights); the chi-squared statistic measures the consistency of the
+    entries with a single value.
+
+    The entries with zero uncertainty are exact: they have infinite weight,
+    i.e. if any exact value is present, the mean is this value with zero
+    uncertainty, and the finite weight entries contribute only to the
+    chi-squared. Different exact values are inconsistent - the chi-squared is
+    infinite, and the mean is not defined.
+
+    The accumulators are merged by the method merge() or by the addition.
+
+    Properties:
+        Count: (read-only) int; the number of the combined entries
+        ExactCount: (read-only) int; the number of the exact entries
+        Weight: (read-only) float; the sum of the weights of the entries with
+            non-zero uncertainty
+        Mean: (read-only) float; the weighted mean, NaN if no entries or
+            different exact values
+        ChiSquared: (read-only) float; the chi-squared of the entries about
+            the mean, NaN if no entries, infinite if different exact values
+        ReducedChiSquared: (read-only) float; the chi-squared per degree of
+            freedom (the number of entries - 1), NaN if less than 2 entries
+
+    Methods:
+        push(Value, SE = None):
+            int OR float OR MeasuredValue /, int OR float OR None/ -> None
+        pushMany(Values, SE = None):
+            type A /, type B/ -> None
+        merge(Other):
+            WeightedMean -> None
+        toMeasuredValue(Scale = False):
+            /bool/ -> MeasuredValue
+
+    Version 1.0.0.0
+    """
+
+    #'private' helper methods
+
+    def _getState(self) -> TWeighted:
+        """
+        Helper 'private' method to get the state as a tuple.
+
+        Signature:
+            None
+                -> tuple(int, float, float, float, float, float, int, float,
+                                                                        float)
+
+        Version 1.0.0.0
+        """
+        return (self._Count, self._Weight, self._WeightError, self._Sum,
+                self._SumError, self._M2, self._Exact, self._Min, self._Max)
+
+    def _setState(self, State: TWeighted) -> None:
+        """
+        Helper 'private' method to set the state from a tuple.
+
+        Signature:
+            tuple(int, float, float, float, float, float, int, float, float)
+                -> None
+
+        Version 1.0.0.0
+        """
+        (self._Count, self._Weight, self._WeightError, self._Sum,
+                self._SumError, self._M2, self._Exact, self._Min,
+                                                            self._Max) = State
+
+    #special methods
+
+    def __init__(self) -> None:
+        """
+        Initializer. Creates an empty accumulator.
+
+        Signature:
+            None -> None
+
+        Version 1.0.0.0
+        """
+        self._setState((0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, math.inf, -math.inf))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of the combined entries.
+
+        Signature:
+            None -> int
+
+        Version 1.0.0.0
+        """
+        return self._Count
+
+    def __add__(self, Other: 'WeightedMean') -> 'WeightedMean':
+        """
+        Creates a new accumulator with the merged states of the both operands,
+        which are not changed.
+
+        Signature:
+            WeightedMean -> WeightedMean
+
+        Raises:
+            UT_TypeError: the other operand is not an instance of WeightedMean
+
+        Version 1.0.0.0
+        """
+        if not isinstance(Other, WeightedMean):
+            raise UT_TypeError(Other, WeightedMean, SkipFrames = 1)
+        Result = self.__class__()
+        Result._setState(_mergeWeighted(self._getState(), Other._getState()))
+        return Result
+
+    def __iadd__(self, Other: 'WeightedMean') -> 'WeightedMean':
+        """
+        Merges the state of the other accumulator into the current one.
+
+        Signature:
+            WeightedMean -> WeightedMean
+
+        Raises:
+            UT_TypeError: the other operand is not an instance of WeightedMean
+
+        Version 1.0.0.0
+        """
+        if not isinstance(Other, WeightedMean):
+            raise UT_TypeError(Other, WeightedMean, SkipFrames = 1)
+        self._setState(_mergeWeighted(self._getState(), Other._getState()))
+        return self
+
+    #public API
+
+    #+ read-only properties
+
+    @property
+    def Count(self) -> int:
+        """
+        Read-only access property to the number of the combined entries.
+
+        Signature:
+            None -> int
+
+        Version 1.0.0.0
+        """
+        return self._Count
+
+    @property
+    def ExactCount(self) -> int:
+        """
+        Read-only access property to the number of the exact entries, i.e.
+        with zero uncertainty.
+
+        Signature:
+            None -> int
+
+        Version 1.0.0.0
+        """
+        return self._Exact
+
+    @property
+    def Weight(self) -> float:
+        """
+        Read-only access property to the sum of the weights (the inverse
+        variances) of the entries with non-zero uncertainty.
+
+        Signature:
+            None -> float
+
+        Version 1.0.0.0
+        """
+        return self._Weight + self._WeightError
+
+    @property
+    def Mean(self) -> float:
+        """
+        Read-only access property to the weighted mean of the entries, or the
+        exact value, if present. NaN if no entries or different exact values.
+
+        Signature:
+            None -> float
+
+        Version 1.0.0.0
+        """
+        if self._Exact:
+            return self._Min if self._Min == self._Max else math.nan
+        if not self._Count:
+            return math.nan
+        return (self._Sum + self._SumError) / self.Weight
+
+    @property
+    def ChiSquared(self) -> float:
+        """
+        Read-only access property to the chi-squared of the entries about the
+        mean, i.e. the sum of the squared deviations of the values from the
+        mean divided by their variances. NaN if no entries, infinite if
+        different exact values.
+
+        Signature:
+            None -> float
+
+        Version 1.0.0.0
+        """
+        if not self._Count:
+            return math.nan
+        if not self._Exact:
+            return self._M2
+        if self._Min != self._Max:
+            return math.inf
+        if not self._Weight:
+            return 0.0
+        Weight = self.Weight
+        Delta = (self._Sum + self._SumError) / Weight - self._Min
+        return self._M2 + Weight * Delta * Delta
+
+    @property
+    def ReducedChiSquared(self) -> float:
+        """
+        Read-only access property to the chi-squared per degree of freedom,
+        i.e. divided by the number of entries - 1. NaN if less than 2
+        entries.
+
+        Signature:
+            None -> float
+
+        Version 1.0.0.0
+        """
+        if self._Count < 2:
+            return math.nan
+        return self.ChiSquared / (self._Count - 1)
+
+    #+ methods
+
+    def push(self, Value: Any, SE: Optional[Any] = None) -> None:
+        """
+        Adds a single measurement with uncertainty.
+
+        Signature:
+            int OR float OR MeasuredValue /, int OR float OR None/ -> None
+
+        Args:
+            Value: int OR float OR MeasuredValue; the measurement with
+                uncertainty, or the mean value, which is exact, unless the
+                uncertainty is passed separately
+            SE: (optional) int >= 0 OR float >= 0 OR None; the uncertainty of
+                the real number mean value, defaults to None
+
+        Raises:
+            UT_TypeError: the value is neither a real number nor a
+                measurement with uncertainty, OR the uncertainty is passed
+                with a measurement, OR the uncertainty is not a real number
+            UT_ValueError: the value or the uncertainty is not finite, OR the
+                uncertainty is negative, OR the inverse variance overflows
+                or underflows to zero
+
+        Version 1.0.0.0
+        """
+        Mean, Error = _toMeasurement(Value, SE)
+        if not Error:
+            Item = (1, 0.0, 0.0, 0.0, 0.0, 0.0, 1, Mean, Mean)
+        else:
+            Weight = 1.0 / (Error * Error)
+            Item = (1, Weight, 0.0, Weight * Mean, 0.0, 0.0, 0, math.inf,
+                                                                    -math.inf)
+        self._setState(_mergeWeighted(self._getState(), Item))
+
+    def pushMany(self, Values: Any, SE: Optional[Any] = None) -> None:
+        """
+        Adds an array of measurements with uncertainty (of any shape, which is
+        flattened) in bulk using the vectorized statistics of the chunks of
+        CHUNK_ELEMENTS entries. The entries are checked before the state is
+        changed, i.e. either all or none of them are added.
+
+        Signature:
+            type A /, type B/ -> None
+
+        Args:
+            Values: type A; a MeasuredArray, a (nested) sequence or numpy
+                array of measurements with uncertainty and / or real numbers
+                (exact), or the real number mean values, if the uncertainties
+                are passed separately
+            SE: (optional) type B; a non-negative real number or a sequence or
+                array of them broadcastable to the shape of the mean values,
+                the uncertainties, defaults to None - taken from the values
+
+        Raises:
+            UT_TypeError: the values are not a sequence or array of real
+                numbers and / or measurements with uncertainty, OR the
+                uncertainties are not a real number or a sequence or array of
+                real numbers, OR the mean values are not real numbers, if the
+                uncertainties are passed
+            UT_ValueError: the uncertainties are not broadcastable to the
+                shape of the values, OR any value or uncertainty is not
+                finite, OR any uncertainty is negative or its inverse variance
+                overflows or underflows to zero
+
+        Version 1.0.0.0
+        """
+        Data, Errors = _toMeasurements(Values, SE)
+        Data = Data.reshape(-1)
+        Errors = Errors.reshape(-1)
+        Statistics = list()
+        Invalid = 0
+        Negative = 0
+        for Start in range(0, Data.size, CHUNK_ELEMENTS):
+            Stop = Start + CHUNK_ELEMENTS
+            Chunk = Data[Start : Stop].astype(np.float64)
+            Uncertainty = Errors[Start : Stop].astype(np.float64)
+            Count = _countInvalid(Chunk, Uncertainty)
+            Invalid += Count[0]
+            Negative += Count[1]
+            if not (Invalid or Negative):
+                Statistics.append(_weightedStatistics(Chunk, Uncertainty))
+        _raiseInvalid(Invalid, Negative, Data.size)
+        State = self._getState()
+        for Item in Statistics:
+            State = _mergeWeighted(State, Item)
+        self._setState(State)
+
+    def merge(self, Other: 'WeightedMean') -> None:
+        """
+        Merges the state of another accumulator into the current one, the
+        other accumulator is not changed.
+
+        Signature:
+            WeightedMean -> None
+
+        Args:
+            Other: WeightedMean; the accumulator to be merged
+
+        Raises:
+            UT_TypeError: the argument is not an instance of WeightedMean
+
+        Version 1.0.0.0
+        """
+        if not isinstance(Other, WeightedMean):
+            raise UT_TypeError(Other, WeightedMean, SkipFrames = 1)
+        self._setState(_mergeWeighted(self._getState(), Other._getState()))
+
+    def toMeasuredValue(self, Scale: bool = False) -> MeasuredValue:
+        """
+        Produces the combined measurement with uncertainty: the weighted mean
+        with the uncertainty 1 / sqrt(sum of weights), or the exact value with
+        zero uncertainty. Optionally, the uncertainty is scaled by the square
+        root of the reduced chi-squared, if it is greater than 1 (Birge
+        ratio), which accounts for the inconsistent entries.
+
+        Signature:
+            /bool/ -> MeasuredValue
+
+        Args:
+            Scale: (optional) bool; if True, the uncertainty is scaled by the
+                Birge ratio, defaults to False
+
+        Returns:
+            MeasuredValue: the combined measurement
+
+        Raises:
+            UT_TypeError: the flag is not boolean
+            UT_ValueError: no entries are combined, OR the exact values are
+                different
+
+        Version 1.0.0.0
+        """
+        if not isinstance(Scale, bool):
+            raise UT_TypeError(Scale, bool, SkipFrames = 1)
+        if not self._Count:
+            raise UT_ValueError(self._Count, '>= 1 entries', SkipFrames = 1)
+        if self._Exact:
+            if self._Min != self._Max:
+                raise UT_ValueError((self._Min, self._Max),
+                            'the same exact values', SkipFrames = 1)
+            return MeasuredValue(self._Min, 0.0)
+        Error = 1.0 / math.sqrt(self.Weight)
+        if Scale and self._Count > 1:
+            Error *= math.sqrt(max(1.0, self.ReducedChiSquared))
+        return MeasuredValue(self.Mean, Error)
+
+class RollingWindow:
+    """
+    Implements the rolling window aggregator of a stream of the measured
+    readings: the window holds the last Size readings (count-based), or the
+    readings within the time Span before the latest reading (time-based,
+    inclusive). The running sums of the values, the variances, the weights
+    (inverse variances) and the weighted values are updated in O(1) per
+    reading by adding the new and subtracting the expired readings with the
+    compensated (Neumaier) summation, so a huge expired reading does not
+    cancel the following small sums, and re-calculated from the stored
+    readings (math.fsum) after every max(RESUM_PERIOD, window length) expired
+    readings, or as soon as the running sum of the weights is not positive,
+    which bounds the drift by the rounding errors at O(1) amortized cost.
+
+    The sum and the mean of the window assume the independent readings; the
+    weighted mean is the inverse-variance weighted mean, or the mean of the
+    exact readings (zero uncertainty) with zero uncertainty, if there are any
+    in the window.
+
+    Properties:
+        Size: (read-only) int OR None; the number of the readings per window
+        Span: (read-only) float OR None; the time span of the window
+        Count: (read-only) int; the current number of readings in the window
+        Sum: (read-only) MeasuredValue; the sum of the readings in the
+            window, zero if empty
+        Mean: (read-only) MeasuredValue; the mean of the readings in the
+            window, NaN if empty
+        WeightedMean: (read-only) MeasuredValue; the inverse-variance
+            weighted mean of the readings in the window, NaN if empty
+
+    Methods:
+        push(Value, SE = None, Time = None):
+            int OR float OR MeasuredValue
+                /, int OR float OR None, int OR float OR None/ -> None
+
+    Version 1.0.0.0
+    """
+
+    #'private' helper methods
+
+    def _update(self, Value: float, Variance: float, Sign: float) -> None:
+        """
+        Helper 'private' method to add (Sign = 1.0) or to subtract (Sign =
+        -1.0) a reading from the running sums.
+
+        Signature:
+            float, float, float -> None
+
+        Version 1.0.0.0
+        """
+        if Variance:
+            Weight = 1.0 / Variance
+            Terms = (Value, Variance, Weight, Weight * Value, 0.0)
+        else:
+            self._Exact += int(Sign)
+            Terms = (Value, 0.0, 0.0, 0.0, Value)
+        Totals, Compensations = self._Totals, self._Compensations
+        for Index, Term in enumerate(Terms):
+            if Term:
+                Totals[Index], Compensations[Index] = _addCompensated(
+                        Totals[Index], Compensations[Index], Sign * Term)
+
+    def _getSums(self) -> Tuple[float, float, float, float, float]:
+        """
+        Helper 'private' method to get the compensated running sums of the
+        values, the variances, the weights, the weighted values and the exact
+        values.
+
+        Signature:
+            None -> float, float, float, float, float
+
+        Version 1.0.0.0
+        """
+        return tuple(Total + Compensation for Total, Compensation
+                                in zip(self._Totals, self._Compensations))
+
+    def _clear(self, *Indexes: int) -> None:
+        """
+        Helper 'private' method to set the running sums with the given
+        indexes (see the method _getSums()) to zero exactly.
+
+        Signature:
+            /int, .../ -> None
+
+        Version 1.0.0.0
+        """
+        for Index in Indexes:
+            self._Totals[Index] = self._Compensations[Index] = 0.0
+
+    def _resum(self) -> None:
+        """
+        Helper 'private' method to re-calculate the running sums from the
+        readings in the window.
+
+        Signature:
+            None -> None
+
+        Version 1.0.0.0
+        """
+        Values = [Item[1] for Item in self._Readings]
+        Variances = [Item[2] for Item in self._Readings]
+        Weights = [1.0 / Item if Item else 0.0 for Item in Variances]
+        self._Totals = [math.fsum(Values), math.fsum(Variances),
+                    math.fsum(Weights), math.fsum(Weight * Value
+                                for Weight, Value in zip(Weights, Values)),
+                    math.fsum(Value for Value, Variance
+                                    in zip(Values, Variances) if not Variance)]
+        self._Compensations = [0.0] * 5
+        self._Exact = sum(1 for Item in Variances if not Item)
+        self._Expired = 0
+
+    #special methods
+
+    def __init__(self, *, Size: Optional[int] = None,
+                                    Span: Optional[float] = None) -> None:
+        """
+        Initializer. Creates an empty window defined either by the number of
+        readings, or by the time span.
+
+        Signature:
+            *, /int > 0 OR None, int > 0 OR float > 0 OR None/ -> None
+
+        Args:
+            Size: (keyword) int > 0 OR None; the number of the readings per
+                window, defaults to None
+            Span: (keyword) int > 0 OR float > 0 OR None; the time span of
+                the window, defaults to None
+
+        Raises:
+            UT_TypeError: the size is not an integer, OR the span is not a
+                real number
+            UT_ValueError: not exactly one of the size and the span is passed,
+                OR the passed one is not positive and finite
+
+        Version 1.0.0.0
+        """
+        _checkWindow(Size, Span)
+        self._Size = None if Size is None else int(Size)
+        self._Span = None if Span is None else float(Span)
+        self._Readings = collections.deque()
+        self._Latest = -math.inf
+        self._resum()
+
+    def __len__(self) -> int:
+        """
+        Returns the current number of readings in the window.
+
+        Signature:
+            None -> int
+
+        Version 1.0.0.0
+        """
+        return len(self._Readings)
+
+    #public API
+
+    #+ read-only properties
+
+    @property
+    def Size(self) -> Optional[int]:
+        """
+        Read-only access property to the number of the readings per window,
+        None for the time-based window.
+
+        Signature:
+            None -> int OR None
+
+        Version 1.0.0.0
+        """
+        return self._Size
+
+    @property
+    def Span(self) -> Optional[float]:
+        """
+        Read-only access property to the time span of the window, None for
+        the count-based window.
+
+        Signature:
+            None -> float OR None
+
+        Version 1.0.0.0
+        """
+        return self._Span
+
+    @property
+    def Count(self) -> int:
+        """
+        Read-only access property to the current number of readings in the
+        window.
+
+        Signature:
+            None -> int
+
+        Version 1.0.0.0
+        """
+        return len(self._Readings)
+
+    @property
+    def Sum(self) -> MeasuredValue:
+        """
+        Read-only access property to the sum of the readings in the window,
+        zero for the empty window.
+
+        Signature:
+            None -> MeasuredValue
+
+        Version 1.0.0.0
+        """
+        Sum, Variance = self._getSums()[:2]
+        return MeasuredValue(Sum, math.sqrt(max(Variance, 0.0)))
+
+    @property
+    def Mean(self) -> MeasuredValue:
+        """
+        Read-only access property to the mean of the readings in the window,
+        NaN for the empty window.
+
+        Signature:
+            None -> MeasuredValue
+
+        Version 1.0.0.0
+        """
+        Count = len(self._Readings)
+        if not Count:
+            return MeasuredValue(math.nan, math.nan)
+        Sum, Variance = self._getSums()[:2]
+        return MeasuredValue(Sum / Count, math.sqrt(max(Variance, 0.0)) / Count)
+
+    @property
+    def WeightedMean(self) -> MeasuredValue:
+        """
+        Read-only access property to the inverse-variance weighted mean of the
+        readings in the window, or the mean of the exact readings with zero
+        uncertainty, if present; NaN for the empty window.
+
+        Signature:
+            None -> MeasuredValue
+
+        Version 1.0.0.0
+        """
+        if not self._Readings:
+            return MeasuredValue(math.nan, math.nan)
+        _, _, Weight, WeightedSum, ExactSum = self._getSums()
+        if self._Exact:
+            return MeasuredValue(ExactSum / self._Exact, 0.0)
+        if not Weight > 0:
+            return MeasuredValue(math.nan, math.nan)
+        return MeasuredValue(WeightedSum / Weight, 1.0 / math.sqrt(Weight))
+
+    #+ methods
+
+    def push(self, Value: Any, SE: Optional[Any] = None,
+                                        Time: Optional[Any] = None) -> None:
+        """
+        Adds a reading to the window and removes the expired readings.
+
+        Signature:
+            int OR float OR MeasuredValue
+                /, int OR float OR None, int OR float OR None/ -> None
+
+        Args:
+            Value: int OR float OR MeasuredValue; the reading with
+                uncertainty, or the mean value, which is exact, unless the
+                uncertainty is passed separately
+            SE: (optional) int >= 0 OR float >= 0 OR None; the uncertainty of
+                the real number mean value, defaults to None
+            Time: (optional) int OR float OR None; the time of the reading,
+                required for the time-based window, ignored otherwise,
+                defaults to None
+
+        Raises:
+            UT_TypeError: the value is neither a real number nor a
+                measurement with uncertainty, OR the uncertainty is passed
+                with a measurement, OR the uncertainty is not a real number,
+                OR the time of the time-based window is not a real number
+            UT_ValueError: the value, the uncertainty or the time is not
+                finite, OR the uncertainty is negative or its inverse
+                variance overflows or underflows to zero, OR the time is less
+                than the time of the previous reading
+
+        Version 1.0.0.0
+        """
+        Mean, Error = _toMeasurement(Value, SE)
+        if self._Span is not None:
+            if ((not isinstance(Time, (int, float, np.integer, np.floating)))
+                                    or isinstance(Time, (bool, np.bool_))):
+                raise UT_TypeError(Time, (int, float), SkipFrames = 1)
+            Time = float(Time)
+            if not math.isfinite(Time):
+                raise UT_ValueError(Time, 'finite time', SkipFrames = 1)
+            if Time < self._Latest:
+                raise UT_ValueError(Time, '>= {}'.format(self._Latest),
+                                                                SkipFrames = 1)
+            self._Latest = Time
+        Variance = Error * Error
+        self._Readings.append((Time, Mean, Variance))
+        self._update(Mean, Variance, 1.0)
+        Readings = self._Readings
+        if self._Span is None:
+            while len(Readings) > self._Size:
+                Item = Readings.popleft()
+                self._update(Item[1], Item[2], -1.0)
+                self._Expired += 1
+        else:
+            Limit = Time - self._Span
+            while Readings[0][0] <= Limit:
+                Item = Readings.popleft()
+                self._update(Item[1], Item[2], -1.0)
+                self._Expired += 1
+        if self._Expired >= max(RESUM_PERIOD, len(Readings)):
+            self._resum()
+        else:
+            #no rounding residuals of the expired readings
+            if not self._Exact:
+                self._clear(4)
+            if self._Exact == len(Readings):
+                self._clear(1, 2, 3)
+            elif not self._getSums()[2] > 0:
+                #the weights cancelled beyond the compensation
+                self._resum()
+
+class CovarianceAccumulator:
+    """
+    Implements the streaming accumulator of the multi-channel samples (e.g.
+    the simultaneous readings of several sensors or ADC channels), which
+    keeps only the number of samples, the mean vector and the co-moment
+    matrix (the sum of the outer products of the deviations from the mean)
+    of the channels, and produces the channel means with their covariance
+    matrix on demand, e.g. for the covariance-aware propagation of the
+    correlated uncertainties. The single samples are added by the
+    multivariate Welford's algorithm (a rank-1 update), the arrays of samples
+    - by the vectorized two-pass statistics (a rank-k update) of the chunks
+    of about CHUNK_ELEMENTS elements, which are merged into the state by the
+    multivariate parallel update formulas of Chan et al. The memory and the
+    state size depend only on the number of channels.
+
+    All samples are weighted equally. The accumulators of the same number of
+    channels filled independently are merged exactly and in any order (up to
+    the rounding errors) by the method merge() or by the addition. The state
+    is serialized by the method toBytes() (COVARIANCE_HEADER_SIZE + 8 * K *
+    (K + 1) bytes for K channels) and restored by the class method
+    fromBytes(); the instances are also picklable.
+
+    Properties:
+        Channels: (read-only) int; the number of channels
+        Count: (read-only) int; the number of the accumulated samples
+        Mean: (read-only) numpy.ndarray; the mean vector of the samples, NaN
+            if no samples
+        Covariance: (read-only) numpy.ndarray; the unbiased sample covariance
+            matrix of the channels, NaN if less than 2 samples
+        Correlation: (read-only) numpy.ndarray; the sample correlation matrix
+            of the channels, NaN if less than 2 samples, and NaN rows and
+            columns of the constant channels
+
+    Methods:
+        push(Sample):
+            seq(int OR float) OR numpy.ndarray -> None
+        pushMany(Samples):
+            seq(seq(int OR float)) OR numpy.ndarray -> None
+        merge(Other):
+            CovarianceAccumulator -> None
+        toMeasuredArray():
+            None -> MeasuredArray, numpy.ndarray
+        toBytes():
+            None -> bytes
+        fromBytes(Data):
+            bytes OR bytearray OR memoryview -> CovarianceAccumulator
+
+    Version 1.0.0.0
+    """
+
+    #'private' helper methods
+
+    def _getState(self) -> TCovariance:
+        """
+        Helper 'private' method to get the state as a tuple.
+
+        Signature:
+            None -> tuple(int, numpy.ndarray, numpy.ndarray)
+
+        Version 1.0.0.0
+        """
+        return self._Count, self._Mean, self._Moments
+
+    def _setState(self, State: TCovariance) -> None:
+        """
+        Helper 'private' method to set the state from a tuple; the arrays are
+        copied.
+
+        Signature:
+            tuple(int, numpy.ndarray, numpy.ndarray) -> None
+
+        Version 1.0.0.0
+        """
+        self._Count = State[0]
+        self._Mean = np.array(State[1], dtype = np.float64)
+        self._Moments = np.array(State[2], dtype = np.float64)
+
+    def _checkOther(self, Other: Any) -> None:
+        """
+        Helper 'private' method to check the accumulator to be merged.
+
+        Signature:
+            type A -> None
+
+        Raises:
+            UT_TypeError: the argument is not an instance of
+                CovarianceAccumulator
+            UT_ValueError: the numbers of channels are different
+
+        Version 1.0.0.0
+        """
+        if not isinstance(Other, CovarianceAccumulator):
+            raise UT_TypeError(Other, CovarianceAccumulator, SkipFrames = 2)
+        if Other.Channels != self.Channels:
+            raise UT_ValueError(Other.Channels, '== {} channels'.format(
+                                                self.Channels), SkipFrames = 2)
+
+    #special methods
+
+    def __init__(self, Channels: int) -> None:
+        """
+        Initializer. Creates an empty accumulator.
+
+        Signature:
+            int > 0 -> None
+
+        Args:
+            Channels: int > 0; the number of channels
+
+        Raises:
+            UT_TypeError: the number of channels is not an integer
+            UT_ValueError: the number of channels is not positive
+
+        Version 1.0.0.0
+        """
+        if ((not isinstance(Channels, (int, np.integer)))
+                                    or isinstance(Channels, (bool, np.bool_))):
+            raise UT_TypeError(Channels, int, SkipFrames = 1)
+        if Channels < 1:
+            raise UT_ValueError(Channels, '>= 1', SkipFrames = 1)
+        self._setState((0, np.zeros(Channels), np.zeros((Channels,
+                                                                Channels))))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of the accumulated samples.
+
+        Signature:
+            None -> int
+
+        Version 1.0.0.0
+        """
+        return self._Count
+
+    def __add__(self, Other: 'CovarianceAccumulator'
+                                                ) -> 'CovarianceAccumulator':
+        """
+        Creates a new accumulator with the merged states of the both operands,
+        which are not changed.
+
+        Signature:
+            CovarianceAccumulator -> CovarianceAccumulator
+
+        Raises:
+            UT_TypeError: the other operand is not an instance of
+                CovarianceAccumulator
+            UT_ValueError: the numbers of channels are different
+
+        Version 1.0.0.0
+        """
+        self._checkOther(Other)
+        Result = self.__class__(self.Channels)
+        Result._setState(_mergeCovariance(self._getState(),
+                                                        Other._getState()))
+        return Result
+
+    def __iadd__(self, Other: 'CovarianceAccumulator'
+                                                ) -> 'CovarianceAccumulator':
+        """
+        Merges the state of the other accumulator into the current one.
+
+        Signature:
+            CovarianceAccumulator -> CovarianceAccumulator
+
+        Raises:
+            UT_TypeError: the other operand is not an instance of
+                CovarianceAccumulator
+            UT_ValueError: the numbers of channels are different
+
+        Version 1.0.0.0
+        """
+        self._checkOther(Other)
+        self._setState(_mergeCovariance(self._getState(), Other._getState()))
+        return self
+
+    #public API
+
+    #+ read-only properties
+
+    @property
+    def Channels(self) -> int:
+        """
+        Read-only access property to the number of channels.
+
+        Signature:
+            None -> int
+
+        Version 1.0.0.0
+        """
+        return self._Mean.size
+
+    @property
+    def Count(self) -> int:
+        """
+        Read-only access property to the number of the accumulated samples.
+
+        Signature:
+            None -> int
+
+        Version 1.0.0.0
+        """
+        return self._Count
+
+    @property
+    def Mean(self) -> np.ndarray:
+        """
+        Read-only access property to the mean vector of the accumulated
+        samples (a copy), NaN if there are no samples.
+
+        Signature:
+            None -> numpy.ndarray
+
+        Version 1.0.0.0
+        """
+        if not self._Count:
+            return np.full(self.Channels, np.nan)
+        return self._Mean.copy()
+
+    @property
+    def Covariance(self) -> np.ndarray:
+        """
+        Read-only access property to the unbiased sample covariance matrix of
+        the channels, NaN if there are less than 2 samples.
+
+        Signature:
+            None -> numpy.ndarray
+
+        Version 1.0.0.0
+        """
+        if self._Count < 2:
+            return np.full(self._Moments.shape, np.nan)
+        return self._Moments / (self._Count - 1)
+
+    @property
+    def Correlation(self) -> np.ndarray:
+        """
+        Read-only access property to the sample correlation matrix of the
+        channels (the same as of the channel means), NaN if there are less
+        than 2 samples; the rows and the columns of the constant channels are
+        NaN.
+
+        Signature:
+            None -> numpy.ndarray
+
+        Version 1.0.0.0
+        """
+        if self._Count < 2:
+            return np.full(self._Moments.shape, np.nan)
+        Scale = np.sqrt(np.diagonal(self._Moments))
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            Result = self._Moments / np.outer(Scale, Scale)
+        Result = np.clip(Result, -1.0, 1.0)
+        IsValid = Scale > 0
+        Result[np.flatnonzero(IsValid), np.flatnonzero(IsValid)] = 1.0
+        return Result
+
+    #+ methods
+
+    def push(self, Sample: Any) -> None:
+        """
+        Adds a single multi-channel sample using the multivariate Welford's
+        algorithm.
+
+        Signature:
+            seq(int OR float) OR numpy.ndarray -> None
+
+        Args:
+            Sample: seq(int OR float) OR numpy.ndarray; the 1-D sequence or
+                array of the real number values of all channels
+
+        Raises:
+            UT_TypeError: the sample is not a sequence or array of real
+                numbers
+            UT_ValueError: the sample is not of the number of channels, OR
+                any value is not finite
+
+        Version 1.0.0.0
+        """
+        Data = _toSamples(Sample)
+        if Data.shape != (self.Channels, ):
+            raise UT_ValueError(Data.shape, '({}, ) sample'.format(
+                                                self.Channels), SkipFrames = 1)
+        Data = Data.astype(np.float64)
+        if not np.all(np.isfinite(Data)):
+            raise UT_ValueError(Sample, 'finite values', SkipFrames = 1)
+        self._Count += 1
+        Delta = Data - self._Mean
+        self._Mean += Delta / self._Count
+        self._Moments += np.outer(Delta, Delta) * ((self._Count - 1)
+                                                                / self._Count)
+
+    def pushMany(self, Samples: Any) -> None:
+        """
+        Adds an array of multi-channel samples (one row per sample) in bulk
+        using the vectorized statistics of the chunks of about CHUNK_ELEMENTS
+        elements. The samples are checked before the state is changed, i.e.
+        either all or none of them are added.
+
+        Signature:
+            seq(seq(int OR float)) OR numpy.ndarray -> None
+
+        Args:
+            Samples: seq(seq(int OR float)) OR numpy.ndarray; the nested
+                sequence or 2-D numpy array of real numbers of the shape
+                (number of samples, number of channels), which can be a
+                memory-mapped array
+
+        Raises:
+            UT_TypeError: the samples are not a sequence or array of real
+                numbers
+            UT_ValueError: the samples are not 2-D with a column per channel,
+                OR any value is not finite
+
+        Version 1.0.0.0
+        """
+        Data = _toSamples(Samples)
+        if Data.size or Data.ndim > 1:
+            if Data.ndim != 2 or Data.shape[1] != self.Channels:
+                raise UT_ValueError(Data.shape, '(N, {}) samples'.format(
+                                                self.Channels), SkipFrames = 1)
+        else:
+            Data = Data.reshape(0, self.Channels)
+        Rows = max(1, CHUNK_ELEMENTS // self.Channels)
+        Statistics = list()
+        Invalid = 0
+        for Start in range(0, Data.shape[0], Rows):
+            Chunk = Data[Start : Start + Rows].astype(np.float64)
+            Invalid += int(np.count_nonzero(~np.isfinite(Chunk)))
+            if not Invalid:
+                Statistics.append(_chunkCovariance(Chunk))
+        if Invalid:
+            Error = UT_ValueError(Invalid, '== 0 non-finite samples',
+                                                                SkipFrames = 1)
+            Error.setMessage('Non-finite samples: {} of {}'.format(Invalid,
+                                                                    Data.size))
+            raise Error
+        State = self._getState()
+        for Item in Statistics:
+            State = _mergeCovariance(State, Item)
+        self._setState(State)
+
+    def merge(self, Other: 'CovarianceAccumulator') -> None:
+        """
+        Merges the state of another accumulator into the current one, the
+        other accumulator is not changed.
+
+        Signature:
+            CovarianceAccumulator -> None
+
+        Args:
+            Other: CovarianceAccumulator; the accumulator to be merged
+
+        Raises:
+            UT_TypeError: the argument is not an instance of
+                CovarianceAccumulator
+            UT_ValueError: the numbers of channels are different
+
+        Version 1.0.0.0
+        """
+        self._checkOther(Other)
+        self._setState(_mergeCovariance(self._getState(), Other._getState()))
+
+    def toMeasuredArray(self) -> Tuple[MeasuredArray, np.ndarray]:
+        """
+        Produces the measurements with uncertainty from the accumulated
+        samples: the channel means with the standard errors of the means, and
+        the covariance matrix of the means, i.e. the unbiased sample
+        covariance matrix divided by the number of samples.
+
+        Signature:
+            None -> MeasuredArray, numpy.ndarray
+
+        Returns:
+            tuple(MeasuredArray, numpy.ndarray): the means with the standard
+                errors of the means, and their covariance matrix
+
+        Raises:
+            UT_ValueError: less than 2 samples are accumulated
+
+        Version 1.0.0.0
+        """
+        if self._Count < 2:
+            raise UT_ValueError(self._Count, '>= 2 samples', SkipFrames = 1)
+        Covariance = self.Covariance / self._Count
+        return (MeasuredArray(self._Mean.copy(),
+                    np.sqrt(np.diagonal(Covariance).copy())), Covariance)
+
+    def toBytes(self) -> bytes:
+        """
+        Serializes the state into COVARIANCE_HEADER_SIZE + 8 * K * (K + 1)
+        bytes for K channels (see COVARIANCE_HEADER).
+
+        Signature:
+            None -> bytes
+
+        Returns:
+            bytes: the binary state
+
+        Version 1.0.0.0
+        """
+        return (struct.pack(COVARIANCE_HEADER, self.Channels, self._Count)
+                    + self._Mean.astype('<f8').tobytes()
+                    + self._Moments.astype('<f8').tobytes())
+
+    @classmethod
+    def fromBytes(cls, Data: Any) -> 'CovarianceAccumulator':
+        """
+        Creates an accumulator from the binary state produced by the method
+        toBytes().
+
+        Signature:
+            bytes OR bytearray OR memoryview -> CovarianceAccumulator
+
+        Args:
+            Data: bytes OR bytearray OR memoryview; the binary state
+
+        Returns:
+            CovarianceAccumulator: the restored accumulator
+
+        Raises:
+            UT_TypeError: the data is not a bytes-like object
+            UT_ValueError: the data is too short, OR its size does not match
+                the number of channels, OR the state is not consistent
+
+        Version 1.0.0.0
+        """
+        if not isinstance(Data, (bytes, bytearray, memoryview)):
+            raise UT_TypeError(Data, (bytes, bytearray, memoryview),
+                                                                SkipFrames = 1)
+        Data = bytes(Data)
+        if len(Data) < COVARIANCE_HEADER_SIZE:
+            raise UT_ValueError(len(Data), '>= {} bytes'.format(
+                                    COVARIANCE_HEADER_SIZE), SkipFrames = 1)
+        Channels, Count = struct.unpack_from(COVARIANCE_HEADER, Data)
+        Size = COVARIANCE_HEADER_SIZE + 8 * Channels * (Channels + 1)
+        if (not Channels) or len(Data) != Size:
+            raise UT_ValueError(len(Data), '== {} bytes'.format(Size),
+                                                                SkipFrames = 1)
+        Values = np.frombuffer(Data, dtype = '<f8',
+                                offset = COVARIANCE_HEADER_SIZE).astype(
+                                                                    np.float64)
+        Mean = Values[:Channels]
+        Moments = Values[Channels:].reshape(Channels, Channels)
+        if not np.all(np.isfinite(Values)):
+            IsValid = False
+        elif not Count:
+            IsValid = not np.any(Values)
+        else:
+            IsValid = (np.array_equal(Moments, Moments.T)
+                                        and np.all(np.diagonal(Moments) >= 0))
+        if not IsValid:
+            raise UT_ValueError(Data, 'consistent state', SkipFrames = 1)
+        Result = cls(Channels)
+        Result._setState((Count, Mean, Moments))
+        return Result
@@ -0,0 +1,664 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.aggregation
+
+Implements the vectorized aggregation of the labelled measurements with
+uncertainty: the readings are grouped by their labels (e.g. the sensor ID,
+the batch or the run number), and the sums, the means and the
+inverse-variance weighted means of all groups are calculated at once by the
+segmented reductions over the arrays of the values and the uncertainties,
+without the Python level loops over the groups or the readings. The labels
+are factorized (sorted) only once, and the same grouping is re-used for any
+number of the value arrays.
+
+The outliers are rejected by the vectorized iterative sigma clipping of the
+readings (along an axis) around their running inverse-variance weighted
+mean, with the boolean masks instead of the element-wise comparisons.
+
+Classes:
+    GroupBy
+
+Functions:
+    groupBy(Labels, Values, SE = None)
+        seq(int OR float OR str) OR numpy.ndarray, type A /, type B/
+            -> numpy.ndarray, numpy.ndarray, MeasuredArray, MeasuredArray,
+                MeasuredArray
+    sigmaClip(Values, SE = None, *, Threshold = CLIP_THRESHOLD, Axis = None,
+                                        MaxIterations = MAX_CLIP_ITERATIONS)
+        type A /, type B, *, /float > 0, int OR None, int > 0/
+            -> MeasuredValue OR MeasuredArray, numpy.ndarray, int
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import math
+
+from typing import Union, Optional, Any, Tuple
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+from phyqus_lib.accumulators import (_toMeasurements, _countInvalid,
+                                                                _raiseInvalid)
+
+#types
+
+#+ factorized labels: the sorted unique labels (keys), the group index of
+#+ each label, the group sizes, the order of the readings sorted by group
+#+ (None if already sorted) and the index of the first sorted reading of each
+#+ group
+
+TGroups = Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray],
+                                                                np.ndarray]
+
+#globals
+
+CLIP_THRESHOLD = 3.0 #default clipping threshold, in the combined SE
+
+MAX_CLIP_ITERATIONS = 10 #default max number of the clipping iterations
+
+#functions
+
+#+ 'private' helper functions
+
+def _factorize(Labels: Any, SkipFrames: int = 2) -> TGroups:
+    """
+    Helper function to check the labels and to factorize them into the
+    groups.
+
+    Signature:
+        seq(int OR float OR str) OR numpy.ndarray /, int/
+            -> numpy.ndarray, numpy.ndarray, numpy.ndarray,
+                numpy.ndarray OR None, numpy.ndarray
+
+    Raises:
+        UT_TypeError: the labels are not a sequence or array of booleans,
+            integers, real numbers or strings
+        UT_ValueError: the labels are not 1-D, OR any label is NaN
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Labels, (list, tuple, np.ndarray)):
+        raise UT_TypeError(Labels, (list, tuple, np.ndarray),
+                                                    SkipFrames = SkipFrames)
+    try:
+        Data = np.asarray(Labels)
+    except (ValueError, TypeError):
+        raise UT_TypeError(Labels, (list, tuple, np.ndarray),
+                                        SkipFrames = SkipFrames) from None
+    if Data.dtype.kind not in 'biufUS':
+        raise UT_TypeError(Labels, (list, tuple, np.ndarray),
+                                                    SkipFrames = SkipFrames)
+    if Data.ndim != 1:
+        raise UT_ValueError(Data.shape, '1-D labels', SkipFrames = SkipFrames)
+    if Data.dtype.kind == 'f' and np.any(np.isnan(Data)):
+        raise UT_ValueError(Labels, 'not NaN labels', SkipFrames = SkipFrames)
+    Keys, Inverse, Counts = np.unique(Data, return_inverse = True,
+                                                        return_counts = True)
+    Inverse = Inverse.ravel()
+    Order = None
+    if np.any(Inverse[1:] < Inverse[:-1]):
+        Order = np.argsort(Inverse, kind = 'stable')
+    Starts = np.zeros(Keys.size, dtype = np.intp)
+    np.cumsum(Counts[:-1], out = Starts[1:])
+    for Item in (Keys, Inverse, Counts, Starts):
+        Item.flags.writeable = False
+    return Keys, Inverse, Counts, Order, Starts
+
+def _toReadings(Groups: TGroups, Values: Any, SE: Any,
+                SkipFrames: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Helper function to check the readings of the groups and to convert them
+    into a pair of float64 arrays of the same shape.
+
+    Signature:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray,
+            numpy.ndarray OR None, numpy.ndarray), type A, type B OR None
+                /, int/ -> numpy.ndarray, numpy.ndarray
+
+    Raises:
+        UT_TypeError: the values or the uncertainties are not real numbers
+            and / or measurements with uncertainty
+        UT_ValueError: the uncertainties are not broadcastable to the shape
+            of the values, OR the length of the values is not the same as of
+            the labels, OR any value or uncertainty is not finite, OR any
+            uncertainty is negative or its inverse variance overflows
+
+    Version 1.0.0.0
+    """
+    Data, Errors = _toMeasurements(Values, SE, SkipFrames = SkipFrames + 1)
+    Length = Groups[1].size
+    if Data.ndim < 1 or Data.shape[0] != Length:
+        raise UT_ValueError(Data.shape, '({}, ...) readings'.format(Length),
+                                                    SkipFrames = SkipFrames)
+    Data = Data.astype(np.float64)
+    Errors = Errors.astype(np.float64)
+    _raiseInvalid(*_countInvalid(Data, Errors), Data.size,
+                                                SkipFrames = SkipFrames + 1)
+    return Data, Errors
+
+def _groupSums(Groups: TGroups, Data: np.ndarray) -> np.ndarray:
+    """
+    Helper function to sum the readings (along the first axis) per group:
+    by the weighted bin counting of the 1-D readings, or by the segmented
+    reduction of the readings sorted by group.
+
+    Signature:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray,
+            numpy.ndarray OR None, numpy.ndarray), numpy.ndarray
+                -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Keys, Inverse, _, Order, Starts = Groups
+    if not Keys.size:
+        return np.zeros((0, ) + Data.shape[1:])
+    if Data.ndim == 1:
+        return np.bincount(Inverse, weights = Data, minlength = Keys.size)
+    if Order is not None:
+        Data = Data[Order]
+    return np.add.reduceat(Data, Starts, axis = 0)
+
+def _counts(Groups: TGroups, Data: np.ndarray) -> np.ndarray:
+    """
+    Helper function to reshape the group sizes for the broadcasting against
+    the group sums of the readings.
+
+    Signature:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray,
+            numpy.ndarray OR None, numpy.ndarray), numpy.ndarray
+                -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    return Groups[2].reshape((-1, ) + (1, ) * (Data.ndim - 1))
+
+def _sum(Groups: TGroups, Data: np.ndarray,
+                                    Errors: np.ndarray) -> MeasuredArray:
+    """
+    Helper function to calculate the sums of the independent readings per
+    group.
+
+    Signature:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray,
+            numpy.ndarray OR None, numpy.ndarray), numpy.ndarray,
+                numpy.ndarray -> MeasuredArray
+
+    Version 1.0.0.0
+    """
+    return MeasuredArray(_groupSums(Groups, Data),
+                                np.sqrt(_groupSums(Groups, Errors * Errors)))
+
+def _mean(Groups: TGroups, Data: np.ndarray,
+                                    Errors: np.ndarray) -> MeasuredArray:
+    """
+    Helper function to calculate the means of the independent readings per
+    group.
+
+    Signature:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray,
+            numpy.ndarray OR None, numpy.ndarray), numpy.ndarray,
+                numpy.ndarray -> MeasuredArray
+
+    Version 1.0.0.0
+    """
+    Counts = _counts(Groups, Data)
+    return MeasuredArray(_groupSums(Groups, Data) / Counts,
+                        np.sqrt(_groupSums(Groups, Errors * Errors)) / Counts)
+
+def _weightedMean(Groups: TGroups, Data: np.ndarray,
+                                    Errors: np.ndarray) -> MeasuredArray:
+    """
+    Helper function to calculate the inverse-variance weighted means of the
+    readings per group, or the means of the exact readings with zero
+    uncertainty, if there are any in a group.
+
+    Signature:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray,
+            numpy.ndarray OR None, numpy.ndarray), numpy.ndarray,
+                numpy.ndarray -> MeasuredArray
+
+    Version 1.0.0.0
+    """
+    IsExact = Errors == 0
+    Weights = 1.0 / np.where(IsExact, np.inf, Errors * Errors)
+    Exact = _groupSums(Groups, IsExact.astype(np.float64))
+    HasExact = Exact > 0
+    Weight = _groupSums(Groups, Weights)
+    WeightedSums = _groupSums(Groups, Weights * Data)
+    ExactSums = _groupSums(Groups, np.where(IsExact, Data, 0.0))
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        Means = np.where(HasExact, ExactSums / np.maximum(Exact, 1),
+                                                        WeightedSums / Weight)
+        Deviations = np.where(HasExact, 0.0, 1.0 / np.sqrt(Weight))
+    return MeasuredArray(Means, Deviations)
+
+def _clippedMean(Data: np.ndarray, Weights: np.ndarray,
+                    Kept: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Helper function to calculate the inverse-variance weighted means of the
+    kept readings of each row and their variances; NaN and infinity
+    respectively for the rows without any kept readings.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray, numpy.ndarray(bool)
+            -> numpy.ndarray, numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Weights = np.where(Kept, Weights, 0.0)
+    Weight = Weights.sum(axis = 1)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        return (Weights * Data).sum(axis = 1) / Weight, 1.0 / Weight
+
+#+ public API
+
+def groupBy(Labels: Any, Values: Any, SE: Optional[Any] = None) -> Tuple[
+                            np.ndarray, np.ndarray, MeasuredArray,
+                                            MeasuredArray, MeasuredArray]:
+    """
+    Groups the measured readings by their labels and calculates the number
+    of readings, the sum, the mean and the inverse-variance weighted mean of
+    each group at once, see the class GroupBy. The groups are ordered by the
+    sorted unique labels (keys).
+
+    Signature:
+        seq(int OR float OR str) OR numpy.ndarray, type A /, type B/
+            -> numpy.ndarray, numpy.ndarray, MeasuredArray, MeasuredArray,
+                MeasuredArray
+
+    Args:
+        Labels: seq(int OR float OR str) OR numpy.ndarray; the 1-D labels of
+            the readings, booleans, integers, real numbers or strings
+        Values: type A; the readings in any form accepted by the class
+            MeasuredArray, or the real number mean values, if the
+            uncertainties are passed separately, with the first axis along
+            the labels
+        SE: (optional) type B; a non-negative real number or a sequence or
+            array of them broadcastable to the shape of the mean values,
+            defaults to None - the uncertainties are taken from the values
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, MeasuredArray, MeasuredArray,
+            MeasuredArray): the keys, the numbers of readings, the sums, the
+            means and the weighted means of the groups
+
+    Raises:
+        UT_TypeError: the labels are not a sequence or array of booleans,
+            integers, real numbers or strings, OR the values or the
+            uncertainties are not real numbers and / or measurements with
+            uncertainty
+        UT_ValueError: the labels are not 1-D, OR any label is NaN, OR the
+            uncertainties are not broadcastable to the shape of the values,
+            OR the length of the values is not the same as of the labels, OR
+            any value or uncertainty is not finite, OR any uncertainty is
+            negative or its inverse variance overflows
+
+    Version 1.0.0.0
+    """
+    Groups = _factorize(Labels)
+    Data, Errors = _toReadings(Groups, Values, SE)
+    return (Groups[0], Groups[2], _sum(Groups, Data, Errors),
+                            _mean(Groups, Data, Errors),
+                                        _weightedMean(Groups, Data, Errors))
+
+def sigmaClip(Values: Any, SE: Optional[Any] = None, *,
+                Threshold: float = CLIP_THRESHOLD, Axis: Optional[int] = None,
+                MaxIterations: int = MAX_CLIP_ITERATIONS) -> Tuple[
+                    Union[MeasuredValue, MeasuredArray], np.ndarray, int]:
+    """
+    Rejects the outliers by the iterative sigma clipping and calculates the
+    inverse-variance weighted mean of the remaining readings - of all
+    readings (Axis is None), or along the axis for each element of the other
+    axes independently. A reading is rejected, if its deviation from the
+    current weighted mean of the kept readings exceeds Threshold times their
+    combined standard error sqrt(SE^2 + SE_mean^2). All rows are clipped at
+    once by the boolean masks, and the iterations stop when no more readings
+    are rejected (the rejected readings are never restored), or after
+    MaxIterations iterations. The rows with all readings rejected, as well as
+    the empty rows (zero length along the axis), result in NaN.
+
+    Signature:
+        type A /, type B, *, /float > 0, int OR None, int > 0/
+            -> MeasuredValue OR MeasuredArray, numpy.ndarray, int
+
+    Args:
+        Values: type A; the readings in any form accepted by the class
+            MeasuredArray, or the real number mean values, if the
+            uncertainties are passed separately
+        SE: (optional) type B; a positive real number or a sequence or
+            array of them broadcastable to the shape of the mean values,
+            defaults to None - the uncertainties are taken from the values
+        Threshold: (keyword) int > 0 OR float > 0; the clipping threshold in
+            the units of the combined standard error, defaults to
+            CLIP_THRESHOLD
+        Axis: (keyword) int OR None; the axis of the readings, defaults to
+            None - all readings
+        MaxIterations: (keyword) int > 0; the max number of the clipping
+            iterations, defaults to MAX_CLIP_ITERATIONS
+
+    Returns:
+        tuple(MeasuredValue, numpy.ndarray, int): the weighted mean of the
+            kept readings, the mask of the rejected readings (True) of the
+            shape of the readings, and the number of the iterations with
+            any readings rejected, Axis is None
+        tuple(MeasuredArray, numpy.ndarray, int): the weighted means along
+            the axis (the shape of the readings without the axis), the mask
+            and the number of the iterations
+
+    Raises:
+        UT_TypeError: the values or the uncertainties are not real numbers
+            and / or measurements with uncertainty, OR the threshold is not
+            a real number, OR the axis is not an integer or None, OR the max
+            number of iterations is not an integer
+        UT_ValueError: the uncertainties are not broadcastable to the shape
+            of the values, OR any value or uncertainty is not finite, OR any
+            uncertainty is not positive or its inverse variance overflows,
+            OR the threshold is not positive and finite, OR the axis is out
+            of the range, OR the max number of iterations is less than 1
+
+    Version 1.0.0.0
+    """
+    if ((not isinstance(Threshold, (int, float, np.integer, np.floating)))
+                                or isinstance(Threshold, (bool, np.bool_))):
+        raise UT_TypeError(Threshold, (int, float), SkipFrames = 1)
+    if not (0 < Threshold < math.inf):
+        raise UT_ValueError(Threshold, 'finite > 0', SkipFrames = 1)
+    if not ((Axis is None) or (isinstance(Axis, (int, np.integer))
+                                and not isinstance(Axis, (bool, np.bool_)))):
+        raise UT_TypeError(Axis, (int, None), SkipFrames = 1)
+    if ((not isinstance(MaxIterations, (int, np.integer)))
+                                or isinstance(MaxIterations, (bool, np.bool_))):
+        raise UT_TypeError(MaxIterations, int, SkipFrames = 1)
+    if MaxIterations < 1:
+        raise UT_ValueError(MaxIterations, '>= 1', SkipFrames = 1)
+    Data, Errors = _toMeasurements(Values, SE)
+    Data = Data.astype(np.float64)
+    Errors = Errors.astype(np.float64)
+    _raiseInvalid(*_countInvalid(Data, Errors), Data.size)
+    Zero = int(np.count_nonzero(Errors == 0))
+    if Zero:
+        Error = UT_ValueError(Zero, '== 0 zero SE', SkipFrames = 1)
+        Error.setMessage('Zero SE of the clipped readings: {} of {}'.format(
+                                                            Zero, Data.size))
+        raise Error
+    Shape = Data.shape
+    if Axis is None:
+        Data, Errors = Data.reshape(1, -1), Errors.reshape(1, -1)
+    else:
+        if not (-Data.ndim <= Axis < Data.ndim):
+            raise UT_ValueError(Axis, 'in [{}, {})'.format(-Data.ndim,
+                                            Data.ndim), SkipFrames = 1)
+        Data, Errors = [np.moveaxis(Item, Axis, -1) for Item in (Data, Errors)]
+        Reduced = Data.shape[:-1]
+        #explicit number of rows, -1 is ambiguous for the empty arrays
+        Data = Data.reshape(int(np.prod(Reduced)), Shape[Axis])
+        Errors = Errors.reshape(int(np.prod(Reduced)), Shape[Axis])
+    Variances = Errors * Errors
+    Weights = 1.0 / Variances
+    Rejected = np.zeros(Data.shape, dtype = bool)
+    Iterations = 0
+    while Iterations < MaxIterations:
+        Means, Variance = _clippedMean(Data, Weights, ~Rejected)
+        with np.errstate(invalid = 'ignore'):
+            Outliers = ~Rejected & (np.abs(Data - Means[:, np.newaxis])
+                > Threshold * np.sqrt(Variances + Variance[:, np.newaxis]))
+        if not np.any(Outliers):
+            break
+        Rejected |= Outliers
+        Iterations += 1
+    Means, Variance = _clippedMean(Data, Weights, ~Rejected)
+    Deviations = np.sqrt(Variance)
+    Deviations[np.isnan(Means)] = np.nan
+    if Axis is None:
+        Mask = Rejected.reshape(Shape)
+        Result = MeasuredValue(float(Means[0]), float(Deviations[0]))
+    else:
+        Mask = np.moveaxis(Rejected.reshape(Reduced + (Shape[Axis], )), -1,
+                                                                        Axis)
+        Result = MeasuredArray(Means.reshape(Reduced),
+                                                Deviations.reshape(Reduced))
+    return Result, Mask, Iterations
+
+#classes
+
+class GroupBy:
+    """
+    Implements the grouping of the measured readings by their labels. The
+    labels are factorized once at the instantiation into the sorted unique
+    labels (keys) and the group index of each reading, and any number of the
+    arrays of readings with the same labels can be reduced per group. The
+    readings are passed as the measurements with uncertainty in any form
+    accepted by the class MeasuredArray, or as the mean values with the
+    separate uncertainties; the first axis of the readings is along the
+    labels, and the reduction of the N-D readings is done for each element
+    along the other axes independently. The results are MeasuredArray
+    instances with one row per group in the order of the keys.
+
+    The sum and the mean of a group assume the independent readings; the
+    weighted mean is the inverse-variance weighted mean, or the mean of the
+    exact readings (zero uncertainty) with zero uncertainty, if there are any
+    in the group.
+
+    Properties:
+        Keys: (read-only) numpy.ndarray; the sorted unique labels
+        Counts: (read-only) numpy.ndarray; the number of readings per group
+        Indexes: (read-only) numpy.ndarray; the group index of each label
+
+    Methods:
+        sum(Values, SE = None):
+            type A /, type B/ -> MeasuredArray
+        mean(Values, SE = None):
+            type A /, type B/ -> MeasuredArray
+        weightedMean(Values, SE = None):
+            type A /, type B/ -> MeasuredArray
+
+    Version 1.0.0.0
+    """
+
+    #special methods
+
+    def __init__(self, Labels: Any) -> None:
+        """
+        Initializer. Factorizes the labels into the groups.
+
+        Signature:
+            seq(int OR float OR str) OR numpy.ndarray -> None
+
+        Args:
+            Labels: seq(int OR float OR str) OR numpy.ndarray; the 1-D labels
+                of the readings, booleans, integers, real numbers or strings
+
+        Raises:
+            UT_TypeError: the labels are not a sequence or array of booleans,
+                integers, real numbers or strings
+            UT_ValueError: the labels are not 1-D, OR any label is NaN
+
+        Version 1.0.0.0
+        """
+        self._Groups = _factorize(Labels)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of groups.
+
+        Signature:
+            None -> int
+
+        Version 1.0.0.0
+        """
+        return int(self._Groups[0].size)
+
+    #public API
+
+    #+ read-only properties
+
+    @property
+    def Keys(self) -> np.ndarray:
+        """
+        Read-only access property to the sorted unique labels, i.e. the keys
+        of the groups.
+
+        Signature:
+            None -> numpy.ndarray
+
+        Version 1.0.0.0
+        """
+        return self._Groups[0]
+
+    @property
+    def Counts(self) -> np.ndarray:
+        """
+        Read-only access property to the number of readings of each group.
+
+        Signature:
+            None -> numpy.ndarray
+
+        Version 1.0.0.0
+        """
+        return self._Groups[2]
+
+    @property
+    def Indexes(self) -> np.ndarray:
+        """
+        Read-only access property to the group index of each label, e.g. to
+        broadcast the group results back to the readings.
+
+        Signature:
+            None -> numpy.ndarray
+
+        Version 1.0.0.0
+        """
+        return self._Groups[1]
+
+    #+ instance methods
+
+    def sum(self, Values: Any, SE: Optional[Any] = None) -> MeasuredArray:
+        """
+        Calculates the sum of the independent readings of each group.
+
+        Signature:
+            type A /, type B/ -> MeasuredArray
+
+        Args:
+            Values: type A; the readings in any form accepted by the class
+                MeasuredArray, or the real number mean values, if the
+                uncertainties are passed separately, with the first axis
+                along the labels
+            SE: (optional) type B; a non-negative real number or a sequence
+                or array of them broadcastable to the shape of the mean
+                values, defaults to None - the uncertainties are taken from
+                the values
+
+        Returns:
+            MeasuredArray: the sums, one row per group
+
+        Raises:
+            UT_TypeError: the values or the uncertainties are not real
+                numbers and / or measurements with uncertainty
+            UT_ValueError: the uncertainties are not broadcastable to the
+                shape of the values, OR the length of the values is not the
+                same as of the labels, OR any value or uncertainty is not
+                finite, OR any uncertainty is negative or its inverse
+                variance overflows
+
+        Version 1.0.0.0
+        """
+        return _sum(self._Groups, *_toReadings(self._Groups, Values, SE))
+
+    def mean(self, Values: Any, SE: Optional[Any] = None) -> MeasuredArray:
+        """
+        Calculates the mean of the independent readings of each group.
+
+        Signature:
+            type A /, type B/ -> MeasuredArray
+
+        Args:
+            Values: type A; the readings in any form accepted by the class
+                MeasuredArray, or the real number mean values, if the
+                uncertainties are passed separately, with the first axis
+                along the labels
+            SE: (optional) type B; a non-negative real number or a sequence
+                or array of them broadcastable to the shape of the mean
+                values, defaults to None - the uncertainties are taken from
+                the values
+
+        Returns:
+            MeasuredArray: the means, one row per group
+
+        Raises:
+            UT_TypeError: the values or the uncertainties are not real
+                numbers and / or measurements with uncertainty
+            UT_ValueError: the uncertainties are not broadcastable to the
+                shape of the values, OR the length of the values is not the
+                same as of the labels, OR any value or uncertainty is not
+                finite, OR any uncertainty is negative or its inverse
+                variance overflows
+
+        Version 1.0.0.0
+        """
+        return _mean(self._Groups, *_toReadings(self._Groups, Values, SE))
+
+    def weightedMean(self, Values: Any,
+                                    SE: Optional[Any] = None) -> MeasuredArray:
+        """
+        Calculates the inverse-variance weighted mean of the readings of each
+        group with the uncertainty 1 / sqrt(sum of weights), or the mean of
+        the exact readings with zero uncertainty, if there are any in the
+        group.
+
+        Signature:
+            type A /, type B/ -> MeasuredArray
+
+        Args:
+            Values: type A; the readings in any form accepted by the class
+                MeasuredArray, or the real number mean values, if the
+                uncertainties are passed separately, with the first axis
+                along the labels
+            SE: (optional) type B; a non-negative real number or a sequence
+                or array of them broadcastable to the shape of the mean
+                values, defaults to None - the uncertainties are taken from
+                the values
+
+        Returns:
+            MeasuredArray: the weighted means, one row per group
+
+        Raises:
+            UT_TypeError: the values or the uncertainties are not real
+                numbers and / or measurements with uncertainty
+            UT_ValueError: the uncertainties are not broadcastable to the
+                shape of the values, OR the length of the values is not the
+                same as of the labels, OR any value or uncertainty is not
+                finite, OR any uncertainty is negative or its inverse
+                variance overflows
+
+        Version 1.0.0.0
+        """
+        return _weightedMean(self._Groups,
+                                    *_toReadings(self._Groups, Values, SE))
@@ -0,0 +1,369 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.calculus
+
+Implements the numerical integration (trapezoidal, cumulative trapezoidal and
+Simpson's rules) and differentiation (second order central differences) of
+the measured series, i.e. 1-D arrays of the measurements with uncertainty,
+sampled at the real or measured coordinates, or with a real or measured
+constant spacing. Each result is a linear combination of the samples, thus
+the uncertainty is calculated from the exact weights of all samples, i.e. the
+correlations between the neighbouring terms sharing the same sample are taken
+into account, as well as the partial derivatives with respect to the
+coordinates. All calculations are vectorized and O(N), the cumulative
+integral uses the cumulative sums of the variance contributions.
+
+Functions:
+    trapz(Y, X = 1.0)
+        type A /, type B/ -> MeasuredValue
+    cumtrapz(Y, X = 1.0, Initial = False)
+        type A /, type B, bool/ -> MeasuredArray
+    simpson(Y, X = 1.0)
+        type A /, type B/ -> MeasuredValue
+    gradient(Y, X = 1.0)
+        type A /, type B/ -> MeasuredArray
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+
+from typing import Any, Tuple
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray, _toArrays
+
+from phyqus_lib.series import _toSeries
+
+#types
+
+#+ coordinates: values, uncertainties and the relative uncertainty of the
+#+ constant spacing (zero for the coordinates array)
+
+TCoordinates = Tuple[np.ndarray, np.ndarray, float]
+
+#functions
+
+#+ 'private' helper functions
+
+def _toCoordinates(X: Any, Size: int, Distinct: bool,
+                                        SkipFrames: int = 2) -> TCoordinates:
+    """
+    Helper function to convert the constant spacing or the coordinates array
+    into the float64 1-D arrays of the coordinates and their uncertainties,
+    and the relative uncertainty of the spacing. The measured spacing is a
+    single measurement shared by all intervals, therefore its uncertainty is
+    not assigned to the coordinates, but returned separately.
+
+    Signature:
+        type A, int, bool /, int/ -> numpy.ndarray, numpy.ndarray, float
+
+    Raises:
+        UT_TypeError: the spacing / coordinates are neither real numbers nor
+            measurements with uncertainty
+        UT_ValueError: the spacing is zero or not finite, OR the coordinates
+            are not 1-D of the same length as the series, OR any coordinate
+            is not finite, OR any interval is zero, if the distinct
+            coordinates are required
+
+    Version 1.0.0.0
+    """
+    Values, Errors = _toArrays(X, SkipFrames = SkipFrames + 1)
+    if not Values.ndim:
+        Spacing, Error = float(Values), float(Errors)
+        if (not np.isfinite(Spacing)) or (not Spacing) or (
+                                                    not np.isfinite(Error)):
+            raise UT_ValueError(X, 'finite non-zero spacing',
+                                                    SkipFrames = SkipFrames)
+        return (Spacing * np.arange(Size, dtype = np.float64),
+                                np.zeros(Size), Error / abs(Spacing))
+    if Values.shape != (Size, ):
+        raise UT_ValueError(X, '1-D coordinates of length {}'.format(Size),
+                                                    SkipFrames = SkipFrames)
+    if not (np.all(np.isfinite(Values)) and np.all(np.isfinite(Errors))):
+        raise UT_ValueError(X, 'finite coordinates', SkipFrames = SkipFrames)
+    if Distinct and not np.all(np.diff(Values)):
+        raise UT_ValueError(X, 'distinct neighbouring coordinates',
+                                                    SkipFrames = SkipFrames)
+    return Values, np.broadcast_to(Errors, Values.shape), 0.0
+
+def _checkInput(Y: Any, X: Any, Minimum: int,
+                    Distinct: bool) -> Tuple[np.ndarray, np.ndarray,
+                                                                TCoordinates]:
+    """
+    Helper function to convert and to check the series and the coordinates.
+
+    Signature:
+        type A, type B, int, bool
+            -> numpy.ndarray, numpy.ndarray,
+                tuple(numpy.ndarray, numpy.ndarray, float)
+
+    Version 1.0.0.0
+    """
+    Values, Errors = _toSeries(Y, Minimum = Minimum, SkipFrames = 3)
+    return Values, Errors, _toCoordinates(X, Values.size, Distinct,
+                                                                SkipFrames = 3)
+
+def _trapezoidWeights(Values: np.ndarray,
+                        H: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Helper function to calculate the weights of the samples in the total
+    trapezoidal integral and the partial derivatives of the integral with
+    respect to the coordinates.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray -> numpy.ndarray, numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Weights = np.zeros(Values.size)
+    Weights[:-1] += 0.5 * H
+    Weights[1:] += 0.5 * H
+    Pairs = 0.5 * (Values[:-1] + Values[1:])
+    Partials = np.zeros(Values.size)
+    Partials[:-1] -= Pairs
+    Partials[1:] += Pairs
+    return Weights, Partials
+
+#+ public API
+
+def trapz(Y: Any, X: Any = 1.0) -> MeasuredValue:
+    """
+    Calculates the integral of a measured series by the trapezoidal rule.
+
+    Signature:
+        type A /, type B/ -> MeasuredValue
+
+    Args:
+        Y: type A; the series as a 1-D sequence or numpy array of real
+            numbers and / or measurements with uncertainty, or an instance of
+            MeasuredArray, at least 2 samples
+        X: (optional) type B; the constant spacing as a real number or a
+            measurement with uncertainty, or the coordinates of the samples
+            as the same types as the series of the same length, defaults to
+            1.0
+
+    Returns:
+        MeasuredValue: the integral
+
+    Raises:
+        UT_TypeError: the series or the coordinates are neither real numbers
+            nor measurements with uncertainty
+        UT_ValueError: the series is not 1-D or has less than 2 samples, OR
+            the spacing is zero or not finite, OR the coordinates are not 1-D
+            of the same length or are not finite
+
+    Version 1.0.0.0
+    """
+    Values, Errors, (XV, XS, Relative) = _checkInput(Y, X, 2, False)
+    Weights, Partials = _trapezoidWeights(Values, np.diff(XV))
+    Result = float(np.dot(Weights, Values))
+    Variance = np.sum((Weights * Errors)**2) + np.sum((Partials * XS)**2)
+    Variance += (Result * Relative)**2
+    return MeasuredValue(Result, float(np.sqrt(Variance)))
+
+def cumtrapz(Y: Any, X: Any = 1.0, Initial: bool = False) -> MeasuredArray:
+    """
+    Calculates the cumulative integral of a measured series by the
+    trapezoidal rule. The uncertainty of each partial integral accounts for
+    the samples shared by the neighbouring trapezoids and is calculated from
+    the cumulative sums of the variance contributions of the inner samples,
+    i.e. in O(N).
+
+    Signature:
+        type A /, type B, bool/ -> MeasuredArray
+
+    Args:
+        Y: type A; the series as a 1-D sequence or numpy array of real
+            numbers and / or measurements with uncertainty, or an instance of
+            MeasuredArray, at least 2 samples
+        X: (optional) type B; the constant spacing as a real number or a
+            measurement with uncertainty, or the coordinates of the samples
+            as the same types as the series of the same length, defaults to
+            1.0
+        Initial: (optional) bool; flag if the zero integral up to the first
+            sample is prepended, defaults to False
+
+    Returns:
+        MeasuredArray: the integrals from the first sample up to each of the
+            following samples, N - 1 elements, or N elements with the initial
+            zero
+
+    Raises:
+        UT_TypeError: the series or the coordinates are neither real numbers
+            nor measurements with uncertainty, OR the initial flag is not
+            boolean
+        UT_ValueError: the series is not 1-D or has less than 2 samples, OR
+            the spacing is zero or not finite, OR the coordinates are not 1-D
+            of the same length or are not finite
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Initial, bool):
+        raise UT_TypeError(Initial, bool, SkipFrames = 1)
+    Values, Errors, (XV, XS, Relative) = _checkInput(Y, X, 2, False)
+    H = np.diff(XV)
+    Pairs = 0.5 * (Values[:-1] + Values[1:])
+    Result = np.cumsum(H * Pairs)
+    #the integral up to the sample k: the first and the last (k-th) samples
+    #+ have the weights of a half interval, the inner ones - of two halves;
+    #+ the same structure for the partial derivatives w.r.t. the coordinates
+    Variance = np.zeros(Result.size)
+    for Weights, Sigma, Inner in ((0.5 * H, Errors, 0.5 * (H[:-1] + H[1:])),
+                                    (Pairs, XS, 0.5 * (Values[:-2]
+                                                            - Values[2:]))):
+        Variance += (Weights[0] * Sigma[0])**2 + (Weights * Sigma[1:])**2
+        Variance[1:] += np.cumsum((Inner * Sigma[1:-1])**2)
+    Variance += (Result * Relative)**2
+    Result = MeasuredArray(Result, np.sqrt(Variance))
+    if Initial:
+        Result = MeasuredArray(np.concatenate(([0.0], Result.Value)),
+                                        np.concatenate(([0.0], Result.SE)))
+    return Result
+
+def simpson(Y: Any, X: Any = 1.0) -> MeasuredValue:
+    """
+    Calculates the integral of a measured series by the composite Simpson's
+    rule (the parabola through each pair of the consecutive intervals, which
+    can be of different widths), which requires an odd number of samples.
+
+    Signature:
+        type A /, type B/ -> MeasuredValue
+
+    Args:
+        Y: type A; the series as a 1-D sequence or numpy array of real
+            numbers and / or measurements with uncertainty, or an instance of
+            MeasuredArray, an odd number (at least 3) of samples
+        X: (optional) type B; the constant spacing as a real number or a
+            measurement with uncertainty, or the coordinates of the samples
+            as the same types as the series of the same length, defaults to
+            1.0
+
+    Returns:
+        MeasuredValue: the integral
+
+    Raises:
+        UT_TypeError: the series or the coordinates are neither real numbers
+            nor measurements with uncertainty
+        UT_ValueError: the series is not 1-D or has not an odd number of at
+            least 3 samples, OR the spacing is zero or not finite, OR the
+            coordinates are not 1-D of the same length, are not finite or any
+            interval is zero
+
+    Version 1.0.0.0
+    """
+    Values, Errors, (XV, XS, Relative) = _checkInput(Y, X, 3, True)
+    if not (Values.size % 2):
+        raise UT_ValueError(Y, 'odd number of samples', SkipFrames = 1)
+    H = np.diff(XV)
+    H0 = H[0::2]
+    H1 = H[1::2]
+    S = H0 + H1
+    #weights of the 3 samples of each pair of intervals and their partial
+    #+ derivatives w.r.t. the widths of the intervals
+    A = (2.0 * H0 + H1 - H1 * H1 / H0) / 6
+    B = S**3 / (6.0 * H0 * H1)
+    C = (2.0 * H1 + H0 - H0 * H0 / H1) / 6
+    Y0, Y1, Y2 = Values[:-2:2], Values[1::2], Values[2::2]
+    D0 = ((2.0 + (H1 / H0)**2) * Y0 + S * S * (2.0 * H0 - H1) / (H0 * H1) * Y1
+                                / H0 + (1.0 - 2.0 * H0 / H1) * Y2) / 6
+    D1 = ((1.0 - 2.0 * H1 / H0) * Y0 + S * S * (2.0 * H1 - H0) / (H0 * H1) * Y1
+                                / H1 + (2.0 + (H0 / H1)**2) * Y2) / 6
+    Weights = np.zeros(Values.size)
+    Weights[:-2:2] += A
+    Weights[1::2] += B
+    Weights[2::2] += C
+    Partials = np.zeros(Values.size)
+    Partials[:-2:2] -= D0
+    Partials[1::2] += D0 - D1
+    Partials[2::2] += D1
+    Result = float(np.dot(Weights, Values))
+    Variance = np.sum((Weights * Errors)**2) + np.sum((Partials * XS)**2)
+    Variance += (Result * Relative)**2
+    return MeasuredValue(Result, float(np.sqrt(Variance)))
+
+def gradient(Y: Any, X: Any = 1.0) -> MeasuredArray:
+    """
+    Calculates the derivative of a measured series by the second order
+    accurate central differences at the inner samples and the first order
+    one-sided differences at the end samples, as the function numpy.gradient()
+    with the default edge order.
+
+    Signature:
+        type A /, type B/ -> MeasuredArray
+
+    Args:
+        Y: type A; the series as a 1-D sequence or numpy array of real
+            numbers and / or measurements with uncertainty, or an instance of
+            MeasuredArray, at least 2 samples
+        X: (optional) type B; the constant spacing as a real number or a
+            measurement with uncertainty, or the coordinates of the samples
+            as the same types as the series of the same length, defaults to
+            1.0
+
+    Returns:
+        MeasuredArray: the derivative at each sample
+
+    Raises:
+        UT_TypeError: the series or the coordinates are neither real numbers
+            nor measurements with uncertainty
+        UT_ValueError: the series is not 1-D or has less than 2 samples, OR
+            the spacing is zero or not finite, OR the coordinates are not 1-D
+            of the same length, are not finite or any interval is zero
+
+    Version 1.0.0.0
+    """
+    Values, Errors, (XV, XS, Relative) = _checkInput(Y, X, 2, True)
+    H = np.diff(XV)
+    Result = np.empty(Values.size)
+    Variance = np.empty(Values.size)
+    Edges = np.diff(Values) / H
+    Result[0], Result[-1] = Edges[0], Edges[-1]
+    for Index, Left, Right, Width in ((0, 0, 1, H[0]), (-1, -2, -1, H[-1])):
+        Slope = Result[Index]
+        Variance[Index] = ((Errors[Left]**2 + Errors[Right]**2) / Width**2
+                            + (Slope / Width)**2 * (XS[Left]**2
+                                                        + XS[Right]**2))
+    if Values.size > 2:
+        P, Q = H[:-1], H[1:]
+        S = P + Q
+        YM, Y0, YP = Values[:-2], Values[1:-1], Values[2:]
+        A = - Q / (P * S)
+        B = (Q - P) / (P * Q)
+        C = P / (Q * S)
+        Result[1:-1] = A * YM + B * Y0 + C * YP
+        #partial derivatives w.r.t. the left (P) and right (Q) intervals
+        DP = (Q * (2.0 * P + Q) / (P * S)**2 * YM - Y0 / (P * P)
+                                                            + YP / (S * S))
+        DQ = (- YM / (S * S) + Y0 / (Q * Q)
+                                - P * (2.0 * Q + P) / (Q * S)**2 * YP)
+        Variance[1:-1] = ((A * Errors[:-2])**2 + (B * Errors[1:-1])**2
+                    + (C * Errors[2:])**2 + (DP * XS[:-2])**2
+                    + ((DP - DQ) * XS[1:-1])**2 + (DQ * XS[2:])**2)
+    Variance += (Result * Relative)**2
+    return MeasuredArray(Result, np.sqrt(Variance))
@@ -0,0 +1,449 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.expressions
+
+Implements the cache-blocked evaluation of the arithmetic expressions over the
+arrays of measurements with uncertainty. The expression is parsed once into a
+tree of the elementary operations, which is evaluated chunk by chunk, so the
+mean values and the uncertainties of each chunk are computed together within
+the CPU cache, and only the final result is written into the full size output
+arrays. The same standard error propagation rules are applied as by the
+MeasuredValue and MeasuredArray classes, including the special case of the
+same object operands.
+
+Functions:
+    evaluate(Expression, Variables = None, ChunkSize = None)
+        str /, dict(str -> type A), int > 0/ -> MeasuredArray
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import ast
+
+from typing import Optional, Any, Dict, Tuple, Callable, List
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.measured_arrays import MeasuredArray, DOMAIN_OK
+from phyqus_lib.measured_arrays import DOMAIN_ZERO_DIVIDER
+from phyqus_lib.measured_arrays import _toArrays, _isMeasured, _isInteger
+from phyqus_lib.measured_arrays import _powCodes, _raiseDomainError
+from phyqus_lib.measured_arrays import _add, _sub, _mul, _div, _pow, _powReal
+from phyqus_lib.measured_arrays import _addSame, _subSame, _mulSame, _divSame
+from phyqus_lib.measured_arrays import _powSame
+
+#types
+
+TChunk = Tuple[np.ndarray, np.ndarray]
+
+#globals
+
+#+ working set budget of a single chunk in bytes, typical L2 cache size
+
+L2_CACHE_SIZE = 262144
+
+#+ the lowest number of elements per chunk, limits the interpreter overhead
+
+MIN_CHUNK_SIZE = 1024
+
+#+ number of the chunk-sized float64 temporaries created by a kernel call
+
+_KERNEL_TEMPORARIES = 4
+
+#+ supported operations: AST node type -> (kernel, same object kernel)
+
+_BINARY_OPS = {
+    ast.Add : (_add, _addSame),
+    ast.Sub : (_sub, _subSame),
+    ast.Mult : (_mul, _mulSame),
+    ast.Div : (_div, _divSame),
+    ast.Pow : (_pow, _powSame)
+}
+
+_UNARY_OPS = (ast.UAdd, ast.USub)
+
+#classes
+
+#+ 'private' helper classes
+
+class _Node:
+    """
+    Helper 'private' class representing a node of the parsed expression tree
+    with the properties of the bound operands.
+
+    Attributes:
+        Op: type A; the AST operator type of a binary or unary operation, None
+            for the leaves and the constants
+        Left: _Node OR None; the left (or the only) operand
+        Right: _Node OR None; the right operand
+        Slot: int OR None; the index of the bound operand for a leaf
+        Value: float OR None; the value of a numeric constant
+        IsMeasured: bool; the (sub-) expression depends on a measurement
+        IsInteger: bool; the (sub-) expression is a plain integer number
+        Need: int > 0; number of the simultaneously live chunk-sized
+            intermediate results required to evaluate the (sub-) expression
+
+    Version 1.0.0.0
+    """
+
+    __slots__ = ('Op', 'Left', 'Right', 'Slot', 'Value', 'IsMeasured',
+                                                        'IsInteger', 'Need')
+
+    def __init__(self, Op: Any = None, Left: Optional['_Node'] = None,
+                    Right: Optional['_Node'] = None) -> None:
+        """
+        Initialization of an operation node or a blank leaf.
+
+        Signature:
+            /type A, _Node OR None, _Node OR None/ -> None
+
+        Version 1.0.0.0
+        """
+        self.Op = Op
+        self.Left = Left
+        self.Right = Right
+        self.Slot = None
+        self.Value = None
+        self.IsMeasured = False
+        self.IsInteger = False
+        self.Need = 1
+        if Right is not None:
+            self.IsMeasured = Left.IsMeasured or Right.IsMeasured
+            self.IsInteger = (Left.IsInteger and Right.IsInteger
+                            and isinstance(Op, (ast.Add, ast.Sub, ast.Mult)))
+            if Left.Need == Right.Need:
+                self.Need = Left.Need + 1
+            else:
+                self.Need = max(Left.Need, Right.Need)
+        elif Left is not None:
+            self.IsMeasured = Left.IsMeasured
+            self.IsInteger = Left.IsInteger
+            self.Need = Left.Need
+
+#functions
+
+#+ 'private' helper functions
+
+def _parse(Expression: str, Variables: Dict[str, Any],
+                                Operands: List[Any]) -> _Node:
+    """
+    Helper function to parse the expression and to bind the variables. The
+    distinct objects referred by the variable names are appended to the list
+    of the operands, and the same object is always represented by the same
+    leaf node, even if referred by different names.
+
+    Signature:
+        str, dict(str -> type A), list(type A) -> _Node
+
+    Raises:
+        UT_ValueError: the expression is not a valid arithmetic expression, OR
+            it refers an undefined variable
+
+    Version 1.0.0.0
+    """
+    try:
+        Tree = ast.parse(Expression.strip(), mode = 'eval')
+    except SyntaxError as err:
+        Error = UT_ValueError(Expression, 'valid expression', SkipFrames = 1)
+        Error.setMessage('Syntax error in expression {} - {}'.format(
+                                                    repr(Expression), err.msg))
+        raise Error from None
+    Leaves = dict()
+
+    def _convert(Item: ast.AST) -> _Node:
+        if isinstance(Item, ast.BinOp) and type(Item.op) in _BINARY_OPS:
+            return _Node(Item.op, _convert(Item.left), _convert(Item.right))
+        if isinstance(Item, ast.UnaryOp) and isinstance(Item.op, _UNARY_OPS):
+            return _Node(Item.op, _convert(Item.operand))
+        if isinstance(Item, ast.Name):
+            if not (Item.id in Variables):
+                Error = UT_ValueError(Item.id, 'defined variable',
+                                                                SkipFrames = 2)
+                Error.setMessage('Undefined variable {} in {}'.format(
+                                                Item.id, repr(Expression)))
+                raise Error
+            Data = Variables[Item.id]
+            if not (id(Data) in Leaves):
+                Result = _Node()
+                Result.Slot = len(Operands)
+                Result.IsMeasured = _isMeasured(Data)
+                Result.IsInteger = _isInteger(Data)
+                Leaves[id(Data)] = Result
+                Operands.append(Data)
+            return Leaves[id(Data)]
+        if sys.version_info < (3, 8):
+            IsConstant = isinstance(Item, ast.Num)
+            Value = getattr(Item, 'n', None)
+        else:
+            IsConstant = isinstance(Item, ast.Constant)
+            Value = getattr(Item, 'value', None)
+        if (IsConstant and isinstance(Value, (int, float))
+                                            and not isinstance(Value, bool)):
+            Result = _Node()
+            Result.Value = Value
+            Result.IsInteger = isinstance(Value, int)
+            return Result
+        Error = UT_ValueError(Expression, 'arithmetic expression',
+                                                                SkipFrames = 2)
+        Element = getattr(Item, 'op', Item)
+        Error.setMessage('Unsupported element {} in {}'.format(
+                                    type(Element).__name__, repr(Expression)))
+        raise Error
+
+    return _convert(Tree.body)
+
+def _broadcastShape(Shapes: List[Tuple[int, ...]]) -> Tuple[int, ...]:
+    """
+    Helper function to calculate the broadcast shape of the operands without
+    allocation of any data.
+
+    Signature:
+        list(tuple(int)) -> tuple(int)
+
+    Raises:
+        UT_ValueError: the shapes are not compatible
+
+    Version 1.0.0.0
+    """
+    Result = ()
+    for Shape in Shapes:
+        try:
+            Result = np.broadcast(np.broadcast_to(0.0, Result),
+                                            np.broadcast_to(0.0, Shape)).shape
+        except ValueError:
+            raise UT_ValueError(Shapes, 'broadcastable shapes',
+                                                    SkipFrames = 2) from None
+    return Result
+
+def _makeSlicer(Data: np.ndarray,
+                    Shape: Tuple[int, ...]) -> Callable[[int, int], np.ndarray]:
+    """
+    Helper function to create a slicer of the contiguous ranges of the
+    flattened (C-order) array broadcast to the shape of the result. A single
+    element array is returned as a 0-dimensional array instead of a slice.
+
+    Signature:
+        numpy.ndarray, tuple(int) -> function(int, int -> numpy.ndarray)
+
+    Version 1.0.0.0
+    """
+    if Data.size == 1:
+        Scalar = Data.reshape(())
+        return lambda Start, Stop: Scalar
+    if Data.shape == Shape:
+        Flat = np.ascontiguousarray(Data).reshape(-1)
+        return lambda Start, Stop: Flat[Start : Stop]
+    Broadcast = np.broadcast_to(Data, Shape)
+    return lambda Start, Stop: Broadcast.flat[Start : Stop]
+
+def _makeLoader(Data: Any,
+                Shape: Tuple[int, ...]) -> Callable[[int, int], TChunk]:
+    """
+    Helper function to create a loader of the contiguous ranges of the
+    flattened (C-order) operand broadcast to the shape of the result. An
+    instance of MeasuredArray of the full shape is decoded chunk by chunk, the
+    real number(s) get zero uncertainty scalar, any other operand is converted
+    into float64 arrays once.
+
+    Signature:
+        type A, tuple(int) -> function(int, int -> numpy.ndarray, numpy.ndarray)
+
+    Raises:
+        UT_TypeError: the operand is neither real number(s) nor measurement(s)
+            with uncertainty
+
+    Version 1.0.0.0
+    """
+    if isinstance(Data, MeasuredArray) and Data.shape == Shape:
+        return Data._decodeFlat
+    if isinstance(Data, np.ndarray) and Data.dtype.kind in 'iuf':
+        Values = np.asarray(Data, dtype = np.float64)
+        Errors = np.zeros(())
+    else:
+        Values, Errors = _toArrays(Data, SkipFrames = 3)
+        if not _isMeasured(Data):
+            Errors = np.zeros(())
+    GetValues = _makeSlicer(Values, Shape)
+    GetErrors = _makeSlicer(Errors, Shape)
+    return lambda Start, Stop: (GetValues(Start, Stop), GetErrors(Start, Stop))
+
+def _evaluateNode(Node: _Node, Loaders: List[Callable[[int, int], TChunk]],
+                    Start: int, Stop: int, Codes: np.ndarray) -> TChunk:
+    """
+    Helper function to evaluate (sub-) expression on a single chunk. The
+    operand requiring more intermediate results is evaluated first, thus the
+    number of the simultaneously live intermediate results does not exceed the
+    Need attribute of the node. The domain error codes are stored into the
+    passed chunk-sized array, the first error of an element is kept.
+
+    Signature:
+        _Node, list(function), int >= 0, int > 0, numpy.ndarray(uint8)
+            -> numpy.ndarray, numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    if Node.Slot is not None:
+        return Loaders[Node.Slot](Start, Stop)
+    if Node.Value is not None:
+        return np.float64(Node.Value), np.float64(0.0)
+    if Node.Right is None:
+        Value, Error = _evaluateNode(Node.Left, Loaders, Start, Stop, Codes)
+        if isinstance(Node.Op, ast.USub):
+            Value = -Value
+        return Value, Error
+    Kernel, SameKernel = _BINARY_OPS[type(Node.Op)]
+    IsSame = (Node.Left is Node.Right and Node.Left.Slot is not None
+                                                    and Node.Left.IsMeasured)
+    if IsSame:
+        V1, S1 = _evaluateNode(Node.Left, Loaders, Start, Stop, Codes)
+        V2 = V1
+    elif Node.Right.Need > Node.Left.Need:
+        V2, S2 = _evaluateNode(Node.Right, Loaders, Start, Stop, Codes)
+        V1, S1 = _evaluateNode(Node.Left, Loaders, Start, Stop, Codes)
+    else:
+        V1, S1 = _evaluateNode(Node.Left, Loaders, Start, Stop, Codes)
+        V2, S2 = _evaluateNode(Node.Right, Loaders, Start, Stop, Codes)
+    NewCodes = None
+    if isinstance(Node.Op, ast.Div) and not IsSame:
+        NewCodes = np.where(V2 == 0, DOMAIN_ZERO_DIVIDER, DOMAIN_OK)
+    elif isinstance(Node.Op, ast.Pow):
+        NewCodes = _powCodes(V1, V2, IsSame or Node.Right.IsMeasured,
+                                                        Node.Right.IsInteger)
+    if NewCodes is not None and np.any(NewCodes):
+        NewCodes = np.broadcast_to(NewCodes, Codes.shape)
+        Free = Codes == DOMAIN_OK
+        Codes[Free] = NewCodes[Free]
+    with np.errstate(all = 'ignore'):
+        if IsSame:
+            Result = SameKernel(V1, S1)
+        elif isinstance(Node.Op, ast.Pow) and not Node.Right.IsMeasured:
+            Result = _powReal(V1, S1, V2)
+        else:
+            Result = Kernel(V1, S1, V2, S2)
+    return Result
+
+#+ public API
+
+def evaluate(Expression: str, Variables: Optional[Dict[str, Any]] = None,
+                        ChunkSize: Optional[int] = None) -> MeasuredArray:
+    """
+    Evaluates an arithmetic expression over the arrays of measurements with
+    uncertainty chunk by chunk. The chunk size is selected such that all
+    intermediate results of a chunk fit into L2_CACHE_SIZE bytes, thus the
+    peak memory usage besides the result does not depend on the expression
+    depth and the array size.
+
+    The expression may contain the variable names, the int and float numeric
+    constants, the binary operators +, -, *, / and **, the unary + and -, and
+    the parentheses. The operands are broadcast to the common shape following
+    the NumPy rules. The domain of all elements is checked at once, and a
+    single exception listing the offending elements is raised.
+
+    Signature:
+        str /, dict(str -> type A), int > 0/ -> MeasuredArray
+
+    Args:
+        Expression: str; the arithmetic expression
+        Variables: (optional) dict(str -> type A); mapping of the variable
+            names to the operands - real number(s) or measurement(s) with
+            uncertainty in any form accepted by MeasuredArray; if not provided
+            the global and local variables of the caller are used
+        ChunkSize: (optional) int > 0; number of the elements per chunk,
+            selected automatically if not provided
+
+    Returns:
+        MeasuredArray: the result with the 'float64' storage
+
+    Raises:
+        UT_TypeError: the expression is not a string, OR the variables are
+            not a dictionary, OR the chunk size is not an integer, OR any
+            operand is neither real number(s) nor measurement(s) with
+            uncertainty
+        UT_ValueError: the expression is not a supported arithmetic expression
+            or refers an undefined variable, OR the operands shapes are not
+            compatible, OR the chunk size is not positive, OR any element
+            violates the domain of division or exponentiation
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Expression, str):
+        raise UT_TypeError(Expression, str, SkipFrames = 1)
+    if Variables is None:
+        Frame = sys._getframe(1)
+        Variables = dict(Frame.f_globals)
+        Variables.update(Frame.f_locals)
+        del Frame
+    elif not isinstance(Variables, dict):
+        raise UT_TypeError(Variables, dict, SkipFrames = 1)
+    if ChunkSize is not None:
+        if not isinstance(ChunkSize, int) or isinstance(ChunkSize, bool):
+            raise UT_TypeError(ChunkSize, int, SkipFrames = 1)
+        if ChunkSize <= 0:
+            raise UT_ValueError(ChunkSize, '> 0', SkipFrames = 1)
+    Operands = list()
+    try:
+        Tree = _parse(Expression, Variables, Operands)
+        Shapes = list()
+        for Data in Operands:
+            if isinstance(Data, MeasuredArray):
+                Shapes.append(Data.shape)
+            elif isinstance(Data, np.ndarray) and Data.dtype.kind in 'iuf':
+                Shapes.append(Data.shape)
+            else:
+                Shapes.append(_toArrays(Data, SkipFrames = 2)[0].shape)
+        Shape = _broadcastShape(Shapes)
+        Loaders = [_makeLoader(Data, Shape) for Data in Operands]
+    except UT_ValueError as err:
+        Error = UT_ValueError(Expression, 'whatever', SkipFrames = 1)
+        Error.setMessage(err.getMessage())
+        raise Error from None
+    except UT_TypeError as err1:
+        Error = UT_TypeError(Expression, str, SkipFrames = 1)
+        Error.setMessage(err1.getMessage())
+        raise Error from None
+    if ChunkSize is None:
+        ChunkSize = max(MIN_CHUNK_SIZE, L2_CACHE_SIZE // (
+                                16 * (Tree.Need + _KERNEL_TEMPORARIES)))
+    Size = int(np.prod(Shape))
+    Values = np.empty(Size, dtype = np.float64)
+    Errors = np.empty(Size, dtype = np.float64)
+    Codes = None
+    Buffer = np.zeros(min(ChunkSize, Size), dtype = np.uint8)
+    for Start in range(0, Size, ChunkSize):
+        Stop = min(Start + ChunkSize, Size)
+        ChunkCodes = Buffer[: Stop - Start]
+        Value, Error = _evaluateNode(Tree, Loaders, Start, Stop, ChunkCodes)
+        Values[Start : Stop] = Value
+        Errors[Start : Stop] = Error
+        if np.any(ChunkCodes):
+            if Codes is None:
+                Codes = np.zeros(Size, dtype = np.uint8)
+            Codes[Start : Stop] = ChunkCodes
+            ChunkCodes[:] = DOMAIN_OK
+    if Codes is not None:
+        _raiseDomainError(Codes.reshape(Shape))
+    return MeasuredArray._fromStorage(Values.reshape(Shape),
+                                        Errors.reshape(Shape), 'float64', 0.0)
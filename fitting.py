@@ -0,0 +1,701 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.fitting
+
+Implements the batched fitting of the models to the measured data points,
+for many independent data sets (e.g. one per channel) at once: the
+iterations run in lockstep over all not yet converged fits with the
+vectorized operations, instead of a Python level loop over the fits.
+
+The straight line y = a + b * x is fitted by the weighted least squares
+(the uncertainties of y only), or by the errors-in-variables regression of
+York et al. (the uncertainties of both x and y), which reduces to the former
+for the exact x values; the data points without any uncertainty are fitted
+by the ordinary least squares with the uncertainties of the parameters
+estimated from the scatter of the residuals.
+
+Any other model y = f(x, p1, p2, ...), vectorized over x and the parameters,
+is fitted by the weighted (or ordinary) least squares using the
+Levenberg-Marquardt algorithm with the analytic or the numerical (central
+differences) Jacobian.
+
+Functions:
+    fitLine(X, Y, *, Scale = False, Tolerance = DEFAULT_TOLERANCE,
+                                MaxIterations = MAX_ITERATIONS, Raise = False)
+        type A, type A, *, /bool, float, int, bool/
+            -> MeasuredValue, MeasuredValue, numpy.ndarray
+                OR MeasuredArray, MeasuredArray, numpy.ndarray
+    fitModel(Model, X, Y, Initial, *, Jacobian = None, Scale = False,
+                Tolerance = DEFAULT_TOLERANCE, MaxIterations = MAX_ITERATIONS,
+                                                                Raise = False)
+        callable, type A, type B, type A, *, /callable OR None, bool, float,
+            int, bool/ -> tuple(MeasuredValue, ...), numpy.ndarray
+                OR MeasuredArray, numpy.ndarray
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+
+from collections.abc import Callable
+
+from typing import Union, Optional, Any, Tuple
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray, DOMAIN_REPORT_LIMIT
+from phyqus_lib.measured_arrays import _toArrays, _isMeasured
+
+from phyqus_lib.accumulators import _countInvalid, _raiseInvalid
+
+#types
+
+TResult = Union[MeasuredValue, MeasuredArray]
+
+#globals
+
+DEFAULT_TOLERANCE = 1.0E-12 #default relative tolerance of the parameters
+
+MAX_ITERATIONS = 100 #default max number of the iterations
+
+DIFFERENCE_STEP = 2.0 ** -17 #relative step of the central differences
+
+INITIAL_DAMPING = 1.0E-3 #initial Levenberg-Marquardt damping parameter
+
+DAMPING_FACTOR = 10.0 #damping increase / decrease factor
+
+#+ fitting error codes
+
+FIT_OK = 0
+
+FIT_DEGENERATE = 1
+
+FIT_NOT_FINITE = 2
+
+FIT_NO_CONVERGENCE = 3
+
+FIT_ERRORS = {
+    FIT_DEGENERATE : 'data points do not define the parameters',
+    FIT_NOT_FINITE : 'fitted parameters are not finite',
+    FIT_NO_CONVERGENCE : 'max number of iterations is exceeded'
+}
+
+#functions
+
+#+ 'private' helper functions
+
+def _checkOptions(Scale: Any, Tolerance: Any, MaxIterations: Any,
+                                    Raise: Any, SkipFrames: int = 2) -> None:
+    """
+    Helper function to check the common keyword arguments of the fitting
+    functions.
+
+    Signature:
+        type A, type A, type A, type A /, int/ -> None
+
+    Raises:
+        UT_TypeError: any flag is not boolean, OR the tolerance is not a
+            floating point number, OR the max number of iterations is not an
+            integer
+        UT_ValueError: the tolerance is not in (0, 1), OR the max number of
+            iterations is less than 1
+
+    Version 1.0.0.0
+    """
+    for Flag in (Scale, Raise):
+        if not isinstance(Flag, bool):
+            raise UT_TypeError(Flag, bool, SkipFrames = SkipFrames)
+    if not isinstance(Tolerance, (float, np.floating)):
+        raise UT_TypeError(Tolerance, float, SkipFrames = SkipFrames)
+    if not (0 < Tolerance < 1):
+        raise UT_ValueError(Tolerance, 'in (0, 1)', SkipFrames = SkipFrames)
+    if ((not isinstance(MaxIterations, (int, np.integer)))
+                                or isinstance(MaxIterations, (bool, np.bool_))):
+        raise UT_TypeError(MaxIterations, int, SkipFrames = SkipFrames)
+    if MaxIterations < 1:
+        raise UT_ValueError(MaxIterations, '>= 1', SkipFrames = SkipFrames)
+
+def _raiseFitError(Codes: np.ndarray) -> None:
+    """
+    Helper function to raise a single UT_ValueError exception listing the
+    indices (up to DOMAIN_REPORT_LIMIT) and the reasons of all failed fits.
+
+    Signature:
+        numpy.ndarray -> None
+
+    Raises:
+        UT_ValueError: always
+
+    Version 1.0.0.0
+    """
+    Indices = np.argwhere(Codes)
+    Items = ['{} - {}'.format(tuple(Index.tolist()),
+                                    FIT_ERRORS[int(Codes[tuple(Index)])])
+                                for Index in Indices[:DOMAIN_REPORT_LIMIT]]
+    if len(Indices) > DOMAIN_REPORT_LIMIT:
+        Items.append('and {} more'.format(len(Indices) - DOMAIN_REPORT_LIMIT))
+    Error = UT_ValueError(len(Indices), '== 0 failed fits', SkipFrames = 2)
+    Error.setMessage('Fitting failed in {} of {} data set(s): {}'.format(
+                                len(Indices), Codes.size, '; '.join(Items)))
+    raise Error
+
+def _checkWeights(YE: np.ndarray, IsExactX: np.ndarray) -> np.ndarray:
+    """
+    Helper function to find the unweighted fits, i.e. without any
+    uncertainty of the data points, and to check that all y uncertainties of
+    the weighted fits are positive.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray -> numpy.ndarray
+
+    Raises:
+        UT_ValueError: any y uncertainty of a weighted fit is zero
+
+    Version 1.0.0.0
+    """
+    IsExact = IsExactX & ~np.any(YE, axis = 1)
+    Invalid = int(np.count_nonzero((YE == 0) & ~IsExact[:, np.newaxis]))
+    if Invalid:
+        Error = UT_ValueError(Invalid, '== 0 zero y SE of weighted fits',
+                                                                SkipFrames = 2)
+        Error.setMessage('Zero y SE in weighted fits: {} of {}'.format(
+                                                            Invalid, YE.size))
+        raise Error
+    return IsExact
+
+def _scaleFactor(ChiSquared: np.ndarray, IsExact: np.ndarray, Freedom: int,
+                                            Scale: bool) -> np.ndarray:
+    """
+    Helper function to calculate the scaling factors of the covariance: the
+    residual variance of the unweighted fits (NaN without the degrees of
+    freedom), and the reduced chi-squared of the weighted fits, if it is
+    greater than 1 and the scaling is requested.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray, int, bool -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    if Freedom < 1:
+        return np.where(IsExact, np.nan, 1.0)
+    Reduced = ChiSquared / Freedom
+    if Scale:
+        return np.where(IsExact, Reduced, np.fmax(1.0, Reduced))
+    return np.where(IsExact, Reduced, 1.0)
+
+def _lineStatistics(X: np.ndarray, Y: np.ndarray, VX: np.ndarray,
+                    VY: np.ndarray, Slope: np.ndarray) -> Tuple[np.ndarray,
+                                                    np.ndarray, np.ndarray]:
+    """
+    Helper function to calculate the York weights of the data points for the
+    given slopes (one per row), and the next slopes.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray,
+            numpy.ndarray -> numpy.ndarray, numpy.ndarray, numpy.ndarray
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): the weights, the
+            (weighted mean x centred) adjustments of x, and the next slopes
+
+    Version 1.0.0.0
+    """
+    B = Slope[:, np.newaxis]
+    W = 1.0 / (VY + B * B * VX)
+    Weight = W.sum(axis = 1)
+    U = X - (W * X).sum(axis = 1, keepdims = True) / Weight[:, np.newaxis]
+    V = Y - (W * Y).sum(axis = 1, keepdims = True) / Weight[:, np.newaxis]
+    Beta = W * (U * VY + B * V * VX)
+    return W, Beta, (W * Beta * V).sum(axis = 1) / (W * Beta * U).sum(axis = 1)
+
+def _checkResult(Result: Any, Shape: Tuple[int, ...],
+                                        SkipFrames: int = 3) -> np.ndarray:
+    """
+    Helper function to check the values returned by the model or its
+    analytic Jacobian and to convert them into a float64 array of the given
+    shape.
+
+    Signature:
+        type A, tuple(int, ...) /, int/ -> numpy.ndarray
+
+    Raises:
+        UT_TypeError: the result is not real numbers
+        UT_ValueError: the result is not broadcastable to the shape
+
+    Version 1.0.0.0
+    """
+    Values = np.asarray(Result)
+    if Values.dtype.kind not in 'iuf':
+        raise UT_TypeError(Result, (int, float), SkipFrames = SkipFrames)
+    try:
+        Values = np.broadcast_to(Values, Shape)
+    except ValueError:
+        raise UT_ValueError(Values.shape, 'broadcastable to {}'.format(Shape),
+                                        SkipFrames = SkipFrames) from None
+    return Values.astype(np.float64)
+
+def _callModel(Model: Callable, X: np.ndarray,
+                                        Parameters: np.ndarray) -> np.ndarray:
+    """
+    Helper function to evaluate the model for the rows of the data points
+    (x values) and of the parameters; each parameter is passed as a column.
+
+    Signature:
+        callable, numpy.ndarray, numpy.ndarray -> numpy.ndarray
+
+    Raises:
+        UT_TypeError: the model does not return real numbers
+        UT_ValueError: the model does not return the value of each data point
+
+    Version 1.0.0.0
+    """
+    Columns = [Parameters[:, Index : Index + 1]
+                                    for Index in range(Parameters.shape[1])]
+    return _checkResult(Model(X, *Columns), X.shape)
+
+def _callJacobian(Model: Callable, Jacobian: Optional[Callable],
+                    X: np.ndarray, Parameters: np.ndarray) -> np.ndarray:
+    """
+    Helper function to evaluate the Jacobian of the model - the partial
+    derivatives of the model values w.r.t. the parameters - for the rows of
+    the data points and of the parameters, by the analytic Jacobian, or by
+    the central differences in a single stacked model call.
+
+    Signature:
+        callable, callable OR None, numpy.ndarray, numpy.ndarray
+            -> numpy.ndarray
+
+    Returns:
+        numpy.ndarray: the partial derivatives, shape (rows, points,
+            parameters)
+
+    Raises:
+        UT_TypeError: the model or the Jacobian does not return real numbers,
+            OR the Jacobian does not return a sequence
+        UT_ValueError: the model does not return the value of each data
+            point, OR the Jacobian does not return the partial derivatives
+            w.r.t. each parameter at each data point
+
+    Version 1.0.0.0
+    """
+    Rows, Count = Parameters.shape
+    if Jacobian is not None:
+        Columns = [Parameters[:, Index : Index + 1] for Index in range(Count)]
+        Result = Jacobian(X, *Columns)
+        if isinstance(Result, np.ndarray) and Result.ndim:
+            Result = list(Result)
+        if not isinstance(Result, (list, tuple)):
+            raise UT_TypeError(Result, (list, tuple, np.ndarray),
+                                                                SkipFrames = 2)
+        if len(Result) != Count:
+            raise UT_ValueError(len(Result),
+                        '{} partial derivatives'.format(Count), SkipFrames = 2)
+        return np.stack([_checkResult(Item, X.shape) for Item in Result],
+                                                                    axis = -1)
+    Steps = DIFFERENCE_STEP * np.where(Parameters != 0, np.abs(Parameters),
+                                                                        1.0)
+    Shifted = np.tile(Parameters, (2 * Count, 1)).reshape(Count, 2, Rows,
+                                                                        Count)
+    for Index in range(Count):
+        Shifted[Index, 0, :, Index] += Steps[:, Index]
+        Shifted[Index, 1, :, Index] -= Steps[:, Index]
+    #actual steps: the representable differences of the parameters
+    Deltas = Shifted[:, 0] - Shifted[:, 1]
+    Values = _callModel(Model, np.tile(X, (2 * Count, 1)),
+            Shifted.reshape(-1, Count)).reshape(Count, 2, Rows, X.shape[1])
+    Derivatives = (Values[:, 0] - Values[:, 1]) / np.diagonal(Deltas,
+                                    axis1 = 0, axis2 = 2).T[..., np.newaxis]
+    return np.moveaxis(Derivatives, 0, -1)
+
+def _solve(Matrix: np.ndarray, Vector: np.ndarray) -> np.ndarray:
+    """
+    Helper function to solve a stack of the linear systems at once; the
+    solutions of the singular systems are NaN.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    try:
+        return np.linalg.solve(Matrix, Vector[..., np.newaxis])[..., 0]
+    except np.linalg.LinAlgError:
+        Result = np.full(Vector.shape, np.nan)
+        for Index in range(Vector.shape[0]):
+            try:
+                Result[Index] = np.linalg.solve(Matrix[Index], Vector[Index])
+            except np.linalg.LinAlgError:
+                pass
+        return Result
+
+def _invert(Matrix: np.ndarray) -> np.ndarray:
+    """
+    Helper function to invert a stack of the symmetric positive
+    semi-definite matrices at once; the inverses of the (numerically)
+    singular matrices are NaN.
+
+    Signature:
+        numpy.ndarray -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Result = np.full(Matrix.shape, np.nan)
+    if not Matrix.shape[0]:
+        return Result
+    Singular = np.linalg.svd(Matrix, compute_uv = False)
+    Regular = Singular[:, -1] > (Singular[:, 0] * Matrix.shape[-1]
+                                                * np.finfo(np.float64).eps)
+    if np.any(Regular):
+        Result[Regular] = np.linalg.inv(Matrix[Regular])
+    return Result
+
+#+ public API
+
+def fitLine(X: Any, Y: Any, *, Scale: bool = False,
+                Tolerance: float = DEFAULT_TOLERANCE,
+                MaxIterations: int = MAX_ITERATIONS,
+                Raise: bool = False) -> Tuple[TResult, TResult, np.ndarray]:
+    """
+    Fits the straight lines y = a + b * x to the measured data points: by the
+    weighted least squares, if x values are exact, by the errors-in-variables
+    regression of York et al., if x values have uncertainties, or by the
+    ordinary least squares with the uncertainties of the parameters estimated
+    from the residuals, if none of the data points of a line has any
+    uncertainty. The uncertainties of x and y of a data point are assumed to
+    be independent. The data points are along the last axis of the broadcast
+    x and y arrays, the other axes define the batch of the independent fits.
+    The failed fits are filled with NaN, or, with Raise = True, a single
+    exception listing all of them is raised.
+
+    Signature:
+        type A, type A, *, /bool, float, int, bool/
+            -> MeasuredValue, MeasuredValue, numpy.ndarray
+                OR MeasuredArray, MeasuredArray, numpy.ndarray
+
+    Args:
+        X: type A; the x values of the data points as real numbers or
+            measurements with uncertainty in any form accepted by
+            MeasuredArray
+        Y: type A; the y values of the data points, as the x values
+        Scale: (keyword) bool; if True the covariance of the weighted fits is
+            scaled by the reduced chi-squared, if it is greater than 1,
+            defaults to False
+        Tolerance: (keyword) float in (0, 1); the relative tolerance of the
+            slopes of the York regression, defaults to DEFAULT_TOLERANCE
+        MaxIterations: (keyword) int > 0; the max number of the iterations
+            of the York regression, defaults to MAX_ITERATIONS
+        Raise: (keyword) bool; if True a single exception listing all failed
+            fits is raised, defaults to False
+
+    Returns:
+        tuple(MeasuredValue, MeasuredValue, numpy.ndarray): the slope, the
+            intercept and their 2 x 2 covariance matrix (slope first), the
+            data points are 1-D
+        tuple(MeasuredArray, MeasuredArray, numpy.ndarray): the slopes, the
+            intercepts and their covariance matrices of the batch shape
+
+    Raises:
+        UT_TypeError: x or y values are not real numbers and / or
+            measurements with uncertainty, OR any keyword argument is of the
+            improper type
+        UT_ValueError: the shapes of x and y values are not compatible, OR
+            there are less than 2 data points, OR any value or uncertainty is
+            not finite, OR any uncertainty is too small, OR any y uncertainty
+            of a weighted fit is zero, OR the tolerance or the max number of
+            iterations is out of the range, OR any fit is failed, and Raise
+            flag is True
+
+    Version 1.0.0.0
+    """
+    _checkOptions(Scale, Tolerance, MaxIterations, Raise)
+    (XV, XE), (YV, YE) = [_toArrays(Item, SkipFrames = 2) for Item in (X, Y)]
+    try:
+        Shape = np.broadcast(XV, XE, YV, YE).shape
+    except ValueError:
+        raise UT_ValueError((np.shape(XV), np.shape(YV)), 'compatible shapes',
+                                                    SkipFrames = 1) from None
+    if not len(Shape) or Shape[-1] < 2:
+        raise UT_ValueError(Shape, '>= 2 data points', SkipFrames = 1)
+    Batch, Length = Shape[:-1], Shape[-1]
+    XV, XE, YV, YE = [np.broadcast_to(Item, Shape).reshape(-1, Length).astype(
+                                np.float64) for Item in (XV, XE, YV, YE)]
+    Values = np.concatenate((XV, YV), axis = 1)
+    Errors = np.concatenate((XE, YE), axis = 1)
+    _raiseInvalid(*_countInvalid(Values, Errors), Values.size, SkipFrames = 2)
+    VX, VY = XE * XE, YE * YE
+    IsExact = _checkWeights(YE, ~np.any(XE, axis = 1))
+    VY[IsExact] = 1.0
+    Size = XV.shape[0]
+    Codes = np.full(Size, FIT_OK, dtype = np.uint8)
+    with np.errstate(all = 'ignore'):
+        #initial slopes: the weighted least squares
+        Slope = _lineStatistics(XV, YV, np.zeros_like(VX), VY,
+                                                            np.zeros(Size))[2]
+        Codes[~np.isfinite(Slope)] = FIT_DEGENERATE
+        Active = np.flatnonzero((Codes == FIT_OK) & np.any(VX, axis = 1))
+        #absolute tolerance of the slopes close to zero
+        Floor = np.sqrt(np.var(YV, axis = 1) / np.var(XV, axis = 1))
+        for _ in range(MaxIterations):
+            if not Active.size:
+                break
+            Next = _lineStatistics(XV[Active], YV[Active], VX[Active],
+                                            VY[Active], Slope[Active])[2]
+            Failed = ~np.isfinite(Next)
+            Codes[Active[Failed]] = FIT_NOT_FINITE
+            Converged = (np.abs(Next - Slope[Active])
+                            <= Tolerance * (np.abs(Next) + Floor[Active]))
+            Slope[Active] = Next
+            Active = Active[~(Converged | Failed)]
+        Codes[Active] = FIT_NO_CONVERGENCE
+        #parameters and covariance at the final slopes
+        W, Beta, _ = _lineStatistics(XV, YV, VX, VY, Slope)
+        Weight = W.sum(axis = 1)
+        Intercept = ((W * YV).sum(axis = 1) - Slope * (W * XV).sum(axis = 1)
+                                                                    ) / Weight
+        Adjusted = Beta + (W * XV).sum(axis = 1, keepdims = True) / Weight[
+                                                                :, np.newaxis]
+        Mean = (W * Adjusted).sum(axis = 1) / Weight
+        U = Adjusted - Mean[:, np.newaxis]
+        SlopeVariance = 1.0 / (W * U * U).sum(axis = 1)
+        Covariance = np.empty((Size, 2, 2))
+        Covariance[:, 0, 0] = SlopeVariance
+        Covariance[:, 0, 1] = Covariance[:, 1, 0] = - Mean * SlopeVariance
+        Covariance[:, 1, 1] = 1.0 / Weight + Mean * Mean * SlopeVariance
+        Residuals = YV - Intercept[:, np.newaxis] - Slope[:, np.newaxis] * XV
+        Covariance *= _scaleFactor((W * Residuals * Residuals).sum(axis = 1),
+                                IsExact, Length - 2, Scale)[:, np.newaxis,
+                                                                np.newaxis]
+    Codes[(Codes == FIT_OK) & ~(np.isfinite(Slope) & np.isfinite(Intercept))
+                                                            ] = FIT_NOT_FINITE
+    if Raise and np.any(Codes):
+        _raiseFitError(Codes.reshape(Batch))
+    Mask = Codes == FIT_OK
+    Slope = np.where(Mask, Slope, np.nan).reshape(Batch)
+    Intercept = np.where(Mask, Intercept, np.nan).reshape(Batch)
+    Covariance = np.where(Mask[:, np.newaxis, np.newaxis], Covariance,
+                                                np.nan).reshape(Batch + (2, 2))
+    SlopeError = np.sqrt(Covariance[..., 0, 0])
+    InterceptError = np.sqrt(Covariance[..., 1, 1])
+    if not len(Batch):
+        return (MeasuredValue(float(Slope), float(SlopeError)),
+                MeasuredValue(float(Intercept), float(InterceptError)),
+                                                                    Covariance)
+    return (MeasuredArray(Slope, SlopeError),
+                        MeasuredArray(Intercept, InterceptError), Covariance)
+
+def fitModel(Model: Callable, X: Any, Y: Any, Initial: Any, *,
+                Jacobian: Optional[Callable] = None, Scale: bool = False,
+                Tolerance: float = DEFAULT_TOLERANCE,
+                MaxIterations: int = MAX_ITERATIONS,
+                Raise: bool = False) -> Tuple[Union[Tuple[MeasuredValue, ...],
+                                                MeasuredArray], np.ndarray]:
+    """
+    Fits the non-linear model y = f(x, p1, p2, ...) to the measured data
+    points by the weighted least squares (weights 1 / SE^2) using the
+    Levenberg-Marquardt algorithm, or by the ordinary least squares with the
+    covariance of the parameters estimated from the residuals, if none of the
+    data points of a fit has any uncertainty. The data points are along the
+    last axis of the broadcast x and y arrays, and the parameters - along the
+    last axis of the initial guess; the other axes of the three arrays are
+    broadcast together and define the batch of the independent fits, which
+    are iterated in lockstep. The model (and the optional analytic Jacobian)
+    is called with the 2-D array of x values (one row per fit) and with one
+    column array per parameter, and must return the model values of the same
+    shape as x (the Jacobian - a sequence of such arrays, one per parameter).
+    The failed fits are filled with NaN, or, with Raise = True, a single
+    exception listing all of them is raised.
+
+    Signature:
+        callable, type A, type B, type A, *, /callable OR None, bool, float,
+            int, bool/ -> tuple(MeasuredValue, ...), numpy.ndarray
+                OR MeasuredArray, numpy.ndarray
+
+    Args:
+        Model: callable(numpy.ndarray, numpy.ndarray, ...) -> numpy.ndarray;
+            the vectorized model f(x, p1, p2, ...)
+        X: type A; the x values of the data points as real numbers
+        Y: type B; the y values of the data points as real numbers or
+            measurements with uncertainty in any form accepted by
+            MeasuredArray
+        Initial: type A; the initial guess of the parameters as real numbers
+        Jacobian: (keyword) callable(numpy.ndarray, numpy.ndarray, ...)
+            -> seq(numpy.ndarray); the vectorized analytic partial
+            derivatives df / dp1, df / dp2, ... with the same arguments as
+            the model, defaults to None - the central differences
+        Scale: (keyword) bool; if True the covariance of the weighted fits is
+            scaled by the reduced chi-squared, if it is greater than 1,
+            defaults to False
+        Tolerance: (keyword) float in (0, 1); the relative tolerance of the
+            parameters, defaults to DEFAULT_TOLERANCE
+        MaxIterations: (keyword) int > 0; the max number of the iterations,
+            defaults to MAX_ITERATIONS
+        Raise: (keyword) bool; if True a single exception listing all failed
+            fits is raised, defaults to False
+
+    Returns:
+        tuple(tuple(MeasuredValue, ...), numpy.ndarray): the parameters and
+            their covariance matrix, the data points are 1-D
+        tuple(MeasuredArray, numpy.ndarray): the parameters and their
+            covariance matrices, the batch shape + (number of parameters, )
+            and + (number of parameters, number of parameters) respectively
+
+    Raises:
+        UT_TypeError: the model or the Jacobian is not callable, OR x values
+            or the initial guess are not real numbers, OR y values are not
+            real numbers and / or measurements with uncertainty, OR any
+            keyword argument is of the improper type, OR the model or the
+            Jacobian does not return real numbers, OR the Jacobian does not
+            return a sequence
+        UT_ValueError: the shapes of x and y values and of the initial guess
+            are not compatible, OR there are less data points than the
+            parameters, OR any value or uncertainty is not finite, OR any
+            uncertainty is too small, OR any y uncertainty of a weighted fit
+            is zero, OR the model or the Jacobian does not preserve the
+            shape, OR the tolerance or the max number of iterations is out
+            of the range, OR any fit is failed, and Raise flag is True
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Model, Callable):
+        raise UT_TypeError(Model, Callable, SkipFrames = 1)
+    if not ((Jacobian is None) or isinstance(Jacobian, Callable)):
+        raise UT_TypeError(Jacobian, Callable, SkipFrames = 1)
+    _checkOptions(Scale, Tolerance, MaxIterations, Raise)
+    for Item in (X, Initial):
+        if _isMeasured(Item):
+            raise UT_TypeError(Item, (int, float, list, tuple, np.ndarray),
+                                                                SkipFrames = 1)
+    (XV, _), (YV, YE), (PV, _) = [_toArrays(Item, SkipFrames = 2)
+                                                for Item in (X, Y, Initial)]
+    if not (XV.ndim and YV.ndim and PV.ndim):
+        raise UT_ValueError((XV.shape, YV.shape, PV.shape), '>= 1-D',
+                                                                SkipFrames = 1)
+    try:
+        Shape = np.broadcast(XV, YV, YE).shape
+        #zero-strided views, np.broadcast_shapes() requires numpy >= 1.20
+        Batch = np.broadcast(np.broadcast_to(0, Shape[:-1]),
+                                    np.broadcast_to(0, PV.shape[:-1])).shape
+    except ValueError:
+        raise UT_ValueError((XV.shape, YV.shape, PV.shape),
+                            'compatible shapes', SkipFrames = 1) from None
+    Length, Count = Shape[-1], PV.shape[-1]
+    if Count < 1:
+        raise UT_ValueError(Count, '>= 1 parameters', SkipFrames = 1)
+    if Length < Count:
+        raise UT_ValueError(Length, '>= {} data points'.format(Count),
+                                                                SkipFrames = 1)
+    XV, YV, YE = [np.broadcast_to(Item, Batch + (Length, )).reshape(-1,
+                        Length).astype(np.float64) for Item in (XV, YV, YE)]
+    PV = np.broadcast_to(PV, Batch + (Count, )).reshape(-1, Count).astype(
+                                                                    np.float64)
+    Values = np.concatenate((XV, YV, PV), axis = 1)
+    Errors = np.concatenate((np.zeros_like(XV), YE, np.zeros_like(PV)),
+                                                                    axis = 1)
+    _raiseInvalid(*_countInvalid(Values, Errors), Values.size, SkipFrames = 2)
+    IsExact = _checkWeights(YE, np.ones(YE.shape[0], dtype = bool))
+    Weights = 1.0 / np.where(IsExact[:, np.newaxis], 1.0, YE)
+    Size = XV.shape[0]
+    Codes = np.full(Size, FIT_OK, dtype = np.uint8)
+    Damping = np.full(Size, INITIAL_DAMPING)
+    Covariance = np.full((Size, Count, Count), np.nan)
+    with np.errstate(all = 'ignore'):
+        Residuals = (YV - _callModel(Model, XV, PV)) * Weights
+        ChiSquared = np.einsum('ij,ij->i', Residuals, Residuals)
+        Codes[~np.isfinite(ChiSquared)] = FIT_NOT_FINITE
+        Active = np.flatnonzero(Codes == FIT_OK)
+        #weighted Jacobian, the normal matrix and the gradient of the active
+        #+ fits, updated after each accepted step
+        J = _callJacobian(Model, Jacobian, XV[Active], PV[Active]
+                                            ) * Weights[Active, :, np.newaxis]
+        Normal = np.einsum('ijk,ijl->ikl', J, J)
+        Gradient = np.einsum('ijk,ij->ik', J, Residuals[Active])
+        for _ in range(MaxIterations):
+            if not Active.size:
+                break
+            Diagonal = np.diagonal(Normal, axis1 = 1, axis2 = 2)
+            Diagonal = np.where(Diagonal > 0, Diagonal, 1.0)
+            Damped = Normal.copy()
+            Damped[:, range(Count), range(Count)] += (Damping[Active,
+                                                    np.newaxis] * Diagonal)
+            Step = _solve(Damped, Gradient)
+            Trial = PV[Active] + Step
+            TrialResiduals = (YV[Active] - _callModel(Model, XV[Active],
+                                                    Trial)) * Weights[Active]
+            TrialChiSquared = np.einsum('ij,ij->i', TrialResiduals,
+                                                            TrialResiduals)
+            #changes of chi-squared within the rounding errors of the sum
+            #+ are not resolved: such steps are accepted, and end the fit
+            Rounding = Length * np.finfo(np.float64).eps * ChiSquared[Active]
+            Change = TrialChiSquared - ChiSquared[Active]
+            Better = Change <= Rounding
+            Converged = Better & ((np.abs(Change) <= Rounding) | np.all(
+                np.abs(Step) <= Tolerance * (np.abs(Trial) + Tolerance),
+                                                                    axis = 1))
+            Accepted = Active[Better]
+            PV[Accepted] = Trial[Better]
+            ChiSquared[Accepted] = TrialChiSquared[Better]
+            Residuals[Accepted] = TrialResiduals[Better]
+            Damping[Active] = np.where(Better,
+                                        Damping[Active] / DAMPING_FACTOR,
+                                        Damping[Active] * DAMPING_FACTOR)
+            Update = np.flatnonzero(Better & ~Converged)
+            if Update.size:
+                Rows = Active[Update]
+                Partials = _callJacobian(Model, Jacobian, XV[Rows], PV[Rows]
+                                                ) * Weights[Rows, :, np.newaxis]
+                J[Update] = Partials
+                Normal[Update] = np.einsum('ijk,ijl->ikl', Partials, Partials)
+                Gradient[Update] = np.einsum('ijk,ij->ik', Partials,
+                                                            Residuals[Rows])
+            Keep = ~Converged
+            Active, J = Active[Keep], J[Keep]
+            Normal, Gradient = Normal[Keep], Gradient[Keep]
+        Codes[Active] = FIT_NO_CONVERGENCE
+        #covariance at the found parameters
+        Valid = np.flatnonzero(Codes == FIT_OK)
+        if Valid.size:
+            J = _callJacobian(Model, Jacobian, XV[Valid], PV[Valid]
+                                            ) * Weights[Valid, :, np.newaxis]
+            Inverse = _invert(np.einsum('ijk,ijl->ikl', J, J))
+            Degenerate = ~np.all(np.isfinite(Inverse), axis = (1, 2))
+            Codes[Valid[Degenerate]] = FIT_DEGENERATE
+            Covariance[Valid] = Inverse * _scaleFactor(ChiSquared[Valid],
+                    IsExact[Valid], Length - Count, Scale)[:, np.newaxis,
+                                                                np.newaxis]
+    Codes[(Codes == FIT_OK) & ~np.all(np.isfinite(PV), axis = 1)
+                                                            ] = FIT_NOT_FINITE
+    if Raise and np.any(Codes):
+        _raiseFitError(Codes.reshape(Batch))
+    Mask = Codes == FIT_OK
+    PV = np.where(Mask[:, np.newaxis], PV, np.nan).reshape(Batch + (Count, ))
+    Covariance = np.where(Mask[:, np.newaxis, np.newaxis], Covariance,
+                                        np.nan).reshape(Batch + (Count, Count))
+    Deviations = np.sqrt(np.diagonal(Covariance, axis1 = -2, axis2 = -1))
+    if not len(Batch):
+        return (tuple(MeasuredValue(float(Value), float(Error))
+                        for Value, Error in zip(PV, Deviations)), Covariance)
+    return MeasuredArray(PV, Deviations), Covariance
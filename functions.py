@@ -0,0 +1,1395 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.functions
+
+Implements the elementary mathematical functions of the measurements with
+uncertainty, extending the functions of the Standard Library module math onto
+the instances of MeasuredValue (scalars) and onto the arrays of measurements.
+The first order uncertainty (see DE001) is propagated using the built-in table
+of the analytic derivatives, and all forms of the input are processed by the
+same vectorized code path. The domain specific functions with the analytic
+derivatives can be registered in the same table using a decorator. The
+arbitrary functions of real numbers are supported via the numerical
+derivatives (complex step or central differences) with the per function cache
+of the selected steps.
+
+Functions:
+    applyArrays(Name, *Pairs, Raise = False)
+        str, tuple(array, array)/, tuple(array, array), .../ /, bool/
+            -> numpy.ndarray, numpy.ndarray, numpy.ndarray(uint8)
+    measuredFunction(*Partials, Domain = None, Name = None, UFunc = None,
+                                                            Vectorized = True)
+        callable/, callable, .../ /, callable OR None, str OR None,
+            numpy.ufunc OR None, bool/ -> callable(callable) -> callable
+    sqrt(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    exp(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    log(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    log10(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    sin(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    cos(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    tan(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    asin(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    acos(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    atan(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    sinh(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    cosh(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    tanh(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    asinh(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    acosh(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    atanh(X)
+        type A -> float OR MeasuredValue OR MeasuredArray
+    hypot(X, Y)
+        type A, type B -> float OR MeasuredValue OR MeasuredArray
+    atan2(Y, X)
+        type A, type B -> float OR MeasuredValue OR MeasuredArray
+    propagate(Function, *Args)
+        callable, type A/, type B, .../ -> MeasuredValue
+    propagateArrays(Function, *Args)
+        callable, type A/, type B, .../ -> MeasuredArray
+    clearStepCache()
+        None -> None
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import math
+import functools
+import inspect
+
+from collections.abc import Callable
+
+from typing import Union, Optional, Any, Tuple, Sequence, List
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.base_classes import MeasuredValue, MeasuredValueABC
+
+from phyqus_lib.measured_arrays import MeasuredArray, TOperand
+from phyqus_lib.measured_arrays import DOMAIN_OK, DOMAIN_NEGATIVE_ARGUMENT
+from phyqus_lib.measured_arrays import DOMAIN_NONPOSITIVE_ARGUMENT
+from phyqus_lib.measured_arrays import DOMAIN_OUT_OF_RANGE
+from phyqus_lib.measured_arrays import DOMAIN_ZERO_ARGUMENTS
+from phyqus_lib.measured_arrays import _toArrays, _isMeasured
+from phyqus_lib.measured_arrays import _raiseDomainError
+
+#types
+
+TResult = Union[float, MeasuredValue, MeasuredArray]
+
+#globals
+
+#+ derivative table: name -> (number of arguments, function, partial
+#+ derivatives, domain check); the function takes the mean values of the
+#+ arguments, the partial derivatives - the same values and the mean of the
+#+ result, and return a tuple of arrays; the domain check returns an array of
+#+ the domain error codes or None (no restrictions)
+
+_LN10 = math.log(10.0)
+
+DERIVATIVE_TABLE = {
+    'sqrt' : (1, np.sqrt, lambda X, F: (0.5 / F, ),
+                lambda X: np.where(X < 0, DOMAIN_NEGATIVE_ARGUMENT, DOMAIN_OK)),
+    'exp' : (1, np.exp, lambda X, F: (F, ), None),
+    'log' : (1, np.log, lambda X, F: (1.0 / X, ),
+            lambda X: np.where(X <= 0, DOMAIN_NONPOSITIVE_ARGUMENT, DOMAIN_OK)),
+    'log10' : (1, np.log10, lambda X, F: (1.0 / (X * _LN10), ),
+            lambda X: np.where(X <= 0, DOMAIN_NONPOSITIVE_ARGUMENT, DOMAIN_OK)),
+    'sin' : (1, np.sin, lambda X, F: (np.cos(X), ), None),
+    'cos' : (1, np.cos, lambda X, F: (-np.sin(X), ), None),
+    'tan' : (1, np.tan, lambda X, F: (1.0 + F * F, ), None),
+    'asin' : (1, np.arcsin, lambda X, F: (1.0 / np.sqrt(1.0 - X * X), ),
+            lambda X: np.where(np.abs(X) > 1, DOMAIN_OUT_OF_RANGE, DOMAIN_OK)),
+    'acos' : (1, np.arccos, lambda X, F: (-1.0 / np.sqrt(1.0 - X * X), ),
+            lambda X: np.where(np.abs(X) > 1, DOMAIN_OUT_OF_RANGE, DOMAIN_OK)),
+    'atan' : (1, np.arctan, lambda X, F: (1.0 / (1.0 + X * X), ), None),
+    'sinh' : (1, np.sinh, lambda X, F: (np.cosh(X), ), None),
+    'cosh' : (1, np.cosh, lambda X, F: (np.sinh(X), ), None),
+    'tanh' : (1, np.tanh, lambda X, F: (1.0 - F * F, ), None),
+    'asinh' : (1, np.arcsinh, lambda X, F: (1.0 / np.sqrt(X * X + 1.0), ),
+                                                                        None),
+    'acosh' : (1, np.arccosh, lambda X, F: (1.0 / np.sqrt(X * X - 1.0), ),
+                lambda X: np.where(X < 1, DOMAIN_OUT_OF_RANGE, DOMAIN_OK)),
+    'atanh' : (1, np.arctanh, lambda X, F: (1.0 / (1.0 - X * X), ),
+            lambda X: np.where(np.abs(X) >= 1, DOMAIN_OUT_OF_RANGE, DOMAIN_OK)),
+    'hypot' : (2, np.hypot, lambda X, Y, F: (X / F, Y / F),
+                lambda X, Y: np.where((X == 0) & (Y == 0),
+                                        DOMAIN_ZERO_ARGUMENTS, DOMAIN_OK)),
+    'atan2' : (2, np.arctan2, lambda Y, X, F: (X / (X * X + Y * Y),
+                                                    -Y / (X * X + Y * Y)),
+                lambda Y, X: np.where((X == 0) & (Y == 0),
+                                        DOMAIN_ZERO_ARGUMENTS, DOMAIN_OK))
+}
+
+#+ names of the built-in functions of the table, which cannot be re-defined
+
+_BUILTIN_NAMES = frozenset(DERIVATIVE_TABLE)
+
+#+ NumPy universal functions dispatched onto the functions of the derivative
+#+ table: ufunc -> name; initially all built-in functions
+
+UFUNC_TABLE = {Entry[1] : Name for Name, Entry in DERIVATIVE_TABLE.items()}
+
+#+ numerical derivatives: candidate relative steps of the central differences
+#+ (the step search), the relative complex step, the relative tolerance of the
+#+ complex step validation and the max number of the functions in the cache
+
+STEP_SEARCH = tuple(10.0 ** -Power for Power in range(1, 11))
+
+COMPLEX_STEP = 1.0E-20
+
+COMPLEX_TOLERANCE = 1.0E-5
+
+STEP_CACHE_SIZE = 256
+
+#+ step cache: (function, number of arguments) -> [complex step flag (None if
+#+ not decided yet), dict(tuple of the argument indices -> relative step)]
+
+_STEP_CACHE = dict()
+
+#functions
+
+#+ 'private' helper functions
+
+def _propagate(Name: str, Values: Sequence[np.ndarray],
+                    Errors: Sequence[np.ndarray], Groups: Sequence[int]
+                        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Helper function implementing the single vectorized code path of all
+    functions of the derivative table: the domain check, the mean values and
+    the first order uncertainty. The partial derivatives of the arguments
+    referring the same object (the same group index) are summed before the
+    propagation. The invalid elements of the result are filled with NaN.
+
+    Signature:
+        str, list(numpy.ndarray), list(numpy.ndarray), list(int)
+            -> numpy.ndarray, numpy.ndarray, numpy.ndarray(uint8)
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray); the values and the
+            uncertainties (float64) of the result and the domain error codes
+            (uint8) of the same (broadcast) shape
+
+    Version 1.0.0.0
+    """
+    _, Function, Partials, Domain = DERIVATIVE_TABLE[Name]
+    with np.errstate(all = 'ignore'):
+        Mean = np.asarray(Function(*Values), dtype = np.float64)
+        Derivatives = Partials(*Values, Mean)
+        Terms = dict()
+        for Group, Error, Derivative in zip(Groups, Errors, Derivatives):
+            if Group in Terms:
+                Terms[Group] = (Error, Terms[Group][1] + Derivative)
+            else:
+                Terms[Group] = (Error, Derivative)
+        Variance = np.zeros(Mean.shape)
+        for Error, Derivative in Terms.values():
+            if np.any(Error):
+                Variance = Variance + np.square(np.where(Error == 0, 0.0,
+                                                        Error * Derivative))
+        SE = np.sqrt(Variance)
+    if Domain is None:
+        Codes = np.zeros(Mean.shape, dtype = np.uint8)
+    else:
+        Codes = np.broadcast_to(Domain(*Values), Mean.shape).astype(np.uint8)
+        if Codes.any():
+            Mean = np.where(Codes == DOMAIN_OK, Mean, np.nan)
+            SE = np.where(Codes == DOMAIN_OK, SE, np.nan)
+    return Mean, SE, Codes
+
+def _evaluate(Name: str, *Args: Any) -> TResult:
+    """
+    Helper function implementing the public functions of the module: the
+    conversion of the arguments, the propagation and the choice of the type of
+    the result.
+
+    Signature:
+        str, type A /, type B, .../ -> float OR MeasuredValue OR MeasuredArray
+
+    Raises:
+        UT_TypeError: any argument is neither real number(s) nor
+            measurement(s) with uncertainty
+        UT_ValueError: the shapes of the arguments are not compatible, OR any
+            element violates the domain of the function
+
+    Version 1.0.0.0
+    """
+    Values = list()
+    Errors = list()
+    Groups = list()
+    for Index, Arg in enumerate(Args):
+        Group = Index
+        for Other in range(Index):
+            if Args[Other] is Arg and _isMeasured(Arg):
+                Group = Groups[Other]
+                break
+        Value, Error = _toArrays(Arg, SkipFrames = 4)
+        Values.append(Value)
+        Errors.append(Error)
+        Groups.append(Group)
+    try:
+        np.broadcast(*Values)
+    except ValueError:
+        raise UT_ValueError(tuple(Value.shape for Value in Values),
+                            'compatible shapes', SkipFrames = 3) from None
+    Mean, SE, Codes = _propagate(Name, Values, Errors, Groups)
+    if Codes.any():
+        _raiseDomainError(Codes, SkipFrames = 3)
+    IsArray = any(isinstance(Arg, (MeasuredArray, list, tuple, np.ndarray))
+                                                                for Arg in Args)
+    if IsArray:
+        Result = MeasuredArray(Mean, SE)
+    elif any(_isMeasured(Arg) for Arg in Args):
+        Result = MeasuredValue(float(Mean), float(SE))
+    else:
+        Result = float(Mean)
+    return Result
+
+def _makeFunction(Name: str, Function: Callable,
+                    Partials: Sequence[Callable],
+                    Domain: Optional[Callable]) -> Callable:
+    """
+    Helper function to generate the function of the measurements from a
+    function of real numbers registered in the derivative table. The
+    generated function has the fast path for the scalar arguments (real
+    numbers and MeasuredValue instances), which checks each argument once and
+    calculates the result and the partial derivatives directly on the floats
+    without any intermediate objects, and the vectorized path of the derivative
+    table for all other arguments.
+
+    Signature:
+        str, callable, seq(callable), callable OR None -> callable
+
+    Version 1.0.0.0
+    """
+    Arity = len(Partials)
+
+    @functools.wraps(Function)
+    def wrapper(*Args: Any) -> TResult:
+        if len(Args) != Arity:
+            raise UT_ValueError(len(Args), '== {} arguments'.format(Arity),
+                                                                SkipFrames = 1)
+        Values = list()
+        Errors = list()
+        for Arg in Args:
+            if isinstance(Arg, (int, float)) and not isinstance(Arg, bool):
+                Values.append(Arg)
+                Errors.append(0)
+            elif (isinstance(Arg, MeasuredArray)
+                        or not (hasattr(Arg, 'Value') and hasattr(Arg, 'SE'))
+                        or not isinstance(Arg.Value, (int, float))):
+                return _evaluate(Name, *Args)
+            elif (not isinstance(Arg.SE, (int, float))) or Arg.SE < 0:
+                raise UT_TypeError(Arg, (int, float, MeasuredValueABC),
+                                                                SkipFrames = 1)
+            else:
+                Values.append(Arg.Value)
+                Errors.append(Arg.SE)
+        if (Domain is not None) and not Domain(*Values):
+            _raiseDomainError(np.array(DOMAIN_OUT_OF_RANGE, dtype = np.uint8),
+                                                                SkipFrames = 2)
+        Mean = float(Function(*Values))
+        if not any(_isMeasured(Arg) for Arg in Args):
+            return Mean
+        Variance = 0.0
+        Done = set()
+        for Index, Arg in enumerate(Args):
+            if Index in Done or not Errors[Index]:
+                continue
+            Derivative = 0.0
+            for Other in range(Index, Arity):
+                if Args[Other] is Arg:
+                    Derivative += Partials[Other](*Values)
+                    Done.add(Other)
+            Variance += (Errors[Index] * Derivative) ** 2
+        return MeasuredValue(Mean, math.sqrt(Variance))
+
+    return wrapper
+
+def _groupArguments(Args: Sequence[Any]) -> List[List[int]]:
+    """
+    Helper function to group the indices of the arguments referring the same
+    measurement object, which are perturbed together.
+
+    Signature:
+        seq(type A) -> list(list(int))
+
+    Version 1.0.0.0
+    """
+    Groups = list()
+    for Index, Arg in enumerate(Args):
+        for Group in Groups:
+            if Args[Group[0]] is Arg and _isMeasured(Arg):
+                Group.append(Index)
+                break
+        else:
+            Groups.append([Index])
+    return Groups
+
+def _scale(Value: Any, Error: Any) -> Any:
+    """
+    Helper function to calculate the scale of the perturbation of an argument
+    as the larger of the absolute mean value and the uncertainty, but not
+    zero.
+
+    Signature:
+        float, float -> float OR numpy.ndarray, numpy.ndarray -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Scale = np.fmax(np.abs(Value), Error)
+    return np.where(Scale == 0, 1.0, Scale)
+
+def _shift(Values: Sequence[Any], Group: Sequence[int],
+                                                    Delta: Any) -> List[Any]:
+    """
+    Helper function to perturb the arguments of the same group by the same
+    delta.
+
+    Signature:
+        seq(type A), seq(int), type B -> list(type A)
+
+    Version 1.0.0.0
+    """
+    Result = list(Values)
+    for Index in Group:
+        Result[Index] = Values[Index] + Delta
+    return Result
+
+def _complexDerivative(Function: Callable, Values: Sequence[Any],
+                                Group: Sequence[int], Scale: Any) -> Any:
+    """
+    Helper function to calculate the derivative using the complex step, i.e.
+    as Im(f(x + i h)) / h.
+
+    Signature:
+        callable, seq(type A), seq(int), type B -> numpy.ndarray OR None
+
+    Returns:
+        numpy.ndarray: the derivative(s)
+        None: the function does not support the complex arguments
+
+    Version 1.0.0.0
+    """
+    Step = COMPLEX_STEP * Scale
+    try:
+        Result = np.asarray(Function(*_shift(Values, Group, 1j * Step)))
+    except (TypeError, ValueError, ArithmeticError):
+        return None
+    if Result.dtype.kind != 'c':
+        return None
+    return Result.imag / Step
+
+def _centralDerivative(Function: Callable, Values: Sequence[Any],
+                                Group: Sequence[int], Step: Any) -> Any:
+    """
+    Helper function to calculate the derivative using the central difference.
+
+    Signature:
+        callable, seq(type A), seq(int), type B -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Plus = np.asarray(Function(*_shift(Values, Group, Step)), dtype = float)
+    Minus = np.asarray(Function(*_shift(Values, Group, -Step)), dtype = float)
+    return (Plus - Minus) / (2 * Step)
+
+def _cacheEntry(Function: Callable, Size: int) -> list:
+    """
+    Helper function to get the step cache entry of a function, which is
+    created, if not present, evicting the oldest entry if the cache is full.
+    A new (not cached) entry is returned for the unhashable functions.
+
+    Signature:
+        callable, int -> list(bool OR None, dict(tuple(int) -> float))
+
+    Version 1.0.0.0
+    """
+    Key = (Function, Size)
+    try:
+        Entry = _STEP_CACHE.get(Key)
+    except TypeError:
+        return [None, dict()]
+    if Entry is None:
+        if len(_STEP_CACHE) >= STEP_CACHE_SIZE:
+            del _STEP_CACHE[next(iter(_STEP_CACHE))]
+        Entry = [None, dict()]
+        _STEP_CACHE[Key] = Entry
+    return Entry
+
+def _selectSteps(Function: Callable, Values: Sequence[float],
+                Errors: Sequence[float], Groups: Sequence[Sequence[int]],
+                    Mean: Optional[float]) -> Tuple[bool, List[float]]:
+    """
+    Helper function to select the method and the relative steps of the
+    numerical derivatives of a function, using the cached values or the step
+    search at the given point for the argument groups not found in the cache.
+
+    The step search calculates the central differences with the relative
+    steps STEP_SEARCH and selects the step with the smallest change of the
+    estimate relative to both the next larger and smaller steps. The complex
+    step is used, if the function returns complex values on the complex
+    arguments, and its derivatives agree with the central differences (within
+    the relative tolerance COMPLEX_TOLERANCE) for all searched groups.
+
+    Signature:
+        callable, seq(float OR numpy.ndarray), seq(float), seq(seq(int)),
+            float OR None -> bool, list(float)
+
+    Args:
+        Function: callable; the function
+        Values: seq(float OR numpy.ndarray); the mean values of the arguments
+            (the point), real numbers or 1-element arrays
+        Errors: seq(float); the uncertainties of the arguments
+        Groups: seq(seq(int)); the groups of the indices of the arguments
+        Mean: float OR None; the value of the function at the point, which is
+            calculated only if required, if None
+
+    Returns:
+        tuple(bool, list(float)): the complex step flag and the relative steps
+            of the central differences of the groups
+
+    Raises:
+        UT_TypeError: the function does not return a real number at the point
+
+    Version 1.0.0.0
+    """
+    Entry = _cacheEntry(Function, len(Values))
+    for Group in Groups:
+        Key = tuple(Group)
+        if Key in Entry[1]:
+            continue
+        Scale = float(_scale(Values[Group[0]], Errors[Group[0]]))
+        if Mean is None:
+            Mean = np.asarray(Function(*Values))
+            if Mean.dtype.kind not in 'iuf' or Mean.ndim:
+                raise UT_TypeError(Mean, (int, float), SkipFrames = 2)
+            Mean = float(Mean)
+        with np.errstate(all = 'ignore'):
+            Estimates = [_centralDerivative(Function, Values, Group,
+                            Step * Scale).item() for Step in STEP_SEARCH]
+            Changes = [abs(First - Second) for First, Second in
+                                        zip(Estimates[:-1], Estimates[1:])]
+            Changes = [Change if math.isfinite(Change) else math.inf
+                                                        for Change in Changes]
+            Changes = [max(First, Second) for First, Second in
+                                            zip(Changes[:-1], Changes[1:])]
+            Best = Changes.index(min(Changes)) + 1
+            Entry[1][Key] = STEP_SEARCH[Best]
+            if not (Entry[0] is False):
+                Derivative = _complexDerivative(Function, Values, Group, Scale)
+                Entry[0] = (Derivative is not None and math.isclose(
+                            Derivative.item(), Estimates[Best],
+                            rel_tol = COMPLEX_TOLERANCE,
+                            abs_tol = COMPLEX_TOLERANCE * abs(Mean) / Scale))
+    return bool(Entry[0]), [Entry[1][tuple(Group)] for Group in Groups]
+
+def _stackedCall(Function: Callable, Values: Sequence[np.ndarray],
+                    Groups: Sequence[Sequence[int]],
+                    Deltas: Sequence[np.ndarray], IsComplex: bool) -> Any:
+    """
+    Helper function to evaluate a vectorized function on the mean values and
+    on all perturbed values in a single call, using the stacks of the
+    arguments along a new first axis: the unperturbed values, followed by
+    one layer per group (complex step) or two layers per group (+/- step of
+    the central differences).
+
+    Signature:
+        callable, seq(numpy.ndarray), seq(seq(int)), seq(numpy.ndarray), bool
+            -> type A
+
+    Version 1.0.0.0
+    """
+    Stacks = list()
+    for Index, Value in enumerate(Values):
+        Layers = [Value]
+        for Group, Delta in zip(Groups, Deltas):
+            if not (Index in Group):
+                Layers.extend([Value] * (1 if IsComplex else 2))
+            elif IsComplex:
+                Layers.append(Value + 1j * Delta)
+            else:
+                Layers.extend([Value + Delta, Value - Delta])
+        Stacks.append(np.stack(Layers))
+    return Function(*Stacks)
+
+#+ public API
+
+def applyArrays(Name: str, *Pairs: Tuple[Any, Any], Raise: bool = False
+                        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Applies a function of the derivative table to the paired arrays of the
+    mean values and of the uncertainties, without the creation of any
+    measurement objects, checking the domain of all elements at once. The
+    invalid elements of the result are filled with NaN (both value and SE).
+    All arguments are treated as independent.
+
+    Signature:
+        str, tuple(array, array)/, tuple(array, array), .../ /, bool/
+            -> numpy.ndarray, numpy.ndarray, numpy.ndarray(uint8)
+
+    Args:
+        Name: str; name of the function, a key of DERIVATIVE_TABLE
+        *Pairs: tuple(array, array); the mean values and the uncertainties of
+            an argument as real numbers or arrays of real numbers of the
+            broadcast compatible shapes, the number of the pairs must be equal
+            to the number of the arguments of the function
+        Raise: (optional) bool; if True a single exception listing all invalid
+            elements is raised, defaults to False
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray); the values and the
+            uncertainties (float64) of the result and the domain error codes
+            (DOMAIN_OK for the valid elements) of the same (broadcast) shape
+
+    Raises:
+        UT_TypeError: the name is not a string, OR any pair is not a pair of
+            real numbers arrays, OR the flag is not boolean
+        UT_ValueError: the name is not in the table, OR the number of pairs
+            does not match the number of arguments, OR any uncertainty is
+            negative, OR the shapes are not compatible, OR any element
+            violates the domain of the function, and Raise flag is True
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Name, str):
+        raise UT_TypeError(Name, str, SkipFrames = 1)
+    if not isinstance(Raise, bool):
+        raise UT_TypeError(Raise, bool, SkipFrames = 1)
+    if not (Name in DERIVATIVE_TABLE):
+        raise UT_ValueError(Name, 'in {}'.format(sorted(DERIVATIVE_TABLE)),
+                                                                SkipFrames = 1)
+    Arity = DERIVATIVE_TABLE[Name][0]
+    if len(Pairs) != Arity:
+        raise UT_ValueError(len(Pairs), '== {} pairs'.format(Arity),
+                                                                SkipFrames = 1)
+    Values = list()
+    Errors = list()
+    for Pair in Pairs:
+        if not (isinstance(Pair, (tuple, list)) and len(Pair) == 2):
+            raise UT_TypeError(Pair, tuple, SkipFrames = 1)
+        for Item in Pair:
+            if isinstance(Item, (str, bytes, bool, np.bool_)):
+                raise UT_TypeError(Item, np.ndarray, SkipFrames = 1)
+        try:
+            Value = np.asarray(Pair[0])
+            Error = np.asarray(Pair[1])
+        except (ValueError, TypeError):
+            raise UT_TypeError(Pair, tuple, SkipFrames = 1) from None
+        for Item in (Value, Error):
+            if Item.dtype.kind not in 'iuf':
+                raise UT_TypeError(Item, np.ndarray, SkipFrames = 1)
+        if np.any(Error < 0):
+            raise UT_ValueError(Error, '>= 0', SkipFrames = 1)
+        Values.append(Value.astype(np.float64))
+        Errors.append(Error.astype(np.float64))
+    try:
+        np.broadcast(*(Values + Errors))
+    except ValueError:
+        raise UT_ValueError(tuple(Value.shape for Value in Values + Errors),
+                            'compatible shapes', SkipFrames = 1) from None
+    Mean, SE, Codes = _propagate(Name, Values, Errors, list(range(Arity)))
+    Mean = np.broadcast_to(Mean, np.broadcast(Mean, *Errors).shape).copy()
+    SE = np.broadcast_to(SE, Mean.shape).copy()
+    Codes = np.broadcast_to(Codes, Mean.shape).copy()
+    if Raise and Codes.any():
+        _raiseDomainError(Codes)
+    return Mean, SE, Codes
+
+def measuredFunction(*Partials: Callable, Domain: Optional[Callable] = None,
+                        Name: Optional[str] = None,
+                        UFunc: Optional[np.ufunc] = None,
+                        Vectorized: bool = True) -> Callable:
+    """
+    Decorator factory, which registers a function of real numbers and its
+    analytic partial derivatives in the derivative table, and replaces the
+    function with the generated function of the measurements with uncertainty
+    with the fast scalar path (real numbers and MeasuredValue instances) and
+    the vectorized path (arrays of measurements in any form). The
+    registration is done once, when the decorated function is defined.
+    A client's function can be re-defined under the same name, but a ufunc
+    dispatched onto another (including a built-in) function cannot be
+    re-dispatched.
+
+    The registered function is also available via the function applyArrays()
+    by its name, and via the NumPy dispatch of the MeasuredArray instances,
+    if the ufunc is provided.
+
+    Usage:
+        @measuredFunction(lambda T, A, E: A * E * np.exp(-E / T) / T ** 2,
+                          lambda T, A, E: np.exp(-E / T),
+                          lambda T, A, E: - A * np.exp(-E / T) / T,
+                          Domain = lambda T, A, E: T > 0)
+        def arrhenius(T, A, E):
+            return A * np.exp(-E / T)
+
+    Signature:
+        callable/, callable, .../ /, callable OR None, str OR None,
+            numpy.ufunc OR None, bool/ -> callable(callable) -> callable
+
+    Args:
+        *Partials: callable(float, ...) -> float; the partial derivatives of
+            the function with respect to each of its arguments, taking the
+            same arguments as the function
+        Domain: (optional) callable(float, ...) -> bool; the domain check of
+            the function, returns True for the valid arguments, defaults to
+            None (no restrictions)
+        Name: (optional) str; the name of the function in the derivative
+            table, defaults to None - the name of the decorated function
+        UFunc: (optional) numpy.ufunc; the NumPy universal function to be
+            dispatched onto the registered function, defaults to None
+        Vectorized: (optional) bool; if True (default) the function, the
+            partial derivatives and the domain check are assumed to be
+            element-wise functions of NumPy arrays, otherwise they are
+            vectorized by numpy.vectorize() for the array path
+
+    Returns:
+        callable(callable) -> callable: the decorator, which returns the
+            generated function type A/, type B, .../ -> float OR
+            MeasuredValue OR MeasuredArray
+
+    Raises:
+        UT_TypeError: any of the partial derivatives, the domain check or the
+            decorated function is not callable, OR the name is not a string,
+            OR the ufunc is not a NumPy ufunc, OR the flag is not boolean
+        UT_ValueError: no partial derivatives are provided, OR the number of
+            the ufunc or function arguments does not match the number of
+            the partial derivatives, OR the name is a built-in function name,
+            OR the ufunc is already dispatched onto another function
+
+    Version 1.0.0.0
+    """
+    if not len(Partials):
+        raise UT_ValueError(0, '> 0 partial derivatives', SkipFrames = 1)
+    for Item in Partials:
+        if not isinstance(Item, Callable):
+            raise UT_TypeError(Item, Callable, SkipFrames = 1)
+    if not (Domain is None or isinstance(Domain, Callable)):
+        raise UT_TypeError(Domain, (Callable, None), SkipFrames = 1)
+    if not (Name is None or isinstance(Name, str)):
+        raise UT_TypeError(Name, (str, None), SkipFrames = 1)
+    if not (UFunc is None or isinstance(UFunc, np.ufunc)):
+        raise UT_TypeError(UFunc, (np.ufunc, None), SkipFrames = 1)
+    if not isinstance(Vectorized, bool):
+        raise UT_TypeError(Vectorized, bool, SkipFrames = 1)
+    Arity = len(Partials)
+    if (UFunc is not None) and UFunc.nin != Arity:
+        raise UT_ValueError(UFunc.nin, '== {}'.format(Arity), SkipFrames = 1)
+
+    def decorator(Function: Callable) -> Callable:
+        if not isinstance(Function, Callable):
+            raise UT_TypeError(Function, Callable, SkipFrames = 1)
+        try:
+            inspect.signature(Function).bind(*range(Arity))
+        except TypeError:
+            raise UT_ValueError(Function,
+                            'function of {} arguments'.format(Arity),
+                                                    SkipFrames = 1) from None
+        except ValueError:
+            pass
+        Key = Function.__name__ if Name is None else Name
+        if Key in _BUILTIN_NAMES:
+            raise UT_ValueError(Key, 'not a built-in function name',
+                                                                SkipFrames = 1)
+        if UFUNC_TABLE.get(UFunc, Key) != Key:
+            raise UT_ValueError(UFunc, 'ufunc not dispatched yet',
+                                                                SkipFrames = 1)
+        if Vectorized:
+            Kernels = (Function, ) + Partials
+            Check = Domain
+        else:
+            Kernels = tuple(np.vectorize(Item, otypes = [np.float64])
+                                        for Item in (Function, ) + Partials)
+            Check = None if Domain is None else np.vectorize(Domain,
+                                                        otypes = [np.bool_])
+        if Check is None:
+            Codes = None
+        else:
+            Codes = lambda *Values: np.where(Check(*Values), DOMAIN_OK,
+                                                        DOMAIN_OUT_OF_RANGE)
+        DERIVATIVE_TABLE[Key] = (Arity, Kernels[0],
+                lambda *Values: tuple(Partial(*Values[:-1])
+                                    for Partial in Kernels[1:]), Codes)
+        if UFunc is not None:
+            UFUNC_TABLE[UFunc] = Key
+        return _makeFunction(Key, Function, Partials, Domain)
+
+    return decorator
+
+def sqrt(X: TOperand) -> TResult:
+    """
+    Square root of the real number(s) or measurement(s) with uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+        UT_ValueError: any element is negative
+
+    Version 1.0.0.0
+    """
+    return _evaluate('sqrt', X)
+
+def exp(X: TOperand) -> TResult:
+    """
+    Exponential function of the real number(s) or measurement(s) with
+    uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+
+    Version 1.0.0.0
+    """
+    return _evaluate('exp', X)
+
+def log(X: TOperand) -> TResult:
+    """
+    Natural logarithm of the real number(s) or measurement(s) with uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+        UT_ValueError: any element is not positive
+
+    Version 1.0.0.0
+    """
+    return _evaluate('log', X)
+
+def log10(X: TOperand) -> TResult:
+    """
+    Decimal logarithm of the real number(s) or measurement(s) with uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+        UT_ValueError: any element is not positive
+
+    Version 1.0.0.0
+    """
+    return _evaluate('log10', X)
+
+def sin(X: TOperand) -> TResult:
+    """
+    Sine (the argument in radians) of the real number(s) or measurement(s)
+    with uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+
+    Version 1.0.0.0
+    """
+    return _evaluate('sin', X)
+
+def cos(X: TOperand) -> TResult:
+    """
+    Cosine (the argument in radians) of the real number(s) or measurement(s)
+    with uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+
+    Version 1.0.0.0
+    """
+    return _evaluate('cos', X)
+
+def tan(X: TOperand) -> TResult:
+    """
+    Tangent (the argument in radians) of the real number(s) or
+    measurement(s) with uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+
+    Version 1.0.0.0
+    """
+    return _evaluate('tan', X)
+
+def asin(X: TOperand) -> TResult:
+    """
+    Arc sine (the result in radians) of the real number(s) or measurement(s)
+    with uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+        UT_ValueError: any element is outside [-1, 1]
+
+    Version 1.0.0.0
+    """
+    return _evaluate('asin', X)
+
+def acos(X: TOperand) -> TResult:
+    """
+    Arc cosine (the result in radians) of the real number(s) or
+    measurement(s) with uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+        UT_ValueError: any element is outside [-1, 1]
+
+    Version 1.0.0.0
+    """
+    return _evaluate('acos', X)
+
+def atan(X: TOperand) -> TResult:
+    """
+    Arc tangent (the result in radians) of the real number(s) or
+    measurement(s) with uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+
+    Version 1.0.0.0
+    """
+    return _evaluate('atan', X)
+
+def sinh(X: TOperand) -> TResult:
+    """
+    Hyperbolic sine of the real number(s) or measurement(s) with uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+
+    Version 1.0.0.0
+    """
+    return _evaluate('sinh', X)
+
+def cosh(X: TOperand) -> TResult:
+    """
+    Hyperbolic cosine of the real number(s) or measurement(s) with uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+
+    Version 1.0.0.0
+    """
+    return _evaluate('cosh', X)
+
+def tanh(X: TOperand) -> TResult:
+    """
+    Hyperbolic tangent of the real number(s) or measurement(s) with uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+
+    Version 1.0.0.0
+    """
+    return _evaluate('tanh', X)
+
+def asinh(X: TOperand) -> TResult:
+    """
+    Inverse hyperbolic sine of the real number(s) or measurement(s) with
+    uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+
+    Version 1.0.0.0
+    """
+    return _evaluate('asinh', X)
+
+def acosh(X: TOperand) -> TResult:
+    """
+    Inverse hyperbolic cosine of the real number(s) or measurement(s) with
+    uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+        UT_ValueError: any element is less than 1
+
+    Version 1.0.0.0
+    """
+    return _evaluate('acosh', X)
+
+def atanh(X: TOperand) -> TResult:
+    """
+    Inverse hyperbolic tangent of the real number(s) or measurement(s) with
+    uncertainty.
+
+    Signature:
+        type A -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+
+    Returns:
+        float: the argument is a real number
+        MeasuredValue: the argument is a single measurement with uncertainty
+        MeasuredArray: the argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: the argument is neither real number(s) nor
+            measurement(s) with uncertainty
+        UT_ValueError: any element is outside (-1, 1)
+
+    Version 1.0.0.0
+    """
+    return _evaluate('atanh', X)
+
+def hypot(X: TOperand, Y: TOperand) -> TResult:
+    """
+    Euclidean norm sqrt(X**2 + Y**2) of the real number(s) or measurement(s)
+    with uncertainty. The first order uncertainty is not defined at the
+    origin, therefore both arguments being zero is treated as the domain
+    violation.
+
+    Signature:
+        type A, type B -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        X: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+        Y: type B; as the first argument
+
+    Returns:
+        float: both arguments are real numbers
+        MeasuredValue: both arguments are scalars, at least one of them is a
+            measurement with uncertainty
+        MeasuredArray: any argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: any argument is neither real number(s) nor
+            measurement(s) with uncertainty
+        UT_ValueError: the shapes of the arguments are not compatible, OR
+            both arguments are zero in any element
+
+    Version 1.0.0.0
+    """
+    return _evaluate('hypot', X, Y)
+
+def atan2(Y: TOperand, X: TOperand) -> TResult:
+    """
+    Arc tangent of Y / X (the result in radians) taking into account the
+    signs of both arguments, which are the real number(s) or measurement(s)
+    with uncertainty. The first order uncertainty is not defined at the
+    origin, therefore both arguments being zero is treated as the domain
+    violation.
+
+    Signature:
+        type A, type B -> float OR MeasuredValue OR MeasuredArray
+
+    Args:
+        Y: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray
+        X: type B; as the first argument
+
+    Returns:
+        float: both arguments are real numbers
+        MeasuredValue: both arguments are scalars, at least one of them is a
+            measurement with uncertainty
+        MeasuredArray: any argument is a sequence or an array
+
+    Raises:
+        UT_TypeError: any argument is neither real number(s) nor
+            measurement(s) with uncertainty
+        UT_ValueError: the shapes of the arguments are not compatible, OR
+            both arguments are zero in any element
+
+    Version 1.0.0.0
+    """
+    return _evaluate('atan2', Y, X)
+
+def propagate(Function: Callable, *Args: Any) -> MeasuredValue:
+    """
+    Calculates the value of an arbitrary function of real numbers on the
+    measurements with uncertainty, with the first order uncertainty being
+    propagated using the numerical partial derivatives, assuming the
+    independence of the arguments, except for the same object arguments.
+
+    The complex step derivatives Im(f(x + i h)) / h are used if the function
+    supports the complex arguments (and the result agrees with the central
+    differences), otherwise the central differences with the step selected by
+    the adaptive search. The selected method and the steps (relative to the
+    scale of the argument) are cached per function, so the search is done only
+    on the first call.
+
+    Signature:
+        callable, type A/, type B, .../ -> MeasuredValue
+
+    Args:
+        Function: callable(float, ...) -> float; the function of real numbers
+        *Args: type A; real numbers or measurements with uncertainty, the
+            arguments of the function
+
+    Returns:
+        MeasuredValue: the result with the propagated uncertainty
+
+    Raises:
+        UT_TypeError: the function is not callable, OR any argument is neither
+            a real number nor a measurement with uncertainty, OR the function
+            does not return a real number
+        UT_ValueError: no arguments are passed
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Function, Callable):
+        raise UT_TypeError(Function, Callable, SkipFrames = 1)
+    if not len(Args):
+        raise UT_ValueError(0, '> 0 arguments', SkipFrames = 1)
+    Values = list()
+    Errors = list()
+    for Arg in Args:
+        Value, Error = _toArrays(Arg, SkipFrames = 2)
+        if Value.ndim:
+            raise UT_TypeError(Arg, (int, float, MeasuredValueABC),
+                                                                SkipFrames = 1)
+        Values.append(float(Value))
+        Errors.append(float(Error))
+    Mean = Function(*Values)
+    if (not isinstance(Mean, (int, float, np.integer, np.floating))
+                                        or isinstance(Mean, (bool, np.bool_))):
+        raise UT_TypeError(Mean, (int, float), SkipFrames = 1)
+    Mean = float(Mean)
+    Groups = [Group for Group in _groupArguments(Args) if Errors[Group[0]]]
+    IsComplex, Steps = _selectSteps(Function, Values, Errors, Groups, Mean)
+    Variance = 0.0
+    with np.errstate(all = 'ignore'):
+        for Group, Step in zip(Groups, Steps):
+            Scale = float(_scale(Values[Group[0]], Errors[Group[0]]))
+            Derivative = None
+            if IsComplex:
+                Derivative = _complexDerivative(Function, Values, Group, Scale)
+            if Derivative is None:
+                Derivative = _centralDerivative(Function, Values, Group,
+                                                                Step * Scale)
+            Variance += (Errors[Group[0]] * float(Derivative)) ** 2
+    return MeasuredValue(Mean, math.sqrt(Variance))
+
+def propagateArrays(Function: Callable, *Args: Any) -> MeasuredArray:
+    """
+    Batch form of the function propagate() for the vectorized (element-wise)
+    functions of the arrays of real numbers, applied to the arrays of the
+    measurements with uncertainty broadcast following the NumPy rules.
+
+    The function is called once on the stacks of the unperturbed and all
+    perturbed arguments along a new first axis, instead of 2 calls per
+    element and argument. The method and the relative steps are selected (and
+    cached) as for the function propagate() using the first element of the
+    broadcast arguments.
+
+    Signature:
+        callable, type A/, type B, .../ -> MeasuredArray
+
+    Args:
+        Function: callable(numpy.ndarray, ...) -> numpy.ndarray; the
+            vectorized function of real numbers arrays
+        *Args: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray, the arguments of the function
+
+    Returns:
+        MeasuredArray: the result with the propagated uncertainty, the
+            broadcast shape of the arguments
+
+    Raises:
+        UT_TypeError: the function is not callable, OR any argument is neither
+            real number(s) nor measurement(s) with uncertainty, OR the
+            function is not vectorized (raises TypeError on the arrays), OR
+            it does not return real numbers
+        UT_ValueError: no arguments are passed, OR the shapes of the arguments
+            are not compatible, OR the function does not preserve the shape
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Function, Callable):
+        raise UT_TypeError(Function, Callable, SkipFrames = 1)
+    if not len(Args):
+        raise UT_ValueError(0, '> 0 arguments', SkipFrames = 1)
+    Pairs = [_toArrays(Arg, SkipFrames = 2) for Arg in Args]
+    try:
+        Shape = np.broadcast(*[Value for Value, _ in Pairs]).shape
+    except ValueError:
+        raise UT_ValueError(tuple(Value.shape for Value, _ in Pairs),
+                            'compatible shapes', SkipFrames = 1) from None
+    Values = [np.broadcast_to(Value, Shape) for Value, _ in Pairs]
+    Errors = [np.broadcast_to(Error, Shape) for _, Error in Pairs]
+    Groups = [Group for Group in _groupArguments(Args)
+                                                if np.any(Errors[Group[0]])]
+    if Groups:
+        IsComplex, Steps = _selectSteps(Function,
+                            [float(Value.flat[0]) for Value in Values],
+                            [float(Error.flat[0]) for Error in Errors], Groups,
+                                                                        None)
+    else:
+        IsComplex, Steps = False, list()
+    Scales = [_scale(Values[Group[0]], Errors[Group[0]]) for Group in Groups]
+    with np.errstate(all = 'ignore'):
+        Result = None
+        if IsComplex:
+            Deltas = [COMPLEX_STEP * Scale for Scale in Scales]
+            try:
+                Result = np.asarray(_stackedCall(Function, Values, Groups,
+                                                            Deltas, True))
+            except (TypeError, ValueError, ArithmeticError):
+                pass
+            if (Result is not None) and Result.dtype.kind != 'c':
+                Result = None
+        if Result is None:
+            IsComplex = False
+            Deltas = [Step * Scale for Step, Scale in zip(Steps, Scales)]
+            try:
+                Result = np.asarray(_stackedCall(Function, Values, Groups,
+                                                            Deltas, False))
+            except TypeError as err:
+                #e.g. math.sin() of an array - the function is not vectorized
+                Error = UT_TypeError(Function, Callable, SkipFrames = 1)
+                Error.setMessage(
+                    '{} must be vectorized (accept numpy arrays): {}'.format(
+                                                                Function, err))
+                raise Error from None
+            if Result.dtype.kind not in 'iuf':
+                raise UT_TypeError(Result, (int, float), SkipFrames = 1)
+        Layers = 1 + len(Groups) * (1 if IsComplex else 2)
+        if Result.shape != (Layers, ) + Shape:
+            raise UT_ValueError(Result.shape[1:], '{} shape'.format(Shape),
+                                                                SkipFrames = 1)
+        Variance = np.zeros(Shape)
+        for Index, (Group, Delta) in enumerate(zip(Groups, Deltas)):
+            if IsComplex:
+                Derivative = Result[1 + Index].imag / Delta
+            else:
+                Derivative = (Result[1 + 2 * Index].real
+                                - Result[2 + 2 * Index].real) / (2 * Delta)
+            Error = Errors[Group[0]]
+            Variance += np.square(np.where(Error == 0, 0.0,
+                                                        Error * Derivative))
+    return MeasuredArray(Result[0].real, np.sqrt(Variance))
+
+def clearStepCache() -> None:
+    """
+    Clears the cache of the numerical derivatives methods and steps used by
+    the functions propagate() and propagateArrays().
+
+    Signature:
+        None -> None
+
+    Version 1.0.0.0
+    """
+    _STEP_CACHE.clear()
@@ -0,0 +1,524 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.interpolation
+
+Implements the tabulated calibration curves, i.e. the conversion of the raw
+readings into the physical values by the interpolation of a table of the
+measured (x, y) points, where both the table entries and the inputs carry the
+uncertainty. The table is sorted and its segment slopes and monotone cubic
+tangents (together with their sensitivities to the table entries) are
+precomputed once, so a lookup is a vectorized binary search followed by the
+evaluation of the segment polynomial and of its first order uncertainty,
+performed in the memory bounded chunks of the input elements.
+
+Classes:
+    CalibrationTable
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+
+from typing import Union, Optional, Any, Tuple
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray, _toArrays
+
+#types
+
+TResult = Union[MeasuredValue, MeasuredArray]
+
+#globals
+
+INTERPOLATION_METHODS = ('linear', 'monotone') #supported methods
+
+CHUNK_ELEMENTS = 2 ** 16 #max number of the input elements evaluated at once
+
+_STEP = 6.0E-6 #relative step of the tangents sensitivities, ~ cbrt(eps)
+
+#functions
+
+#+ 'private' helper functions
+
+def _tangents(X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+    """
+    Helper function to calculate the tangents of the monotone piecewise cubic
+    Hermite interpolation (Fritsch - Butland weighted harmonic mean at the
+    inner points, shape preserving three-point formula at the end points).
+    Works along the last axis, so a stack of the perturbed tables can be
+    processed in a single call.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    H = np.diff(X, axis = -1)
+    Delta = np.diff(Y, axis = -1) / H
+    Result = np.empty(Y.shape, dtype = np.float64)
+    if Y.shape[-1] == 2:
+        Result[..., 0] = Delta[..., 0]
+        Result[..., 1] = Delta[..., 0]
+        return Result
+    W1 = 2.0 * H[..., 1:] + H[..., :-1]
+    W2 = H[..., 1:] + 2.0 * H[..., :-1]
+    Same = (Delta[..., :-1] * Delta[..., 1:]) > 0
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        Inner = (W1 + W2) / (W1 / Delta[..., :-1] + W2 / Delta[..., 1:])
+    Result[..., 1:-1] = np.where(Same, Inner, 0.0)
+    for Index, First, Second in ((0, 0, 1), (-1, -1, -2)):
+        H0 = H[..., First]
+        H1 = H[..., Second]
+        D0 = Delta[..., First]
+        D1 = Delta[..., Second]
+        Edge = ((2.0 * H0 + H1) * D0 - H0 * D1) / (H0 + H1)
+        Edge = np.where(np.sign(Edge) != np.sign(D0), 0.0, Edge)
+        Overshoot = (np.sign(D0) != np.sign(D1)) & (
+                                                np.abs(Edge) > 3 * np.abs(D0))
+        Result[..., Index] = np.where(Overshoot, 3.0 * D0, Edge)
+    return Result
+
+def _sensitivities(X: np.ndarray, Y: np.ndarray,
+                    Perturbed: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Helper function to calculate the partial derivatives of the monotone cubic
+    tangents with respect to the abscissas or the ordinates of the table by
+    the central differences. Each tangent depends on 3 consecutive points at
+    most, so every third point is perturbed at once, and the whole Jacobian
+    is obtained in 3 passes of 2 vectorized evaluations each.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray, str -> numpy.ndarray, numpy.ndarray
+
+    Args:
+        X: numpy.ndarray; the sorted abscissas of the table
+        Y: numpy.ndarray; the ordinates of the table
+        Perturbed: str; 'X' or 'Y' - the perturbed coordinate
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray): the derivatives of each tangent
+            with respect to the points it depends on, shape (N, 3), and the
+            index of the first of these points per tangent, shape (N, )
+
+    Version 1.0.0.0
+    """
+    Size = X.size
+    Width = min(Size, 3)
+    Offsets = np.clip(np.arange(Size) - 1, 0, Size - Width)
+    Jacobian = np.zeros((Size, 3), dtype = np.float64)
+    Base = X if Perturbed == 'X' else Y
+    if Perturbed == 'X':
+        Step = _STEP * np.diff(X).min()
+    else:
+        Step = _STEP * max(np.abs(Y).max(), np.abs(np.diff(Y)).max())
+    if not (Step > 0):
+        Step = _STEP
+    Tangent = np.arange(Size)
+    for Residue in range(Width):
+        Points = np.arange(Residue, Size, 3)
+        Stack = np.stack([Base, Base])
+        Stack[0, Points] += Step
+        Stack[1, Points] -= Step
+        if Perturbed == 'X':
+            Values = _tangents(Stack, np.broadcast_to(Y, Stack.shape))
+        else:
+            Values = _tangents(np.broadcast_to(X, Stack.shape), Stack)
+        Columns = (Residue - Offsets) % 3
+        Valid = Columns < Width
+        Dependent = Offsets + Columns
+        Dependent[~Valid] = 0
+        Denominator = Stack[0, Dependent] - Stack[1, Dependent]
+        Derivative = (Values[0] - Values[1]) / Denominator
+        Jacobian[Tangent[Valid], Columns[Valid]] = Derivative[Valid]
+    return Jacobian, Offsets
+
+#classes
+
+class CalibrationTable:
+    """
+    Implements the calibration curve as a table of the measured (x, y) points
+    with the vectorized lookup and interpolation of the measurements with
+    uncertainty. The points are sorted by the mean values of the abscissas,
+    which must be distinct, upon instantiation, and the segment slopes, the
+    monotone cubic tangents and their sensitivities to the table entries are
+    precomputed. The segment of each input element is found by the binary
+    search, i.e. O(log N) per element for N points of the table.
+
+    Two interpolation methods are supported, see INTERPOLATION_METHODS:
+        * 'linear' - the piecewise linear interpolation
+        * 'monotone' - the monotone piecewise cubic Hermite interpolation
+            (PCHIP), which is continuous with the first derivative and does
+            not overshoot the monotone data
+
+    The uncertainty of the result is propagated in the first order from the
+    uncertainty of the input (via the slope of the curve) and the independent
+    uncertainties of the abscissas and ordinates of all table points, which
+    affect the interpolated value (2 points for the linear interpolation, up
+    to 4 points for the monotone cubic interpolation). The inputs outside the
+    table range are rejected, unless the extrapolation is enabled, in which
+    case the end segments polynomials are extended.
+
+    Properties:
+        X: (read-only) MeasuredArray; the sorted abscissas of the table
+        Y: (read-only) MeasuredArray; the ordinates of the table
+        Method: (read-only) str; the default interpolation method
+        Extrapolate: (read-only) bool; flag if the extrapolation is enabled
+
+    Methods:
+        interpolate(Data, Method = None):
+            type A /, str OR None/ -> MeasuredValue OR MeasuredArray
+
+    Version 1.0.0.0
+    """
+
+    #'private' helper methods
+
+    def _checkData(self, Data: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Helper 'private' method to convert the input data into the float64
+        arrays of the mean values and the uncertainties and to check that the
+        values are finite and, unless the extrapolation is enabled, within the
+        table range.
+
+        Signature:
+            type A -> numpy.ndarray, numpy.ndarray
+
+        Raises:
+            UT_TypeError: the data is not real number(s) or measurement(s)
+                with uncertainty
+            UT_ValueError: any value is not finite or is outside the table
+                range with the extrapolation disabled
+
+        Version 1.0.0.0
+        """
+        Values, Errors = _toArrays(Data, SkipFrames = 3)
+        Invalid = int(np.count_nonzero(~(np.isfinite(Values)
+                                                    & np.isfinite(Errors))))
+        if Invalid:
+            Error = UT_ValueError(Invalid, '== 0 non-finite values',
+                                                                SkipFrames = 3)
+            Error.setMessage('Non-finite input in {} of {} element(s)'.format(
+                                                        Invalid, Values.size))
+            raise Error
+        if not self._Extrapolate:
+            Outside = int(np.count_nonzero((Values < self._XV[0])
+                                                | (Values > self._XV[-1])))
+            if Outside:
+                Error = UT_ValueError(Outside, '== 0 values outside range',
+                                                                SkipFrames = 3)
+                Error.setMessage(' '.join(['Input outside [{}, {}]'.format(
+                    self._XV[0], self._XV[-1]), 'in {} of {} element(s)'.format(
+                                                        Outside, Values.size)]))
+                raise Error
+        return Values, Errors
+
+    def _linear(self, Values: np.ndarray, Errors: np.ndarray,
+                    Index: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Helper 'private' method to evaluate the linear interpolation and its
+        uncertainty for a chunk of the input elements with the known indexes
+        of the segments.
+
+        Signature:
+            numpy.ndarray, numpy.ndarray, numpy.ndarray
+                -> numpy.ndarray, numpy.ndarray
+
+        Version 1.0.0.0
+        """
+        Slope = self._Slopes[Index]
+        T = (Values - self._XV[Index]) / self._H[Index]
+        U = 1.0 - T
+        Result = self._YV[Index] + Slope * (Values - self._XV[Index])
+        Variance = (Slope * Errors)**2
+        Variance += (U * self._YS[Index])**2 + (T * self._YS[Index + 1])**2
+        Variance += Slope * Slope * ((U * self._XS[Index])**2
+                                                + (T * self._XS[Index + 1])**2)
+        return Result, np.sqrt(Variance)
+
+    def _monotone(self, Values: np.ndarray, Errors: np.ndarray,
+                    Index: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Helper 'private' method to evaluate the monotone cubic interpolation
+        and its uncertainty for a chunk of the input elements with the known
+        indexes of the segments.
+
+        Signature:
+            numpy.ndarray, numpy.ndarray, numpy.ndarray
+                -> numpy.ndarray, numpy.ndarray
+
+        Version 1.0.0.0
+        """
+        H = self._H[Index]
+        T = (Values - self._XV[Index]) / H
+        U = 1.0 - T
+        H00 = (1.0 + 2.0 * T) * U * U
+        H01 = T * T * (3.0 - 2.0 * T)
+        H10 = T * U * U
+        H11 = - T * T * U
+        Y0 = self._YV[Index]
+        Y1 = self._YV[Index + 1]
+        D0 = self._Tangents[Index]
+        D1 = self._Tangents[Index + 1]
+        Tangential = H10 * D0 + H11 * D1
+        Result = H00 * Y0 + H01 * Y1 + H * Tangential
+        Slope = (6.0 * T * U * (Y1 - Y0) / H + (U - 2.0 * T) * U * D0
+                                                    + (3.0 * T - 2.0) * T * D1)
+        Variance = (Slope * Errors)**2
+        First = Index - self._Windows[Index]
+        for Column in range(self._DY0.shape[1]):
+            Direct = np.where(First == Column, H00, 0.0)
+            Direct += np.where(First + 1 == Column, H01, 0.0)
+            Sensitivity = Direct + H * (H10 * self._DY0[Index, Column]
+                                            + H11 * self._DY1[Index, Column])
+            Variance += (Sensitivity * self._SYW[Index, Column])**2
+            Direct = np.where(First == Column, - Slope * U - Tangential, 0.0)
+            Direct += np.where(First + 1 == Column, - Slope * T + Tangential,
+                                                                        0.0)
+            Sensitivity = Direct + H * (H10 * self._DX0[Index, Column]
+                                            + H11 * self._DX1[Index, Column])
+            Variance += (Sensitivity * self._SXW[Index, Column])**2
+        return Result, np.sqrt(Variance)
+
+    #special methods
+
+    def __init__(self, X: Any, Y: Any, Method: str = 'linear',
+                                        Extrapolate: bool = False) -> None:
+        """
+        Initializer. The abscissas and the ordinates of the table can be passed
+        as any 1-D data accepted by the class MeasuredArray (real numbers and /
+        or measurements with uncertainty) of the same length.
+
+        Signature:
+            type A, type B /, str, bool/ -> None
+
+        Args:
+            X: type A; the abscissas (raw readings) of the table points
+            Y: type B; the ordinates (physical values) of the table points
+            Method: (optional) str; the default interpolation method, see
+                INTERPOLATION_METHODS, defaults to 'linear'
+            Extrapolate: (optional) bool; flag if the input outside the table
+                range is extrapolated by the end segments, defaults to False
+
+        Raises:
+            UT_TypeError: the abscissas or the ordinates are not real numbers
+                or measurements with uncertainty, OR the method is not a
+                string, OR the extrapolation flag is not boolean
+            UT_ValueError: the abscissas or the ordinates are not 1-D, OR
+                their lengths differ, OR less than 2 points, OR any value or
+                uncertainty is not finite, OR the abscissas are not distinct,
+                OR unknown method
+
+        Version 1.0.0.0
+        """
+        if not isinstance(Method, str):
+            raise UT_TypeError(Method, str, SkipFrames = 1)
+        if not (Method in INTERPOLATION_METHODS):
+            raise UT_ValueError(Method, 'one of {}'.format(
+                                list(INTERPOLATION_METHODS)), SkipFrames = 1)
+        if not isinstance(Extrapolate, bool):
+            raise UT_TypeError(Extrapolate, bool, SkipFrames = 1)
+        XV, XS = _toArrays(X)
+        YV, YS = _toArrays(Y)
+        for Item, Values in ((X, XV), (Y, YV)):
+            if Values.ndim != 1:
+                raise UT_ValueError(Item, '1-D data', SkipFrames = 1)
+        if XV.size != YV.size:
+            raise UT_ValueError(Y, 'length {}'.format(XV.size), SkipFrames = 1)
+        if XV.size < 2:
+            raise UT_ValueError(X, 'at least 2 points', SkipFrames = 1)
+        for Item, Arrays in ((X, (XV, XS)), (Y, (YV, YS))):
+            if not all(np.all(np.isfinite(Array)) for Array in Arrays):
+                raise UT_ValueError(Item, 'finite values and SE',
+                                                                SkipFrames = 1)
+        Order = np.argsort(XV, kind = 'stable')
+        self._XV, self._XS = XV[Order], XS[Order]
+        self._YV, self._YS = YV[Order], YS[Order]
+        self._H = np.diff(self._XV)
+        if not np.all(self._H > 0):
+            raise UT_ValueError(X, 'distinct values', SkipFrames = 1)
+        self._Method = Method
+        self._Extrapolate = Extrapolate
+        self._Slopes = np.diff(self._YV) / self._H
+        self._Tangents = _tangents(self._XV, self._YV)
+        #+ per segment window of the table points affecting the cubic, and
+        #+ the derivatives of the end tangents of the segment w.r.t. them
+        Size = self._XV.size
+        Width = min(Size, 4)
+        Segments = np.arange(Size - 1)
+        self._Windows = np.clip(Segments - 1, 0, Size - Width)
+        Columns = np.arange(Width)
+        Points = self._Windows[:, np.newaxis] + Columns
+        self._SYW = self._YS[Points]
+        self._SXW = self._XS[Points]
+        for Perturbed in ('Y', 'X'):
+            Jacobian, Offsets = _sensitivities(self._XV, self._YV, Perturbed)
+            Ends = []
+            for Tangent in (Segments, Segments + 1):
+                Shift = (Offsets[Tangent] - self._Windows)[:, np.newaxis]
+                Local = Columns - Shift
+                Inside = (Local >= 0) & (Local < 3)
+                Ends.append(np.where(Inside, np.take_along_axis(
+                    Jacobian[Tangent], np.clip(Local, 0, 2), axis = 1), 0.0))
+            if Perturbed == 'Y':
+                self._DY0, self._DY1 = Ends
+            else:
+                self._DX0, self._DX1 = Ends
+
+    def __len__(self) -> int:
+        """
+        Returns the number of the points of the table.
+
+        Signature:
+            None -> int
+
+        Version 1.0.0.0
+        """
+        return int(self._XV.size)
+
+    def __call__(self, Data: Any, Method: Optional[str] = None) -> TResult:
+        """
+        Shortcut for the method interpolate().
+
+        Signature:
+            type A /, str OR None/ -> MeasuredValue OR MeasuredArray
+
+        Version 1.0.0.0
+        """
+        return self.interpolate(Data, Method = Method)
+
+    #public API
+
+    #+ read-only properties
+
+    @property
+    def X(self) -> MeasuredArray:
+        """
+        Read-only access property to the sorted abscissas of the table.
+
+        Signature:
+            None -> MeasuredArray
+
+        Version 1.0.0.0
+        """
+        return MeasuredArray(self._XV, self._XS)
+
+    @property
+    def Y(self) -> MeasuredArray:
+        """
+        Read-only access property to the ordinates of the table in the order
+        of the sorted abscissas.
+
+        Signature:
+            None -> MeasuredArray
+
+        Version 1.0.0.0
+        """
+        return MeasuredArray(self._YV, self._YS)
+
+    @property
+    def Method(self) -> str:
+        """
+        Read-only access property to the default interpolation method.
+
+        Signature:
+            None -> str
+
+        Version 1.0.0.0
+        """
+        return self._Method
+
+    @property
+    def Extrapolate(self) -> bool:
+        """
+        Read-only access property to the extrapolation flag.
+
+        Signature:
+            None -> bool
+
+        Version 1.0.0.0
+        """
+        return self._Extrapolate
+
+    #+ methods
+
+    def interpolate(self, Data: Any, Method: Optional[str] = None) -> TResult:
+        """
+        Converts the input readings into the calibrated values with the
+        uncertainty propagated from the input and from the table. The input is
+        processed in chunks of CHUNK_ELEMENTS elements.
+
+        Signature:
+            type A /, str OR None/ -> MeasuredValue OR MeasuredArray
+
+        Args:
+            Data: type A; a real number, a measurement with uncertainty, an
+                instance of MeasuredArray or a (nested) sequence or numpy
+                array of real numbers and / or measurements with uncertainty
+            Method: (optional) str; the interpolation method, see
+                INTERPOLATION_METHODS, defaults to None - the default method
+                of the table
+
+        Returns:
+            MeasuredValue: the calibrated value, if the input is a scalar
+            MeasuredArray: the calibrated values of the same shape as the
+                input, otherwise
+
+        Raises:
+            UT_TypeError: the input is not real number(s) or measurement(s)
+                with uncertainty, OR the method is neither a string nor None
+            UT_ValueError: unknown method, OR any input value is not finite,
+                OR any input value is outside the table range with the
+                extrapolation disabled
+
+        Version 1.0.0.0
+        """
+        if Method is None:
+            Method = self._Method
+        elif not isinstance(Method, str):
+            raise UT_TypeError(Method, (str, None), SkipFrames = 1)
+        elif not (Method in INTERPOLATION_METHODS):
+            raise UT_ValueError(Method, 'one of {}'.format(
+                                list(INTERPOLATION_METHODS)), SkipFrames = 1)
+        Values, Errors = self._checkData(Data)
+        Shape = Values.shape
+        Values = Values.reshape(-1)
+        Errors = np.broadcast_to(Errors, Shape).reshape(-1)
+        Kernel = self._linear if Method == 'linear' else self._monotone
+        Result = np.empty(Values.size, dtype = np.float64)
+        Deviation = np.empty(Values.size, dtype = np.float64)
+        Last = self._XV.size - 2
+        for Start in range(0, Values.size, CHUNK_ELEMENTS):
+            Stop = Start + CHUNK_ELEMENTS
+            Chunk = Values[Start : Stop]
+            Index = np.searchsorted(self._XV, Chunk, side = 'right') - 1
+            np.clip(Index, 0, Last, out = Index)
+            Result[Start : Stop], Deviation[Start : Stop] = Kernel(Chunk,
+                                                    Errors[Start : Stop], Index)
+        if not len(Shape):
+            return MeasuredValue(float(Result[0]), float(Deviation[0]))
+        return MeasuredArray(Result.reshape(Shape), Deviation.reshape(Shape))
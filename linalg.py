@@ -0,0 +1,458 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.linalg
+
+Implements the linear algebra operations on the arrays of measurements with
+uncertainty. The mean values are calculated by NumPy (BLAS / LAPACK), whereas
+the uncertainties are propagated by the vectorized products of the squared
+sensitivities, assuming the independence of all elements of the operands (see
+DE001), except for the special case of the same object operands. Optionally,
+the full covariance matrix of the matrix product is calculated.
+
+Functions:
+    dot(Left, Right, Covariance = False)
+        type A, type B /, bool/
+            -> MeasuredArray OR tuple(MeasuredArray, numpy.ndarray)
+    matmul(Left, Right, Covariance = False)
+        type A, type B /, bool/
+            -> MeasuredArray OR tuple(MeasuredArray, numpy.ndarray)
+    solve(Matrix, Vector)
+        type A, type B -> MeasuredArray
+    inv(Matrix)
+        type A -> MeasuredArray
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+
+from typing import Union, Optional, Any, Tuple
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.measured_arrays import MeasuredArray, TOperand
+from phyqus_lib.measured_arrays import DOMAIN_REPORT_LIMIT
+from phyqus_lib.measured_arrays import _toArrays, _isMeasured
+
+#types
+
+TResult = Union[MeasuredArray, Tuple[MeasuredArray, np.ndarray]]
+
+#functions
+
+#+ 'private' helper functions
+
+def _batchEquality(Batch: Tuple[int, ...],
+                            Shape: Tuple[int, ...]) -> np.ndarray:
+    """
+    Helper function to find which elements of the broadcast stack of matrices
+    refer the same matrix of an operand with the stack shape Batch.
+
+    Signature:
+        tuple(int), tuple(int) -> numpy.ndarray(bool)
+
+    Returns:
+        numpy.ndarray(dtype = bool); square matrix, True if the elements of
+            the broadcast stack refer the same matrix of the operand
+
+    Version 1.0.0.0
+    """
+    Indices = np.arange(int(np.prod(Batch))).reshape(Batch)
+    Indices = np.broadcast_to(Indices, Shape).reshape(-1)
+    return Indices[:, None] == Indices[None, :]
+
+def _covariance(V1: np.ndarray, S1: np.ndarray, V2: np.ndarray,
+                            S2: np.ndarray, IsSame: bool) -> np.ndarray:
+    """
+    Helper function to calculate the covariance matrix of the flattened (in C
+    order) result of the matrix product of two stacks of matrices. The terms
+    arising from the uncertainties of each operand are calculated separately;
+    for the same object operands the cross terms are added.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, bool
+            -> numpy.ndarray
+
+    Args:
+        V1: numpy.ndarray; the mean values of the left operand, N-D, N > 1
+        S1: numpy.ndarray; the uncertainties of the left operand
+        V2: numpy.ndarray; the mean values of the right operand, N-D, N > 1
+        S2: numpy.ndarray; the uncertainties of the right operand
+        IsSame: bool; the operands are the same object
+
+    Returns:
+        numpy.ndarray: the covariance matrix, 2-D (square)
+
+    Version 1.0.0.0
+    """
+    Rows, Inner = V1.shape[-2:]
+    Columns = V2.shape[-1]
+    Shape = np.broadcast(np.broadcast_to(0.0, V1.shape[:-2]),
+                                    np.broadcast_to(0.0, V2.shape[:-2])).shape
+    Stack = int(np.prod(Shape))
+    A = np.broadcast_to(V1, Shape + V1.shape[-2:]).reshape(Stack, Rows, Inner)
+    B = np.broadcast_to(V2, Shape + V2.shape[-2:]).reshape(Stack, Inner,
+                                                                    Columns)
+    SA = np.broadcast_to(np.square(S1), Shape + V1.shape[-2:]).reshape(
+                                                        Stack, Rows, Inner)
+    SB = np.broadcast_to(np.square(S2), Shape + V2.shape[-2:]).reshape(
+                                                        Stack, Inner, Columns)
+    Result = np.zeros((Stack, Rows, Columns, Stack, Rows, Columns))
+    RowIndex = np.arange(Rows)
+    ColumnIndex = np.arange(Columns)
+    if np.any(SA):
+        Term = np.einsum('bmj,cml,bim->bcijl', B, B, SA)
+        Term *= _batchEquality(V1.shape[:-2], Shape)[:, :, None, None, None]
+        Result[:, RowIndex, :, :, RowIndex, :] += Term.transpose(2, 0, 3, 1, 4)
+    if np.any(SB):
+        Term = np.einsum('bim,ckm,bmj->bcikj', A, A, SB)
+        Term *= _batchEquality(V2.shape[:-2], Shape)[:, :, None, None, None]
+        Result[:, :, ColumnIndex, :, :, ColumnIndex] += Term.transpose(4, 0, 2,
+                                                                        1, 3)
+    if IsSame and np.any(SA):
+        Term = np.einsum('bil,blj,bki->bijkl', SA, A, A)
+        Term += np.einsum('bkj,bik,bjl->bijkl', SA, A, A)
+        StackIndex = np.arange(Stack)
+        Result[StackIndex, :, :, StackIndex, :, :] += Term
+    Size = Stack * Rows * Columns
+    return Result.reshape(Size, Size)
+
+def _product(Left: Any, Right: Any, Covariance: bool, MaxDim: Optional[int],
+                                                    SkipFrames: int) -> TResult:
+    """
+    Helper function implementing the matrix product of the measurements with
+    uncertainty following the NumPy matmul() rules.
+
+    Signature:
+        type A, type B, bool, int > 0 OR None, int > 0
+            -> MeasuredArray OR tuple(MeasuredArray, numpy.ndarray)
+
+    Raises:
+        UT_TypeError: any operand is neither real number(s) nor measurement(s)
+            with uncertainty, OR the covariance flag is not boolean
+        UT_ValueError: the operands are scalars or have more than MaxDim
+            dimensions (if not None), OR their shapes are not compatible
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Covariance, bool):
+        raise UT_TypeError(Covariance, bool, SkipFrames = SkipFrames)
+    IsSame = Left is Right and _isMeasured(Left)
+    V1, S1 = _toArrays(Left, SkipFrames = SkipFrames + 1)
+    if IsSame:
+        V2, S2 = V1, S1
+    else:
+        V2, S2 = _toArrays(Right, SkipFrames = SkipFrames + 1)
+    for Value in (V1, V2):
+        if not Value.ndim:
+            raise UT_ValueError(Value.shape, 'at least 1 dimension',
+                                                    SkipFrames = SkipFrames)
+        if (MaxDim is not None) and Value.ndim > MaxDim:
+            raise UT_ValueError(Value.shape,
+                            'at most {} dimensions'.format(MaxDim),
+                                                    SkipFrames = SkipFrames)
+    try:
+        Mean = np.matmul(V1, V2)
+    except ValueError:
+        raise UT_ValueError((V1.shape, V2.shape), 'compatible shapes',
+                                        SkipFrames = SkipFrames) from None
+    if IsSame and V1.ndim == 1:
+        Variance = 4 * np.dot(np.square(V1), np.square(S1))
+        if Covariance:
+            return (MeasuredArray(Mean, np.sqrt(Variance)),
+                                                    np.full((1, 1), Variance))
+        return MeasuredArray(Mean, np.sqrt(Variance))
+    Variance = np.zeros(Mean.shape)
+    if np.any(S1):
+        Variance += np.matmul(np.square(S1), np.square(V2))
+    if np.any(S2):
+        Variance += np.matmul(np.square(V1), np.square(S2))
+    if IsSame:
+        Diagonal = np.diagonal(V1, axis1 = -2, axis2 = -1)
+        Variance += (2 * Diagonal[..., :, None] * Diagonal[..., None, :]
+                                                            * np.square(S1))
+    Result = MeasuredArray(Mean, np.sqrt(Variance))
+    if Covariance:
+        if V1.ndim == 1:
+            V1, S1 = V1[None, :], S1[None, :]
+        if V2.ndim == 1:
+            V2, S2 = V2[:, None], S2[:, None]
+        Result = (Result, _covariance(V1, S1, V2, S2, IsSame))
+    return Result
+
+def _checkSquare(Value: np.ndarray, SkipFrames: int) -> None:
+    """
+    Helper function to check that the array is a square matrix or a stack of
+    square matrices.
+
+    Signature:
+        numpy.ndarray, int > 0 -> None
+
+    Raises:
+        UT_ValueError: the array is not a (stack of) square matrix
+
+    Version 1.0.0.0
+    """
+    if Value.ndim < 2 or Value.shape[-1] != Value.shape[-2]:
+        raise UT_ValueError(Value.shape, 'square matrix (stack)',
+                                                    SkipFrames = SkipFrames + 1)
+
+def _findSingular(Matrix: np.ndarray, SkipFrames: int) -> None:
+    """
+    Helper function to find the singular matrices in the stack, when the
+    factorization of the whole stack has failed, and to raise an exception
+    listing their indices.
+
+    Signature:
+        numpy.ndarray, int > 0 -> None
+
+    Raises:
+        UT_ValueError: always
+
+    Version 1.0.0.0
+    """
+    Stack = Matrix.reshape((-1, ) + Matrix.shape[-2:])
+    Singular = list()
+    for Index in range(Stack.shape[0]):
+        try:
+            np.linalg.inv(Stack[Index])
+        except np.linalg.LinAlgError:
+            Singular.append(np.unravel_index(Index, Matrix.shape[:-2]))
+    Error = UT_ValueError(len(Singular), '== 0 singular matrices',
+                                                SkipFrames = SkipFrames + 1)
+    if Matrix.ndim > 2:
+        Items = [str(tuple(int(Item) for Item in Index))
+                                    for Index in Singular[:DOMAIN_REPORT_LIMIT]]
+        Error.setMessage('Singular matrix in {} of {} stack element(s): {}'
+                    .format(len(Singular), Stack.shape[0], ', '.join(Items)))
+    else:
+        Error.setMessage('Singular matrix')
+    raise Error
+
+#+ public API
+
+def dot(Left: TOperand, Right: TOperand, Covariance: bool = False) -> TResult:
+    """
+    Calculates the dot product of two vectors, the product of a matrix and a
+    vector or of two matrices, when any operand or both may be measurements
+    with uncertainty. All elements of the operands are assumed to be
+    independent, except for the special case of the same object operands.
+
+    Signature:
+        type A, type B /, bool/
+            -> MeasuredArray OR tuple(MeasuredArray, numpy.ndarray)
+
+    Args:
+        Left: type A; 1-D or 2-D array of real numbers or measurements with
+            uncertainty in any form accepted by MeasuredArray
+        Right: type B; 1-D or 2-D array, as the left operand
+        Covariance: (optional) bool; if True, the covariance matrix of the
+            result is also returned, defaults to False
+
+    Returns:
+        MeasuredArray: the product, 0-D for two vectors, if Covariance is False
+        tuple(MeasuredArray, numpy.ndarray): the product and the covariance
+            matrix of the flattened (C order) product, if Covariance is True
+
+    Raises:
+        UT_TypeError: any operand is neither real number(s) nor measurement(s)
+            with uncertainty, OR the covariance flag is not boolean
+        UT_ValueError: any operand is not 1-D or 2-D array, OR the shapes are
+            not aligned
+
+    Version 1.0.0.0
+    """
+    return _product(Left, Right, Covariance, 2, 3)
+
+def matmul(Left: TOperand, Right: TOperand,
+                                        Covariance: bool = False) -> TResult:
+    """
+    Calculates the matrix product of two arrays, when any operand or both may
+    be measurements with uncertainty, following the NumPy matmul() rules, i.e.
+    N-D arrays are treated as stacks of matrices residing in the last two
+    dimensions, and 1-D arrays are promoted to a matrix. All elements of the
+    operands are assumed to be independent, except for the special case of the
+    same object operands.
+
+    Signature:
+        type A, type B /, bool/
+            -> MeasuredArray OR tuple(MeasuredArray, numpy.ndarray)
+
+    Args:
+        Left: type A; N-D array of real numbers or measurements with
+            uncertainty in any form accepted by MeasuredArray, N > 0
+        Right: type B; N-D array, as the left operand
+        Covariance: (optional) bool; if True, the covariance matrix of the
+            result is also returned, defaults to False
+
+    Returns:
+        MeasuredArray: the product, if Covariance is False
+        tuple(MeasuredArray, numpy.ndarray): the product and the covariance
+            matrix of the flattened (C order) product, if Covariance is True
+
+    Raises:
+        UT_TypeError: any operand is neither real number(s) nor measurement(s)
+            with uncertainty, OR the covariance flag is not boolean
+        UT_ValueError: any operand is a scalar, OR the shapes are not
+            compatible
+
+    Version 1.0.0.0
+    """
+    return _product(Left, Right, Covariance, None, 3)
+
+def solve(Matrix: TOperand, Vector: TOperand) -> MeasuredArray:
+    """
+    Solves the linear system (or a stack of systems) A x = b, when the matrix
+    A or the right-hand side b or both are measurements with uncertainty. The
+    solution and the inverse matrix are found together using a single LU
+    factorization, and the first order uncertainty is propagated analytically
+    using the derivative of the inverse matrix, assuming the independence of
+    all elements of A and b:
+
+    Var(x) = (inv(A) ** 2) @ (SE(b) ** 2 + (SE(A) ** 2) @ (x ** 2))
+
+    The right-hand side is treated as a (stack of) vector(s), if it is 1-D or
+    it has one dimension less than the matrix, otherwise as a (stack of)
+    matrix with the columns being the independent right-hand sides. The stacks
+    are broadcast following the NumPy rules; a single matrix is factorized
+    once for all right-hand sides of a stack.
+
+    Signature:
+        type A, type B -> MeasuredArray
+
+    Args:
+        Matrix: type A; N-D array (N > 1) of real numbers or measurements with
+            uncertainty in any form accepted by MeasuredArray; a square matrix
+            or a stack of square matrices in the last two dimensions
+        Vector: type B; the right-hand side(s), as the matrix; a vector, a
+            matrix or a stack of them
+
+    Returns:
+        MeasuredArray: the solution, the same shape as the (broadcast)
+            right-hand side
+
+    Raises:
+        UT_TypeError: any operand is neither real numbers nor measurements
+            with uncertainty
+        UT_ValueError: the matrix is not square or a stack of square matrices,
+            OR the shapes are not compatible, OR any matrix is singular
+
+    Version 1.0.0.0
+    """
+    IsSame = Matrix is Vector and _isMeasured(Matrix)
+    V1, S1 = _toArrays(Matrix, SkipFrames = 2)
+    _checkSquare(V1, 1)
+    if IsSame:
+        V2, S2 = V1, S1
+    else:
+        V2, S2 = _toArrays(Vector, SkipFrames = 2)
+    IsVector = V2.ndim in (1, V1.ndim - 1)
+    if IsVector:
+        V2, S2 = V2[..., None], S2[..., None]
+    Size = V1.shape[-1]
+    if V2.ndim < 2 or V2.shape[-2] != Size:
+        raise UT_ValueError((V1.shape, V2.shape), 'compatible shapes',
+                                                                SkipFrames = 1)
+    try:
+        Shape = np.broadcast(np.broadcast_to(0.0, V1.shape[:-2]),
+                                    np.broadcast_to(0.0, V2.shape[:-2])).shape
+    except ValueError:
+        raise UT_ValueError((V1.shape, V2.shape), 'compatible shapes',
+                                                    SkipFrames = 1) from None
+    Columns = V2.shape[-1]
+    try:
+        if V1.ndim == 2:
+            Stack = int(np.prod(Shape))
+            Right = np.moveaxis(np.broadcast_to(V2, Shape + (Size, Columns)
+                        ).reshape(Stack, Size, Columns), 0, 1).reshape(Size, -1)
+            Solution = np.linalg.solve(V1, np.concatenate([Right,
+                                                np.eye(Size)], axis = -1))
+            Inverse = Solution[:, -Size:]
+            Mean = np.moveaxis(Solution[:, :-Size].reshape(Size, Stack,
+                    Columns), 1, 0).reshape(Shape + (Size, Columns))
+        else:
+            Right = np.concatenate([
+                            np.broadcast_to(V2, Shape + (Size, Columns)),
+                            np.broadcast_to(np.eye(Size), Shape + (Size, Size))
+                                                                ], axis = -1)
+            Solution = np.linalg.solve(np.broadcast_to(V1,
+                                            Shape + (Size, Size)), Right)
+            Inverse = Solution[..., Columns:]
+            Mean = Solution[..., :Columns]
+    except np.linalg.LinAlgError:
+        _findSingular(V1, 1)
+    if IsSame:
+        Variance = np.zeros(Mean.shape)
+    else:
+        Weights = np.zeros(Mean.shape)
+        if np.any(S2):
+            Weights = Weights + np.square(S2)
+        if np.any(S1):
+            Weights = Weights + np.matmul(np.square(S1), np.square(Mean))
+        Variance = np.matmul(np.square(Inverse), Weights)
+    if IsVector:
+        Mean, Variance = Mean[..., 0], Variance[..., 0]
+    return MeasuredArray(Mean, np.sqrt(Variance))
+
+def inv(Matrix: TOperand) -> MeasuredArray:
+    """
+    Calculates the inverse of a square matrix (or a stack of matrices) of the
+    measurements with uncertainty. The first order uncertainty is propagated
+    analytically using the derivative of the inverse matrix, assuming the
+    independence of all elements:
+
+    Var(inv(A)) = (inv(A) ** 2) @ (SE(A) ** 2) @ (inv(A) ** 2)
+
+    Signature:
+        type A -> MeasuredArray
+
+    Args:
+        Matrix: type A; N-D array (N > 1) of real numbers or measurements with
+            uncertainty in any form accepted by MeasuredArray; a square matrix
+            or a stack of square matrices in the last two dimensions
+
+    Returns:
+        MeasuredArray: the inverse matrix (stack), the same shape as the input
+
+    Raises:
+        UT_TypeError: the argument is neither real numbers nor measurements
+            with uncertainty
+        UT_ValueError: the argument is not square matrix or a stack of square
+            matrices, OR any matrix is singular
+
+    Version 1.0.0.0
+    """
+    Value, Error = _toArrays(Matrix, SkipFrames = 2)
+    _checkSquare(Value, 1)
+    try:
+        Mean = np.linalg.inv(Value)
+    except np.linalg.LinAlgError:
+        _findSingular(Value, 1)
+    Squared = np.square(Mean)
+    if np.any(Error):
+        Variance = np.matmul(np.matmul(Squared, np.square(Error)), Squared)
+    else:
+        Variance = np.zeros(Mean.shape)
+    return MeasuredArray(Mean, np.sqrt(Variance))
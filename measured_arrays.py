@@ -0,0 +1,1538 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.measured_arrays
+
+Implements the array container for the measurements with uncertainty, i.e.
+paired arrays of the mean values and of the associated uncertainties, with the
+vectorized arithmetics following the same standard error propagation rules as
+the scalar class MeasuredValue. The container supports several storage modes
+with reduced precision of the stored data in order to save memory, whereas all
+calculations are performed in double precision (float64).
+
+Classes:
+    MeasuredArray
+
+Functions:
+    asMeasuredArray(Data)
+        type A -> MeasuredArray
+    divide(Left, Right, Raise = False)
+        type A, type B /, bool/
+            -> MeasuredArray, numpy.ndarray(bool), numpy.ndarray(uint8)
+    power(Base, Exponent, Raise = False)
+        type A, type B /, bool/
+            -> MeasuredArray, numpy.ndarray(bool), numpy.ndarray(uint8)
+"""
+
+__version__= '1.1.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+
+from typing import Union, Optional, Any, Tuple, List
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.base_classes import MeasuredValue, MeasuredValueABC
+
+#types
+
+TReal = Union[int, float]
+
+TOperand = Union[TReal, MeasuredValueABC, 'MeasuredArray', np.ndarray]
+
+#globals
+
+#+ storage modes: name -> (values dtype, uncertainties dtype)
+
+STORAGE_MODES = {
+    'float64' : (np.float64, np.float64),
+    'float32' : (np.float32, np.float32),
+    'relative16' : (np.float32, np.float16),
+    'coded8' : (np.float32, np.uint8)
+}
+
+#+ coded relative uncertainty: code 0 is zero SE, codes 1..254 are the
+#+ logarithmically spaced levels from CODED_MIN to CODED_MAX, code 255 is NaN
+
+CODED_MIN = 1.0E-6
+
+CODED_MAX = 10.0
+
+_CODED_STEP = np.log(CODED_MAX / CODED_MIN) / 253
+
+_CODED_TABLE = np.empty(256, dtype = np.float64)
+_CODED_TABLE[0] = 0.0
+_CODED_TABLE[1:255] = CODED_MIN * np.exp(_CODED_STEP * np.arange(254))
+_CODED_TABLE[255] = np.nan
+
+#+ upper limits of the relative uncertainty storage, defining the floor of the
+#+ denominator of the relative uncertainty
+
+_RELATIVE_MAX = {
+    'relative16' : 32768.0,
+    'coded8' : CODED_MAX
+}
+
+#+ domain error codes of the division, exponentiation and of the elementary
+#+ functions (see module functions)
+
+DOMAIN_OK = 0
+
+DOMAIN_ZERO_DIVIDER = 1
+
+DOMAIN_NEGATIVE_BASE = 2
+
+DOMAIN_ZERO_BASE = 3
+
+DOMAIN_NONPOSITIVE_BASE = 4
+
+DOMAIN_NEGATIVE_ARGUMENT = 5
+
+DOMAIN_NONPOSITIVE_ARGUMENT = 6
+
+DOMAIN_OUT_OF_RANGE = 7
+
+DOMAIN_ZERO_ARGUMENTS = 8
+
+DOMAIN_ERRORS = {
+    DOMAIN_OK : 'valid',
+    DOMAIN_ZERO_DIVIDER : 'division by zero',
+    DOMAIN_NEGATIVE_BASE : 'negative base with non-integer exponent',
+    DOMAIN_ZERO_BASE : 'zero base with negative exponent',
+    DOMAIN_NONPOSITIVE_BASE : 'non-positive base with measured exponent',
+    DOMAIN_NEGATIVE_ARGUMENT : 'negative argument',
+    DOMAIN_NONPOSITIVE_ARGUMENT : 'non-positive argument',
+    DOMAIN_OUT_OF_RANGE : 'argument out of the function domain',
+    DOMAIN_ZERO_ARGUMENTS : 'both arguments are zero'
+}
+
+#+ max number of the offending elements listed in the exception message
+
+DOMAIN_REPORT_LIMIT = 20
+
+#+ NumPy universal functions dispatched onto the arithmetic methods of the
+#+ class MeasuredArray: ufunc -> (method, reflected method)
+
+_UFUNC_OPERATORS = {
+    np.add : ('__add__', '__radd__'),
+    np.subtract : ('__sub__', '__rsub__'),
+    np.multiply : ('__mul__', '__rmul__'),
+    np.true_divide : ('__truediv__', '__rtruediv__'),
+    np.power : ('__pow__', '__rpow__'),
+    np.matmul : ('__matmul__', '__rmatmul__'),
+    np.negative : ('__neg__', None),
+    np.positive : ('__pos__', None)
+}
+
+#functions
+
+#+ 'private' helper functions - encoding / decoding of the storage
+
+def _encode(Values: np.ndarray, Errors: np.ndarray,
+            Storage: str) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Helper function to convert the double precision values and uncertainties
+    into the raw storage format.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray, str
+            -> numpy.ndarray, numpy.ndarray, float
+
+    Args:
+        Values: numpy.ndarray(dtype = float64); the mean values
+        Errors: numpy.ndarray(dtype = float64); the uncertainties, same shape
+        Storage: str; one of the keys of STORAGE_MODES
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, float); the stored values, the
+            stored (absolute, relative or coded) uncertainties and the floor of
+            the denominator of the relative uncertainties (zero for the modes
+            with absolute uncertainties)
+
+    Raises:
+        UT_ValueError: finite value or uncertainty cannot be represented in
+            the reduced precision storage (overflow)
+
+    Version 1.0.0.0
+    """
+    ValuesType, ErrorsType = STORAGE_MODES[Storage]
+    with np.errstate(over = 'ignore', invalid = 'ignore', divide = 'ignore'):
+        RawValues = np.asarray(Values, dtype = ValuesType, order = 'C')
+        if ValuesType is not np.float64:
+            if np.any(np.isinf(RawValues) & np.isfinite(Values)):
+                raise UT_ValueError(Storage, 'values within float32 range',
+                                                                SkipFrames = 2)
+        Floor = 0.0
+        if Storage == 'float64':
+            RawErrors = np.asarray(Errors, dtype = np.float64, order = 'C')
+        elif Storage == 'float32':
+            RawErrors = np.asarray(Errors, dtype = np.float32, order = 'C')
+            if np.any(np.isinf(RawErrors) & np.isfinite(Errors)):
+                raise UT_ValueError(Storage, 'SE within float32 range',
+                                                                SkipFrames = 2)
+        else:
+            Finite = Errors[np.isfinite(Errors)]
+            if Finite.size:
+                Floor = float(Finite.max()) / _RELATIVE_MAX[Storage]
+            Denominator = np.fmax(np.abs(RawValues.astype(np.float64)), Floor)
+            Relative = np.where(Errors == 0, 0.0, Errors / Denominator)
+            if Storage == 'relative16':
+                RawErrors = np.asarray(Relative, dtype = np.float16,
+                                                                order = 'C')
+            else:
+                Codes = np.rint(np.log(Relative / CODED_MIN) / _CODED_STEP) + 1
+                Codes = np.clip(Codes, 1, 254)
+                Codes[Relative < 0.5 * CODED_MIN] = 0
+                Codes[np.isnan(Relative) | np.isinf(Relative)] = 255
+                RawErrors = np.asarray(Codes, dtype = np.uint8,
+                                                                order = 'C')
+    return RawValues, RawErrors, Floor
+
+def _decode(RawValues: np.ndarray, RawErrors: np.ndarray, Storage: str,
+                                Floor: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Helper function to convert the raw storage into the double precision
+    values and uncertainties. The passed arrays may be any slices of the
+    stored data.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray, str, float
+            -> numpy.ndarray, numpy.ndarray
+
+    Args:
+        RawValues: numpy.ndarray; the stored values
+        RawErrors: numpy.ndarray; the stored uncertainties, same shape
+        Storage: str; one of the keys of STORAGE_MODES
+        Floor: float >= 0; the floor of the denominator of the relative
+            uncertainties
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray); the mean values and the absolute
+            uncertainties as float64 arrays
+
+    Version 1.0.0.0
+    """
+    Values = RawValues.astype(np.float64, copy = False)
+    if Storage in ('float64', 'float32'):
+        Errors = RawErrors.astype(np.float64, copy = False)
+    else:
+        if Storage == 'relative16':
+            Relative = RawErrors.astype(np.float64)
+        else:
+            Relative = _CODED_TABLE[RawErrors]
+        Errors = Relative * np.fmax(np.abs(Values), Floor)
+    return Values, Errors
+
+def _toArrays(Data: Any, SkipFrames: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Helper function to convert the input data into a pair of float64 arrays of
+    the mean values and the uncertainties.
+
+    Signature:
+        type A /, int/ -> numpy.ndarray, numpy.ndarray
+
+    Args:
+        Data: type A; a real number, a measurement with uncertainty (as 'HAS A'
+            Value and SE attributes), an instance of MeasuredArray, or a
+            (nested) sequence or numpy array of real numbers and / or
+            measurements with uncertainty
+        SkipFrames: (optional) int >= 0; number of the innermost frames to hide
+            in the traceback of the raised exception, defaults to 2
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray); the mean values and the absolute
+            uncertainties as float64 arrays of the same shape
+
+    Raises:
+        UT_TypeError: data is neither real number(s) nor measurement(s) with
+            uncertainty
+
+    Version 1.0.0.0
+    """
+    if isinstance(Data, MeasuredArray):
+        return Data.Value, Data.SE
+    if isinstance(Data, (int, float, np.integer, np.floating)):
+        if isinstance(Data, (bool, np.bool_)):
+            raise UT_TypeError(Data, (int, float, MeasuredValueABC,
+                                    MeasuredArray), SkipFrames = SkipFrames)
+        return np.array(Data, dtype = np.float64), np.zeros(())
+    if hasattr(Data, 'Value') and hasattr(Data, 'SE'):
+        Cond1 = isinstance(Data.Value, (int, float))
+        Cond2 = isinstance(Data.SE, (int, float)) and not (Data.SE < 0)
+        if not (Cond1 and Cond2):
+            raise UT_TypeError(Data, (int, float, MeasuredValueABC,
+                                    MeasuredArray), SkipFrames = SkipFrames)
+        return (np.array(Data.Value, dtype = np.float64),
+                                    np.array(Data.SE, dtype = np.float64))
+    if isinstance(Data, (str, bytes, dict, set)):
+        raise UT_TypeError(Data, (int, float, MeasuredValueABC, MeasuredArray),
+                                                        SkipFrames = SkipFrames)
+    try:
+        Array = np.asarray(Data)
+    except (ValueError, TypeError):
+        raise UT_TypeError(Data, (int, float, MeasuredValueABC, MeasuredArray),
+                                        SkipFrames = SkipFrames) from None
+    if Array.dtype.kind in 'iuf':
+        return Array.astype(np.float64), np.zeros(Array.shape)
+    if Array.dtype.kind != 'O' or not Array.size:
+        raise UT_TypeError(Data, (int, float, MeasuredValueABC, MeasuredArray),
+                                                        SkipFrames = SkipFrames)
+    Values = np.empty(Array.shape, dtype = np.float64)
+    Errors = np.zeros(Array.shape, dtype = np.float64)
+    for Index, Item in np.ndenumerate(Array):
+        if isinstance(Item, (int, float)) and not isinstance(Item, bool):
+            Values[Index] = Item
+        elif hasattr(Item, 'Value') and hasattr(Item, 'SE'):
+            Cond1 = isinstance(Item.Value, (int, float))
+            Cond2 = isinstance(Item.SE, (int, float)) and not (Item.SE < 0)
+            if not (Cond1 and Cond2):
+                raise UT_TypeError(Item, (int, float, MeasuredValueABC),
+                                                        SkipFrames = SkipFrames)
+            Values[Index] = Item.Value
+            Errors[Index] = Item.SE
+        else:
+            raise UT_TypeError(Item, (int, float, MeasuredValueABC),
+                                                        SkipFrames = SkipFrames)
+    return Values, Errors
+
+#+ 'private' arithmetic kernels on float64 arrays; (V, S) pairs are the mean
+#+ values and the uncertainties, K - plain real exponent
+
+def _add(V1: np.ndarray, S1: np.ndarray, V2: np.ndarray,
+                            S2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Addition kernel of two independent measurements.
+
+    Version 1.0.0.0
+    """
+    return V1 + V2, np.hypot(S1, S2)
+
+def _sub(V1: np.ndarray, S1: np.ndarray, V2: np.ndarray,
+                            S2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Subtraction kernel of two independent measurements.
+
+    Version 1.0.0.0
+    """
+    return V1 - V2, np.hypot(S1, S2)
+
+def _mul(V1: np.ndarray, S1: np.ndarray, V2: np.ndarray,
+                            S2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Multiplication kernel of two independent measurements.
+
+    Version 1.0.0.0
+    """
+    return V1 * V2, np.hypot(S1 * V2, S2 * V1)
+
+def _div(V1: np.ndarray, S1: np.ndarray, V2: np.ndarray,
+                            S2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Division kernel of two independent measurements. The divider must not be
+    zero.
+
+    Version 1.0.0.0
+    """
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        Mean = V1 / V2
+        SE = np.hypot(S1 / V2, S2 * Mean / V2)
+    return Mean, SE
+
+def _pow(V1: np.ndarray, S1: np.ndarray, V2: np.ndarray,
+                            S2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exponentiation kernel of two independent measurements. The base must be
+    positive.
+
+    Version 1.0.0.0
+    """
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        Mean = np.power(V1, V2)
+        SE = np.abs(Mean) * np.hypot(V2 * S1 / V1, S2 * np.log(V1))
+    return Mean, SE
+
+def _powReal(V: np.ndarray, S: np.ndarray,
+                            K: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exponentiation kernel of a measurement into a plain real power, including
+    the special cases of zero exponent and zero base.
+
+    Version 1.0.0.0
+    """
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        Mean = np.power(V, K)
+        SE = np.where(V != 0, S * np.abs(K * Mean / V), np.power(S, K))
+        Mean = np.where(K == 0, 1.0, Mean)
+        SE = np.where(K == 0, 0.0, SE)
+    return Mean, SE
+
+#+ special cases - the second operand is the same object
+
+def _addSame(V: np.ndarray, S: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Addition kernel of a measurement to itself.
+
+    Version 1.0.0.0
+    """
+    return 2 * V, 2 * S
+
+def _subSame(V: np.ndarray, S: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Subtraction kernel of a measurement from itself.
+
+    Version 1.0.0.0
+    """
+    return np.zeros_like(V), np.zeros_like(S)
+
+def _mulSame(V: np.ndarray, S: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Multiplication kernel of a measurement by itself.
+
+    Version 1.0.0.0
+    """
+    return V * V, 2 * S * np.abs(V)
+
+def _divSame(V: np.ndarray, S: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Division kernel of a measurement by itself.
+
+    Version 1.0.0.0
+    """
+    return np.ones_like(V), np.zeros_like(S)
+
+def _powSame(V: np.ndarray, S: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exponentiation kernel of a measurement into itself. The base must be
+    positive.
+
+    Version 1.0.0.0
+    """
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        Mean = np.power(V, V)
+        SE = S * np.abs(Mean * (1 + np.log(V)))
+    return Mean, SE
+
+#+ 'private' domain checks of division and exponentiation
+
+def _isMeasured(Data: Any) -> bool:
+    """
+    Helper function to determine if the operand is a measurement (or an array
+    of measurements) with uncertainty or plain real number(s).
+
+    Version 1.0.0.0
+    """
+    Result = (isinstance(Data, MeasuredArray)
+                or (hasattr(Data, 'Value') and hasattr(Data, 'SE'))
+                or (isinstance(Data, (list, tuple, np.ndarray))
+                                    and np.asarray(Data).dtype.kind == 'O'))
+    return Result
+
+def _isInteger(Data: Any) -> bool:
+    """
+    Helper function to determine if the plain real exponent is an integer
+    (int type or integer dtype array).
+
+    Version 1.0.0.0
+    """
+    Result = (isinstance(Data, (int, np.integer))
+                or (isinstance(Data, (list, tuple, np.ndarray))
+                                    and np.asarray(Data).dtype.kind in 'iu'))
+    return Result
+
+def _powCodes(V1: np.ndarray, V2: np.ndarray, IsMeasured: bool,
+                                            IsInteger: bool) -> np.ndarray:
+    """
+    Helper function to calculate the domain error codes of the exponentiation
+    of the base(s) V1 into the exponent(s) V2, following the same rules as for
+    the MeasuredValue class.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray, bool, bool -> numpy.ndarray
+
+    Args:
+        V1: numpy.ndarray; the mean values of the base(s)
+        V2: numpy.ndarray; the mean values of the exponent(s)
+        IsMeasured: bool; True if the exponent is a measurement (with
+            uncertainty)
+        IsInteger: bool; True if the plain real exponent is of integer type
+
+    Returns:
+        numpy.ndarray(dtype = int); the error codes, broadcast shape
+
+    Version 1.0.0.0
+    """
+    if IsMeasured:
+        Codes = np.where(V1 <= 0, DOMAIN_NONPOSITIVE_BASE, DOMAIN_OK)
+    else:
+        Codes = np.where((V1 == 0) & (V2 < 0), DOMAIN_ZERO_BASE, DOMAIN_OK)
+        if not IsInteger:
+            Codes = np.where((V1 < 0) & (V2 != 0), DOMAIN_NEGATIVE_BASE,
+                                                                        Codes)
+    return Codes
+
+def _divide(Left: Any, Right: Any,
+        SkipFrames: int = 3) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Helper function to perform the element-wise division with the domain
+    check of each element, without raising on the domain violation.
+
+    Signature:
+        type A, type B /, int/ -> numpy.ndarray, numpy.ndarray, numpy.ndarray
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray); the values and the
+            uncertainties (float64) of the result and the domain error codes
+            (uint8) of the same shape
+
+    Raises:
+        UT_TypeError: any operand is neither real number(s) nor measurement(s)
+            with uncertainty
+
+    Version 1.0.0.0
+    """
+    if Left is Right and _isMeasured(Left):
+        V1, S1 = _toArrays(Left, SkipFrames = SkipFrames)
+        Mean, SE = _divSame(V1, S1)
+        Codes = np.zeros(Mean.shape, dtype = np.uint8)
+    else:
+        V1, S1 = _toArrays(Left, SkipFrames = SkipFrames)
+        V2, S2 = _toArrays(Right, SkipFrames = SkipFrames)
+        Mean, SE = _div(V1, S1, V2, S2)
+        Codes = np.where(V2 == 0, DOMAIN_ZERO_DIVIDER, DOMAIN_OK)
+    Codes = np.broadcast_to(Codes, Mean.shape).astype(np.uint8)
+    return Mean, SE, Codes
+
+def _power(Base: Any, Exponent: Any,
+        SkipFrames: int = 3) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Helper function to perform the element-wise exponentiation with the domain
+    check of each element, without raising on the domain violation.
+
+    Signature:
+        type A, type B /, int/ -> numpy.ndarray, numpy.ndarray, numpy.ndarray
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray); the values and the
+            uncertainties (float64) of the result and the domain error codes
+            (uint8) of the same shape
+
+    Raises:
+        UT_TypeError: any operand is neither real number(s) nor measurement(s)
+            with uncertainty
+
+    Version 1.0.0.0
+    """
+    V1, S1 = _toArrays(Base, SkipFrames = SkipFrames)
+    if Base is Exponent and _isMeasured(Base):
+        Mean, SE = _powSame(V1, S1)
+        Codes = _powCodes(V1, V1, True, False)
+    else:
+        V2, S2 = _toArrays(Exponent, SkipFrames = SkipFrames)
+        IsMeasured = _isMeasured(Exponent)
+        if IsMeasured:
+            Mean, SE = _pow(V1, S1, V2, S2)
+        else:
+            Mean, SE = _powReal(V1, S1, V2)
+        Codes = _powCodes(V1, V2, IsMeasured, _isInteger(Exponent))
+    Codes = np.broadcast_to(Codes, Mean.shape).astype(np.uint8)
+    return Mean, SE, Codes
+
+def _raiseDomainError(Codes: np.ndarray, SkipFrames: int = 2) -> None:
+    """
+    Helper function to raise a single UT_ValueError exception listing the
+    indices (up to DOMAIN_REPORT_LIMIT) and the reasons of all domain
+    violations.
+
+    Signature:
+        numpy.ndarray /, int/ -> None
+
+    Raises:
+        UT_ValueError: always
+
+    Version 1.0.0.0
+    """
+    Indices = np.argwhere(Codes)
+    Items = ['{} - {}'.format(tuple(Index.tolist()),
+                                    DOMAIN_ERRORS[int(Codes[tuple(Index)])])
+                                for Index in Indices[:DOMAIN_REPORT_LIMIT]]
+    if len(Indices) > DOMAIN_REPORT_LIMIT:
+        Items.append('and {} more'.format(len(Indices) - DOMAIN_REPORT_LIMIT))
+    Error = UT_ValueError(len(Indices), '== 0 domain violations',
+                                                    SkipFrames = SkipFrames)
+    Error.setMessage('Domain violation in {} of {} element(s): {}'.format(
+                                len(Indices), Codes.size, '; '.join(Items)))
+    raise Error
+
+#+ public API
+
+def divide(Left: TOperand, Right: TOperand, Raise: bool = False
+                    ) -> Tuple['MeasuredArray', np.ndarray, np.ndarray]:
+    """
+    Performs the element-wise division of the measurements with uncertainty
+    and / or real numbers, checking the domain of all elements at once. The
+    invalid elements of the result are filled with NaN (both value and SE).
+
+    Signature:
+        type A, type B /, bool/
+            -> MeasuredArray, numpy.ndarray(bool), numpy.ndarray(uint8)
+
+    Args:
+        Left: type A; the dividend(s) as real number(s) or measurement(s) with
+            uncertainty in any form accepted by MeasuredArray
+        Right: type B; the divider(s), as the dividend(s)
+        Raise: (optional) bool; if True a single exception listing all invalid
+            elements is raised, defaults to False
+
+    Returns:
+        tuple(MeasuredArray, numpy.ndarray, numpy.ndarray); the result, the
+            validity mask (True for the valid elements) and the domain error
+            codes (DOMAIN_OK for the valid elements) of the same shape
+
+    Raises:
+        UT_TypeError: any operand is neither real number(s) nor measurement(s)
+            with uncertainty
+        UT_ValueError: any of the dividers is zero, and Raise flag is True
+
+    Version 1.0.0.0
+    """
+    Mean, SE, Codes = _divide(Left, Right)
+    Mask = Codes == DOMAIN_OK
+    if Raise and not Mask.all():
+        _raiseDomainError(Codes)
+    Result = MeasuredArray(np.where(Mask, Mean, np.nan),
+                                                np.where(Mask, SE, np.nan))
+    return Result, Mask, Codes
+
+def power(Base: TOperand, Exponent: TOperand, Raise: bool = False
+                    ) -> Tuple['MeasuredArray', np.ndarray, np.ndarray]:
+    """
+    Performs the element-wise exponentiation of the measurements with
+    uncertainty and / or real numbers, checking the domain of all elements at
+    once. The same limitations are applied as for the MeasuredValue class. The
+    invalid elements of the result are filled with NaN (both value and SE).
+
+    Signature:
+        type A, type B /, bool/
+            -> MeasuredArray, numpy.ndarray(bool), numpy.ndarray(uint8)
+
+    Args:
+        Base: type A; the base(s) as real number(s) or measurement(s) with
+            uncertainty in any form accepted by MeasuredArray
+        Exponent: type B; the exponent(s), as the base(s); a plain real
+            exponent of int type or integer dtype allows negative bases
+        Raise: (optional) bool; if True a single exception listing all invalid
+            elements is raised, defaults to False
+
+    Returns:
+        tuple(MeasuredArray, numpy.ndarray, numpy.ndarray); the result, the
+            validity mask (True for the valid elements) and the domain error
+            codes (DOMAIN_OK for the valid elements) of the same shape
+
+    Raises:
+        UT_TypeError: any operand is neither real number(s) nor measurement(s)
+            with uncertainty
+        UT_ValueError: any of the elements violates the domain, and Raise flag
+            is True
+
+    Version 1.0.0.0
+    """
+    Mean, SE, Codes = _power(Base, Exponent)
+    Mask = Codes == DOMAIN_OK
+    if Raise and not Mask.all():
+        _raiseDomainError(Codes)
+    Result = MeasuredArray(np.where(Mask, Mean, np.nan),
+                                                np.where(Mask, SE, np.nan))
+    return Result, Mask, Codes
+
+def asMeasuredArray(Data: Any) -> 'MeasuredArray':
+    """
+    Converts the input data into an instance of MeasuredArray, unless it is
+    already an instance of this class, in which case it is returned as it is.
+
+    Signature:
+        type A -> MeasuredArray
+
+    Args:
+        Data: type A; a real number, a measurement with uncertainty, an
+            instance of MeasuredArray, or a (nested) sequence or numpy array of
+            real numbers and / or measurements with uncertainty
+
+    Returns:
+        MeasuredArray: the converted data
+
+    Raises:
+        UT_TypeError: data is neither real number(s) nor measurement(s) with
+            uncertainty
+
+    Version 1.0.0.0
+    """
+    if isinstance(Data, MeasuredArray):
+        Result = Data
+    else:
+        Values, Errors = _toArrays(Data)
+        Result = MeasuredArray(Values, Errors)
+    return Result
+
+#classes
+
+class MeasuredArray:
+    """
+    Implements the array container of the measurements with uncertainty as
+    two arrays of the same shape: the mean values and the uncertainties.
+    Supports indexing and slicing (a single element is returned as an instance
+    of MeasuredValue), iteration and the vectorized arithmetics (addition,
+    subtraction, multiplication, division and exponentiation, including the
+    augmented assignments) with real numbers, numpy arrays of real numbers,
+    measurements with uncertainty and other instances of this class, following
+    the standard error propagation model. NumPy broadcasting rules apply.
+    The NumPy universal functions of the arithmetic operations and of the
+    elementary functions registered in the module phyqus_lib.functions are
+    dispatched onto this class.
+
+    The data can be stored with the reduced precision, see STORAGE_MODES:
+        * 'float64' - the values and the uncertainties as float64 (16 bytes
+            per element)
+        * 'float32' - the values and the uncertainties as float32 (8 bytes per
+            element)
+        * 'relative16' - the values as float32 and the relative uncertainties
+            as float16 (6 bytes per element)
+        * 'coded8' - the values as float32 and the relative uncertainties
+            coded logarithmically into uint8 (5 bytes per element)
+
+    The stored data is always converted into float64 upon access, and the
+    arithmetics is performed in float64; the results are stored as 'float64'.
+    The storage errors are bound by (D = max(|Value|, Floor), where Floor is
+    the largest finite SE in the array divided by 32768 for 'relative16' and
+    by CODED_MAX for 'coded8'):
+        * 'float32' - relative error of the values and SE <= 2^-24
+        * 'relative16' - relative error of the values <= 2^-24, absolute error
+            of SE <= 2^-11 * SE + 2^-25 * D
+        * 'coded8' - relative error of the values <= 2^-24, absolute error of
+            SE <= 0.033 * SE + CODED_MIN * D; non-finite SE is stored as NaN
+
+    Avoids ZeroDivisionError by checking operands and raising UT_ValueError
+    instead. Note that this data type does not support comparison operations.
+
+    Properties:
+        Value: (read-only) numpy.ndarray(dtype = float64); the mean values
+        SE: (read-only) numpy.ndarray(dtype = float64); the uncertainties
+        Storage: (read-only) str; the storage mode
+        shape: (read-only) tuple(int >= 0); the shape of the array
+        ndim: (read-only) int >= 0; the number of dimensions
+        size: (read-only) int >= 0; the total number of elements
+        nbytes: (read-only) int >= 0; the memory used by the stored data
+
+    Methods:
+        astype(Storage):
+            str -> MeasuredArray
+        reshape(*Shape):
+            int(s) OR tuple(int) -> MeasuredArray
+        toList():
+            None -> MeasuredValue OR list(MeasuredValue OR list(...))
+
+    Version 1.1.0.0
+    """
+
+    #'private' helper methods
+
+    @classmethod
+    def _fromStorage(cls, RawValues: np.ndarray, RawErrors: np.ndarray,
+                                Storage: str, Floor: float) -> 'MeasuredArray':
+        """
+        Helper 'private' class method to create an instance directly from the
+        raw stored data, bypassing the encoding and the input checks.
+
+        Signature:
+            numpy.ndarray, numpy.ndarray, str, float -> MeasuredArray
+
+        Version 1.0.0.0
+        """
+        Result = cls.__new__(cls)
+        Result._Values = np.asarray(RawValues, order = 'C')
+        Result._Errors = np.asarray(RawErrors, order = 'C')
+        Result._Storage = Storage
+        Result._Floor = Floor
+        return Result
+
+    def _setData(self, Values: np.ndarray, Errors: np.ndarray) -> None:
+        """
+        Helper 'private' method to encode and store the float64 values and
+        uncertainties using the storage mode of the instance.
+
+        Signature:
+            numpy.ndarray, numpy.ndarray -> None
+
+        Version 1.0.0.0
+        """
+        Values, Errors = np.broadcast_arrays(Values, Errors)
+        self._Values, self._Errors, self._Floor = _encode(Values, Errors,
+                                                                self._Storage)
+
+    def _decodeFlat(self, Start: int,
+                            Stop: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Helper 'private' method to decode a contiguous range of the elements
+        of the flattened array (in C order) into float64 arrays.
+
+        Signature:
+            int, int -> numpy.ndarray, numpy.ndarray
+
+        Version 1.0.0.0
+        """
+        return _decode(self._Values.reshape(-1)[Start : Stop],
+                        self._Errors.reshape(-1)[Start : Stop], self._Storage,
+                        self._Floor)
+
+    #special methods
+
+    def __init__(self, Value: Any, SE: Optional[Any] = None,
+                                        Storage: str = 'float64') -> None:
+        """
+        Initializer. The mean values can be passed as a single real number, a
+        measurement with uncertainty, another instance of this class or a
+        (nested) sequence or numpy array of real numbers and / or measurements
+        with uncertainty. The uncertainties are taken from the first argument
+        (zero for the plain real numbers), unless the second argument is
+        provided, which should be a non-negative real number or an array of
+        them broadcastable to the shape of the values.
+
+        Signature:
+            type A /, type B, str/ -> None
+
+        Args:
+            Value: type A; the mean values with the optional uncertainties
+            SE: (optional) type B; the uncertainties, if provided (not None),
+                overwrite the values assigned based on the first argument
+            Storage: (optional) str; the storage mode, see STORAGE_MODES,
+                defaults to 'float64'
+
+        Raises:
+            UT_TypeError: the first argument is not real number(s) or
+                measurement(s) with uncertainty, OR the second argument is not
+                real number(s) or None, OR storage mode is not a string
+            UT_ValueError: any of the uncertainties is negative, OR the values
+                and uncertainties shapes are incompatible, OR unknown storage
+                mode, OR the values do not fit into the storage
+
+        Version 1.0.0.0
+        """
+        if not isinstance(Storage, str):
+            raise UT_TypeError(Storage, str, SkipFrames = 1)
+        if not (Storage in STORAGE_MODES):
+            raise UT_ValueError(Storage, 'one of {}'.format(
+                                    list(STORAGE_MODES.keys())), SkipFrames = 1)
+        self._Storage = Storage
+        Values, Errors = _toArrays(Value)
+        if not (SE is None):
+            Cond1 = isinstance(SE, (bool, np.bool_, str, bytes))
+            try:
+                Errors = np.asarray(SE)
+                Cond2 = not (Errors.dtype.kind in 'iuf')
+            except (ValueError, TypeError):
+                Cond2 = True
+            if Cond1 or Cond2:
+                raise UT_TypeError(SE, (int, float, np.ndarray, None),
+                                                                SkipFrames = 1)
+            Errors = Errors.astype(np.float64)
+        if np.any(Errors < 0):
+            raise UT_ValueError(SE, '>= 0', SkipFrames = 1)
+        try:
+            Values, Errors = np.broadcast_arrays(Values, Errors)
+        except ValueError:
+            raise UT_ValueError(SE, 'broadcastable to shape {}'.format(
+                                    Values.shape), SkipFrames = 1) from None
+        self._Values, self._Errors, self._Floor = _encode(Values, Errors,
+                                                                    Storage)
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the stored data with each element
+        as (Value +/- SE) or just Value, if SE is zero.
+
+        Signature:
+            None -> str
+
+        Version 1.0.0.0
+        """
+        Values, Errors = _decode(self._Values, self._Errors, self._Storage,
+                                                                    self._Floor)
+        Strings = np.empty(Values.shape, dtype = object)
+        for Index, Item in np.ndenumerate(Values):
+            Strings[Index] = str(MeasuredValue(float(Item),
+                                                        float(Errors[Index])))
+        return np.array2string(Strings, separator = ', ',
+                                            formatter = {'object' : str})
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the stored data as
+        'MeasuredArray(Values,SEs)'.
+
+        Signature:
+            None -> str
+
+        Version 1.0.0.0
+        """
+        Values, Errors = _decode(self._Values, self._Errors, self._Storage,
+                                                                    self._Floor)
+        return "'{}({},{})'".format(self.__class__.__name__,
+                                np.array2string(Values, separator = ', '),
+                                np.array2string(Errors, separator = ', '))
+
+    def __len__(self) -> int:
+        """
+        Returns the length of the first dimension of the array.
+
+        Signature:
+            None -> int >= 0
+
+        Version 1.0.0.0
+        """
+        return len(self._Values)
+
+    def __getitem__(self, Key: Any) -> Union[MeasuredValue, 'MeasuredArray']:
+        """
+        Implements the indexing and slicing with the standard NumPy rules. A
+        single element is returned as an instance of MeasuredValue, otherwise
+        an instance of MeasuredArray with the same storage mode is returned.
+
+        Signature:
+            type A -> MeasuredValue OR MeasuredArray
+
+        Version 1.0.0.0
+        """
+        RawValues = self._Values[Key]
+        RawErrors = self._Errors[Key]
+        if np.ndim(RawValues):
+            Result = MeasuredArray._fromStorage(RawValues, RawErrors,
+                                                    self._Storage, self._Floor)
+        else:
+            Values, Errors = _decode(np.asarray(RawValues),
+                            np.asarray(RawErrors), self._Storage, self._Floor)
+            Result = MeasuredValue(float(Values), float(Errors))
+        return Result
+
+    def __iter__(self):
+        """
+        Iterates over the first dimension of the array.
+
+        Signature:
+            None -> generator(MeasuredValue OR MeasuredArray)
+
+        Version 1.0.0.0
+        """
+        for Index in range(len(self)):
+            yield self[Index]
+
+    def __pos__(self) -> 'MeasuredArray':
+        """
+        Implements an unitary plus operation, returns a copy of itself.
+
+        Signature:
+            None -> MeasuredArray
+
+        Version 1.0.0.0
+        """
+        return MeasuredArray._fromStorage(self._Values.copy(),
+                            self._Errors.copy(), self._Storage, self._Floor)
+
+    def __neg__(self) -> 'MeasuredArray':
+        """
+        Implements an unitary minus, i.e. negation operation.
+
+        Signature:
+            None -> MeasuredArray
+
+        Version 1.0.0.0
+        """
+        return MeasuredArray(- self.Value, self.SE)
+
+    def __add__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the addition operation with the current instance being the
+        left operand.
+
+        Signature:
+            int OR float OR MeasuredValue OR MeasuredArray OR array-like
+                -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+
+        Version 1.0.0.0
+        """
+        if Other is self:
+            Mean, SE = _addSame(self.Value, self.SE)
+        else:
+            V2, S2 = _toArrays(Other)
+            Mean, SE = _add(self.Value, self.SE, V2, S2)
+        return MeasuredArray(Mean, SE)
+
+    def __radd__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the addition operation with the current instance being the
+        right operand.
+
+        Signature:
+            int OR float OR array-like -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+
+        Version 1.0.0.0
+        """
+        V2, S2 = _toArrays(Other)
+        Mean, SE = _add(V2, S2, self.Value, self.SE)
+        return MeasuredArray(Mean, SE)
+
+    def __iadd__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the augmented addition assignment to current instance. The
+        storage mode is preserved.
+
+        Signature:
+            int OR float OR MeasuredValue OR MeasuredArray OR array-like
+                -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+
+        Version 1.0.0.0
+        """
+        if Other is self:
+            Mean, SE = _addSame(self.Value, self.SE)
+        else:
+            V2, S2 = _toArrays(Other)
+            Mean, SE = _add(self.Value, self.SE, V2, S2)
+        self._setData(Mean, SE)
+        return self
+
+    def __sub__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the subtraction operation with the current instance being
+        the left operand.
+
+        Signature:
+            int OR float OR MeasuredValue OR MeasuredArray OR array-like
+                -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+
+        Version 1.0.0.0
+        """
+        if Other is self:
+            Mean, SE = _subSame(self.Value, self.SE)
+        else:
+            V2, S2 = _toArrays(Other)
+            Mean, SE = _sub(self.Value, self.SE, V2, S2)
+        return MeasuredArray(Mean, SE)
+
+    def __rsub__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the subtraction operation with the current instance being
+        the right operand.
+
+        Signature:
+            int OR float OR array-like -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+
+        Version 1.0.0.0
+        """
+        V2, S2 = _toArrays(Other)
+        Mean, SE = _sub(V2, S2, self.Value, self.SE)
+        return MeasuredArray(Mean, SE)
+
+    def __isub__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the augmented subtraction assignment to current instance.
+        The storage mode is preserved.
+
+        Signature:
+            int OR float OR MeasuredValue OR MeasuredArray OR array-like
+                -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+
+        Version 1.0.0.0
+        """
+        if Other is self:
+            Mean, SE = _subSame(self.Value, self.SE)
+        else:
+            V2, S2 = _toArrays(Other)
+            Mean, SE = _sub(self.Value, self.SE, V2, S2)
+        self._setData(Mean, SE)
+        return self
+
+    def __mul__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the multiplication operation with the current instance being
+        the left operand.
+
+        Signature:
+            int OR float OR MeasuredValue OR MeasuredArray OR array-like
+                -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+
+        Version 1.0.0.0
+        """
+        if Other is self:
+            Mean, SE = _mulSame(self.Value, self.SE)
+        else:
+            V2, S2 = _toArrays(Other)
+            Mean, SE = _mul(self.Value, self.SE, V2, S2)
+        return MeasuredArray(Mean, SE)
+
+    def __rmul__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the multiplication operation with the current instance being
+        the right operand.
+
+        Signature:
+            int OR float OR array-like -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+
+        Version 1.0.0.0
+        """
+        V2, S2 = _toArrays(Other)
+        Mean, SE = _mul(V2, S2, self.Value, self.SE)
+        return MeasuredArray(Mean, SE)
+
+    def __imul__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the augmented multiplication assignment to current instance.
+        The storage mode is preserved.
+
+        Signature:
+            int OR float OR MeasuredValue OR MeasuredArray OR array-like
+                -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+
+        Version 1.0.0.0
+        """
+        if Other is self:
+            Mean, SE = _mulSame(self.Value, self.SE)
+        else:
+            V2, S2 = _toArrays(Other)
+            Mean, SE = _mul(self.Value, self.SE, V2, S2)
+        self._setData(Mean, SE)
+        return self
+
+    def __truediv__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the division operation with the current instance being the
+        left operand.
+
+        Signature:
+            int OR float OR MeasuredValue OR MeasuredArray OR array-like
+                -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+            UT_ValueError: any of the dividers is zero or has zero mean value,
+                all offending elements are listed
+
+        Version 1.1.0.0
+        """
+        Mean, SE, Codes = _divide(self, Other)
+        if np.any(Codes):
+            _raiseDomainError(Codes)
+        return MeasuredArray(Mean, SE)
+
+    def __rtruediv__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the division operation with the current instance being the
+        right operand.
+
+        Signature:
+            int OR float OR array-like -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+            UT_ValueError: any of the stored mean values is zero, all offending
+                elements are listed
+
+        Version 1.1.0.0
+        """
+        Mean, SE, Codes = _divide(Other, self)
+        if np.any(Codes):
+            _raiseDomainError(Codes)
+        return MeasuredArray(Mean, SE)
+
+    def __itruediv__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the augmented division assignment to current instance. The
+        storage mode is preserved.
+
+        Signature:
+            int OR float OR MeasuredValue OR MeasuredArray OR array-like
+                -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+            UT_ValueError: any of the dividers is zero or has zero mean value,
+                all offending elements are listed
+
+        Version 1.1.0.0
+        """
+        Mean, SE, Codes = _divide(self, Other)
+        if np.any(Codes):
+            _raiseDomainError(Codes)
+        self._setData(Mean, SE)
+        return self
+
+    def __pow__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the power operation with the current instance being the left
+        operand. The same limitations on the base and the exponent are applied
+        as in the case of the MeasuredValue class, element-wise.
+
+        Signature:
+            int OR float OR MeasuredValue OR MeasuredArray OR array-like
+                -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+            UT_ValueError: raising negative mean to a fractional, not integer
+                power or to value with uncertainty; raising zero mean to
+                negative power or to value with uncertainty; all offending
+                elements are listed
+
+        Version 1.1.0.0
+        """
+        Mean, SE, Codes = _power(self, Other)
+        if np.any(Codes):
+            _raiseDomainError(Codes)
+        return MeasuredArray(Mean, SE)
+
+    def __rpow__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the power operation with the current instance being the
+        right operand.
+
+        Signature:
+            int OR float OR array-like -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+            UT_ValueError: the argument (left operand) is not positive, all
+                offending elements are listed
+
+        Version 1.1.0.0
+        """
+        Mean, SE, Codes = _power(Other, self)
+        if np.any(Codes):
+            _raiseDomainError(Codes)
+        return MeasuredArray(Mean, SE)
+
+    def __ipow__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the augmented power assignment to current instance. The
+        storage mode is preserved.
+
+        Signature:
+            int OR float OR MeasuredValue OR MeasuredArray OR array-like
+                -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real number(s) nor
+                measurement(s) with uncertainty
+            UT_ValueError: raising negative mean to a fractional, not integer
+                power or to value with uncertainty; raising zero mean to
+                negative power or to value with uncertainty; all offending
+                elements are listed
+
+        Version 1.1.0.0
+        """
+        Mean, SE, Codes = _power(self, Other)
+        if np.any(Codes):
+            _raiseDomainError(Codes)
+        self._setData(Mean, SE)
+        return self
+
+    def __matmul__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the matrix product with the current instance being the left
+        operand, see the function phyqus_lib.linalg.matmul().
+
+        Signature:
+            MeasuredValue OR MeasuredArray OR array-like -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real numbers nor
+                measurements with uncertainty
+            UT_ValueError: any operand is a scalar, OR the shapes are not
+                compatible
+
+        Version 1.0.0.0
+        """
+        from phyqus_lib.linalg import matmul
+
+        return matmul(self, Other)
+
+    def __rmatmul__(self, Other: TOperand) -> 'MeasuredArray':
+        """
+        Implements the matrix product with the current instance being the
+        right operand, see the function phyqus_lib.linalg.matmul().
+
+        Signature:
+            array-like -> MeasuredArray
+
+        Raises:
+            UT_TypeError: the passed argument is neither real numbers nor
+                measurements with uncertainty
+            UT_ValueError: any operand is a scalar, OR the shapes are not
+                compatible
+
+        Version 1.0.0.0
+        """
+        from phyqus_lib.linalg import matmul
+
+        return matmul(Other, self)
+
+    def __array_ufunc__(self, UFunc: np.ufunc, Method: str, *Inputs: Any,
+                                                        **Kwargs: Any) -> Any:
+        """
+        Implements the NumPy universal functions dispatch. The arithmetic
+        ufuncs (add, subtract, multiply, true_divide, power, matmul, negative
+        and positive) are performed by the respective (reflected) arithmetic
+        methods, thus the operators of NumPy arrays and scalars with an
+        instance of this class as the right operand are supported. The ufuncs
+        registered in the module phyqus_lib.functions (e.g. numpy.sin or
+        numpy.hypot) are performed by the respective functions of that module.
+        Any other ufunc, method (e.g. reduce) or keyword argument (e.g. out)
+        is not supported.
+
+        Signature:
+            numpy.ufunc, str, type A/, type B, .../ /, **kwargs/
+                -> MeasuredArray OR type NotImplemented
+
+        Raises:
+            UT_TypeError: any operand is neither real numbers nor measurements
+                with uncertainty
+            UT_ValueError: the shapes are not compatible, OR any element
+                violates the domain of the operation or function
+
+        Version 1.0.0.0
+        """
+        if Method != '__call__' or Kwargs:
+            return NotImplemented
+        if UFunc in _UFUNC_OPERATORS:
+            Direct, Reflected = _UFUNC_OPERATORS[UFunc]
+            if len(Inputs) == 1:
+                Result = getattr(self, Direct)()
+            elif Inputs[0] is self:
+                Result = getattr(self, Direct)(Inputs[1])
+            elif isinstance(Inputs[0], MeasuredArray):
+                Result = getattr(Inputs[0], Direct)(Inputs[1])
+            else:
+                Result = getattr(self, Reflected)(Inputs[0])
+            return Result
+        from phyqus_lib.functions import UFUNC_TABLE, _evaluate
+
+        if UFunc in UFUNC_TABLE:
+            return _evaluate(UFUNC_TABLE[UFunc], *Inputs)
+        return NotImplemented
+
+    #public API
+
+    #+ read-only properties
+
+    @property
+    def Value(self) -> np.ndarray:
+        """
+        Read-only access property to the stored mean values, converted into
+        float64.
+
+        Signature:
+            None -> numpy.ndarray(dtype = float64)
+
+        Version 1.0.0.0
+        """
+        Values = self._Values.astype(np.float64)
+        return Values
+
+    @property
+    def SE(self) -> np.ndarray:
+        """
+        Read-only access property to the stored uncertainties, converted into
+        float64 absolute uncertainties.
+
+        Signature:
+            None -> numpy.ndarray(dtype = float64)
+
+        Version 1.0.0.0
+        """
+        _, Errors = _decode(self._Values, self._Errors, self._Storage,
+                                                                    self._Floor)
+        return np.array(Errors, dtype = np.float64)
+
+    @property
+    def Storage(self) -> str:
+        """
+        Read-only access property to the storage mode.
+
+        Signature:
+            None -> str
+
+        Version 1.0.0.0
+        """
+        return self._Storage
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """
+        Read-only access property to the shape of the array.
+
+        Signature:
+            None -> tuple(int >= 0)
+
+        Version 1.0.0.0
+        """
+        return self._Values.shape
+
+    @property
+    def ndim(self) -> int:
+        """
+        Read-only access property to the number of dimensions of the array.
+
+        Signature:
+            None -> int >= 0
+
+        Version 1.0.0.0
+        """
+        return self._Values.ndim
+
+    @property
+    def size(self) -> int:
+        """
+        Read-only access property to the total number of elements.
+
+        Signature:
+            None -> int >= 0
+
+        Version 1.0.0.0
+        """
+        return self._Values.size
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Read-only access property to the memory (in bytes) used by the stored
+        values and uncertainties.
+
+        Signature:
+            None -> int >= 0
+
+        Version 1.0.0.0
+        """
+        return self._Values.nbytes + self._Errors.nbytes
+
+    #+ methods
+
+    def astype(self, Storage: str) -> 'MeasuredArray':
+        """
+        Creates a copy of the array with the requested storage mode.
+
+        Signature:
+            str -> MeasuredArray
+
+        Args:
+            Storage: str; the storage mode, see STORAGE_MODES
+
+        Returns:
+            MeasuredArray: the converted copy
+
+        Raises:
+            UT_TypeError: storage mode is not a string
+            UT_ValueError: unknown storage mode, OR the values do not fit into
+                the storage
+
+        Version 1.0.0.0
+        """
+        return MeasuredArray(self.Value, self.SE, Storage = Storage)
+
+    def reshape(self, *Shape: Union[int, Tuple[int, ...]]) -> 'MeasuredArray':
+        """
+        Creates a copy of the array with the changed shape and the same storage
+        mode.
+
+        Signature:
+            int(s) OR tuple(int) -> MeasuredArray
+
+        Raises:
+            UT_ValueError: the shape is incompatible with the array size
+
+        Version 1.0.0.0
+        """
+        if len(Shape) == 1 and isinstance(Shape[0], (tuple, list)):
+            Shape = tuple(Shape[0])
+        try:
+            RawValues = self._Values.reshape(Shape)
+        except (ValueError, TypeError):
+            raise UT_ValueError(Shape, 'compatible with size {}'.format(
+                                        self.size), SkipFrames = 1) from None
+        return MeasuredArray._fromStorage(RawValues.copy(),
+                                self._Errors.reshape(Shape).copy(),
+                                self._Storage, self._Floor)
+
+    def toList(self) -> Union[MeasuredValue, List[Any]]:
+        """
+        Converts the array into a (nested) list of MeasuredValue instances, or
+        a single instance in the case of a 0-dimensional array.
+
+        Signature:
+            None -> MeasuredValue OR list(MeasuredValue OR list(...))
+
+        Version 1.0.0.0
+        """
+        Values, Errors = _decode(self._Values, self._Errors, self._Storage,
+                                                                    self._Floor)
+        Result = np.empty(Values.shape, dtype = object)
+        for Index, Item in np.ndenumerate(Values):
+            Result[Index] = MeasuredValue(float(Item), float(Errors[Index]))
+        return Result.tolist()
@@ -0,0 +1,1028 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.monte_carlo
+
+Implements the Monte Carlo propagation of the uncertainty through the
+arbitrary vectorized functions of the measurements with uncertainty, which
+validates (or replaces) the first order propagation (see DE001) for the
+strongly nonlinear functions. The samples of each argument are drawn as NumPy
+arrays (normal distribution by default, other distributions and correlated
+normal arguments are supported), and the function is evaluated in the memory
+bounded chunks of samples, which are reduced into the mean, the standard
+deviation and, optionally, the quantiles by the streaming accumulators. The
+chunks can be distributed between the worker processes; each chunk has its
+own random seed spawned from a single numpy.random.SeedSequence, so the
+results are reproducible. The adaptive propagation uses the first order
+approximation and falls back to the Monte Carlo method only for the elements
+with the large nonlinearity indicator. The bootstrap derives the measurements
+with uncertainty from the raw samples using the same chunked and parallel
+evaluation of the blocks of resamples.
+
+Functions:
+    monteCarlo(Function, *Args, Samples = DEFAULT_SAMPLES,
+                Distributions = None, Correlation = None, Quantiles = None,
+                Seed = None, ChunkSize = None, Workers = 1)
+        callable, type A/, type B, .../ /, int, seq(str OR callable) OR None,
+            array OR None, seq(float) OR None, int OR SeedSequence OR None,
+                int OR None, int/
+                    -> MeasuredValue OR MeasuredArray
+                    OR tuple(MeasuredValue OR MeasuredArray, numpy.ndarray)
+    nonlinearity(Function, *Args)
+        callable, type A/, type B, .../ -> float OR numpy.ndarray
+    propagateAdaptive(Function, *Args, Threshold = NONLINEARITY_THRESHOLD,
+                        Samples = DEFAULT_SAMPLES, Seed = None,
+                        ChunkSize = None, Workers = 1, Mask = False)
+        callable, type A/, type B, .../ /, int OR float, int,
+            int OR SeedSequence OR None, int OR None, int, bool/
+                -> MeasuredValue OR MeasuredArray
+                OR tuple(MeasuredValue OR MeasuredArray, numpy.ndarray)
+    bootstrap(Statistic, *Samples, Resamples = DEFAULT_RESAMPLES,
+                Paired = False, Quantiles = None, Seed = None,
+                BlockSize = None, Workers = 1)
+        callable, array/, array, .../ /, int, bool, seq(float) OR None,
+            int OR SeedSequence OR None, int OR None, int/
+                -> MeasuredValue OR MeasuredArray
+                OR tuple(MeasuredValue OR MeasuredArray, numpy.ndarray)
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+import math
+import pickle
+
+from concurrent.futures import ProcessPoolExecutor
+
+from collections.abc import Callable
+
+from typing import Union, Optional, Any, Tuple, Sequence, List
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray, _toArrays
+
+from phyqus_lib.functions import propagateArrays
+from phyqus_lib.functions import _groupArguments, _stackedCall
+
+#types
+
+TResult = Union[MeasuredValue, MeasuredArray]
+
+#+ streaming statistics of a chunk or a range of chunks: number of samples,
+#+ mean, sum of the squared deviations from the mean, histogram counts (or
+#+ None) and the number of the non-finite function values
+
+TStatistics = Tuple[int, np.ndarray, np.ndarray, Optional[np.ndarray], int]
+
+#globals
+
+DEFAULT_SAMPLES = 100000 #default number of samples
+
+DEFAULT_RESAMPLES = 2000 #default number of the bootstrap resamples
+
+CHUNK_ELEMENTS = 2 ** 20 #max number of the elements of a chunk per argument
+
+QUANTILE_BINS = 1024 #number of the histogram bins of the quantiles estimation
+
+QUANTILE_MARGIN = 0.5 #histogram range extension, fraction of the pilot
+                      #samples range on each side
+
+QUANTILE_PILOT = 1000 #min number of the pilot samples defining the histogram
+                      #range, independently of the chunk size
+
+QUANTILE_MAX_COUNTS = 2 ** 25 #max number of the histogram counts (all
+                              #elements), i.e. 256 MiB of int64
+
+NONLINEARITY_THRESHOLD = 0.1 #max nonlinearity indicator of the linear
+                             #propagation in the adaptive mode
+
+#+ distributions with zero mean and unit variance: name -> sampler
+
+_SQRT3 = math.sqrt(3.0)
+
+_SQRT6 = math.sqrt(6.0)
+
+DISTRIBUTIONS = {
+    'normal' : lambda Generator, Size: Generator.standard_normal(Size),
+    'uniform' : lambda Generator, Size: Generator.uniform(-_SQRT3, _SQRT3,
+                                                                        Size),
+    'triangular' : lambda Generator, Size: Generator.triangular(-_SQRT6, 0.0,
+                                                                _SQRT6, Size)
+}
+
+#functions
+
+#+ 'private' helper functions
+
+def _broadcastArguments(Args: Sequence[Any], SkipFrames: int = 3
+        ) -> Tuple[Tuple[int, ...], List[np.ndarray], List[np.ndarray]]:
+    """
+    Helper function to convert the arguments into the float64 arrays of the
+    mean values and the uncertainties broadcast to the common shape.
+
+    Signature:
+        seq(type A) /, int/
+            -> tuple(int), list(numpy.ndarray), list(numpy.ndarray)
+
+    Raises:
+        UT_TypeError: any argument is neither real number(s) nor
+            measurement(s) with uncertainty
+        UT_ValueError: the shapes of the arguments are not compatible
+
+    Version 1.0.0.0
+    """
+    Pairs = [_toArrays(Arg, SkipFrames = SkipFrames) for Arg in Args]
+    try:
+        Shape = np.broadcast(*[Value for Value, _ in Pairs]).shape
+    except ValueError:
+        raise UT_ValueError(tuple(Value.shape for Value, _ in Pairs),
+                    'compatible shapes', SkipFrames = SkipFrames - 1) from None
+    Values = [np.broadcast_to(Value, Shape) for Value, _ in Pairs]
+    Errors = [np.broadcast_to(Error, Shape) for _, Error in Pairs]
+    return Shape, Values, Errors
+
+def _checkCorrelation(Correlation: Any, Size: int) -> np.ndarray:
+    """
+    Helper function to check the correlation matrix of the arguments and to
+    convert it into a float64 array.
+
+    Signature:
+        type A, int -> numpy.ndarray
+
+    Raises:
+        UT_TypeError: the matrix is not an array of real numbers
+        UT_ValueError: the matrix is not square of the proper size, OR it is
+            not symmetric, OR the diagonal elements are not 1, OR any element
+            is outside [-1, 1]
+
+    Version 1.0.0.0
+    """
+    if isinstance(Correlation, (str, bytes, dict, set, MeasuredArray)):
+        raise UT_TypeError(Correlation, (list, tuple, np.ndarray),
+                                                                SkipFrames = 2)
+    try:
+        Matrix = np.asarray(Correlation)
+    except (ValueError, TypeError):
+        raise UT_TypeError(Correlation, (list, tuple, np.ndarray),
+                                                    SkipFrames = 2) from None
+    if Matrix.dtype.kind not in 'iuf':
+        raise UT_TypeError(Correlation, (list, tuple, np.ndarray),
+                                                                SkipFrames = 2)
+    Matrix = Matrix.astype(np.float64)
+    if Matrix.shape != (Size, Size):
+        raise UT_ValueError(Matrix.shape, '({0}, {0}) shape'.format(Size),
+                                                                SkipFrames = 2)
+    if not np.all(np.abs(Matrix) <= 1):
+        raise UT_ValueError(Correlation, 'elements in [-1, 1]', SkipFrames = 2)
+    if not np.all(np.diagonal(Matrix) == 1):
+        raise UT_ValueError(Correlation, 'unit diagonal', SkipFrames = 2)
+    if not np.allclose(Matrix, Matrix.T, rtol = 0, atol = 1E-12):
+        raise UT_ValueError(Correlation, 'symmetric matrix', SkipFrames = 2)
+    return Matrix
+
+def _drawSamples(Generator: np.random.Generator, Size: Tuple[int, ...],
+                    Samplers: Sequence[Any],
+                    Cholesky: Optional[np.ndarray]) -> List[np.ndarray]:
+    """
+    Helper function to draw the standardized (zero mean, unit variance)
+    deviates of each group of the arguments. The correlated deviates are
+    obtained from the independent standard normal deviates by the Cholesky
+    factor of the correlation matrix.
+
+    Signature:
+        numpy.random.Generator, tuple(int), seq(str OR callable OR None),
+            numpy.ndarray OR None -> list(numpy.ndarray OR None)
+
+    Version 1.0.0.0
+    """
+    if Cholesky is not None:
+        Deviates = Generator.standard_normal((len(Samplers), ) + Size)
+        return list(np.tensordot(Cholesky, Deviates, axes = 1))
+    Result = list()
+    for Sampler in Samplers:
+        if Sampler is None:
+            Result.append(None)
+        else:
+            if isinstance(Sampler, str):
+                Sampler = DISTRIBUTIONS[Sampler]
+            Result.append(np.asarray(Sampler(Generator, Size),
+                                                        dtype = np.float64))
+    return Result
+
+def _evaluateChunk(Function: Callable, Values: Sequence[np.ndarray],
+                    Errors: Sequence[np.ndarray],
+                    Groups: Sequence[Sequence[int]], Samplers: Sequence[Any],
+                    Cholesky: Optional[np.ndarray], Count: int,
+                    Seed: np.random.SeedSequence) -> np.ndarray:
+    """
+    Helper function to draw a chunk of samples of all arguments and to
+    evaluate the function on them. The arguments of the same group share the
+    same deviates, the arguments without uncertainty are broadcast (views).
+
+    Signature:
+        callable, seq(numpy.ndarray), seq(numpy.ndarray), seq(seq(int)),
+            seq(str OR callable OR None), numpy.ndarray OR None, int,
+                numpy.random.SeedSequence -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Shape = Values[0].shape
+    Generator = np.random.default_rng(Seed)
+    Deviates = _drawSamples(Generator, (Count, ) + Shape, Samplers, Cholesky)
+    Arguments = [np.broadcast_to(Value, (Count, ) + Shape) for Value in Values]
+    for Group, Deviate in zip(Groups, Deviates):
+        if Deviate is not None:
+            for Index in Group:
+                Arguments[Index] = Values[Index] + Errors[Index] * Deviate
+    with np.errstate(all = 'ignore'):
+        Result = np.asarray(Function(*Arguments))
+    return Result
+
+def _resampleChunk(Statistic: Callable, Data: Sequence[np.ndarray],
+                    Paired: bool, Count: int,
+                    Seed: np.random.SeedSequence) -> np.ndarray:
+    """
+    Helper function to draw a chunk (block) of the bootstrap resamples of the
+    raw samples (with replacement along the first axis) and to evaluate the
+    statistic on them. The paired samples share the same resample indices.
+
+    Signature:
+        callable, seq(numpy.ndarray), bool, int, numpy.random.SeedSequence
+            -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Generator = np.random.default_rng(Seed)
+    if Paired:
+        Length = Data[0].shape[0]
+        Indices = Generator.integers(0, Length, (Count, Length))
+        Resamples = [Item[Indices] for Item in Data]
+    else:
+        Resamples = [Item[Generator.integers(0, Item.shape[0],
+                                    (Count, Item.shape[0]))] for Item in Data]
+    with np.errstate(all = 'ignore'):
+        Result = np.asarray(Statistic(*Resamples))
+    return Result
+
+def _chunkStatistics(Result: np.ndarray, Lower: Optional[np.ndarray],
+                                Width: Optional[np.ndarray]) -> TStatistics:
+    """
+    Helper function to calculate the streaming statistics of a chunk of the
+    function values: the mean, the sum of the squared deviations from the
+    mean and, if the histogram range is defined, the histogram counts of
+    each element (outliers are counted in the edge bins).
+
+    Signature:
+        numpy.ndarray, numpy.ndarray OR None, numpy.ndarray OR None
+            -> tuple(int, numpy.ndarray, numpy.ndarray,
+                                        numpy.ndarray OR None, int)
+
+    Version 1.0.0.0
+    """
+    Count = Result.shape[0]
+    IsFinite = np.isfinite(Result)
+    Invalid = int(Count * Result[0].size - np.count_nonzero(IsFinite))
+    if Invalid:
+        Zeros = np.zeros(Result.shape[1:])
+        return 0, Zeros, Zeros, None, Invalid
+    Mean = Result.mean(axis = 0)
+    M2 = np.square(Result - Mean).sum(axis = 0)
+    Counts = None
+    if Lower is not None:
+        Size = Mean.size
+        Bins = np.floor((Result - Lower) / Width).astype(np.int64)
+        np.clip(Bins, 0, QUANTILE_BINS - 1, out = Bins)
+        Flat = Bins.reshape(Count, Size) * Size + np.arange(Size)
+        Counts = np.bincount(Flat.ravel(), minlength = QUANTILE_BINS * Size)
+        Counts = Counts.reshape((QUANTILE_BINS, ) + Mean.shape)
+    return Count, Mean, M2, Counts, 0
+
+def _merge(First: TStatistics, Second: TStatistics) -> TStatistics:
+    """
+    Helper function to merge the streaming statistics of two sets of samples
+    using the parallel update formulas of Chan et al.
+
+    Signature:
+        tuple(int, numpy.ndarray, numpy.ndarray, numpy.ndarray OR None, int),
+            tuple(int, numpy.ndarray, numpy.ndarray, numpy.ndarray OR None,
+                int) -> tuple(int, numpy.ndarray, numpy.ndarray,
+                                                numpy.ndarray OR None, int)
+
+    Version 1.0.0.0
+    """
+    Count1, Mean1, M21, Counts1, Invalid1 = First
+    Count2, Mean2, M22, Counts2, Invalid2 = Second
+    Invalid = Invalid1 + Invalid2
+    if Invalid or not Count2:
+        return Count1, Mean1, M21, Counts1, Invalid
+    if not Count1:
+        return Count2, Mean2, M22, Counts2, Invalid
+    Count = Count1 + Count2
+    Delta = Mean2 - Mean1
+    Mean = Mean1 + Delta * (Count2 / Count)
+    M2 = M21 + M22 + np.square(Delta) * (Count1 * Count2 / Count)
+    Counts = None if Counts1 is None else Counts1 + Counts2
+    return Count, Mean, M2, Counts, Invalid
+
+def _runChunks(Evaluate: Callable, State: Tuple[Any, ...],
+                Chunks: Sequence[Tuple[int, Any]],
+                Lower: Optional[np.ndarray],
+                Width: Optional[np.ndarray]) -> TStatistics:
+    """
+    Helper function to evaluate a range of chunks in order and to merge their
+    statistics; it is the task executed by the worker processes. The chunk
+    evaluation function takes the state, the number of samples in the chunk
+    and the seed sequence of the chunk. If the histogram range is defined,
+    the small chunks are buffered up to QUANTILE_BINS samples, so the cost of
+    the histogram counts does not grow with the number of chunks; the buffer
+    does not take more memory than the counts.
+
+    Signature:
+        callable, tuple(type A), seq(tuple(int, numpy.random.SeedSequence)),
+            numpy.ndarray OR None, numpy.ndarray OR None
+                -> tuple(int, numpy.ndarray, numpy.ndarray,
+                                                numpy.ndarray OR None, int)
+
+    Version 1.0.0.0
+    """
+    Statistics = None
+    Buffer = list()
+    Buffered = 0
+    for Index, (Count, Seed) in enumerate(Chunks):
+        Buffer.append(np.asarray(Evaluate(*State, Count, Seed),
+                                                        dtype = np.float64))
+        Buffered += Count
+        if (Lower is None or Buffered >= QUANTILE_BINS
+                                                or Index == len(Chunks) - 1):
+            Current = _chunkStatistics(np.concatenate(Buffer), Lower, Width)
+            Statistics = Current if Statistics is None else _merge(
+                                                        Statistics, Current)
+            Buffer.clear()
+            Buffered = 0
+    return Statistics
+
+def _quantiles(Counts: np.ndarray, Lower: np.ndarray, Width: np.ndarray,
+                        Total: int, Probabilities: np.ndarray) -> np.ndarray:
+    """
+    Helper function to estimate the quantiles from the histogram counts with
+    the linear interpolation within the bin.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray, numpy.ndarray, int, numpy.ndarray
+            -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Cumulative = np.cumsum(Counts, axis = 0)
+    Result = list()
+    for Probability in Probabilities:
+        Target = Probability * Total
+        Index = np.argmax(Cumulative >= Target, axis = 0)
+        Above = np.take_along_axis(Cumulative, Index[np.newaxis], 0)[0]
+        InBin = np.take_along_axis(Counts, Index[np.newaxis], 0)[0]
+        Below = Above - InBin
+        Fraction = np.where(InBin > 0, (Target - Below) / np.where(InBin > 0,
+                                                            InBin, 1), 0.5)
+        Result.append(Lower + (Index + Fraction) * Width)
+    return np.array(Result)
+
+def _nonlinearity(Function: Callable, Args: Sequence[Any]
+                        ) -> Tuple[MeasuredArray, np.ndarray, List[np.ndarray],
+                                    List[np.ndarray], List[List[int]]]:
+    """
+    Helper function to calculate the first order propagation through the
+    vectorized function and the nonlinearity indicator of each element - the
+    sum of the absolute second differences of the function over +/- one
+    uncertainty of each measured argument (group), divided by the doubled
+    first order uncertainty of the result. It is infinite, if the first
+    order uncertainty is zero but the second differences are not, or any
+    probe value is not finite.
+
+    Signature:
+        callable, seq(type A) -> MeasuredArray, numpy.ndarray,
+            list(numpy.ndarray), list(numpy.ndarray), list(list(int))
+
+    Raises:
+        UT_TypeError: the function is not callable, OR any argument is neither
+            real number(s) nor measurement(s) with uncertainty, OR the
+            function does not return real numbers
+        UT_ValueError: no arguments are passed, OR the shapes of the arguments
+            are not compatible, OR the function does not preserve the shape
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Function, Callable):
+        raise UT_TypeError(Function, Callable, SkipFrames = 2)
+    if not len(Args):
+        raise UT_ValueError(0, '> 0 arguments', SkipFrames = 2)
+    Shape, Values, Errors = _broadcastArguments(Args, SkipFrames = 4)
+    Linear = propagateArrays(Function, *Args)
+    Groups = _groupArguments(Args)
+    Measured = [Group for Group in Groups if np.any(Errors[Group[0]])]
+    Curvature = np.zeros(Shape)
+    if Measured:
+        with np.errstate(all = 'ignore'):
+            Probes = np.asarray(_stackedCall(Function, Values, Measured,
+                        [Errors[Group[0]] for Group in Measured], False),
+                                                        dtype = np.float64)
+            for Index in range(len(Measured)):
+                Curvature += np.abs(Probes[1 + 2 * Index]
+                                    + Probes[2 + 2 * Index] - 2 * Probes[0])
+    Error = Linear.SE
+    with np.errstate(all = 'ignore'):
+        Indicator = np.where(Error > 0, Curvature / (2 * Error),
+                                    np.where(Curvature == 0, 0.0, np.inf))
+    Indicator[~np.isfinite(Indicator) | ~np.isfinite(Linear.Value)] = np.inf
+    return Linear, Indicator, Values, Errors, Groups
+
+def _checkSettings(Samples: Any, ChunkSize: Any, Workers: Any,
+                                                        Seed: Any) -> None:
+    """
+    Helper function to check the number of samples, the chunk size, the
+    number of the worker processes and the seed.
+
+    Signature:
+        type A, type B, type C, type D -> None
+
+    Raises:
+        UT_TypeError: the number of samples, chunk size or workers is not an
+            integer, OR the seed is neither an integer nor a seed sequence
+        UT_ValueError: the number of samples is less than 2, OR the chunk
+            size or the number of workers is less than 1, OR the seed is
+            negative
+
+    Version 1.0.0.0
+    """
+    Limits = [(Samples, 2), (Workers, 1)]
+    if ChunkSize is not None:
+        Limits.append((ChunkSize, 1))
+    for Value, Minimum in Limits:
+        if (not isinstance(Value, (int, np.integer))) or isinstance(Value,
+                                                            (bool, np.bool_)):
+            raise UT_TypeError(Value, int, SkipFrames = 2)
+        if Value < Minimum:
+            raise UT_ValueError(Value, '>= {}'.format(Minimum), SkipFrames = 2)
+    if not ((Seed is None) or isinstance(Seed, np.random.SeedSequence)):
+        if (not isinstance(Seed, (int, np.integer))) or isinstance(Seed,
+                                                            (bool, np.bool_)):
+            raise UT_TypeError(Seed, (int, np.random.SeedSequence),
+                                                                SkipFrames = 2)
+        if Seed < 0:
+            raise UT_ValueError(Seed, '>= 0', SkipFrames = 2)
+
+def _checkQuantiles(Quantiles: Any) -> Optional[np.ndarray]:
+    """
+    Helper function to check the probabilities of the requested quantiles and
+    to convert them into a float64 array.
+
+    Signature:
+        seq(float) OR None -> numpy.ndarray OR None
+
+    Raises:
+        UT_TypeError: the probabilities are not a flat sequence of floats
+        UT_ValueError: any probability is outside (0, 1)
+
+    Version 1.0.0.0
+    """
+    if Quantiles is None:
+        return None
+    if isinstance(Quantiles, (str, bytes, dict, set)):
+        raise UT_TypeError(Quantiles, (list, tuple), SkipFrames = 2)
+    try:
+        Probabilities = np.asarray(Quantiles)
+    except (ValueError, TypeError):
+        raise UT_TypeError(Quantiles, (list, tuple), SkipFrames = 2) from None
+    if Probabilities.ndim != 1 or Probabilities.dtype.kind != 'f':
+        raise UT_TypeError(Quantiles, (list, tuple), SkipFrames = 2)
+    if not np.all((Probabilities > 0) & (Probabilities < 1)):
+        raise UT_ValueError(Quantiles, 'probabilities in (0, 1)',
+                                                                SkipFrames = 2)
+    return Probabilities.astype(np.float64)
+
+def _simulate(Evaluate: Callable, State: Tuple[Any, ...], Total: int,
+                ChunkSize: Optional[int],
+                Seed: Optional[Union[int, np.random.SeedSequence]],
+                Shape: Tuple[int, ...], Probabilities: Optional[np.ndarray],
+                Workers: int) -> Union[TResult, Tuple[TResult, np.ndarray]]:
+    """
+    Helper function to evaluate all chunks and to reduce the results into the
+    mean, the standard deviation and, optionally, the quantiles. The first
+    chunk is evaluated in the current process (the checks of the type and the
+    shape of the result), as well as the following chunks up to at least
+    QUANTILE_PILOT samples in total, if the quantiles are requested, which
+    define the histogram range independently of the chunk size; the rest -
+    in the current process or by the pool of the worker processes in
+    contiguous ranges.
+    Each chunk gets its own child of a copy of the seed sequence, so the
+    caller's seed sequence is not modified and gives the same result again;
+    the copy keeps the number of the already spawned children, so the chunks
+    never reuse the child streams spawned by the caller before the call.
+
+    Signature:
+        callable, tuple(type A), int, int OR None,
+            int OR numpy.random.SeedSequence OR None, tuple(int),
+                numpy.ndarray OR None, int -> MeasuredValue OR MeasuredArray
+                OR tuple(MeasuredValue OR MeasuredArray, numpy.ndarray)
+
+    Raises:
+        UT_TypeError: the evaluated function does not return real numbers
+        UT_ValueError: the histogram of the quantiles would exceed
+            QUANTILE_MAX_COUNTS counts, OR the evaluated function does not
+            return the expected shape, OR any value is not finite
+
+    Version 1.0.0.0
+    """
+    Elements = int(np.prod(Shape))
+    if (Probabilities is not None
+                            and QUANTILE_BINS * Elements > QUANTILE_MAX_COUNTS):
+        raise UT_ValueError(Elements, '<= {} elements with quantiles'.format(
+                    QUANTILE_MAX_COUNTS // QUANTILE_BINS), SkipFrames = 2)
+    if ChunkSize is None:
+        ChunkSize = max(1, CHUNK_ELEMENTS // max(1, Elements))
+    Total = int(Total)
+    Sizes = [min(ChunkSize, Total - Start) for Start in range(0, Total,
+                                                                ChunkSize)]
+    if isinstance(Seed, np.random.SeedSequence):
+        #spawn() advances the counter of the children in place
+        Seed = np.random.SeedSequence(Seed.entropy,
+                        spawn_key = Seed.spawn_key, pool_size = Seed.pool_size,
+                        n_children_spawned = Seed.n_children_spawned)
+    else:
+        Seed = np.random.SeedSequence(Seed)
+    Chunks = list(zip(Sizes, Seed.spawn(len(Sizes))))
+    #+ the first chunk: checks
+    Result = np.asarray(Evaluate(*State, *Chunks[0]))
+    if Result.dtype.kind not in 'iuf':
+        raise UT_TypeError(Result, (int, float), SkipFrames = 2)
+    if Result.shape != (Sizes[0], ) + Shape:
+        raise UT_ValueError(Result.shape[1:], '{} shape'.format(Shape),
+                                                                SkipFrames = 2)
+    Buffer = [Result.astype(np.float64)]
+    del Result
+    #+ the pilot chunks: the histogram range
+    Pilot = 0 if Probabilities is None else min(QUANTILE_PILOT, Total)
+    IsFinite = bool(np.all(np.isfinite(Buffer[0])))
+    while IsFinite and sum(Sizes[ : len(Buffer)]) < Pilot:
+        Buffer.append(np.asarray(Evaluate(*State, *Chunks[len(Buffer)]),
+                                                        dtype = np.float64))
+        IsFinite = bool(np.all(np.isfinite(Buffer[-1])))
+    Lower, Width = None, None
+    if Probabilities is not None and IsFinite:
+        Minimum = np.min([Item.min(axis = 0) for Item in Buffer], axis = 0)
+        Span = np.max([Item.max(axis = 0) for Item in Buffer],
+                                                        axis = 0) - Minimum
+        Span = np.where(Span > 0, Span, np.fmax(np.abs(Minimum), 1.0))
+        Lower = Minimum - QUANTILE_MARGIN * Span
+        Width = (1 + 2 * QUANTILE_MARGIN) * Span / QUANTILE_BINS
+    Statistics = _chunkStatistics(np.concatenate(Buffer), Lower, Width)
+    #+ the rest of the chunks
+    Rest = Chunks[len(Buffer) : ]
+    del Buffer
+    if Rest and Workers > 1 and not Statistics[4]:
+        Tasks = min(len(Rest), 4 * Workers)
+        Bounds = [(len(Rest) * Index) // Tasks for Index in range(Tasks + 1)]
+        Ranges = [Rest[Start : End] for Start, End in zip(Bounds[:-1],
+                                                                Bounds[1:])]
+        with ProcessPoolExecutor(max_workers = Workers) as Executor:
+            for Current in Executor.map(_runChunks, [Evaluate] * Tasks,
+                                        [State] * Tasks, Ranges,
+                                        [Lower] * Tasks, [Width] * Tasks):
+                Statistics = _merge(Statistics, Current)
+    elif Rest and not Statistics[4]:
+        Statistics = _merge(Statistics, _runChunks(Evaluate, State, Rest,
+                                                                Lower, Width))
+    Count, Mean, M2, Counts, Invalid = Statistics
+    if Invalid:
+        Error = UT_ValueError(Invalid, '== 0 non-finite values',
+                                                                SkipFrames = 2)
+        Error.setMessage('Non-finite value in {} of {} element(s)'.format(
+                                                    Invalid, Total * Elements))
+        raise Error
+    Deviation = np.sqrt(M2 / (Count - 1))
+    if Shape:
+        Measured = MeasuredArray(Mean, Deviation)
+    else:
+        Measured = MeasuredValue(float(Mean), float(Deviation))
+    if Probabilities is None:
+        return Measured
+    return Measured, _quantiles(Counts, Lower, Width, Count, Probabilities)
+
+#+ public API
+
+def monteCarlo(Function: Callable, *Args: Any, Samples: int = DEFAULT_SAMPLES,
+                Distributions: Optional[Sequence[Any]] = None,
+                Correlation: Optional[Any] = None,
+                Quantiles: Optional[Sequence[float]] = None,
+                Seed: Optional[Union[int, np.random.SeedSequence]] = None,
+                ChunkSize: Optional[int] = None, Workers: int = 1
+                                ) -> Union[TResult, Tuple[TResult, np.ndarray]]:
+    """
+    Propagates the uncertainty through a vectorized (element-wise) function
+    of the arrays of real numbers by the Monte Carlo method. The samples of
+    each measured argument are drawn with the mean value and the standard
+    deviation equal to the 'mean' value and the uncertainty of the argument,
+    the function is evaluated in chunks of samples stacked along a new first
+    axis, and the result is reduced into the mean and the standard deviation
+    (as the uncertainty) and, optionally, the quantiles of the distribution of
+    the function values. The same object arguments share the same samples.
+
+    The samples of a chunk are drawn by a generator seeded by its own child of
+    the numpy.random.SeedSequence, so the result does not depend on the
+    order of the chunks evaluation. The chunks except the first one can be
+    distributed between the worker processes, then the function and the
+    custom distributions must be picklable.
+
+    Signature:
+        callable, type A/, type B, .../ /, int, seq(str OR callable) OR None,
+            array OR None, seq(float) OR None, int OR SeedSequence OR None,
+                int OR None, int/
+                    -> MeasuredValue OR MeasuredArray
+                    OR tuple(MeasuredValue OR MeasuredArray, numpy.ndarray)
+
+    Args:
+        Function: callable(numpy.ndarray, ...) -> numpy.ndarray; the
+            vectorized function of real numbers arrays
+        *Args: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray, the arguments of the function
+        Samples: (optional) int >= 2; the number of samples, defaults to
+            DEFAULT_SAMPLES
+        Distributions: (optional) seq(str OR callable); the distribution per
+            argument - 'normal', 'uniform', 'triangular' or callable(
+            numpy.random.Generator, tuple(int)) -> numpy.ndarray returning
+            the deviates with zero mean and unit variance of the given shape,
+            defaults to None - all normal
+        Correlation: (optional) array; the correlation matrix of the
+            arguments (normal distributions only), defaults to None -
+            independent arguments
+        Quantiles: (optional) seq(float); the probabilities in (0, 1) of the
+            quantiles to be estimated, defaults to None - no quantiles
+        Seed: (optional) int >= 0 OR numpy.random.SeedSequence; the seed of
+            the random generators, defaults to None - the fresh entropy
+        ChunkSize: (optional) int > 0; the number of samples per chunk,
+            defaults to None - CHUNK_ELEMENTS divided by the size of the
+            broadcast arguments
+        Workers: (optional) int > 0; the number of the worker processes,
+            defaults to 1 - evaluation in the current process
+
+    Returns:
+        MeasuredValue: the mean and the standard deviation of the function,
+            all arguments are scalars
+        MeasuredArray: the same, the broadcast shape of the arguments
+        tuple(MeasuredValue OR MeasuredArray, numpy.ndarray): the result and
+            the quantiles, the first axis is the probabilities, if the
+            quantiles are requested
+
+    Raises:
+        UT_TypeError: the function is not callable, OR any argument is neither
+            real number(s) nor measurement(s) with uncertainty, OR any
+            keyword argument is of the improper type, OR the function does not
+            return real numbers, OR the function or any distribution is not
+            picklable, when the worker processes are used
+        UT_ValueError: no arguments are passed, OR the shapes of the arguments
+            are not compatible, OR the number of samples, chunk size or
+            workers is too small, OR the number of the distributions or the
+            shape of the correlation matrix does not match the number of the
+            arguments, OR a distribution is unknown, OR the correlation
+            matrix is not a valid (positive definite) correlation matrix, OR
+            the correlation is used with not normal distributions, OR any
+            probability is outside (0, 1), OR the quantiles are requested for
+            more than QUANTILE_MAX_COUNTS / QUANTILE_BINS elements, OR the
+            function does not preserve the shape, OR any function value is
+            not finite
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Function, Callable):
+        raise UT_TypeError(Function, Callable, SkipFrames = 1)
+    if not len(Args):
+        raise UT_ValueError(0, '> 0 arguments', SkipFrames = 1)
+    _checkSettings(Samples, ChunkSize, Workers, Seed)
+    Shape, Values, Errors = _broadcastArguments(Args)
+    Groups = _groupArguments(Args)
+    #+ distributions and correlation
+    if Distributions is None:
+        Distributions = ['normal'] * len(Args)
+    elif not isinstance(Distributions, (list, tuple)):
+        raise UT_TypeError(Distributions, (list, tuple), SkipFrames = 1)
+    elif len(Distributions) != len(Args):
+        raise UT_ValueError(len(Distributions), '{} distributions'.format(
+                                                len(Args)), SkipFrames = 1)
+    for Item in Distributions:
+        if isinstance(Item, str):
+            if not (Item in DISTRIBUTIONS):
+                raise UT_ValueError(Item, 'one of {}'.format(
+                            tuple(DISTRIBUTIONS.keys())), SkipFrames = 1)
+        elif not isinstance(Item, Callable):
+            raise UT_TypeError(Item, (str, Callable), SkipFrames = 1)
+    Cholesky = None
+    if Correlation is not None:
+        Matrix = _checkCorrelation(Correlation, len(Args))
+        if any(Item != 'normal' for Item in Distributions):
+            raise UT_ValueError(Distributions, 'normal distributions',
+                                                                SkipFrames = 1)
+        Indices = [Group[0] for Group in Groups]
+        try:
+            Cholesky = np.linalg.cholesky(Matrix[np.ix_(Indices, Indices)])
+        except np.linalg.LinAlgError:
+            raise UT_ValueError(Correlation, 'positive definite matrix',
+                                                    SkipFrames = 1) from None
+        Samplers = ['normal'] * len(Groups)
+    else:
+        Samplers = [Distributions[Group[0]] if np.any(Errors[Group[0]])
+                                                else None for Group in Groups]
+    Probabilities = _checkQuantiles(Quantiles)
+    if Workers > 1:
+        try:
+            pickle.dumps((Function, Distributions))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            raise UT_TypeError(Function, Callable, SkipFrames = 1) from None
+    State = (Function, Values, Errors, Groups, Samplers, Cholesky)
+    return _simulate(_evaluateChunk, State, Samples, ChunkSize, Seed, Shape,
+                                                        Probabilities, Workers)
+
+def nonlinearity(Function: Callable, *Args: Any) -> Union[float, np.ndarray]:
+    """
+    Calculates the nonlinearity indicator of the first order propagation of
+    the uncertainty through a vectorized (element-wise) function: the sum of
+    the absolute second differences of the function over +/- one uncertainty
+    of each measured argument, divided by the doubled first order uncertainty
+    of the result. The value about 0.1 and above indicates the noticeable
+    bias of the mean and error of the uncertainty of the linear
+    approximation. The indicator is infinite, if the first order uncertainty
+    is zero but the function is not constant within the uncertainty, or the
+    function is not finite within one uncertainty from the mean.
+
+    Signature:
+        callable, type A/, type B, .../ -> float OR numpy.ndarray
+
+    Args:
+        Function: callable(numpy.ndarray, ...) -> numpy.ndarray; the
+            vectorized function of real numbers arrays
+        *Args: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray, the arguments of the function
+
+    Returns:
+        float: the indicator, all arguments are scalars
+        numpy.ndarray: the indicator per element, the broadcast shape of the
+            arguments
+
+    Raises:
+        UT_TypeError: the function is not callable, OR any argument is neither
+            real number(s) nor measurement(s) with uncertainty, OR the
+            function does not return real numbers
+        UT_ValueError: no arguments are passed, OR the shapes of the arguments
+            are not compatible, OR the function does not preserve the shape
+
+    Version 1.0.0.0
+    """
+    Indicator = _nonlinearity(Function, Args)[1]
+    if not Indicator.ndim:
+        return float(Indicator)
+    return Indicator
+
+def propagateAdaptive(Function: Callable, *Args: Any,
+                Threshold: float = NONLINEARITY_THRESHOLD,
+                Samples: int = DEFAULT_SAMPLES,
+                Seed: Optional[Union[int, np.random.SeedSequence]] = None,
+                ChunkSize: Optional[int] = None, Workers: int = 1,
+                Mask: bool = False) -> Union[TResult, Tuple[TResult,
+                                                                np.ndarray]]:
+    """
+    Propagates the uncertainty through a vectorized (element-wise) function
+    using the first order (linear) approximation for the elements, where it
+    is accurate, and the Monte Carlo method (normal distributions) only for
+    the elements, where the nonlinearity indicator (see the function
+    nonlinearity()) exceeds the threshold. The Monte Carlo propagation is
+    applied to the 1-D arrays of the flagged elements only, so the rest of
+    the elements costs only the linear propagation and the indicator (2 more
+    function calls per measured argument, stacked into a single call).
+
+    Signature:
+        callable, type A/, type B, .../ /, int OR float, int,
+            int OR SeedSequence OR None, int OR None, int, bool/
+                -> MeasuredValue OR MeasuredArray
+                OR tuple(MeasuredValue OR MeasuredArray, numpy.ndarray)
+
+    Args:
+        Function: callable(numpy.ndarray, ...) -> numpy.ndarray; the
+            vectorized function of real numbers arrays
+        *Args: type A; real number(s) or measurement(s) with uncertainty in any
+            form accepted by MeasuredArray, the arguments of the function
+        Threshold: (optional) int > 0 OR float > 0; the max nonlinearity
+            indicator of the linear propagation, defaults to
+            NONLINEARITY_THRESHOLD
+        Samples: (optional) int >= 2; the number of the Monte Carlo samples,
+            defaults to DEFAULT_SAMPLES
+        Seed: (optional) int >= 0 OR numpy.random.SeedSequence; the seed of
+            the random generators, defaults to None - the fresh entropy
+        ChunkSize: (optional) int > 0; the number of samples per chunk,
+            defaults to None - see the function monteCarlo()
+        Workers: (optional) int > 0; the number of the worker processes,
+            defaults to 1 - evaluation in the current process
+        Mask: (optional) bool; if True, the boolean mask of the elements
+            propagated by the Monte Carlo method is also returned, defaults
+            to False
+
+    Returns:
+        MeasuredValue: the result with the propagated uncertainty, all
+            arguments are scalars
+        MeasuredArray: the same, the broadcast shape of the arguments
+        tuple(MeasuredValue OR MeasuredArray, numpy.ndarray): the result and
+            the mask, if the mask is requested
+
+    Raises:
+        UT_TypeError: the function is not callable, OR any argument is neither
+            real number(s) nor measurement(s) with uncertainty, OR any
+            keyword argument is of the improper type, OR the function does not
+            return real numbers, OR the function is not picklable, when the
+            worker processes are used
+        UT_ValueError: no arguments are passed, OR the shapes of the arguments
+            are not compatible, OR the function does not preserve the shape,
+            OR the threshold is not positive, OR the number of samples, chunk
+            size or workers is too small, OR any function value of the Monte
+            Carlo samples is not finite
+
+    Version 1.0.0.0
+    """
+    if ((not isinstance(Threshold, (int, float, np.integer, np.floating)))
+                                or isinstance(Threshold, (bool, np.bool_))):
+        raise UT_TypeError(Threshold, (int, float), SkipFrames = 1)
+    if not (Threshold > 0):
+        raise UT_ValueError(Threshold, '> 0', SkipFrames = 1)
+    if not isinstance(Mask, bool):
+        raise UT_TypeError(Mask, bool, SkipFrames = 1)
+    _checkSettings(Samples, ChunkSize, Workers, Seed)
+    Linear, Indicator, Values, Errors, Groups = _nonlinearity(Function, Args)
+    Flags = ~(Indicator <= Threshold)
+    MeanValues, Deviations = Linear.Value, Linear.SE
+    if np.any(Flags):
+        Subsets = [None] * len(Args)
+        for Group in Groups:
+            Subset = MeasuredArray(Values[Group[0]][Flags],
+                                                    Errors[Group[0]][Flags])
+            for Index in Group:
+                Subsets[Index] = Subset
+        Sampled = monteCarlo(Function, *Subsets, Samples = Samples,
+                        Seed = Seed, ChunkSize = ChunkSize, Workers = Workers)
+        MeanValues[Flags] = Sampled.Value
+        Deviations[Flags] = Sampled.SE
+    if Indicator.ndim:
+        Result = MeasuredArray(MeanValues, Deviations)
+    else:
+        Result = MeasuredValue(float(MeanValues), float(Deviations))
+    if Mask:
+        return Result, Flags
+    return Result
+
+def bootstrap(Statistic: Callable, *Samples: Any,
+                Resamples: int = DEFAULT_RESAMPLES, Paired: bool = False,
+                Quantiles: Optional[Sequence[float]] = None,
+                Seed: Optional[Union[int, np.random.SeedSequence]] = None,
+                BlockSize: Optional[int] = None, Workers: int = 1
+                                ) -> Union[TResult, Tuple[TResult, np.ndarray]]:
+    """
+    Derives a measurement with uncertainty from the raw samples by the
+    bootstrap method: the 'mean' value is the statistic of the original
+    samples, and the uncertainty is the standard deviation of the statistic
+    over the resamples (with replacement) of the raw samples. Suitable for the
+    statistics without the simple standard error formula, e.g. the median,
+    the ratio of the means or the fit parameters.
+
+    The statistic must be vectorized over the resamples: it takes one array
+    per raw samples array with the resamples stacked along a new first axis,
+    i.e. of the shape (resamples, N, ...) for the raw samples of the shape
+    (N, ...), and it returns the array of the shape (resamples, ...). The
+    resamples are drawn and evaluated in blocks, each with its own child of
+    the numpy.random.SeedSequence, so the memory usage is bounded by the
+    block size, and the blocks except the first one can be distributed
+    between the worker processes (then the statistic must be picklable).
+
+    Signature:
+        callable, array/, array, .../ /, int, bool, seq(float) OR None,
+            int OR SeedSequence OR None, int OR None, int/
+                -> MeasuredValue OR MeasuredArray
+                OR tuple(MeasuredValue OR MeasuredArray, numpy.ndarray)
+
+    Args:
+        Statistic: callable(numpy.ndarray, ...) -> numpy.ndarray; the
+            statistic vectorized over the first axis (resamples)
+        *Samples: array; the raw samples as the arrays of real numbers, the
+            first axis is the observations (at least 2)
+        Resamples: (optional) int >= 2; the number of the resamples, defaults
+            to DEFAULT_RESAMPLES
+        Paired: (optional) bool; if True, the raw samples arrays are of the
+            same length and resampled with the same indices, otherwise they
+            are resampled independently, defaults to False
+        Quantiles: (optional) seq(float); the probabilities in (0, 1) of the
+            quantiles of the statistic to be estimated (percentile intervals),
+            defaults to None - no quantiles
+        Seed: (optional) int >= 0 OR numpy.random.SeedSequence; the seed of
+            the random generators, defaults to None - the fresh entropy
+        BlockSize: (optional) int > 0; the number of the resamples per block,
+            defaults to None - CHUNK_ELEMENTS divided by the total size of the
+            raw samples
+        Workers: (optional) int > 0; the number of the worker processes,
+            defaults to 1 - evaluation in the current process
+
+    Returns:
+        MeasuredValue: the statistic with the bootstrap uncertainty, the
+            statistic is a scalar
+        MeasuredArray: the same, the statistic is an array
+        tuple(MeasuredValue OR MeasuredArray, numpy.ndarray): the result and
+            the quantiles, the first axis is the probabilities, if the
+            quantiles are requested
+
+    Raises:
+        UT_TypeError: the statistic is not callable, OR any raw samples array
+            is not an array of real numbers, OR any keyword argument is of the
+            improper type, OR the statistic does not return real numbers, OR
+            the statistic is not picklable, when the worker processes are
+            used
+        UT_ValueError: no raw samples are passed, OR any raw samples array
+            is a scalar or has less than 2 observations, OR the paired
+            samples are of different lengths, OR the number of resamples,
+            block size or workers is too small, OR any probability is outside
+            (0, 1), OR the quantiles are requested for more than
+            QUANTILE_MAX_COUNTS / QUANTILE_BINS elements of the statistic,
+            OR the statistic does not keep the resamples axis, OR any value
+            of the statistic is not finite
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Statistic, Callable):
+        raise UT_TypeError(Statistic, Callable, SkipFrames = 1)
+    if not len(Samples):
+        raise UT_ValueError(0, '> 0 raw samples arrays', SkipFrames = 1)
+    if not isinstance(Paired, bool):
+        raise UT_TypeError(Paired, bool, SkipFrames = 1)
+    _checkSettings(Resamples, BlockSize, Workers, Seed)
+    Probabilities = _checkQuantiles(Quantiles)
+    Data = list()
+    for Item in Samples:
+        if isinstance(Item, (str, bytes, dict, set, MeasuredArray)):
+            raise UT_TypeError(Item, (list, tuple, np.ndarray), SkipFrames = 1)
+        try:
+            Array = np.asarray(Item)
+        except (ValueError, TypeError):
+            raise UT_TypeError(Item, (list, tuple, np.ndarray),
+                                                    SkipFrames = 1) from None
+        if Array.dtype.kind not in 'iuf':
+            raise UT_TypeError(Item, (list, tuple, np.ndarray), SkipFrames = 1)
+        if Array.ndim < 1 or Array.shape[0] < 2:
+            raise UT_ValueError(Array.shape, '>= 2 observations',
+                                                                SkipFrames = 1)
+        Data.append(Array.astype(np.float64))
+    if Paired and len(set(Array.shape[0] for Array in Data)) > 1:
+        raise UT_ValueError(tuple(Array.shape[0] for Array in Data),
+                                        'the same lengths', SkipFrames = 1)
+    if Workers > 1:
+        try:
+            pickle.dumps(Statistic)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            raise UT_TypeError(Statistic, Callable, SkipFrames = 1) from None
+    with np.errstate(all = 'ignore'):
+        Estimate = np.asarray(Statistic(*[Array[np.newaxis]
+                                                        for Array in Data]))
+    if Estimate.dtype.kind not in 'iuf':
+        raise UT_TypeError(Estimate, (int, float), SkipFrames = 1)
+    if Estimate.ndim < 1 or Estimate.shape[0] != 1:
+        raise UT_ValueError(Estimate.shape, '(1, ...) shape', SkipFrames = 1)
+    Estimate = Estimate[0].astype(np.float64)
+    if not np.all(np.isfinite(Estimate)):
+        raise UT_ValueError(Estimate, 'finite statistic', SkipFrames = 1)
+    if BlockSize is None:
+        BlockSize = max(1, CHUNK_ELEMENTS // sum(Array.size for Array in Data))
+    Result = _simulate(_resampleChunk, (Statistic, Data, Paired), Resamples,
+                BlockSize, Seed, Estimate.shape, Probabilities, Workers)
+    Measured = Result if Probabilities is None else Result[0]
+    if Estimate.ndim:
+        Measured = MeasuredArray(Estimate, Measured.SE)
+    else:
+        Measured = MeasuredValue(float(Estimate), Measured.SE)
+    if Probabilities is None:
+        return Measured
+    return Measured, Result[1]
@@ -0,0 +1,531 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.raw_samples
+
+Implements the reduction of the raw samples files of the digital (sampled)
+detectors into the arrays of the measurements with uncertainty: each block of
+samples (fixed size, or variable blocks defined by the index of their starts)
+becomes one measurement - the mean of the samples with the standard error of
+the mean (see DE001). The flat binary files are memory-mapped read-only with
+the configurable sample type (including the byte order), the offset of the
+first sample and the stride between the samples (interleaved channels or
+records), so the file is never loaded into memory entirely. The blocks are
+reduced by the vectorized two-pass statistics in the memory bounded chunks of
+blocks; the regions of a file can be reduced by the worker processes, each
+mapping the file on its own.
+
+Functions:
+    mapSamples(Path, DType = 'float64', *, Offset = 0, Stride = None)
+        str OR os.PathLike /, str OR type OR numpy.dtype/, *, /int >= 0,
+            int > 0 OR None/ -> numpy.ndarray
+    reduceBlocks(Samples, BlockSize = None, *, Starts = None)
+        seq(int OR float) OR numpy.ndarray /, int > 0 OR None/, *,
+            /seq(int) OR numpy.ndarray OR None/ -> MeasuredArray
+    reduceFile(Path, BlockSize = None, *, Starts = None, DType = 'float64',
+                Offset = 0, Stride = None, Workers = 1)
+        str OR os.PathLike /, int > 0 OR None/, *,
+            /seq(int) OR numpy.ndarray OR None, str OR type OR numpy.dtype,
+                int >= 0, int > 0 OR None, int > 0/ -> MeasuredArray
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+
+from typing import Optional, Any, Tuple
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.measured_arrays import MeasuredArray
+
+#types
+
+#+ layout of the samples in a file: the sample type, the offset of the first
+#+ sample and the stride between the samples (both in bytes)
+
+TLayout = Tuple[np.dtype, int, int]
+
+#+ means and standard errors of the means of a range of blocks
+
+TReduced = Tuple[np.ndarray, np.ndarray]
+
+#globals
+
+CHUNK_ELEMENTS = 2 ** 20 #max number of the samples reduced at once
+
+#functions
+
+#+ 'private' helper functions
+
+def _checkInteger(Value: Any, Minimum: int, SkipFrames: int = 2) -> int:
+    """
+    Helper function to check that the value is an integer not less than the
+    minimum.
+
+    Signature:
+        type A, int /, int/ -> int
+
+    Raises:
+        UT_TypeError: the value is not an integer
+        UT_ValueError: the value is less than the minimum
+
+    Version 1.0.0.0
+    """
+    if (not isinstance(Value, (int, np.integer))) or isinstance(Value,
+                                                            (bool, np.bool_)):
+        raise UT_TypeError(Value, int, SkipFrames = SkipFrames)
+    if Value < Minimum:
+        raise UT_ValueError(Value, '>= {}'.format(Minimum),
+                                                    SkipFrames = SkipFrames)
+    return int(Value)
+
+def _checkLayout(Path: Any, DType: Any, Offset: Any, Stride: Any,
+                                        SkipFrames: int = 2) -> TLayout:
+    """
+    Helper function to check the path of a file and the layout of the samples
+    in it.
+
+    Signature:
+        type A, type B, type C, type D /, int/ -> numpy.dtype, int, int
+
+    Raises:
+        UT_TypeError: the path is neither a string nor a path-like object, OR
+            the sample type is not a data type specification, OR the offset
+            or the stride is not an integer
+        UT_ValueError: the sample type is not an integer or floating point
+            number type, OR the offset is negative, OR the stride is less than
+            the size of the sample
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Path, (str, os.PathLike)):
+        raise UT_TypeError(Path, (str, os.PathLike), SkipFrames = SkipFrames)
+    if not isinstance(DType, (str, type, np.dtype)):
+        raise UT_TypeError(DType, (str, type, np.dtype),
+                                                    SkipFrames = SkipFrames)
+    try:
+        Type = np.dtype(DType)
+    except TypeError:
+        raise UT_TypeError(DType, (str, type, np.dtype),
+                                        SkipFrames = SkipFrames) from None
+    if Type.kind not in 'iuf':
+        raise UT_ValueError(DType, 'integer or floating point type',
+                                                    SkipFrames = SkipFrames)
+    Offset = _checkInteger(Offset, 0, SkipFrames = SkipFrames + 1)
+    if Stride is None:
+        Stride = Type.itemsize
+    else:
+        Stride = _checkInteger(Stride, Type.itemsize,
+                                                SkipFrames = SkipFrames + 1)
+    return Type, Offset, Stride
+
+def _map(Path: str, Layout: TLayout) -> np.ndarray:
+    """
+    Helper function to memory-map the samples of a file read-only as a 1-D
+    (strided) array; the incomplete trailing sample is ignored.
+
+    Signature:
+        str OR os.PathLike, tuple(numpy.dtype, int, int) -> numpy.ndarray
+
+    Raises:
+        OSError: the file cannot be opened
+
+    Version 1.0.0.0
+    """
+    Type, Offset, Stride = Layout
+    Size = os.path.getsize(Path)
+    if Size < Offset + Type.itemsize:
+        return np.empty(0, dtype = Type)
+    Count = (Size - Offset - Type.itemsize) // Stride + 1
+    Buffer = np.memmap(Path, dtype = np.uint8, mode = 'r')
+    return np.ndarray((Count, ), dtype = Type, buffer = Buffer,
+                                        offset = Offset, strides = (Stride, ))
+
+def _toSamples(Samples: Any, SkipFrames: int = 2) -> np.ndarray:
+    """
+    Helper function to check the samples and to convert them into a 1-D
+    numpy array (a view, if possible).
+
+    Signature:
+        type A /, int/ -> numpy.ndarray
+
+    Raises:
+        UT_TypeError: the samples are not a sequence or array of real numbers
+        UT_ValueError: the samples are not 1-D
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Samples, (list, tuple, np.ndarray)):
+        raise UT_TypeError(Samples, (list, tuple, np.ndarray),
+                                                    SkipFrames = SkipFrames)
+    try:
+        Result = np.asarray(Samples)
+    except (ValueError, TypeError):
+        raise UT_TypeError(Samples, (list, tuple, np.ndarray),
+                                        SkipFrames = SkipFrames) from None
+    if Result.dtype.kind not in 'iuf' and Result.size:
+        raise UT_TypeError(Samples, (list, tuple, np.ndarray),
+                                                    SkipFrames = SkipFrames)
+    if Result.ndim != 1:
+        raise UT_ValueError(Result.shape, '1-D samples',
+                                                    SkipFrames = SkipFrames)
+    return Result
+
+def _checkBlocks(BlockSize: Any, Starts: Any,
+                            SkipFrames: int = 2) -> Optional[np.ndarray]:
+    """
+    Helper function to check the definition of the blocks - either the fixed
+    size, or the starts of the variable blocks - and to convert the starts
+    into an int64 array.
+
+    Signature:
+        type A, type B /, int/ -> numpy.ndarray OR None
+
+    Raises:
+        UT_TypeError: the block size is not an integer, OR the starts are not
+            a sequence or array of integers
+        UT_ValueError: not exactly one of the block size and the starts is
+            passed, OR the block size is less than 1, OR the starts are not
+            1-D, OR not strictly increasing, OR negative
+
+    Version 1.0.0.0
+    """
+    if (BlockSize is None) == (Starts is None):
+        raise UT_ValueError((BlockSize, Starts), 'exactly one of BlockSize '
+                                'and Starts', SkipFrames = SkipFrames)
+    if Starts is None:
+        _checkInteger(BlockSize, 1, SkipFrames = SkipFrames + 1)
+        return None
+    if not isinstance(Starts, (list, tuple, np.ndarray)):
+        raise UT_TypeError(Starts, (list, tuple, np.ndarray),
+                                                    SkipFrames = SkipFrames)
+    try:
+        Index = np.asarray(Starts)
+    except (ValueError, TypeError):
+        raise UT_TypeError(Starts, (list, tuple, np.ndarray),
+                                        SkipFrames = SkipFrames) from None
+    if Index.dtype.kind not in 'iu' and Index.size:
+        raise UT_TypeError(Starts, (list, tuple, np.ndarray),
+                                                    SkipFrames = SkipFrames)
+    if Index.ndim != 1:
+        raise UT_ValueError(Index.shape, '1-D starts', SkipFrames = SkipFrames)
+    Index = Index.astype(np.int64)
+    if np.any(np.diff(Index) <= 0):
+        raise UT_ValueError(Starts, 'strictly increasing starts',
+                                                    SkipFrames = SkipFrames)
+    if Index.size and Index[0] < 0:
+        raise UT_ValueError(Starts, 'non-negative starts',
+                                                    SkipFrames = SkipFrames)
+    return Index
+
+def _toBounds(Starts: np.ndarray, Total: int,
+                                        SkipFrames: int = 2) -> np.ndarray:
+    """
+    Helper function to check the starts of the variable blocks against the
+    number of samples, and to append it to the starts as the end of the last
+    block.
+
+    Signature:
+        numpy.ndarray, int /, int/ -> numpy.ndarray
+
+    Raises:
+        UT_ValueError: any start is out of the range of the samples
+
+    Version 1.0.0.0
+    """
+    if Starts.size and Starts[-1] >= Total:
+        raise UT_ValueError(Starts[-1], '< {} samples'.format(Total),
+                                                    SkipFrames = SkipFrames)
+    return np.concatenate((Starts, [Total]))
+
+def _statistics(Data: np.ndarray, Local: np.ndarray,
+                                            Lengths: np.ndarray) -> TReduced:
+    """
+    Helper function to calculate the means and the standard errors of the
+    means of the contiguous blocks of a float64 array by the two-pass
+    algorithm; NaN standard error for a single sample block.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray, numpy.ndarray
+            -> numpy.ndarray, numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Means = np.add.reduceat(Data, Local) / Lengths
+    Deviations = Data - np.repeat(Means, Lengths)
+    M2 = np.add.reduceat(Deviations * Deviations, Local)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        Errors = np.sqrt(M2 / (Lengths * (Lengths - 1.0)))
+    return Means, Errors
+
+def _reduceFixed(Samples: np.ndarray, BlockSize: int, First: int,
+                                                    Last: int) -> TReduced:
+    """
+    Helper function to reduce the range [First, Last) of the fixed size
+    blocks in the chunks of (at least one block and) up to CHUNK_ELEMENTS
+    samples.
+
+    Signature:
+        numpy.ndarray, int, int, int -> numpy.ndarray, numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Means = np.empty(Last - First)
+    Errors = np.empty(Last - First)
+    Step = max(1, CHUNK_ELEMENTS // BlockSize)
+    for Start in range(First, Last, Step):
+        Stop = min(Last, Start + Step)
+        Data = Samples[Start * BlockSize : Stop * BlockSize].astype(
+                                    np.float64).reshape(Stop - Start, BlockSize)
+        Mean = Data.mean(axis = 1)
+        Data -= Mean[:, np.newaxis]
+        M2 = np.einsum('ij,ij->i', Data, Data)
+        Means[Start - First : Stop - First] = Mean
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            Errors[Start - First : Stop - First] = np.sqrt(M2 / (BlockSize
+                                                        * (BlockSize - 1.0)))
+    return Means, Errors
+
+def _reduceVariable(Samples: np.ndarray, Bounds: np.ndarray) -> TReduced:
+    """
+    Helper function to reduce the variable blocks [Bounds[i], Bounds[i + 1])
+    in the chunks of (at least one block and) up to CHUNK_ELEMENTS samples.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray -> numpy.ndarray, numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Total = Bounds.size - 1
+    Means = np.empty(Total)
+    Errors = np.empty(Total)
+    Start = 0
+    while Start < Total:
+        Stop = int(np.searchsorted(Bounds, Bounds[Start] + CHUNK_ELEMENTS,
+                                                        side = 'right')) - 1
+        Stop = min(Total, max(Stop, Start + 1))
+        Offset = Bounds[Start]
+        Data = Samples[Offset : Bounds[Stop]].astype(np.float64)
+        Means[Start : Stop], Errors[Start : Stop] = _statistics(Data,
+            Bounds[Start : Stop] - Offset, np.diff(Bounds[Start : Stop + 1]))
+        Start = Stop
+    return Means, Errors
+
+def _reduce(Samples: np.ndarray, BlockSize: Optional[int],
+                        Bounds: Optional[np.ndarray], First: int,
+                                                    Last: int) -> TReduced:
+    """
+    Helper function to reduce the range [First, Last) of the fixed size or
+    variable blocks.
+
+    Signature:
+        numpy.ndarray, int OR None, numpy.ndarray OR None, int, int
+            -> numpy.ndarray, numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    if Bounds is None:
+        return _reduceFixed(Samples, BlockSize, First, Last)
+    return _reduceVariable(Samples, Bounds[First : Last + 1])
+
+def _reduceRegion(Path: str, Layout: TLayout, BlockSize: Optional[int],
+                        Bounds: Optional[np.ndarray], First: int,
+                                                    Last: int) -> TReduced:
+    """
+    Helper function to map the file and to reduce a range of blocks; it is
+    the task executed by the worker processes.
+
+    Signature:
+        str OR os.PathLike, tuple(numpy.dtype, int, int), int OR None,
+            numpy.ndarray OR None, int, int -> numpy.ndarray, numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    return _reduce(_map(Path, Layout), BlockSize, Bounds, First, Last)
+
+#+ public API
+
+def mapSamples(Path: Any, DType: Any = 'float64', *, Offset: int = 0,
+                                    Stride: Optional[int] = None) -> np.ndarray:
+    """
+    Memory-maps the raw samples of a flat binary file read-only as a 1-D
+    (strided) numpy array. The samples start at the given byte offset, and
+    are separated by the stride (in bytes, the size of the sample type by
+    default); the trailing incomplete sample is ignored. E.g. the second
+    channel of the int16 samples of 4 interleaved channels after a 512 bytes
+    header is mapped with DType = '<i2', Offset = 514, Stride = 8.
+
+    Signature:
+        str OR os.PathLike /, str OR type OR numpy.dtype/, *, /int >= 0,
+            int > 0 OR None/ -> numpy.ndarray
+
+    Args:
+        Path: str OR os.PathLike; the path to the file
+        DType: (optional) str OR type OR numpy.dtype; the integer or floating
+            point sample type in any form accepted by numpy.dtype, including
+            the byte order, defaults to 'float64' - native byte order
+        Offset: (keyword) int >= 0; the offset of the first sample in bytes,
+            defaults to 0
+        Stride: (keyword) int > 0 OR None; the distance between the
+            consecutive samples in bytes, not less than the size of the
+            sample, defaults to None - the size of the sample
+
+    Returns:
+        numpy.ndarray: the read-only 1-D array of the samples backed by the
+            memory-mapped file
+
+    Raises:
+        UT_TypeError: the path is neither a string nor a path-like object, OR
+            the sample type is not a data type specification, OR the offset
+            or the stride is not an integer
+        UT_ValueError: the sample type is not an integer or floating point
+            number type, OR the offset is negative, OR the stride is less
+            than the size of the sample
+        OSError: the file cannot be opened
+
+    Version 1.0.0.0
+    """
+    return _map(Path, _checkLayout(Path, DType, Offset, Stride))
+
+def reduceBlocks(Samples: Any, BlockSize: Optional[int] = None, *,
+                            Starts: Optional[Any] = None) -> MeasuredArray:
+    """
+    Reduces each block of the samples into a measurement with uncertainty -
+    the mean of the samples with the standard error of the mean (NaN for a
+    single sample block). The blocks are either of a fixed size (the trailing
+    incomplete block is ignored), or variable - from each start to the next
+    one, the last block - to the end of the samples. The non-finite samples
+    result in the non-finite statistics of their blocks.
+
+    Signature:
+        seq(int OR float) OR numpy.ndarray /, int > 0 OR None/, *,
+            /seq(int) OR numpy.ndarray OR None/ -> MeasuredArray
+
+    Args:
+        Samples: seq(int OR float) OR numpy.ndarray; the 1-D samples,
+            including the memory-mapped arrays (see mapSamples())
+        BlockSize: (optional) int > 0 OR None; the number of the samples per
+            block, defaults to None
+        Starts: (keyword) seq(int) OR numpy.ndarray OR None; the strictly
+            increasing indexes of the first samples of the variable blocks,
+            defaults to None
+
+    Returns:
+        MeasuredArray: the 1-D array of the measurements, one per block
+
+    Raises:
+        UT_TypeError: the samples are not a sequence or array of real numbers,
+            OR the block size is not an integer, OR the starts are not a
+            sequence or array of integers
+        UT_ValueError: the samples are not 1-D, OR not exactly one of the
+            block size and the starts is passed, OR the block size is less
+            than 1, OR the starts are not 1-D, OR not strictly increasing, OR
+            out of the range of the samples
+
+    Version 1.0.0.0
+    """
+    Data = _toSamples(Samples)
+    Bounds = _checkBlocks(BlockSize, Starts)
+    if Bounds is not None:
+        Bounds = _toBounds(Bounds, Data.size)
+    Total = Data.size // BlockSize if Bounds is None else Bounds.size - 1
+    return MeasuredArray(*_reduce(Data, BlockSize, Bounds, 0, Total))
+
+def reduceFile(Path: Any, BlockSize: Optional[int] = None, *,
+                Starts: Optional[Any] = None, DType: Any = 'float64',
+                Offset: int = 0, Stride: Optional[int] = None,
+                                        Workers: int = 1) -> MeasuredArray:
+    """
+    Reduces each block of the raw samples of a flat binary file into a
+    measurement with uncertainty, as the function reduceBlocks() of the
+    samples memory-mapped by the function mapSamples(). The blocks can be
+    distributed between the worker processes in contiguous ranges (file
+    regions), each process maps the file on its own.
+
+    Signature:
+        str OR os.PathLike /, int > 0 OR None/, *,
+            /seq(int) OR numpy.ndarray OR None, str OR type OR numpy.dtype,
+                int >= 0, int > 0 OR None, int > 0/ -> MeasuredArray
+
+    Args:
+        Path: str OR os.PathLike; the path to the file
+        BlockSize: (optional) int > 0 OR None; the number of the samples per
+            block, defaults to None
+        Starts: (keyword) seq(int) OR numpy.ndarray OR None; the strictly
+            increasing indexes of the first samples of the variable blocks,
+            defaults to None
+        DType: (keyword) str OR type OR numpy.dtype; the integer or floating
+            point sample type, defaults to 'float64'
+        Offset: (keyword) int >= 0; the offset of the first sample in bytes,
+            defaults to 0
+        Stride: (keyword) int > 0 OR None; the distance between the
+            consecutive samples in bytes, defaults to None - the size of the
+            sample
+        Workers: (keyword) int > 0; the number of the worker processes,
+            defaults to 1 - the current process only
+
+    Returns:
+        MeasuredArray: the 1-D array of the measurements, one per block
+
+    Raises:
+        UT_TypeError: the path is neither a string nor a path-like object, OR
+            the sample type is not a data type specification, OR the offset,
+            the stride, the block size or the number of workers is not an
+            integer, OR the starts are not a sequence or array of integers
+        UT_ValueError: the sample type is not an integer or floating point
+            number type, OR the offset is negative, OR the stride is less
+            than the size of the sample, OR not exactly one of the block size
+            and the starts is passed, OR the block size or the number of
+            workers is less than 1, OR the starts are not 1-D, OR not strictly
+            increasing, OR out of the range of the samples
+        OSError: the file cannot be opened
+
+    Version 1.0.0.0
+    """
+    Layout = _checkLayout(Path, DType, Offset, Stride)
+    Workers = _checkInteger(Workers, 1)
+    Bounds = _checkBlocks(BlockSize, Starts)
+    Samples = _map(Path, Layout)
+    if Bounds is not None:
+        Bounds = _toBounds(Bounds, Samples.size)
+    Total = Samples.size // BlockSize if Bounds is None else Bounds.size - 1
+    if Workers == 1 or Total < 2:
+        return MeasuredArray(*_reduce(Samples, BlockSize, Bounds, 0, Total))
+    del Samples
+    Tasks = min(Total, 4 * Workers)
+    Limits = [(Total * Index) // Tasks for Index in range(Tasks + 1)]
+    Arguments = list()
+    for First, Last in zip(Limits[:-1], Limits[1:]):
+        if Bounds is None:
+            Arguments.append((Path, Layout, BlockSize, None, First, Last))
+        else:
+            Arguments.append((Path, Layout, None, Bounds[First : Last + 1], 0,
+                                                                Last - First))
+    with ProcessPoolExecutor(max_workers = Workers) as Executor:
+        Results = list(Executor.map(_reduceRegion, *zip(*Arguments)))
+    return MeasuredArray(np.concatenate([Item[0] for Item in Results]),
+                                np.concatenate([Item[1] for Item in Results]))
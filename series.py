@@ -0,0 +1,319 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.series
+
+Implements the convolution, the FIR filtering and the moving average of the
+measured time series, i.e. 1-D arrays of the measurements with uncertainty,
+with the optionally measured kernel coefficients. The mean values are the
+NumPy convolution of the mean values, and the variances are the convolution
+of the squared coefficients with the squared uncertainties of the signal
+(plus the convolution of the squared uncertainties of the coefficients with
+the squared signal values), so the cost is O(N * K) vectorized operations,
+or O((N + K) log(N + K)) with the FFT-based convolution for the long kernels.
+The filter and the moving average can process an unbounded signal chunk by
+chunk with the state carried over between the calls.
+
+Functions:
+    convolve(Signal, Kernel, Mode = 'full')
+        type A, type B /, str/ -> MeasuredArray
+    firFilter(Signal, Coefficients, State = None)
+        type A, type B /, type C OR None/ -> MeasuredArray, MeasuredArray
+    movingAverage(Signal, Window, State = None)
+        type A, int /, type C OR None/ -> MeasuredArray, MeasuredArray
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+
+from typing import Optional, Any, Tuple
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.measured_arrays import MeasuredArray, _toArrays
+
+#types
+
+TSeries = Tuple[np.ndarray, np.ndarray]
+
+#globals
+
+CONVOLUTION_MODES = ('full', 'same', 'valid') #supported output modes
+
+DIRECT_KERNEL_SIZE = 512 #max length of the shorter operand of the direct
+                         #convolution, the FFT is used for the longer ones
+
+#functions
+
+#+ 'private' helper functions
+
+def _toSeries(Data: Any, Minimum: int = 1, SkipFrames: int = 2) -> TSeries:
+    """
+    Helper function to convert the input data into a pair of float64 1-D
+    arrays of the mean values and the uncertainties.
+
+    Signature:
+        type A /, int, int/ -> numpy.ndarray, numpy.ndarray
+
+    Raises:
+        UT_TypeError: data is neither real numbers nor measurements with
+            uncertainty
+        UT_ValueError: data is not 1-D, OR has less than the minimum number
+            of elements
+
+    Version 1.0.0.0
+    """
+    Values, Errors = _toArrays(Data, SkipFrames = SkipFrames + 1)
+    if Values.ndim != 1:
+        raise UT_ValueError(Data, '1-D data', SkipFrames = SkipFrames)
+    if Values.size < Minimum:
+        raise UT_ValueError(Data, 'at least {} element(s)'.format(Minimum),
+                                                    SkipFrames = SkipFrames)
+    return Values, np.broadcast_to(Errors, Values.shape)
+
+def _convolveFull(Left: np.ndarray, Right: np.ndarray) -> np.ndarray:
+    """
+    Helper function to calculate the full discrete linear convolution of two
+    1-D float64 arrays directly or via the real FFT, depending on the length
+    of the shorter one.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray -> numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    if min(Left.size, Right.size) <= DIRECT_KERNEL_SIZE:
+        return np.convolve(Left, Right)
+    Length = Left.size + Right.size - 1
+    Size = 1 << (Length - 1).bit_length()
+    Spectrum = np.fft.rfft(Left, Size) * np.fft.rfft(Right, Size)
+    return np.fft.irfft(Spectrum, Size)[:Length]
+
+def _convolveMeasured(Signal: TSeries, Kernel: TSeries) -> TSeries:
+    """
+    Helper function to calculate the full convolution of the mean values and
+    its uncertainty; the signal and the kernel are independent.
+
+    Signature:
+        tuple(numpy.ndarray, numpy.ndarray),
+            tuple(numpy.ndarray, numpy.ndarray)
+                -> numpy.ndarray, numpy.ndarray
+
+    Version 1.0.0.0
+    """
+    Values = _convolveFull(Signal[0], Kernel[0])
+    Variance = _convolveFull(Signal[1] * Signal[1], Kernel[0] * Kernel[0])
+    if np.any(Kernel[1]):
+        Variance += _convolveFull(Signal[0] * Signal[0],
+                                                    Kernel[1] * Kernel[1])
+    #the FFT rounding errors may result in tiny negative variances
+    return Values, np.sqrt(np.maximum(Variance, 0.0))
+
+def _checkState(State: Any, Limit: int, Exact: bool) -> TSeries:
+    """
+    Helper function to convert the carried over state into the float64 1-D
+    arrays and to check its length.
+
+    Signature:
+        type A OR None, int, bool -> numpy.ndarray, numpy.ndarray
+
+    Raises:
+        UT_TypeError: state is neither real numbers nor measurements with
+            uncertainty
+        UT_ValueError: state is not 1-D, OR its length is not equal to (is
+            greater than) the limit
+
+    Version 1.0.0.0
+    """
+    if State is None:
+        Size = Limit if Exact else 0
+        return np.zeros(Size), np.zeros(Size)
+    Values, Errors = _toSeries(State, Minimum = 0, SkipFrames = 3)
+    if Values.size > Limit or (Exact and Values.size != Limit):
+        raise UT_ValueError(State, 'length {} {}'.format(
+                    '==' if Exact else '<=', Limit), SkipFrames = 2)
+    return Values, Errors
+
+def _tail(Values: np.ndarray, Errors: np.ndarray,
+                                        Length: int) -> MeasuredArray:
+    """
+    Helper function to extract the last elements of the extended signal as
+    the state for the next call.
+
+    Signature:
+        numpy.ndarray, numpy.ndarray, int -> MeasuredArray
+
+    Version 1.0.0.0
+    """
+    Start = max(Values.size - Length, 0)
+    return MeasuredArray(Values[Start:].copy(), Errors[Start:].copy())
+
+#+ public API
+
+def convolve(Signal: Any, Kernel: Any, Mode: str = 'full') -> MeasuredArray:
+    """
+    Calculates the discrete linear convolution of a measured series with a
+    kernel, which can also be measured, with the same output modes as the
+    function numpy.convolve(). The signal and the kernel are treated as
+    independent measurements.
+
+    Signature:
+        type A, type B /, str/ -> MeasuredArray
+
+    Args:
+        Signal: type A; the signal as a 1-D sequence or numpy array of real
+            numbers and / or measurements with uncertainty, or an instance of
+            MeasuredArray
+        Kernel: type B; the kernel, the same types as the signal
+        Mode: (optional) str; the output mode, see CONVOLUTION_MODES,
+            defaults to 'full'
+
+    Returns:
+        MeasuredArray: the convolution, of the length N + K - 1 for 'full',
+            max(N, K) for 'same' and max(N, K) - min(N, K) + 1 for 'valid'
+
+    Raises:
+        UT_TypeError: the signal or the kernel is not real numbers or
+            measurements with uncertainty, OR the mode is not a string
+        UT_ValueError: the signal or the kernel is not 1-D or is empty, OR
+            unknown mode
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Mode, str):
+        raise UT_TypeError(Mode, str, SkipFrames = 1)
+    if not (Mode in CONVOLUTION_MODES):
+        raise UT_ValueError(Mode, 'one of {}'.format(list(CONVOLUTION_MODES)),
+                                                                SkipFrames = 1)
+    Data = _toSeries(Signal)
+    Weights = _toSeries(Kernel)
+    Values, Errors = _convolveMeasured(Data, Weights)
+    Longer = max(Data[0].size, Weights[0].size)
+    Shorter = min(Data[0].size, Weights[0].size)
+    if Mode == 'same':
+        Start = (Shorter - 1) // 2
+        Values = Values[Start : Start + Longer]
+        Errors = Errors[Start : Start + Longer]
+    elif Mode == 'valid':
+        Values = Values[Shorter - 1 : Longer]
+        Errors = Errors[Shorter - 1 : Longer]
+    return MeasuredArray(Values, Errors)
+
+def firFilter(Signal: Any, Coefficients: Any,
+                State: Optional[Any] = None) -> Tuple[MeasuredArray,
+                                                            MeasuredArray]:
+    """
+    Applies the causal FIR filter y[n] = sum(h[k] * x[n - k]) to a measured
+    series, which is a chunk of an unbounded signal. The state is the last
+    K - 1 input samples, which precede the chunk; for the first chunk (state
+    is None) the preceding samples are zeros. Thus the concatenation of the
+    outputs of the consecutive chunks with the carried over state is the same
+    as the output of the entire signal at once.
+
+    Signature:
+        type A, type B /, type C OR None/ -> MeasuredArray, MeasuredArray
+
+    Args:
+        Signal: type A; the chunk of the signal as a 1-D sequence or numpy
+            array of real numbers and / or measurements with uncertainty, or
+            an instance of MeasuredArray
+        Coefficients: type B; the K filter coefficients (impulse response),
+            the same types as the signal
+        State: (optional) type C; the state returned by the previous call,
+            defaults to None - the start of the signal
+
+    Returns:
+        tuple(MeasuredArray, MeasuredArray): the filtered chunk of the same
+            length as the input chunk, and the state for the next call
+
+    Raises:
+        UT_TypeError: the signal, the coefficients or the state is not real
+            numbers or measurements with uncertainty
+        UT_ValueError: the signal or the coefficients is not 1-D or is empty,
+            OR the state is not 1-D of the length K - 1
+
+    Version 1.0.0.0
+    """
+    Data = _toSeries(Signal)
+    Weights = _toSeries(Coefficients)
+    Order = Weights[0].size - 1
+    Previous = _checkState(State, Order, True)
+    Values = np.concatenate((Previous[0], Data[0]))
+    Errors = np.concatenate((Previous[1], Data[1]))
+    Result = _convolveMeasured((Values, Errors), Weights)
+    Output = MeasuredArray(Result[0][Order : Values.size],
+                                            Result[1][Order : Values.size])
+    return Output, _tail(Values, Errors, Order)
+
+def movingAverage(Signal: Any, Window: int,
+                    State: Optional[Any] = None) -> Tuple[MeasuredArray,
+                                                            MeasuredArray]:
+    """
+    Calculates the moving (boxcar) average of the measured series over the
+    complete windows of the given number of samples, which is a chunk of an
+    unbounded signal. The state is the last (up to Window - 1) input samples,
+    which precede the chunk; for the first chunk (state is None) the output
+    starts with the first complete window. Thus the concatenation of the
+    outputs of the consecutive chunks with the carried over state is the same
+    as the output of the entire signal at once, i.e. N - Window + 1 averages.
+
+    Signature:
+        type A, int /, type C OR None/ -> MeasuredArray, MeasuredArray
+
+    Args:
+        Signal: type A; the chunk of the signal as a 1-D sequence or numpy
+            array of real numbers and / or measurements with uncertainty, or
+            an instance of MeasuredArray
+        Window: int > 0; the number of samples per average
+        State: (optional) type C; the state returned by the previous call,
+            defaults to None - the start of the signal
+
+    Returns:
+        tuple(MeasuredArray, MeasuredArray): the averages of the complete
+            windows ending within the chunk (can be empty), and the state for
+            the next call
+
+    Raises:
+        UT_TypeError: the signal or the state is not real numbers or
+            measurements with uncertainty, OR the window is not an integer
+        UT_ValueError: the signal is not 1-D or is empty, OR the window is
+            less than 1, OR the state is not 1-D of the length <= Window - 1
+
+    Version 1.0.0.0
+    """
+    if (not isinstance(Window, (int, np.integer))) or isinstance(Window,
+                                                            (bool, np.bool_)):
+        raise UT_TypeError(Window, int, SkipFrames = 1)
+    if Window < 1:
+        raise UT_ValueError(Window, '>= 1', SkipFrames = 1)
+    Data = _toSeries(Signal)
+    Previous = _checkState(State, Window - 1, False)
+    Values = np.concatenate((Previous[0], Data[0]))
+    Errors = np.concatenate((Previous[1], Data[1]))
+    Kernel = np.full(Window, 1.0 / Window)
+    Result = _convolveMeasured((Values, Errors), (Kernel, np.zeros(Window)))
+    Output = MeasuredArray(Result[0][Window - 1 : Values.size],
+                                            Result[1][Window - 1 : Values.size])
+    return Output, _tail(Values, Errors, Window - 1)
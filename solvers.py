@@ -0,0 +1,424 @@
+#usr/bin/python3
+"""
+Module phyqus_lib.solvers
+
+Implements the batched root finding of the equations f(x, p1, p2, ...) = 0
+with respect to x, where the parameters are the measurements with uncertainty,
+for the arrays of the equations at once. Each root is bracketed, and the
+safeguarded Newton iterations (with the bisection fallback) run in lockstep
+over all elements with the vectorized function calls on the not yet converged
+elements only. The uncertainty of the roots is calculated in the same pass
+by the implicit function theorem, dx / dp = - (df / dp) / (df / dx), using
+the partial derivatives at the found roots (a single stacked function call),
+i.e. without perturbing the parameters and solving the equations again.
+
+Functions:
+    findRoot(Function, Lower, Upper, *Parameters, Derivative = None,
+                Tolerance = DEFAULT_TOLERANCE, MaxIterations = MAX_ITERATIONS,
+                Raise = False)
+        callable, type A, type A/, type B, .../ /, callable OR None, float,
+            int, bool/ -> MeasuredValue OR MeasuredArray
+"""
+
+__version__= '1.0.0.0'
+__date__ = '19-10-2026'
+__status__ = 'Development'
+
+#imports
+
+#+ standard library
+
+import sys
+import os
+
+from collections.abc import Callable
+
+from typing import Union, Optional, Any, Tuple, Sequence, List
+
+#+ 3rd party libraries
+
+import numpy as np
+
+#+ custom modules
+
+MODULE_PATH = os.path.realpath(__file__)
+LIB_FOLDER = os.path.dirname(MODULE_PATH)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#++ actual import
+
+from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+
+from phyqus_lib.base_classes import MeasuredValue
+
+from phyqus_lib.measured_arrays import MeasuredArray, DOMAIN_REPORT_LIMIT
+from phyqus_lib.measured_arrays import _toArrays, _isMeasured
+
+from phyqus_lib.functions import COMPLEX_STEP
+from phyqus_lib.functions import _groupArguments, _scale, _selectSteps
+from phyqus_lib.functions import _stackedCall
+
+#types
+
+TResult = Union[MeasuredValue, MeasuredArray]
+
+#globals
+
+DEFAULT_TOLERANCE = 1.0E-12 #default relative tolerance of the roots
+
+MAX_ITERATIONS = 100 #default max number of the iterations
+
+DIFFERENCE_STEP = 2.0 ** -17 #relative step of the central differences, if
+                             #the step search fails at the probe point
+
+#+ root finding error codes
+
+ROOT_OK = 0
+
+ROOT_NO_BRACKET = 1
+
+ROOT_NOT_FINITE = 2
+
+ROOT_NO_CONVERGENCE = 3
+
+ROOT_ERRORS = {
+    ROOT_NO_BRACKET : 'function has the same sign at the bracket ends',
+    ROOT_NOT_FINITE : 'function value is not finite',
+    ROOT_NO_CONVERGENCE : 'max number of iterations is exceeded'
+}
+
+#functions
+
+#+ 'private' helper functions
+
+def _probeSteps(Function: Callable, Point: Sequence[np.ndarray],
+                Errors: Sequence[float], Groups: Sequence[Sequence[int]]
+                                                ) -> Tuple[bool, List[float]]:
+    """
+    Helper function to select the method and the relative steps of the
+    numerical derivatives at the probe point - the 1-element arrays of the
+    bracket midpoint and of the parameters of the first element, since the
+    function is always called with the 1-D arrays. The central differences
+    with the relative step DIFFERENCE_STEP are used, if the function fails or
+    is not finite at the probe point (e.g. a singularity at the midpoint).
+
+    Signature:
+        callable, seq(numpy.ndarray), seq(float), seq(seq(int))
+            -> bool, list(float)
+
+    Version 1.0.0.0
+    """
+    try:
+        with np.errstate(all = 'ignore'):
+            Mean = np.asarray(Function(*Point))
+            if (Mean.dtype.kind in 'iuf' and Mean.shape == (1, )
+                                                and np.isfinite(Mean[0])):
+                return _selectSteps(Function, Point, Errors, Groups,
+                                                                float(Mean[0]))
+    except (TypeError, ValueError, AttributeError, IndexError,
+                                                            ArithmeticError):
+        pass
+    return False, [DIFFERENCE_STEP] * len(Groups)
+
+def _evaluate(Function: Callable, Values: Sequence[np.ndarray],
+                Groups: Sequence[Sequence[int]], Scales: Sequence[np.ndarray],
+                Steps: Sequence[float], IsComplex: bool
+                                    ) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Helper function to calculate the function values and its numerical
+    partial derivatives with respect to the argument groups in a single
+    stacked call, using the complex step, if supported, otherwise the
+    central differences with the relative steps of the groups.
+
+    Signature:
+        callable, seq(numpy.ndarray), seq(seq(int)), seq(numpy.ndarray),
+            seq(float), bool -> numpy.ndarray, list(numpy.ndarray)
+
+    Raises:
+        UT_TypeError: the function does not return real numbers
+        UT_ValueError: the function does not preserve the shape
+
+    Version 1.0.0.0
+    """
+    Result = None
+    if IsComplex:
+        Deltas = [COMPLEX_STEP * Scale for Scale in Scales]
+        try:
+            Result = np.asarray(_stackedCall(Function, Values, Groups,
+                                                                Deltas, True))
+        except (TypeError, ValueError, ArithmeticError):
+            pass
+        if (Result is not None) and Result.dtype.kind != 'c':
+            Result = None
+    if Result is None:
+        IsComplex = False
+        Deltas = [Step * Scale for Step, Scale in zip(Steps, Scales)]
+        Result = np.asarray(_stackedCall(Function, Values, Groups, Deltas,
+                                                                        False))
+        if Result.dtype.kind not in 'iuf':
+            raise UT_TypeError(Result, (int, float), SkipFrames = 2)
+    Layers = 1 + len(Groups) * (1 if IsComplex else 2)
+    if Result.shape != (Layers, ) + Values[0].shape:
+        raise UT_ValueError(Result.shape[1:],
+                    '{} shape'.format(Values[0].shape), SkipFrames = 2)
+    Derivatives = list()
+    for Index, Delta in enumerate(Deltas):
+        if IsComplex:
+            Derivatives.append(Result[1 + Index].imag / Delta)
+        else:
+            Derivatives.append((Result[1 + 2 * Index].real
+                                - Result[2 + 2 * Index].real) / (2 * Delta))
+    return Result[0].real, Derivatives
+
+def _checkValues(Result: Any, Size: int) -> np.ndarray:
+    """
+    Helper function to check the values returned by the function or the
+    analytic derivative and to convert them into a float64 1-D array.
+
+    Signature:
+        type A, int -> numpy.ndarray
+
+    Raises:
+        UT_TypeError: the result is not real numbers
+        UT_ValueError: the result is not of the same shape as the arguments
+
+    Version 1.0.0.0
+    """
+    Values = np.asarray(Result)
+    if Values.dtype.kind not in 'iuf':
+        raise UT_TypeError(Result, (int, float), SkipFrames = 2)
+    if Values.shape != (Size, ):
+        raise UT_ValueError(Values.shape, '({}, ) shape'.format(Size),
+                                                                SkipFrames = 2)
+    return Values.astype(np.float64)
+
+def _raiseRootError(Codes: np.ndarray) -> None:
+    """
+    Helper function to raise a single UT_ValueError exception listing the
+    indices (up to DOMAIN_REPORT_LIMIT) and the reasons of all failed roots.
+
+    Signature:
+        numpy.ndarray -> None
+
+    Raises:
+        UT_ValueError: always
+
+    Version 1.0.0.0
+    """
+    Indices = np.argwhere(Codes)
+    Items = ['{} - {}'.format(tuple(Index.tolist()),
+                                    ROOT_ERRORS[int(Codes[tuple(Index)])])
+                                for Index in Indices[:DOMAIN_REPORT_LIMIT]]
+    if len(Indices) > DOMAIN_REPORT_LIMIT:
+        Items.append('and {} more'.format(len(Indices) - DOMAIN_REPORT_LIMIT))
+    Error = UT_ValueError(len(Indices), '== 0 failed roots', SkipFrames = 2)
+    Error.setMessage('Root finding failed in {} of {} element(s): {}'.format(
+                                len(Indices), Codes.size, '; '.join(Items)))
+    raise Error
+
+#+ public API
+
+def findRoot(Function: Callable, Lower: Any, Upper: Any, *Parameters: Any,
+                Derivative: Optional[Callable] = None,
+                Tolerance: float = DEFAULT_TOLERANCE,
+                MaxIterations: int = MAX_ITERATIONS,
+                Raise: bool = False) -> TResult:
+    """
+    Solves the equations f(x, p1, p2, ...) = 0 with respect to x within the
+    brackets [Lower, Upper] for the arrays of the measured parameters, which
+    are broadcast together with the brackets following the NumPy rules. The
+    safeguarded Newton iterations run in lockstep over all elements: the
+    Newton step is replaced by the bisection of the current bracket, if it
+    leaves the bracket or does not reduce the function fast enough; the
+    derivative df / dx is analytic, if provided, or numerical (the complex
+    step, if the function supports it, otherwise the central differences).
+    The uncertainty of each root is propagated from the parameters using the
+    implicit function theorem dx / dp = - (df / dp) / (df / dx) with the
+    numerical partial derivatives at the root, assuming the independence of
+    the parameters, except for the same object parameters.
+
+    The function is called with the 1-D arrays of the not yet converged
+    elements, i.e. it must be vectorized (element-wise), including the probe
+    of the numerical derivatives with the 1-element arrays at the midpoint
+    of the first bracket. The failed elements
+    (the function has the same sign at both bracket ends, is not finite, or
+    the iterations do not converge) are filled with NaN (both value and SE),
+    unless the single exception listing all of them is requested.
+
+    Signature:
+        callable, type A, type A/, type B, .../ /, callable OR None, float,
+            int, bool/ -> MeasuredValue OR MeasuredArray
+
+    Args:
+        Function: callable(numpy.ndarray, numpy.ndarray, ...)
+            -> numpy.ndarray; the vectorized function f(x, p1, p2, ...) of
+            real numbers arrays
+        Lower: type A; the lower end(s) of the bracket(s) as real number(s)
+            in any form accepted by MeasuredArray
+        Upper: type A; the upper end(s) of the bracket(s), as the lower ends
+        *Parameters: type B; real number(s) or measurement(s) with
+            uncertainty in any form accepted by MeasuredArray, the parameters
+            of the function
+        Derivative: (optional) callable(numpy.ndarray, numpy.ndarray, ...)
+            -> numpy.ndarray; the vectorized analytic derivative df / dx with
+            the same arguments as the function, defaults to None - the
+            numerical derivative
+        Tolerance: (optional) float in (0, 1); the relative tolerance of the
+            roots, the absolute tolerance of the roots close to zero is
+            Tolerance**2 times the magnitude of the bracket, defaults to
+            DEFAULT_TOLERANCE
+        MaxIterations: (optional) int > 0; the max number of the iterations,
+            defaults to MAX_ITERATIONS
+        Raise: (optional) bool; if True a single exception listing all failed
+            roots is raised, defaults to False
+
+    Returns:
+        MeasuredValue: the root with the propagated uncertainty, the brackets
+            and all parameters are scalars
+        MeasuredArray: the roots, the broadcast shape of the brackets and the
+            parameters
+
+    Raises:
+        UT_TypeError: the function or the derivative is not callable, OR the
+            brackets are not real numbers, OR any parameter is neither real
+            number(s) nor measurement(s) with uncertainty, OR any keyword
+            argument is of the improper type, OR the function or the
+            derivative does not return real numbers
+        UT_ValueError: the shapes of the brackets and the parameters are not
+            compatible, OR the function or the derivative does not preserve
+            the shape, OR the tolerance or the max number of iterations is out
+            of the range, OR any root is failed, and Raise flag is True
+
+    Version 1.0.0.0
+    """
+    if not isinstance(Function, Callable):
+        raise UT_TypeError(Function, Callable, SkipFrames = 1)
+    if not ((Derivative is None) or isinstance(Derivative, Callable)):
+        raise UT_TypeError(Derivative, Callable, SkipFrames = 1)
+    if not isinstance(Tolerance, (float, np.floating)):
+        raise UT_TypeError(Tolerance, float, SkipFrames = 1)
+    if not (0 < Tolerance < 1):
+        raise UT_ValueError(Tolerance, 'in (0, 1)', SkipFrames = 1)
+    if ((not isinstance(MaxIterations, (int, np.integer)))
+                                or isinstance(MaxIterations, (bool, np.bool_))):
+        raise UT_TypeError(MaxIterations, int, SkipFrames = 1)
+    if MaxIterations < 1:
+        raise UT_ValueError(MaxIterations, '>= 1', SkipFrames = 1)
+    if not isinstance(Raise, bool):
+        raise UT_TypeError(Raise, bool, SkipFrames = 1)
+    for Bound in (Lower, Upper):
+        if _isMeasured(Bound):
+            raise UT_TypeError(Bound, (int, float, list, tuple, np.ndarray),
+                                                                SkipFrames = 1)
+    Pairs = [_toArrays(Arg, SkipFrames = 2) for Arg in (Lower, Upper)
+                                                                + Parameters]
+    try:
+        Shape = np.broadcast(*[Value for Value, _ in Pairs]).shape
+    except ValueError:
+        raise UT_ValueError(tuple(Value.shape for Value, _ in Pairs),
+                            'compatible shapes', SkipFrames = 1) from None
+    Values = [np.broadcast_to(Value, Shape).ravel() for Value, _ in Pairs]
+    Errors = [np.broadcast_to(Error, Shape).ravel() for _, Error in Pairs[2:]]
+    Size = Values[0].size
+    Low, High, Values = Values[0], Values[1], Values[2:]
+    Groups = [Group for Group in _groupArguments(Parameters)
+                                                if np.any(Errors[Group[0]])]
+    #numerical derivatives: the method and the relative steps w.r.t. x and
+    #+ the measured parameter groups, selected at the first element
+    Groups = [[0]] + [[Index + 1 for Index in Group] for Group in Groups]
+    if Size:
+        IsComplex, Steps = _probeSteps(Function,
+                    [np.full(1, 0.5 * (Low[0] + High[0]))]
+                    + [Value[ : 1] for Value in Values],
+                    [0.0] + [float(Error[0]) for Error in Errors], Groups)
+    else:
+        IsComplex, Steps = False, [0.0] * len(Groups)
+    Codes = np.full(Size, ROOT_OK, dtype = np.uint8)
+    Root = np.full(Size, np.nan)
+    with np.errstate(all = 'ignore'):
+        FLow = _checkValues(Function(Low, *Values), Size)
+        FHigh = _checkValues(Function(High, *Values), Size)
+        Codes[~(np.isfinite(FLow) & np.isfinite(FHigh))] = ROOT_NOT_FINITE
+        Codes[(Codes == ROOT_OK) & (np.sign(FLow) * np.sign(FHigh) > 0)
+                                                            ] = ROOT_NO_BRACKET
+        Done = (Codes != ROOT_OK) | (FLow == 0) | (FHigh == 0)
+        Root[FHigh == 0] = High[FHigh == 0]
+        Root[FLow == 0] = Low[FLow == 0]
+        #the bracket is oriented: f(Left) < 0 < f(Right)
+        Active = np.flatnonzero(~Done)
+        Swap = FLow[Active] > 0
+        Left = np.where(Swap, High[Active], Low[Active])
+        Right = np.where(Swap, Low[Active], High[Active])
+        FLeft = np.where(Swap, FHigh[Active], FLow[Active])
+        FRight = np.where(Swap, FLow[Active], FHigh[Active])
+        #start from the false position point
+        X = Left - FLeft * (Right - Left) / (FRight - FLeft)
+        X = np.where(np.isfinite(X), X, 0.5 * (Left + Right))
+        Previous = Last = np.abs(Right - Left)
+        #absolute tolerance of the roots close to zero
+        Floor = Tolerance * np.fmax(np.abs(Left), np.abs(Right))
+        for _ in range(MaxIterations):
+            if not Active.size:
+                break
+            Arguments = [X] + [Value[Active] for Value in Values]
+            if Derivative is None:
+                F, (D, ) = _evaluate(Function, Arguments, Groups[:1],
+                                    [_scale(X, 0.0)], Steps[:1], IsComplex)
+            else:
+                F = _checkValues(Function(*Arguments), Active.size)
+                D = _checkValues(Derivative(*Arguments), Active.size)
+            Failed = ~np.isfinite(F)
+            Codes[Active[Failed]] = ROOT_NOT_FINITE
+            Left = np.where(F < 0, X, Left)
+            Right = np.where(F > 0, X, Right)
+            Next = X - F / D
+            Limit = Tolerance * (np.abs(X) + Floor)
+            Inside = ((Next > np.fmin(Left, Right))
+                                            & (Next < np.fmax(Left, Right)))
+            Converged = ((F == 0) | (np.abs(Next - X) <= Limit)
+                                            | (np.abs(Right - Left) <= Limit))
+            #bisection, if the Newton step leaves the bracket, or it is not
+            #+ less than a half of the step before the last one
+            Bisect = ~(Converged | (Inside
+                                    & (np.abs(2 * F) <= np.abs(Previous * D))))
+            Next = np.where(Bisect, 0.5 * (Left + Right), Next)
+            Step = np.abs(Next - X)
+            Root[Active] = np.where(F == 0, X, Next)
+            Keep = ~(Converged | Failed)
+            Active, X, Left, Right = (Active[Keep], Next[Keep], Left[Keep],
+                                                                Right[Keep])
+            Previous, Last, Floor = Last[Keep], Step[Keep], Floor[Keep]
+        Codes[Active] = ROOT_NO_CONVERGENCE
+        #uncertainty by the implicit function theorem at the roots
+        Variance = np.zeros(Size)
+        Valid = np.flatnonzero(Codes == ROOT_OK)
+        if Valid.size and len(Groups) > 1:
+            Arguments = [Root[Valid]] + [Value[Valid] for Value in Values]
+            Scales = [_scale(Arguments[Group[0]],
+                            Errors[Group[0] - 1][Valid] if Group[0] else 0.0)
+                                                        for Group in Groups]
+            if Derivative is None:
+                _, Partials = _evaluate(Function, Arguments, Groups, Scales,
+                                                            Steps, IsComplex)
+            else:
+                _, Partials = _evaluate(Function, Arguments, Groups[1:],
+                                            Scales[1:], Steps[1:], IsComplex)
+                Partials.insert(0, _checkValues(Derivative(*Arguments),
+                                                                Valid.size))
+            for Group, Partial in zip(Groups[1:], Partials[1:]):
+                Error = Errors[Group[0] - 1][Valid]
+                Variance[Valid] += np.square(np.where(Error == 0, 0.0,
+                                                Error * Partial / Partials[0]))
+    Codes[Codes == ROOT_OK] = np.where(np.isfinite(Root[Codes == ROOT_OK]),
+                                                    ROOT_OK, ROOT_NOT_FINITE)
+    if Raise and np.any(Codes):
+        _raiseRootError(Codes.reshape(Shape))
+    Mask = Codes == ROOT_OK
+    Root = np.where(Mask, Root, np.nan).reshape(Shape)
+    Error = np.where(Mask, np.sqrt(Variance), np.nan).reshape(Shape)
+    if not len(Shape):
+        return MeasuredValue(float(Root), float(Error))
+    return MeasuredArray(Root, Error)